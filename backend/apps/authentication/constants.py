@@ -12,6 +12,11 @@ class AccountProviderChoices(models.TextChoices):
     GOOGLE = "GOOGLE"
 
 
+class UserPlanChoices(models.TextChoices):
+    FREE = "FREE"
+    PRO = "PRO"
+
+
 class SignUpErrorCodeChoices(models.TextChoices):
     EMAIL_ALREADY_EXISTS = "EMAIL_ALREADY_EXISTS"
 
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-17 12:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0002_alter_user_email_verified_alter_user_is_active"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="plan",
+            field=models.CharField(
+                choices=[("FREE", "Free"), ("PRO", "Pro")],
+                default="FREE",
+                help_text="User's plan, paid plans keep the most capable Gemini model under load.",
+                max_length=10,
+                verbose_name="plan",
+            ),
+        ),
+    ]
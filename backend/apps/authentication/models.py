@@ -5,7 +5,7 @@ from uuid import uuid4
 from django.db import models
 
 # App Imports
-from .constants import AccountProviderChoices, AccountTypeChoices
+from .constants import AccountProviderChoices, AccountTypeChoices, UserPlanChoices
 
 # Project Imports
 from core.models import CreatedAtMixin, TimeStampMixin
@@ -41,6 +41,13 @@ class User(TimeStampMixin):
         null=True,
         help_text="User's avatar obtained from social login provider.",
     )
+    plan = models.CharField(
+        "plan",
+        max_length=10,
+        choices=UserPlanChoices.choices,
+        default=UserPlanChoices.FREE.value,
+        help_text="User's plan, paid plans keep the most capable Gemini model under load.",
+    )
 
     REQUIRED_FIELDS = []  # Used by Django Simple JWT package
     USERNAME_FIELD = "email"  # Used by Django Simple JWT package
@@ -48,7 +48,11 @@ class UserModelSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = "__all__"
-        extra_kwargs = {"password": {"write_only": True, "required": True}}
+        extra_kwargs = {
+            "password": {"write_only": True, "required": True},
+            # Never chosen by the user, e.g. on sign up
+            "plan": {"read_only": True},
+        }
 
 
 class SignUpModelSerializer(UserModelSerializer):
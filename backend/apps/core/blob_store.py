@@ -0,0 +1,194 @@
+# Python Imports
+import hashlib
+import json
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from compression import zstd
+from functools import cache
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Optional
+
+# Django Imports
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+CHUNK_SIZE = 64 * 1024
+
+
+class BlobNotFoundError(Exception):
+    """Raised when no blob is stored under the requested key"""
+
+
+class BlobStore(ABC):
+    """
+    Content-addressed store for large payloads.
+
+    Blobs are zstd-compressed and keyed by the SHA-256 of their uncompressed content,
+    so storing the same payload twice keeps a single copy.
+    """
+
+    def __init__(self, compression_level: int = 3) -> None:
+        self.compression_level = compression_level
+
+    @abstractmethod
+    def put_stream(self, chunks: Iterable[bytes]) -> str:
+        """Store the concatenated chunks and return their content key"""
+
+    @abstractmethod
+    def open(self, key: str) -> BinaryIO:
+        """Return a file-like object streaming the decompressed blob"""
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
+
+    def put(self, data: bytes) -> str:
+        return self.put_stream([data])
+
+    def put_json(self, data: Any) -> str:
+        return self.put(json.dumps(data, separators=(",", ":"), default=str).encode())
+
+    def read(self, key: str) -> bytes:
+        with self.open(key) as stream:
+            return stream.read()
+
+    def read_json(self, key: str) -> Any:
+        with self.open(key) as stream:
+            return json.load(stream)
+
+    def _compress_to(self, chunks: Iterable[bytes], fileobj: BinaryIO) -> str:
+        """Compress chunks into `fileobj` and return the SHA-256 of the raw content"""
+
+        digest = hashlib.sha256()
+        with zstd.ZstdFile(fileobj, "wb", level=self.compression_level) as compressed:
+            for chunk in chunks:
+                digest.update(chunk)
+                compressed.write(chunk)
+
+        return digest.hexdigest()
+
+
+class LocalFileSystemBlobStore(BlobStore):
+    """
+    Blob store on the local filesystem (or a volume shared by the API and the workers).
+
+    Blobs live under `location/<key[:2]>/<key[2:4]>/<key>.zst` and are decompressed while
+    streaming from the file, so the compressed file is never held in the process memory.
+    """
+
+    def __init__(self, location: str, compression_level: int = 3) -> None:
+        super().__init__(compression_level)
+        self.location = Path(location)
+
+    def put_stream(self, chunks: Iterable[bytes]) -> str:
+        tmp_dir = self.location / "tmp"
+        tmp_dir.mkdir(parents=True, exist_ok=True)
+
+        with tempfile.NamedTemporaryFile(dir=tmp_dir, delete=False) as tmp:
+            try:
+                key = self._compress_to(chunks, tmp)
+            except BaseException:
+                os.unlink(tmp.name)
+                raise
+
+        path = self._path(key)
+        if path.exists():
+            os.unlink(tmp.name)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp.name, path)
+
+        return key
+
+    def open(self, key: str) -> BinaryIO:
+        path = self._path(key)
+        try:
+            if not path.stat().st_size:
+                # Even an empty payload compresses to a frame, this file is a broken copy
+                raise BlobNotFoundError(key)
+
+            # Opened by path, closing the ZstdFile closes the file
+            return zstd.ZstdFile(path, "rb")
+        except FileNotFoundError as e:
+            raise BlobNotFoundError(key) from e
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        return self.location / key[:2] / key[2:4] / f"{key}.zst"
+
+
+class S3BlobStore(BlobStore):
+    """
+    Blob store on an S3-compatible object store. Requires the optional `boto3` package.
+
+    Payloads are compressed into a spooled temporary file before upload and streamed
+    back from the object body on read.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "blobs/",
+        endpoint_url: Optional[str] = None,
+        compression_level: int = 3,
+    ) -> None:
+        super().__init__(compression_level)
+
+        try:
+            import boto3
+        except ImportError as e:
+            raise ImproperlyConfigured("S3BlobStore requires the `boto3` package") from e
+
+        self.bucket = bucket
+        self.prefix = prefix
+        self.client = boto3.client("s3", endpoint_url=endpoint_url)
+
+    def put_stream(self, chunks: Iterable[bytes]) -> str:
+        with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as spool:
+            key = self._compress_to(chunks, spool)
+
+            if not self.exists(key):
+                spool.seek(0)
+                self.client.upload_fileobj(spool, self.bucket, self._object_key(key))
+
+        return key
+
+    def open(self, key: str) -> BinaryIO:
+        try:
+            response = self.client.get_object(Bucket=self.bucket, Key=self._object_key(key))
+        except self.client.exceptions.NoSuchKey as e:
+            raise BlobNotFoundError(key) from e
+
+        return zstd.ZstdFile(response["Body"], "rb")
+
+    def exists(self, key: str) -> bool:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self._object_key(key))
+            return True
+        except self.client.exceptions.ClientError:
+            return False
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=self._object_key(key))
+
+    def _object_key(self, key: str) -> str:
+        return f"{self.prefix}{key}.zst"
+
+
+@cache
+def get_blob_store() -> BlobStore:
+    """Return the process-wide blob store configured by the `BLOB_STORE` setting"""
+
+    backend = import_string(settings.BLOB_STORE["BACKEND"])
+    return backend(**settings.BLOB_STORE.get("OPTIONS", {}))
@@ -0,0 +1,144 @@
+# Python Imports
+import codecs
+import json
+from typing import Any, BinaryIO, Iterator, Optional
+
+# App Imports
+from .blob_store import CHUNK_SIZE
+
+WHITESPACE = " \t\n\r"
+
+
+class PayloadTooLargeError(ValueError):
+    """Raised when a streamed payload grows past its maximum size"""
+
+
+def iter_json_items(
+    stream: BinaryIO, max_size: Optional[int] = None, chunk_size: int = CHUNK_SIZE
+) -> Iterator[Any]:
+    """
+    Decode a UTF-8 JSON document from a binary stream incrementally and yield the items of
+    its top-level array one at a time (a document that is not an array is yielded as the
+    only item). Only the item being decoded and one read are buffered, so memory stays
+    bounded by the largest item rather than the whole document.
+
+    Args:
+        stream (BinaryIO): The stream to read the document from.
+        max_size (Optional[int]): The maximum document size in bytes, unbounded when None.
+        chunk_size (int): The minimum number of bytes read at once.
+
+    Raises:
+        PayloadTooLargeError: The document is larger than `max_size`.
+        ValueError: The document is not valid JSON (`json.JSONDecodeError`) or is empty.
+
+    Returns:
+        Iterator[Any]: The decoded items.
+    """
+
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer, pos, size, eof = "", 0, 0, False
+
+    def fill(minimum: int) -> bool:
+        """Append at least `minimum` bytes to the buffer, return False at end of stream"""
+
+        nonlocal buffer, pos, size, eof
+
+        if eof:
+            return False
+
+        chunk = stream.read(max(minimum, chunk_size))
+        size += len(chunk)
+        if max_size is not None and size > max_size:
+            raise PayloadTooLargeError(f"Payload is larger than {max_size} bytes")
+
+        eof = not chunk
+        buffer = buffer[pos:] + text_decoder.decode(chunk, final=eof)
+        pos = 0
+
+        return not eof
+
+    def skip_whitespace() -> Optional[str]:
+        """Move to the next significant character and return it, None at end of stream"""
+
+        nonlocal pos
+
+        while True:
+            while pos < len(buffer) and buffer[pos] in WHITESPACE:
+                pos += 1
+
+            if pos < len(buffer):
+                return buffer[pos]
+
+            if not fill(chunk_size):
+                return None
+
+    def decode_value() -> Any:
+        """Decode the value at `pos`, reading more until it is followed by a character"""
+
+        nonlocal pos
+
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Read at least as much again as the partial value, so a large value is
+                # decoded in a logarithmic number of attempts
+                if fill(len(buffer) - pos):
+                    continue
+                raise
+
+            # A number or literal can end with the buffer, make sure it is complete
+            if end < len(buffer) or eof:
+                pos = end
+                return value
+
+            fill(chunk_size)
+
+    first = skip_whitespace()
+    if first is None:
+        raise ValueError("Empty JSON document")
+
+    if first != "[":
+        yield decode_value()
+
+    else:
+        pos += 1
+
+        if skip_whitespace() == "]":
+            pos += 1
+        else:
+            while True:
+                yield decode_value()
+
+                separator = skip_whitespace()
+                pos += 1
+
+                if separator == "]":
+                    break
+
+                if separator != ",":
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos - 1)
+
+                skip_whitespace()
+
+    if skip_whitespace() is not None:
+        raise json.JSONDecodeError("Extra data", buffer, pos)
+
+
+def iter_bounded_chunks(
+    stream: BinaryIO, max_size: Optional[int] = None, chunk_size: int = CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Yield a binary stream's content chunk by chunk, raising PayloadTooLargeError as soon
+    as more than `max_size` bytes were read.
+    """
+
+    size = 0
+
+    while chunk := stream.read(chunk_size):
+        size += len(chunk)
+        if max_size is not None and size > max_size:
+            raise PayloadTooLargeError(f"Payload is larger than {max_size} bytes")
+
+        yield chunk
@@ -0,0 +1,221 @@
+# Python Imports
+import json
+import logging
+import math
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Third-Party Imports
+from asgiref.sync import sync_to_async
+from redis.exceptions import RedisError
+
+# App Imports
+from .redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "metrics:"
+
+
+class Metric:
+    """
+    Base class for metrics shared by every API and worker process.
+
+    Values are kept in one Redis hash per metric, keyed by the JSON encoded label values,
+    so any process can render the cluster-wide values. Recording a value never raises,
+    a Redis outage only loses samples. The `a*` variants run the Redis round trip in a
+    worker thread, for use on an event loop.
+    """
+
+    type: str
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+        registry.register(self)
+
+    @property
+    def key(self) -> str:
+        return f"{KEY_PREFIX}{self.name}"
+
+    def _field(self, labels: dict) -> str:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+
+        return json.dumps([labels[name] for name in self.labelnames])
+
+    def _labels(self, field: str) -> Dict[str, str]:
+        return dict(zip(self.labelnames, json.loads(field)))
+
+    def collect(self) -> Dict[str, Any]:
+        return get_redis().hgetall(self.key)
+
+    def render(self, values: Dict[str, Any]) -> List[str]:
+        return [
+            f"{self.name}{format_labels(self._labels(field))} {value}"
+            for field, value in sorted(values.items())
+        ]
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        try:
+            get_redis().hincrbyfloat(self.key, self._field(labels), amount)
+        except RedisError as e:
+            logger.warning(f"Failed to record metric {self.name}: {e}")
+
+    async def ainc(self, amount: float = 1, **labels: str) -> None:
+        await sync_to_async(self.inc, thread_sensitive=False)(amount, **labels)
+
+
+class Gauge(Metric):
+    type = "gauge"
+
+    def set(self, value: float, **labels: str) -> None:
+        try:
+            get_redis().hset(self.key, self._field(labels), value)
+        except RedisError as e:
+            logger.warning(f"Failed to record metric {self.name}: {e}")
+
+
+class Summary(Metric):
+    """
+    Distribution of observed values (e.g. latencies) exposed as quantiles plus the
+    `_sum` and `_count` series.
+
+    Quantiles are computed at render time from the latest `max_samples` observations of
+    each label set, kept in a capped Redis list, so they follow recent behaviour rather
+    than the whole process lifetime.
+    """
+
+    type = "summary"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        quantiles: Iterable[float] = (0.5, 0.95, 0.99),
+        max_samples: int = 1024,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.quantiles = tuple(quantiles)
+        self.max_samples = max_samples
+
+    def _samples_key(self, field: str) -> str:
+        return f"{self.key}:samples:{field}"
+
+    def observe(self, value: float, **labels: str) -> None:
+        field = self._field(labels)
+
+        try:
+            pipeline = get_redis().pipeline(transaction=False)
+            pipeline.hincrbyfloat(f"{self.key}:sum", field, value)
+            pipeline.hincrby(f"{self.key}:count", field, 1)
+            pipeline.lpush(self._samples_key(field), value)
+            pipeline.ltrim(self._samples_key(field), 0, self.max_samples - 1)
+            pipeline.execute()
+        except RedisError as e:
+            logger.warning(f"Failed to record metric {self.name}: {e}")
+
+    async def aobserve(self, value: float, **labels: str) -> None:
+        await sync_to_async(self.observe, thread_sensitive=False)(value, **labels)
+
+    def collect(self) -> Dict[str, Any]:
+        redis = get_redis()
+        sums = redis.hgetall(f"{self.key}:sum")
+        counts = redis.hgetall(f"{self.key}:count")
+
+        return {
+            field: (
+                counts.get(field, 0),
+                total,
+                sorted(float(sample) for sample in redis.lrange(self._samples_key(field), 0, -1)),
+            )
+            for field, total in sums.items()
+        }
+
+    def quantile(self, quantile: float, min_samples: int = 1, **labels: str) -> Optional[float]:
+        """
+        Return the `quantile` of the latest observations of a label set, or None with fewer
+        than `min_samples` of them or when Redis is unavailable.
+        """
+
+        try:
+            samples = get_redis().lrange(self._samples_key(self._field(labels)), 0, -1)
+        except RedisError as e:
+            logger.warning(f"Failed to read metric {self.name}: {e}")
+            return None
+
+        if len(samples) < max(min_samples, 1):
+            return None
+
+        return nearest_rank(sorted(float(sample) for sample in samples), quantile)
+
+    async def aquantile(
+        self, quantile: float, min_samples: int = 1, **labels: str
+    ) -> Optional[float]:
+        return await sync_to_async(self.quantile, thread_sensitive=False)(
+            quantile, min_samples, **labels
+        )
+
+    def render(self, values: Dict[str, Any]) -> List[str]:
+        lines = []
+        for field, (count, total, samples) in sorted(values.items()):
+            labels = self._labels(field)
+
+            for quantile in self.quantiles:
+                value = nearest_rank(samples, quantile) if samples else "NaN"
+                lines.append(f"{self.name}{format_labels(labels, ('quantile', quantile))} {value}")
+
+            lines.append(f"{self.name}_sum{format_labels(labels)} {total}")
+            lines.append(f"{self.name}_count{format_labels(labels)} {count}")
+
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+
+        self._metrics[metric.name] = metric
+
+    def render_prometheus(self) -> str:
+        """Render every registered metric in the Prometheus text exposition format"""
+
+        lines = []
+        for metric in sorted(self._metrics.values(), key=lambda m: m.name):
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.render(metric.collect()))
+
+        return "\n".join(lines) + "\n"
+
+
+def nearest_rank(sorted_samples: List[float], quantile: float) -> float:
+    """Return the `quantile` of already sorted samples using the nearest-rank method"""
+
+    rank = max(math.ceil(quantile * len(sorted_samples)), 1)
+    return sorted_samples[rank - 1]
+
+
+def format_labels(labels: Dict[str, str], *extra: Tuple[str, str]) -> str:
+    pairs = [*labels.items(), *extra]
+    if not pairs:
+        return ""
+
+    escaped = (
+        (name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for name, value in pairs
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+registry = MetricsRegistry()
@@ -1,4 +1,6 @@
 # Python Imports
+import logging
+from typing import Awaitable, Callable, Iterable
 from urllib.parse import parse_qs
 
 # Third-Party Imports
@@ -14,6 +16,8 @@ from rest_framework_simplejwt.tokens import AccessToken
 # Project Imports
 from authentication.models import User
 
+logger = logging.getLogger(__name__)
+
 
 class WebsocketJWTAuthentication(BaseMiddleware):
 
@@ -56,3 +60,35 @@ class WebsocketJWTAuthentication(BaseMiddleware):
 
         except Exception as e:
             await send({"type": "websocket.close", "code": 4001, "reason": str(e)})
+
+
+class LifespanMiddleware:
+    """
+    ASGI middleware answering the `lifespan` protocol, so process-wide resources (e.g.
+    pooled HTTP clients) are released by the `on_shutdown` callbacks when the server
+    stops. Other scopes are passed to the wrapped application.
+    """
+
+    def __init__(self, app, on_shutdown: Iterable[Callable[[], Awaitable[None]]] = ()) -> None:
+        self.app = app
+        self.on_shutdown = tuple(on_shutdown)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "lifespan":
+            return await self.app(scope, receive, send)
+
+        while True:
+            message = await receive()
+
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+
+            elif message["type"] == "lifespan.shutdown":
+                for callback in self.on_shutdown:
+                    try:
+                        await callback()
+                    except Exception as e:
+                        logger.error(f"Lifespan shutdown callback failed: {e}")
+
+                await send({"type": "lifespan.shutdown.complete"})
+                return
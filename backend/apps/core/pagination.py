@@ -0,0 +1,149 @@
+# Python Imports
+import base64
+import binascii
+import json
+import uuid
+from datetime import datetime
+from typing import Any, List, Optional, Self, TypedDict
+
+# Django Imports
+from django.db.models import Model, Q, QuerySet
+
+
+class InvalidCursorError(Exception):
+    """Raised when a client supplied cursor cannot be decoded"""
+
+
+class CursorPagination(TypedDict):
+    next: Optional[str]
+    previous: Optional[str]
+    page_size: int
+
+
+class Cursor:
+    """
+    Opaque position in a keyset ordered by (`position_field`, `pk`) descending, of a
+    timezone aware position and a UUID primary key.
+
+    `reverse` marks a cursor pointing to the previous page (rows newer than the position).
+    """
+
+    def __init__(self, position: datetime, pk: str, reverse: bool = False) -> None:
+        self.position = position
+        self.pk = pk
+        self.reverse = reverse
+
+    def encode(self) -> str:
+        payload = json.dumps(
+            {"p": self.position.isoformat(), "k": self.pk, "r": int(self.reverse)},
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, raw: str) -> Self:
+        try:
+            padded = raw + "=" * (-len(raw) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            position = datetime.fromisoformat(payload["p"])
+            if position.tzinfo is None:
+                # Would be compared in the wrong timezone
+                raise ValueError("Naive cursor position")
+
+            return cls(
+                position=position,
+                pk=str(uuid.UUID(str(payload["k"]))),
+                reverse=bool(payload["r"]),
+            )
+        except (binascii.Error, ValueError, KeyError, TypeError) as e:
+            raise InvalidCursorError("Invalid pagination cursor") from e
+
+
+class CursorPage:
+    def __init__(
+        self,
+        items: List[Model],
+        next_cursor: Optional[Cursor],
+        previous_cursor: Optional[Cursor],
+        page_size: int,
+    ) -> None:
+        self.items = items
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self.page_size = page_size
+
+    @property
+    def pagination(self) -> CursorPagination:
+        return {
+            "next": self.next_cursor.encode() if self.next_cursor else None,
+            "previous": self.previous_cursor.encode() if self.previous_cursor else None,
+            "page_size": self.page_size,
+        }
+
+
+class KeysetPaginator:
+    """
+    Keyset (cursor) paginator ordering rows by `position_field` descending with the primary
+    key as a tiebreak.
+
+    Each page is a single range scan starting at the cursor position, so deep pages cost
+    the same as the first one as long as an index leads with the filtered columns
+    followed by `position_field`.
+    """
+
+    def __init__(self, position_field: str, page_size: int, max_page_size: int) -> None:
+        self.position_field = position_field
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+
+    def get_page_size(self, raw_page_size: Optional[Any]) -> int:
+        try:
+            page_size = int(raw_page_size)
+        except (TypeError, ValueError):
+            return self.page_size
+
+        return max(1, min(page_size, self.max_page_size))
+
+    def get_cursor(self, raw_cursor: Optional[str]) -> Optional[Cursor]:
+        """Decode a client supplied cursor. Raises InvalidCursorError - caller must handle it."""
+
+        return Cursor.decode(raw_cursor) if raw_cursor else None
+
+    async def apaginate(
+        self, queryset: QuerySet, cursor: Optional[Cursor], page_size: int
+    ) -> CursorPage:
+        field = self.position_field
+
+        if cursor and cursor.reverse:
+            queryset = queryset.filter(
+                Q(**{f"{field}__gt": cursor.position})
+                | Q(**{field: cursor.position, "pk__gt": cursor.pk})
+            ).order_by(field, "pk")
+        elif cursor:
+            queryset = queryset.filter(
+                Q(**{f"{field}__lt": cursor.position})
+                | Q(**{field: cursor.position, "pk__lt": cursor.pk})
+            ).order_by(f"-{field}", "-pk")
+        else:
+            queryset = queryset.order_by(f"-{field}", "-pk")
+
+        items = [item async for item in queryset[: page_size + 1]]
+        has_more = len(items) > page_size
+        items = items[:page_size]
+
+        if cursor and cursor.reverse:
+            items.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, cursor is not None
+
+        next_cursor = previous_cursor = None
+        if items and has_next:
+            next_cursor = self._cursor_for(items[-1], reverse=False)
+        if items and has_previous:
+            previous_cursor = self._cursor_for(items[0], reverse=True)
+
+        return CursorPage(items, next_cursor, previous_cursor, page_size)
+
+    def _cursor_for(self, item: Model, reverse: bool) -> Cursor:
+        return Cursor(getattr(item, self.position_field), str(item.pk), reverse=reverse)
@@ -0,0 +1,190 @@
+# Python Imports
+import asyncio
+import random
+import time
+from typing import Callable, Dict, Optional
+
+# Third-Party Imports
+from asgiref.sync import sync_to_async
+
+# App Imports
+from .redis import get_redis
+from .resilience import CallRejectedError
+
+KEY_PREFIX = "rate_limit:"
+
+# KEYS: one hash per bucket. ARGV: for each bucket its capacity, refill rate per second
+# and cost. Either every bucket has room for its cost and all are charged, or none is
+# and the seconds until all would have room are returned. Amounts are passed and
+# returned as strings, Redis truncates Lua numbers to integers.
+ACQUIRE_SCRIPT = """
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local wait = 0
+local levels = {}
+
+for index, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[index * 3 - 2])
+    local rate = tonumber(ARGV[index * 3 - 1])
+    local cost = math.min(tonumber(ARGV[index * 3]), capacity)
+    local state = redis.call("HMGET", key, "level", "updated_at")
+    local level = tonumber(state[1]) or capacity
+    local updated_at = tonumber(state[2]) or now
+
+    level = math.min(capacity, level + math.max(0, now - updated_at) * rate)
+    levels[index] = level
+
+    if level < cost then
+        wait = math.max(wait, (cost - level) / rate)
+    end
+end
+
+if wait > 0 then
+    return tostring(wait)
+end
+
+for index, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[index * 3 - 2])
+    local rate = tonumber(ARGV[index * 3 - 1])
+    local cost = math.min(tonumber(ARGV[index * 3]), capacity)
+
+    redis.call("HSET", key, "level", tostring(levels[index] - cost), "updated_at", tostring(now))
+    redis.call("EXPIRE", key, math.ceil(capacity / rate) + 1)
+end
+
+return "0"
+"""
+
+# KEYS: the bucket hashes. ARGV: the penalty in seconds, then each bucket's capacity and
+# refill rate. Empties every bucket and puts it `penalty` seconds of refill in debt.
+PENALIZE_SCRIPT = """
+local time = redis.call("TIME")
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local penalty = tonumber(ARGV[1])
+
+for index, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[index * 2])
+    local rate = tonumber(ARGV[index * 2 + 1])
+
+    redis.call("HSET", key, "level", tostring(-penalty * rate), "updated_at", tostring(now))
+    redis.call("EXPIRE", key, math.ceil(capacity / rate + penalty) + 1)
+end
+
+return "0"
+"""
+
+
+class RateLimitTimeoutError(CallRejectedError):
+    """Raised when the rate limit leaves no room for a call within the maximum wait"""
+
+    reason = "rate_limit"
+
+
+class TokenBucketRateLimiter:
+    """
+    Rate limiter shared by every process of the cluster, with one token bucket per quota
+    kept in Redis (e.g. requests and tokens per minute of an API).
+
+    Each bucket holds up to a minute of its quota and refills continuously. A call
+    acquires its cost from every bucket at once in a Lua script, so concurrent workers
+    never overdraw a quota, and waits while any of them lacks room. A cost larger than a
+    bucket's capacity waits for a full bucket instead of waiting forever.
+
+    The async methods run the scripts and `on_throttle` in worker threads, so waiting on
+    Redis never blocks the event loop.
+
+    Args:
+        name (str): Name of the limited dependency, part of the Redis keys.
+        limits (Dict[str, float]): Quota per minute by bucket name, a bucket whose quota
+            is 0 is not limited.
+        max_wait (float): Seconds `acquire` waits for room before giving up.
+        on_throttle (Optional[Callable[[float], None]]): Called with the seconds a call
+            waited for room, when it had to.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        limits: Dict[str, float],
+        max_wait: float,
+        on_throttle: Optional[Callable[[float], None]] = None,
+    ) -> None:
+        self.name = name
+        self.limits = {bucket: limit for bucket, limit in limits.items() if limit > 0}
+        self.max_wait = max_wait
+        self.on_throttle = on_throttle
+
+        redis = get_redis()
+        self._acquire = redis.register_script(ACQUIRE_SCRIPT)
+        self._penalize = redis.register_script(PENALIZE_SCRIPT)
+
+    def key(self, bucket: str) -> str:
+        return f"{KEY_PREFIX}{self.name}:{bucket}"
+
+    def try_acquire(self, **costs: float) -> float:
+        """
+        Charge each bucket its cost if all of them have room.
+
+        Returns:
+            float: 0 when charged, otherwise the seconds until all buckets would have room.
+        """
+
+        buckets = [bucket for bucket in costs if bucket in self.limits]
+        if not buckets:
+            return 0.0
+
+        args = []
+        for bucket in buckets:
+            args += [self.limits[bucket], self.limits[bucket] / 60, costs[bucket]]
+
+        return float(self._acquire(keys=[self.key(bucket) for bucket in buckets], args=args))
+
+    async def acquire(self, **costs: float) -> float:
+        """
+        Wait until every bucket has room for its cost, then charge them.
+
+        Raises:
+            RateLimitTimeoutError: No room within `max_wait` seconds.
+
+        Returns:
+            float: The seconds waited.
+        """
+
+        started_at = time.monotonic()
+        throttled = False
+
+        try_acquire = sync_to_async(self.try_acquire, thread_sensitive=False)
+
+        while wait := await try_acquire(**costs):
+            throttled = True
+            if time.monotonic() - started_at + wait > self.max_wait:
+                raise RateLimitTimeoutError(
+                    f"No {self.name} rate limit room within {self.max_wait} seconds"
+                )
+
+            # Jittered so the waiting workers do not retry in lockstep
+            await asyncio.sleep(wait * random.uniform(1, 1.2))
+
+        waited = time.monotonic() - started_at if throttled else 0.0
+        if throttled and self.on_throttle:
+            await sync_to_async(self.on_throttle, thread_sensitive=False)(waited)
+
+        return waited
+
+    def penalize(self, seconds: float) -> None:
+        """
+        Empty every bucket so no call goes through for `seconds`, e.g. after the
+        dependency answered that a quota is exhausted anyway.
+        """
+
+        if not self.limits:
+            return
+
+        args = [seconds]
+        for bucket, limit in self.limits.items():
+            args += [limit, limit / 60]
+
+        self._penalize(keys=[self.key(bucket) for bucket in self.limits], args=args)
+
+    async def apenalize(self, seconds: float) -> None:
+        await sync_to_async(self.penalize, thread_sensitive=False)(seconds)
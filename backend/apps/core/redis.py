@@ -0,0 +1,15 @@
+# Python Imports
+from functools import cache
+
+# Django Imports
+from django.conf import settings
+
+# Third-Party Imports
+from redis import Redis
+
+
+@cache
+def get_redis() -> Redis:
+    """Return the process-wide Redis client configured by the `REDIS_URL` setting"""
+
+    return Redis.from_url(settings.REDIS_URL, decode_responses=True)
@@ -2,7 +2,7 @@
 from typing import Any, Optional
 
 # REST Framework Imports
-from rest_framework.renderers import JSONRenderer as DRFJSONRenderer
+from rest_framework.renderers import BaseRenderer, JSONRenderer as DRFJSONRenderer
 
 # App Imports
 from .responses import Response
@@ -26,6 +26,10 @@ class JSONRenderer(DRFJSONRenderer):
         else:
             wrapped_data["data"] = data
 
+        pagination = getattr(response, "pagination", None)
+        if pagination is not None:
+            wrapped_data["pagination"] = pagination
+
         if status_text == "SUCCESS" and status_code >= 500:
             status_text = "UNKNOWN_ERROR"
         elif status_text == "SUCCESS" and status_code >= 400:
@@ -34,3 +38,17 @@ class JSONRenderer(DRFJSONRenderer):
         wrapped_data["status_text"] = status_text
 
         return super().render(wrapped_data, accepted_media_type, renderer_context)
+
+
+class PrometheusTextRenderer(BaseRenderer):
+    media_type = "text/plain"
+    format = "txt"
+    charset = "utf-8"
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[dict] = None,
+    ) -> bytes:
+        return data.encode(self.charset) if isinstance(data, str) else str(data).encode()
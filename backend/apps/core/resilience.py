@@ -0,0 +1,208 @@
+# Python Imports
+import asyncio
+import math
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Optional
+
+
+class CallRejectedError(Exception):
+    """Raised when a call to a dependency is rejected without being attempted"""
+
+    reason: str = "rejected"
+
+
+class CircuitOpenError(CallRejectedError):
+    """Raised when a call is attempted while its circuit breaker is open"""
+
+    reason = "circuit_open"
+
+
+class ConcurrencyLimitError(CallRejectedError):
+    """Raised when no in-flight slot frees up within the acquire timeout"""
+
+    reason = "concurrency_limit"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker guarding calls to an unreliable dependency, shared by the whole process.
+
+    After `failure_threshold` consecutive failures the circuit opens and calls are rejected
+    with `CircuitOpenError` for `recovery_timeout` seconds. It then turns half-open and lets
+    up to `half_open_max_calls` probe calls through: a successful probe closes the circuit,
+    a failed one opens it again.
+
+    State is kept in memory behind a thread lock, so it works from any event loop or thread.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int,
+        recovery_timeout: float,
+        half_open_max_calls: int = 1,
+        on_state_change: Optional[Callable[[str], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.on_state_change = on_state_change
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def before_call(self) -> None:
+        """Reserve a call, raises CircuitOpenError when the circuit does not allow it"""
+
+        with self._lock:
+            state = self._current_state()
+
+            if state == self.OPEN:
+                raise CircuitOpenError("Circuit is open")
+
+            if state == self.HALF_OPEN:
+                if self._half_open_calls >= self.half_open_max_calls:
+                    raise CircuitOpenError("Circuit is half-open and already probing")
+
+                self._half_open_calls += 1
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            if self._current_state() != self.CLOSED:
+                self._set_state(self.CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            state = self._current_state()
+
+            if state == self.HALF_OPEN or (
+                state == self.CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._opened_at = self.clock()
+                self._set_state(self.OPEN)
+
+    def _current_state(self) -> str:
+        if self._state == self.OPEN and self.clock() - self._opened_at >= self.recovery_timeout:
+            self._set_state(self.HALF_OPEN)
+
+        return self._state
+
+    def _set_state(self, state: str) -> None:
+        self._state = state
+        self._half_open_calls = 0
+
+        if self.on_state_change:
+            self.on_state_change(state)
+
+
+class AIMDLimiter:
+    """
+    Adaptive limit of in-flight calls per process (additive increase, multiplicative
+    decrease), in the spirit of TCP congestion control.
+
+    Every successful call faster than `latency_target` seconds grows the limit by
+    `1 / limit` (about +1 per limit's worth of calls), every failed or slow call multiplies
+    it by `backoff_ratio`. The limit stays within [`min_limit`, `max_limit`].
+
+    Waiting for a slot polls instead of using asyncio primitives, so one limiter can be
+    shared by every event loop of the process.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int,
+        max_limit: int,
+        latency_target: float,
+        backoff_ratio: float = 0.5,
+        on_limit_change: Optional[Callable[[int], None]] = None,
+        poll_interval: float = 0.01,
+    ) -> None:
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.backoff_ratio = backoff_ratio
+        self.on_limit_change = on_limit_change
+        self.poll_interval = poll_interval
+
+        self._lock = threading.Lock()
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self._in_flight = 0
+
+    @property
+    def limit(self) -> int:
+        return math.floor(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @asynccontextmanager
+    async def slot(self, timeout: float) -> AsyncIterator[Callable[[bool], None]]:
+        """
+        Hold an in-flight slot for the duration of the block, waiting up to `timeout`
+        seconds for one, otherwise raise ConcurrencyLimitError.
+
+        Yields a `record(success)` callback: call it with the outcome of the call so the
+        limit can adapt, or with None when the call was not made. A block left by an
+        exception before recording counts as a failure.
+        """
+
+        deadline = time.monotonic() + timeout
+        while not self._try_acquire():
+            if time.monotonic() >= deadline:
+                raise ConcurrencyLimitError(f"{self.limit} calls already in flight")
+
+            await asyncio.sleep(self.poll_interval)
+
+        started_at = time.monotonic()
+        outcome: dict = {}
+
+        try:
+            yield lambda success: outcome.update(success=success)
+        except BaseException:
+            outcome.setdefault("success", False)
+            raise
+        finally:
+            self._release(outcome.get("success"), time.monotonic() - started_at)
+
+    def _try_acquire(self) -> bool:
+        with self._lock:
+            if self._in_flight >= self.limit:
+                return False
+
+            self._in_flight += 1
+            return True
+
+    def _release(self, success: Optional[bool], latency: float) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            previous = self.limit
+
+            if success is None:
+                return
+
+            if success and latency <= self.latency_target:
+                self._limit = min(self._limit + 1 / self._limit, self.max_limit)
+            else:
+                self._limit = max(self._limit * self.backoff_ratio, self.min_limit)
+
+            if self.on_limit_change and self.limit != previous:
+                self.on_limit_change(self.limit)
@@ -17,11 +17,14 @@ class Response(DRFResponse):
         template_name: Optional[str, None] = None,
         headers: Optional[dict] = None,
         content_type: Optional[str] = None,
+        pagination: Optional[dict] = None,
     ):
 
         if status_text:
             self._status_text = status_text
 
+        self._pagination = pagination
+
         super().__init__(
             data,
             status=status_code,
@@ -33,3 +36,7 @@ class Response(DRFResponse):
     @property
     def status_text(self):
         return self._status_text
+
+    @property
+    def pagination(self):
+        return self._pagination
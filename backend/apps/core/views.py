@@ -0,0 +1,33 @@
+# Django Imports
+from django.conf import settings
+
+# REST Framework Imports
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.views import APIView
+
+# App Imports
+from .metrics import registry
+from .renderers import PrometheusTextRenderer
+from .responses import Response
+
+
+class MetricsAPIView(APIView):
+    """Expose the cluster-wide metrics in the Prometheus text format"""
+
+    authentication_classes = []
+    permission_classes = []
+    renderer_classes = [PrometheusTextRenderer]
+
+    def get(self, request: Request) -> Response:
+        auth_header = request.headers.get("Authorization", "")
+
+        if (
+            not settings.METRICS_AUTH_TOKEN
+            or auth_header != f"Bearer {settings.METRICS_AUTH_TOKEN}"
+        ):
+            return Response(
+                data="Unauthorized to do this action", status_code=status.HTTP_403_FORBIDDEN
+            )
+
+        return Response(data=registry.render_prometheus())
@@ -0,0 +1,825 @@
+# Python Imports
+import asyncio
+import json
+import logging
+import time
+from functools import cache
+from itertools import count
+from typing import Any, Awaitable, Dict, List, Optional, Sequence, Tuple, Type
+
+# Django Imports
+from django.conf import settings
+
+# Third-Party Imports
+from asgiref.sync import sync_to_async
+from google.api_core.exceptions import ResourceExhausted, ServerError
+from langchain.messages import AnyMessage, HumanMessage, SystemMessage
+from langchain_core.exceptions import OutputParserException
+from langchain_core.runnables import Runnable
+from langchain_google_genai.chat_models import ChatGoogleGenerativeAI
+from pydantic import BaseModel, ValidationError
+
+# Project Imports
+from core.rate_limit import RateLimitTimeoutError, TokenBucketRateLimiter
+
+# App Imports
+from .constants import (
+    ANALYSIS_JOB_FIELDS,
+    DEFAULT_MODEL_TIER,
+    GEMINI_GENERATION_SETTINGS,
+    GEMINI_HEDGE_DELAY_TTL,
+    GEMINI_HEDGE_MIN_SAMPLES,
+    ScrapingJobEventChoices,
+    ScrapingJobStatusChoices,
+)
+from .events import apublish_job_status
+from .metrics import (
+    analysis_cache_requests,
+    gemini_calls_throttled,
+    gemini_hedged_calls,
+    gemini_map_reduce_chunks,
+    gemini_model_tier_call_seconds,
+    gemini_model_tier_calls,
+    gemini_prompt_tokens_saved,
+    gemini_rate_limit_wait_seconds,
+    gemini_report_generation_seconds,
+    gemini_report_generations,
+    gemini_report_repairs,
+    gemini_report_section_failures,
+)
+from .model_routing import aroute_job_model_tiers
+from .models import AnalysisCacheEntry, ScrapingJob, ScrapingJobEvent
+from .prompts.gemini import GeminiPrompt, gemini_prompt
+from .prompts.scraping_data import (
+    CompactScrapingData,
+    chunk_scraping_data,
+    compact_scraping_data,
+    dumps,
+)
+from .report_merge import merge_seo_reports
+from .report_repair import failing_sections, format_errors, repair_mechanically
+from .report_stream import ReportSectionPublisher
+from .schemas import SEO_REPORT_SECTIONS, SEOReportSchema
+from .utils import build_analysis_cache_key, estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+_rate_limiter: Optional[TokenBucketRateLimiter] = None
+
+# Tier -> (hedge delay, monotonic time it expires), see `aget_hedge_delay`
+_hedge_delays: Dict[str, Tuple[float, float]] = {}
+
+
+@cache
+def get_chat_model(tier: str = DEFAULT_MODEL_TIER) -> ChatGoogleGenerativeAI:
+    """
+    Return the Gemini chat model of a `GEMINI_MODEL_TIERS` tier, built once per process.
+
+    Its sync client is shared by every caller. Its async client is created on the first
+    `ainvoke` and bound to that event loop, only the long-lived loop of `AnalysisWorker`
+    awaits it (see `aanalyze_job`).
+    """
+
+    return ChatGoogleGenerativeAI(
+        model=settings.GEMINI_MODEL_TIERS[tier],
+        google_api_key=settings.GOOGLE_API_KEY,
+        # A single attempt, quota errors are retried cluster-wide by `ainvoke_analysis_model`
+        max_retries=1,
+        **GEMINI_GENERATION_SETTINGS,
+    )
+
+
+@cache
+def get_analysis_model(
+    schema: Type[BaseModel] = SEOReportSchema, tier: str = DEFAULT_MODEL_TIER
+) -> Runnable:
+    """
+    Return the Gemini chat model of a tier producing `schema` instances, `SEOReportSchema`
+    reports or one of the `SEO_REPORT_SECTIONS`. An output failing the schema raises
+    `OutputParserException`.
+    """
+
+    return get_chat_model(tier).with_structured_output(schema, method="json_mode")
+
+
+@cache
+def get_streaming_analysis_model(tier: str = DEFAULT_MODEL_TIER) -> Runnable:
+    """
+    Return the Gemini chat model of a tier generating `SEOReportSchema` reports, whose
+    `astream` yields the report parsed so far as a dict after each chunk of output. The
+    report is not validated, see `astream_report`.
+    """
+
+    return get_chat_model(tier).with_structured_output(
+        SEOReportSchema.model_json_schema(), method="json_mode"
+    )
+
+
+def get_gemini_rate_limiter() -> TokenBucketRateLimiter:
+    """Return the limiter of Gemini calls to the `GEMINI_*_PER_MINUTE` project quotas"""
+
+    global _rate_limiter
+
+    if _rate_limiter is None:
+
+        def on_throttle(waited: float) -> None:
+            gemini_calls_throttled.inc(reason="limiter")
+            gemini_rate_limit_wait_seconds.observe(waited)
+
+        _rate_limiter = TokenBucketRateLimiter(
+            "gemini",
+            {
+                "requests": settings.GEMINI_REQUESTS_PER_MINUTE,
+                "tokens": settings.GEMINI_TOKENS_PER_MINUTE,
+            },
+            max_wait=settings.GEMINI_RATE_LIMIT_MAX_WAIT,
+            on_throttle=on_throttle,
+        )
+
+    return _rate_limiter
+
+
+def reset_gemini_rate_limiter() -> None:
+    """Drop the rate limiter so it is rebuilt from the current settings and Redis client"""
+
+    global _rate_limiter
+    _rate_limiter = None
+
+
+def estimate_gemini_tokens(messages: List[AnyMessage]) -> int:
+    """Estimate the input tokens of a Gemini call without asking Gemini to count them"""
+
+    return sum(estimate_tokens(message.content) for message in messages)
+
+
+async def ainvoke_analysis_model(
+    messages: List[AnyMessage],
+    native_async: bool = False,
+    schema: Type[BaseModel] = SEOReportSchema,
+    tiers: Sequence[str] = (DEFAULT_MODEL_TIER,),
+    publisher: Optional[ReportSectionPublisher] = None,
+) -> BaseModel:
+    """
+    Call the analysis model producing `schema` on the first of `tiers` (see
+    `route_model_tiers`), falling back to the next one when a call times out or Gemini
+    answers with a 5xx. A `publisher` gets the sections of a report as they are generated,
+    see `ainvoke_model_tier`.
+
+    Raises:
+        ServerError | TimeoutError: The last tier failed too.
+        RateLimitTimeoutError: See `ainvoke_model_tier`.
+    """
+
+    for index, tier in enumerate(tiers):
+        try:
+            return await ainvoke_hedged(messages, native_async, schema, tiers[index:], publisher)
+        except (ServerError, TimeoutError) as e:
+            if index == len(tiers) - 1:
+                raise
+
+            logger.warning(
+                f"Gemini {tier} tier call failed ({type(e).__name__}), "
+                f"falling back to the {tiers[index + 1]} tier"
+            )
+
+
+async def aget_hedge_delay(tier: str) -> float:
+    """
+    Return the seconds a call to a tier runs before being hedged: the `GEMINI_HEDGE_PERCENTILE`
+    latency of its latest calls, read at most every `GEMINI_HEDGE_DELAY_TTL` seconds per
+    process, or `GEMINI_HEDGE_DEFAULT_DELAY` until `GEMINI_HEDGE_MIN_SAMPLES` calls were seen.
+    """
+
+    delay, expires_at = _hedge_delays.get(tier, (0.0, 0.0))
+    if expires_at > time.monotonic():
+        return delay
+
+    latency = await gemini_model_tier_call_seconds.aquantile(
+        settings.GEMINI_HEDGE_PERCENTILE, GEMINI_HEDGE_MIN_SAMPLES, tier=tier
+    )
+    delay = max(
+        settings.GEMINI_HEDGE_DEFAULT_DELAY if latency is None else latency,
+        settings.GEMINI_HEDGE_MIN_DELAY,
+    )
+    _hedge_delays[tier] = delay, time.monotonic() + GEMINI_HEDGE_DELAY_TTL
+    return delay
+
+
+def reset_hedge_delays() -> None:
+    """Drop the hedge delays so they are read again from the latest calls"""
+
+    _hedge_delays.clear()
+
+
+async def ainvoke_hedged(
+    messages: List[AnyMessage],
+    native_async: bool,
+    schema: Type[BaseModel],
+    tiers: Sequence[str],
+    publisher: Optional[ReportSectionPublisher] = None,
+) -> BaseModel:
+    """
+    Call the analysis model of the first of `tiers` and, with `GEMINI_HEDGING`, hedge the
+    call when it is still running after `aget_hedge_delay`: a second call is sent to the same
+    tier, or the next one with a "next" `GEMINI_HEDGE_TARGET`. The first valid output wins
+    and the other call is cancelled. A blocking call (not `native_async`) cannot be stopped,
+    its worker thread runs on but its output is dropped.
+
+    Only the first call streams its sections to the `publisher`. When the hedge wins, the
+    sections it sent are replaced with the hedge's, so no section of the losing call is left.
+
+    Raises:
+        Exception: What the first call raised, when the hedge failed too.
+    """
+
+    tier = tiers[0]
+    primary = asyncio.ensure_future(
+        ainvoke_model_tier(messages, native_async, schema, tier, publisher)
+    )
+    if not settings.GEMINI_HEDGING:
+        return await primary
+
+    try:
+        done, _ = await asyncio.wait({primary}, timeout=await aget_hedge_delay(tier))
+        if done:
+            return primary.result()
+
+        hedge_tier = tiers[1] if settings.GEMINI_HEDGE_TARGET == "next" and tiers[1:] else tier
+        logger.info(f"Gemini {tier} tier call is slow, hedging it on the {hedge_tier} tier")
+        hedge = asyncio.ensure_future(
+            ainvoke_model_tier(messages, native_async, schema, hedge_tier)
+        )
+        pending = {primary, hedge}
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # The primary first when both finished together
+                for task in sorted(done, key=lambda task: task is hedge):
+                    if task.exception() is None:
+                        if task is hedge and publisher is not None:
+                            # Stopped first so it sends no section after they are replaced
+                            primary.cancel()
+                            await publisher.areplace(task.result().model_dump(mode="json"))
+
+                        winner = "primary" if task is primary else "hedge"
+                        await gemini_hedged_calls.ainc(tier=tier, winner=winner)
+                        return task.result()
+
+            await gemini_hedged_calls.ainc(tier=tier, winner="none")
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if hedge.done() and not hedge.cancelled():
+                # Retrieved so a failed hedge is not logged as never retrieved
+                hedge.exception()
+    finally:
+        primary.cancel()
+
+
+async def ainvoke_model_tier(
+    messages: List[AnyMessage],
+    native_async: bool,
+    schema: Type[BaseModel],
+    tier: str,
+    publisher: Optional[ReportSectionPublisher] = None,
+) -> BaseModel:
+    """
+    Call the analysis model of a tier, with `ainvoke` on the caller's event loop when
+    `native_async`, otherwise with the blocking `invoke` in a worker thread. A call taking
+    more than `GEMINI_CALL_TIMEOUT` seconds is abandoned.
+
+    With a `publisher` and `native_async`, a report is streamed instead (see
+    `astream_report`) so its sections are published as they are generated.
+
+    The call first waits for room under the Gemini requests and tokens per minute quotas
+    (see `get_gemini_rate_limiter`). When Gemini answers that a quota is exhausted anyway,
+    every worker pauses for its retry delay (or `GEMINI_QUOTA_BACKOFF` seconds) and the
+    call is retried, up to `GEMINI_QUOTA_MAX_RETRIES` times.
+
+    The latency and outcome of every call are recorded per tier, to tune the routing.
+
+    Raises:
+        RateLimitTimeoutError: No room under the quotas within `GEMINI_RATE_LIMIT_MAX_WAIT`.
+        TimeoutError: The call took more than `GEMINI_CALL_TIMEOUT` seconds.
+    """
+
+    model = get_analysis_model(schema, tier)
+    limiter = get_gemini_rate_limiter()
+    tokens = estimate_gemini_tokens(messages)
+
+    for attempt in count():
+        try:
+            await limiter.acquire(requests=1, tokens=tokens)
+        except RateLimitTimeoutError:
+            await gemini_calls_throttled.ainc(reason="timeout")
+            raise
+
+        started_at = time.perf_counter()
+        outcome = "error"
+
+        try:
+            if native_async and publisher is not None:
+                call = astream_report(
+                    get_streaming_analysis_model(tier), messages, schema, publisher
+                )
+            elif native_async:
+                call = model.ainvoke(messages)
+            else:
+                call = sync_to_async(model.invoke, thread_sensitive=False)(messages)
+
+            output = await asyncio.wait_for(call, settings.GEMINI_CALL_TIMEOUT)
+            outcome = "success"
+            return output
+
+        except ResourceExhausted as e:
+            outcome = "quota_exhausted"
+            await gemini_calls_throttled.ainc(reason="quota_exhausted")
+            if attempt >= settings.GEMINI_QUOTA_MAX_RETRIES:
+                raise
+
+            retry_after = getattr(e, "retry_after", None) or settings.GEMINI_QUOTA_BACKOFF
+            logger.warning(f"Gemini quota exhausted, pausing Gemini calls for {retry_after}s")
+            await limiter.apenalize(retry_after)
+
+        except OutputParserException:
+            outcome = "invalid"
+            raise
+
+        except TimeoutError:
+            outcome = "timeout"
+            raise
+
+        except ServerError:
+            outcome = "server_error"
+            raise
+
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+
+        finally:
+            await gemini_model_tier_calls.ainc(tier=tier, outcome=outcome)
+            # A cancelled call lost a hedge, its latency would lower the hedge delay
+            if outcome != "cancelled":
+                await gemini_model_tier_call_seconds.aobserve(
+                    time.perf_counter() - started_at, tier=tier
+                )
+
+
+async def astream_report(
+    model: Runnable,
+    messages: List[AnyMessage],
+    schema: Type[BaseModel],
+    publisher: ReportSectionPublisher,
+) -> BaseModel:
+    """
+    Generate a report with a streaming model (see `get_streaming_analysis_model`), handing
+    each top-level section to `publisher` once the next one starts, then validate it against
+    `schema` like the structured output of `get_analysis_model`.
+
+    Raises:
+        OutputParserException: The report fails `schema`, its JSON as `llm_output`.
+    """
+
+    report = None
+    async for report in model.astream(messages):
+        if isinstance(report, dict):
+            await publisher.apublish({key: report[key] for key in list(report)[:-1]})
+
+    if not isinstance(report, dict):
+        raise OutputParserException(
+            f"Failed to parse {schema.__name__}, not a JSON object", llm_output=json.dumps(report)
+        )
+
+    await publisher.apublish(report)
+
+    try:
+        return schema.model_validate(report)
+    except ValidationError as e:
+        raise OutputParserException(
+            f"Failed to parse {schema.__name__}: {e}", llm_output=json.dumps(report)
+        ) from e
+
+
+async def ainvoke_report_model(
+    messages: List[AnyMessage],
+    scraping_data: str,
+    native_async: bool = False,
+    tiers: Sequence[str] = (DEFAULT_MODEL_TIER,),
+    publisher: Optional[ReportSectionPublisher] = None,
+) -> SEOReportSchema:
+    """
+    Generate a whole report with `ainvoke_analysis_model`, repairing an output failing
+    `SEOReportSchema` with `arepair_report` rather than failing at once.
+    """
+
+    try:
+        return await ainvoke_analysis_model(
+            messages, native_async, SEOReportSchema, tiers, publisher
+        )
+    except OutputParserException as e:
+        return await arepair_report(e, scraping_data, native_async, tiers)
+
+
+async def arepair_report(
+    error: OutputParserException,
+    scraping_data: str,
+    native_async: bool = False,
+    tiers: Sequence[str] = (DEFAULT_MODEL_TIER,),
+) -> SEOReportSchema:
+    """
+    Repair the output of a report that failed `SEOReportSchema`, as a cheaper alternative
+    to generating the whole report again.
+
+    What needs no model is fixed in place first (see `repair_mechanically`), e.g. lists over
+    their maximum length are cut to it. The sections still failing (see `SEO_REPORT_SECTIONS`)
+    are then generated again, at once, from the scraping data with their invalid output and
+    validation errors attached, up to `GEMINI_REPAIR_MAX_ATTEMPTS` rounds.
+
+    Args:
+        error (OutputParserException): The failure of the report, holding its output.
+        scraping_data (str): The scraping data the report was generated from.
+        native_async (bool): See `ainvoke_analysis_model`.
+        tiers (Sequence[str]): See `ainvoke_analysis_model`.
+
+    Raises:
+        OutputParserException: `error`, when the output is not a JSON object or still
+            fails after the last round.
+
+    Returns:
+        SEOReportSchema: The repaired report.
+    """
+
+    try:
+        report = json.loads(error.llm_output or "")
+    except ValueError:
+        report = None
+
+    if not isinstance(report, dict):
+        await gemini_report_repairs.ainc(outcome="failed")
+        raise error
+
+    system_prompt = gemini_prompt.build("SYSTEM")
+
+    async def regenerate(section: str, errors: list) -> dict:
+        keys = list(SEO_REPORT_SECTIONS[section].model_fields)
+        prompt = gemini_prompt.build(
+            "REPAIR",
+            scraping_data,
+            sections=keys,
+            report=dumps({key: report.get(key) for key in keys}),
+            errors=format_errors(errors),
+        )
+        messages = [SystemMessage(content=system_prompt), HumanMessage(content=prompt)]
+
+        try:
+            output = await ainvoke_analysis_model(
+                messages, native_async, SEO_REPORT_SECTIONS[section], tiers
+            )
+            return output.model_dump(mode="json")
+        except OutputParserException as e:
+            # Still invalid, the next round repairs what it can of it
+            try:
+                output = json.loads(e.llm_output or "")
+            except ValueError:
+                return {}
+
+            return (
+                {key: output[key] for key in keys if key in output}
+                if isinstance(output, dict)
+                else {}
+            )
+
+    errors = repair_mechanically(report)
+
+    for attempt in count(1):
+        if not errors:
+            await gemini_report_repairs.ainc(
+                outcome="mechanical" if attempt == 1 else "regenerated"
+            )
+            return SEOReportSchema.model_validate(report)
+
+        sections = failing_sections(errors)
+        if not sections or attempt > settings.GEMINI_REPAIR_MAX_ATTEMPTS:
+            await gemini_report_repairs.ainc(outcome="failed")
+            raise error
+
+        logger.warning(f"Generating invalid report sections again: {', '.join(sections)}")
+        outputs = await agather_or_cancel(
+            *(regenerate(section, section_errors) for section, section_errors in sections.items())
+        )
+        for output in outputs:
+            report.update(output)
+
+        errors = repair_mechanically(report)
+
+
+async def amap_reduce_analysis(
+    chunks: List[CompactScrapingData],
+    native_async: bool = False,
+    tiers: Sequence[str] = (DEFAULT_MODEL_TIER,),
+) -> SEOReportSchema:
+    """
+    Analyze scraping data too large for one prompt: each chunk (see `chunk_scraping_data`)
+    is analyzed on its own, up to `GEMINI_MAP_REDUCE_CONCURRENCY` at once, and the partial
+    reports are merged with `merge_seo_reports`.
+
+    Raises:
+        Whatever a chunk's analysis raised first, the other chunks are cancelled.
+    """
+
+    semaphore = asyncio.Semaphore(settings.GEMINI_MAP_REDUCE_CONCURRENCY)
+    system_prompt = gemini_prompt.build("SYSTEM")
+
+    async def analyze_chunk(chunk: CompactScrapingData) -> SEOReportSchema:
+        async with semaphore:
+            messages = [
+                SystemMessage(content=system_prompt),
+                HumanMessage(content=gemini_prompt.build("MAP", chunk.text)),
+            ]
+            return await ainvoke_report_model(messages, chunk.text, native_async, tiers)
+
+    reports = await agather_or_cancel(*map(analyze_chunk, chunks))
+
+    await gemini_map_reduce_chunks.aobserve(len(chunks))
+    return merge_seo_reports(reports)
+
+
+async def asectioned_analysis(
+    scraping_data: str,
+    native_async: bool = False,
+    tiers: Sequence[str] = (DEFAULT_MODEL_TIER,),
+    publisher: Optional[ReportSectionPublisher] = None,
+) -> SEOReportSchema:
+    """
+    Generate a report section by section: every section of `SEO_REPORT_SECTIONS` but the
+    summary is generated from the scraping data by its own call, all at once, then the
+    summary from those sections.
+
+    A report then takes as long as its slowest section rather than all of them, and an
+    output failing its section's schema only costs that section, which is generated again
+    up to `GEMINI_SECTION_MAX_ATTEMPTS` times. Each section is handed to `publisher` as
+    soon as it is valid.
+
+    Raises:
+        OutputParserException: A section still failing its schema after its last attempt.
+    """
+
+    system_prompt = gemini_prompt.build("SYSTEM")
+
+    async def generate(section: str, prompt: str) -> dict:
+        schema = SEO_REPORT_SECTIONS[section]
+        messages = [SystemMessage(content=system_prompt), HumanMessage(content=prompt)]
+
+        for attempt in range(1, settings.GEMINI_SECTION_MAX_ATTEMPTS + 1):
+            try:
+                output = await ainvoke_analysis_model(messages, native_async, schema, tiers)
+            except OutputParserException:
+                await gemini_report_section_failures.ainc(section=section)
+                if attempt == settings.GEMINI_SECTION_MAX_ATTEMPTS:
+                    raise
+
+                logger.warning(f"Generating the {section} report section again, invalid output")
+                continue
+
+            if publisher is not None:
+                await publisher.apublish(output.model_dump(mode="json"))
+            return output.model_dump(mode="json")
+
+    outputs = await agather_or_cancel(
+        *(
+            generate(
+                section,
+                gemini_prompt.build("SECTION", scraping_data, sections=list(schema.model_fields)),
+            )
+            for section, schema in SEO_REPORT_SECTIONS.items()
+            if section != "summary"
+        )
+    )
+    report = {key: value for output in outputs for key, value in output.items()}
+    summary = await generate("summary", gemini_prompt.build("SUMMARY", report=dumps(report)))
+
+    return SEOReportSchema.model_validate({**report, **summary})
+
+
+async def agather_or_cancel(*aws: Awaitable[Any]) -> List[Any]:
+    """Like `asyncio.gather`, but the first failure cancels the awaitables still running"""
+
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+async def agenerate_report(
+    mode: str,
+    analysis_prompt: str,
+    scraping_data: CompactScrapingData,
+    chunks: List[CompactScrapingData],
+    native_async: bool = False,
+    tiers: Sequence[str] = (DEFAULT_MODEL_TIER,),
+    publisher: Optional[ReportSectionPublisher] = None,
+) -> SEOReportSchema:
+    """
+    Generate the report of `aanalyze_job` with Gemini in the given mode: "single" in one
+    call on `analysis_prompt`, "sections" with `asectioned_analysis` or "map_reduce" with
+    `amap_reduce_analysis` on `chunks`. Its duration and outcome are recorded per mode.
+
+    Whole reports failing the schema, in the "single" and "map_reduce" modes, are repaired
+    with `arepair_report` before giving up.
+
+    A `publisher` gets the sections of a "single" or "sections" report as they are generated
+    and has sent them all once the report is returned.
+    """
+
+    started_at = time.perf_counter()
+    outcome = "error"
+
+    try:
+        if mode == "map_reduce":
+            seo_report = await amap_reduce_analysis(chunks, native_async, tiers)
+        elif mode == "sections":
+            seo_report = await asectioned_analysis(
+                scraping_data.text, native_async, tiers, publisher
+            )
+        else:
+            messages = [
+                SystemMessage(content=gemini_prompt.build("SYSTEM")),
+                HumanMessage(content=analysis_prompt),
+            ]
+            seo_report = await ainvoke_report_model(
+                messages, scraping_data.text, native_async, tiers, publisher
+            )
+
+        if publisher is not None:
+            await publisher.aclose()
+
+        outcome = "completed"
+        return seo_report
+
+    except (ValidationError, OutputParserException):
+        outcome = "invalid"
+        raise
+
+    finally:
+        if publisher is not None:
+            publisher.discard()
+        await gemini_report_generations.ainc(mode=mode, outcome=outcome)
+        await gemini_report_generation_seconds.aobserve(time.perf_counter() - started_at, mode=mode)
+
+
+async def aanalyze_job(job_id: str, native_async: bool = False) -> None:
+    """
+    Analyze scraped data for the given ScrapingJob using Gemini.
+
+    The job is expected to be ANALYZING already, whoever moved it there (webhook, retry or
+    a cached scrape) dispatched the analysis. The run reads the job once and writes it once
+    through `ScrapingJob.objects.acomplete_analysis` (or `set_job_to_failed`).
+
+    Scraping data larger than `GEMINI_MAP_REDUCE_THRESHOLD` estimated tokens, which one
+    prompt would have to trim, is analyzed in chunks instead (see `amap_reduce_analysis`).
+
+    Args:
+        job_id (str): The ID of the ScrapingJob whose scraped data should be analyzed.
+        native_async (bool): Await the model on the running event loop, see
+            `ainvoke_analysis_model`. Only for a loop that outlives the job.
+
+    Returns:
+        None
+    """
+
+    job: Optional[ScrapingJob] = (
+        await ScrapingJob.objects.filter(id=job_id).only(*ANALYSIS_JOB_FIELDS).afirst()
+    )
+
+    if not job:
+        logger.error(f"No ScrapingJob found for given ID: {job_id}")
+        return
+
+    if job.status != ScrapingJobStatusChoices.ANALYZING.value:
+        logger.warning(f"Skipping analysis of ScrapingJob {job_id} in status {job.status}")
+        return
+
+    await ScrapingJobEvent.objects.arecord(job.id, ScrapingJobEventChoices.ANALYSIS_STARTED.value)
+
+    analysis_prompt = None
+    failure_message = "Analyzing ScrapingJob has been failed"
+
+    try:
+        records = await sync_to_async(job.load_results, thread_sensitive=False)()
+        scraping_data = compact_scraping_data(records, settings.GEMINI_PROMPT_TOKEN_BUDGET)
+
+        if not scraping_data.answers:
+            error_message = "No scraping data available for scraping job${0}"
+
+            await ScrapingJob.objects.set_job_to_failed(job.id, error_message.format(""))
+
+            logger.error(error_message.format(f": {job.id}"))
+
+            await apublish_job_status(
+                job.user_id, job_id, ScrapingJobStatusChoices.FAILED.value, failure_message
+            )
+            return
+
+        await apublish_job_status(
+            job.user_id,
+            job_id,
+            ScrapingJobStatusChoices.ANALYZING.value,
+            "ScrapingJob Analysis has been started",
+        )
+
+        chunks: List[CompactScrapingData] = []
+        if 0 < settings.GEMINI_MAP_REDUCE_THRESHOLD < scraping_data.untrimmed_tokens:
+            chunks = chunk_scraping_data(records, settings.GEMINI_MAP_REDUCE_CHUNK_TOKENS)
+            logger.info(
+                f"Analyzing {scraping_data.untrimmed_tokens} tokens of scraping data of "
+                f"ScrapingJob {job_id} in {len(chunks)} chunks"
+            )
+            # The chunks' prompts, in order, key the cached merged report
+            analysis_prompt = "\n\n".join(
+                gemini_prompt.build("MAP", chunk.text) for chunk in chunks
+            )
+        else:
+            await gemini_prompt_tokens_saved.aobserve(scraping_data.tokens_saved)
+            logger.info(
+                f"Compacted scraping data of ScrapingJob {job_id} to {scraping_data.tokens} "
+                f"tokens, {scraping_data.tokens_saved} saved"
+            )
+            analysis_prompt = gemini_prompt.build("USER", scraping_data.text)
+
+        mode = "map_reduce" if chunks else settings.GEMINI_ANALYSIS_MODE
+        tiers = await aroute_job_model_tiers(
+            job.user_id, max(chunk.tokens for chunk in chunks) if chunks else scraping_data.tokens
+        )
+        logger.info(f"Analyzing ScrapingJob {job_id} with the Gemini {' > '.join(tiers)} tiers")
+        generation_settings = GEMINI_GENERATION_SETTINGS
+        if mode == "sections":
+            generation_settings = {**generation_settings, "analysis_mode": mode}
+
+        analysis_cache_key = build_analysis_cache_key(
+            GeminiPrompt.VERSION,
+            analysis_prompt,
+            # Keyed by the routed model, a fallback's report is cached under it too
+            settings.GEMINI_MODEL_TIERS[tiers[0]],
+            generation_settings,
+        )
+        cached_analysis = (
+            await AnalysisCacheEntry.objects.aget_fresh(analysis_cache_key)
+            if job.use_analysis_cache
+            else None
+        )
+
+        if cached_analysis:
+            await analysis_cache_requests.ainc(result="hit")
+            seo_report = cached_analysis.seo_report
+        else:
+            if job.use_analysis_cache:
+                await analysis_cache_requests.ainc(result="miss")
+
+            publisher = (
+                ReportSectionPublisher(job.user_id, job_id, mode)
+                if settings.REPORT_SECTION_EVENTS and mode != "map_reduce"
+                else None
+            )
+            seo_report = await agenerate_report(
+                mode, analysis_prompt, scraping_data, chunks, native_async, tiers, publisher
+            )
+
+            if job.use_analysis_cache:
+                await AnalysisCacheEntry.objects.astore(analysis_cache_key, seo_report)
+
+        if not await ScrapingJob.objects.acomplete_analysis(job.id, analysis_prompt, seo_report):
+            logger.warning(f"ScrapingJob {job_id} left ANALYZING before its analysis completed")
+            return
+
+        await apublish_job_status(
+            job.user_id,
+            job_id,
+            ScrapingJobStatusChoices.COMPLETED.value,
+            "ScrapingJob Analysis has been completed successfully",
+        )
+
+    except (ValidationError, OutputParserException) as e:
+        logger.error("SEO report's schema validation falied", extra={"errors": str(e)})
+
+        await ScrapingJob.objects.set_job_to_failed(
+            job_id, "SEO report's schema validation failed", analysis_prompt
+        )
+
+        await apublish_job_status(
+            job.user_id, job_id, ScrapingJobStatusChoices.FAILED.value, failure_message
+        )
+
+    except Exception as e:
+        await ScrapingJob.objects.set_job_to_failed(job_id, str(e), analysis_prompt)
+
+        logger.error(f"ScarpingJob {job_id} marked as failed due to analysis error")
+
+        await apublish_job_status(
+            job.user_id, job_id, ScrapingJobStatusChoices.FAILED.value, failure_message
+        )
@@ -0,0 +1,174 @@
+# Python Imports
+import asyncio
+import logging
+import os
+import socket
+from typing import Dict, List, Optional, Set, Tuple
+
+# Django Imports
+from django.conf import settings
+from django.db import close_old_connections
+
+# Third-Party Imports
+from asgiref.sync import sync_to_async
+from redis.exceptions import ResponseError
+
+# Project Imports
+from core.redis import get_redis
+
+# App Imports
+from .analysis import aanalyze_job
+
+logger = logging.getLogger(__name__)
+
+ANALYSIS_CONSUMER_GROUP = "analysis"
+
+
+def enqueue_analysis(job_id: str) -> str:
+    """
+    Append a job to the `ANALYSIS_STREAM` Redis stream, where `AnalysisWorker` picks it up.
+
+    Returns:
+        str: The ID of the stream entry.
+    """
+
+    return get_redis().xadd(
+        settings.ANALYSIS_STREAM,
+        {"job_id": str(job_id)},
+        maxlen=settings.ANALYSIS_STREAM_MAXLEN,
+        approximate=True,
+    )
+
+
+class AnalysisWorker:
+    """
+    Run the analyses enqueued by `enqueue_analysis` on one event loop, up to `concurrency`
+    at once, as a member of the `ANALYSIS_CONSUMER_GROUP` consumer group of the
+    `ANALYSIS_STREAM` Redis stream so several worker processes share the jobs.
+
+    Each analysis awaits Gemini with `ainvoke` (see `aanalyze_job`), so an in-flight
+    analysis costs a coroutine rather than a prefork process. A job is acknowledged once
+    analyzed. One whose worker crashed is claimed again after `ANALYSIS_RECLAIM_AFTER`
+    seconds, up to `ANALYSIS_MAX_DELIVERIES` attempts after which it is dropped with an
+    error log.
+    """
+
+    def __init__(self, name: Optional[str] = None, concurrency: Optional[int] = None) -> None:
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}"
+        self.concurrency = concurrency or settings.ANALYSIS_WORKER_CONCURRENCY
+        self.stream = settings.ANALYSIS_STREAM
+        # In-flight analyses by stream entry ID
+        self.tasks: Dict[str, asyncio.Task] = {}
+
+    def ensure_group(self) -> None:
+        try:
+            get_redis().xgroup_create(self.stream, ANALYSIS_CONSUMER_GROUP, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def run(self, block: int = 5000) -> None:
+        """Run analyses until interrupted, waiting up to `block` ms for new jobs"""
+
+        await sync_to_async(self.ensure_group, thread_sensitive=False)()
+        logger.info(f"Running up to {self.concurrency} analyses at once as {self.name}")
+
+        try:
+            while True:
+                await self.consume_once(block)
+                await sync_to_async(close_old_connections)()
+        finally:
+            await self.drain()
+
+    async def consume_once(self, block: Optional[int] = None) -> int:
+        """
+        Start analyzing the jobs due for a retry and the new ones, as many as there are
+        free slots, waiting up to `block` ms for new ones when there are none. Waits for
+        a slot to free up first when all are busy.
+
+        The Redis calls run in worker threads, so the analyses in flight go on while it
+        waits for new jobs.
+
+        Returns:
+            int: The number of analyses started.
+        """
+
+        if len(self.tasks) >= self.concurrency:
+            await asyncio.wait(self.tasks.values(), return_when=asyncio.FIRST_COMPLETED)
+
+        await sync_to_async(self.ensure_group, thread_sensitive=False)()
+        free_slots = self.concurrency - len(self.tasks)
+        entries = await sync_to_async(self._reclaim, thread_sensitive=False)(
+            free_slots, set(self.tasks)
+        )
+        if len(entries) < free_slots:
+            entries += await sync_to_async(self._read, thread_sensitive=False)(
+                free_slots - len(entries), block
+            )
+
+        for entry_id, fields in entries:
+            task = asyncio.create_task(self._analyze(entry_id, fields["job_id"]))
+            self.tasks[entry_id] = task
+            task.add_done_callback(lambda _, entry_id=entry_id: self.tasks.pop(entry_id, None))
+
+        return len(entries)
+
+    async def drain(self) -> None:
+        """Wait for the analyses in flight to finish"""
+
+        if self.tasks:
+            await asyncio.wait(self.tasks.values())
+
+    async def _analyze(self, entry_id: str, job_id: str) -> None:
+        try:
+            await aanalyze_job(job_id, native_async=True)
+        except Exception:
+            logger.exception(f"Failed to analyze ScrapingJob {job_id} of entry {entry_id}")
+            return
+
+        await sync_to_async(get_redis().xack, thread_sensitive=False)(
+            self.stream, ANALYSIS_CONSUMER_GROUP, entry_id
+        )
+
+    def _read(self, count: int, block: Optional[int]) -> List[Tuple[str, dict]]:
+        response = get_redis().xreadgroup(
+            ANALYSIS_CONSUMER_GROUP,
+            self.name,
+            {self.stream: ">"},
+            count=count,
+            block=block,
+        )
+
+        return [entry for _, entries in response or [] for entry in entries]
+
+    def _reclaim(self, count: int, in_flight: Set[str]) -> List[Tuple[str, dict]]:
+        redis = get_redis()
+        _, entries, _ = redis.xautoclaim(
+            self.stream,
+            ANALYSIS_CONSUMER_GROUP,
+            self.name,
+            min_idle_time=int(settings.ANALYSIS_RECLAIM_AFTER * 1000),
+            count=count,
+        )
+
+        retried = []
+        for entry_id, fields in entries:
+            # Still analyzed here, a long analysis goes idle for the consumer group
+            if entry_id in in_flight:
+                continue
+
+            [pending] = redis.xpending_range(
+                self.stream, ANALYSIS_CONSUMER_GROUP, min=entry_id, max=entry_id, count=1
+            )
+
+            if pending["times_delivered"] > settings.ANALYSIS_MAX_DELIVERIES:
+                logger.error(
+                    f"Dropping analysis of ScrapingJob {fields['job_id']} after "
+                    f"{settings.ANALYSIS_MAX_DELIVERIES} attempts"
+                )
+                redis.xack(self.stream, ANALYSIS_CONSUMER_GROUP, entry_id)
+                continue
+
+            retried.append((entry_id, fields))
+
+        return retried
@@ -0,0 +1,281 @@
+# Python Imports
+import asyncio
+import logging
+import os
+import socket
+import tempfile
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Literal, Optional
+
+# Django Imports
+from django.conf import settings
+
+# Third-Party Imports
+import httpx
+from asgiref.sync import sync_to_async
+
+# Project Imports
+from core.blob_store import CHUNK_SIZE, get_blob_store
+from core.resilience import AIMDLimiter, CallRejectedError, CircuitBreaker, CircuitOpenError
+
+# App Imports
+from .metrics import (
+    brightdata_calls_rejected,
+    brightdata_circuit_state,
+    brightdata_concurrency_limit,
+)
+
+logger = logging.getLogger(__name__)
+
+SnapshotStatus = Literal["running", "ready", "failed"]
+
+CIRCUIT_STATE_VALUES = {
+    CircuitBreaker.CLOSED: 0,
+    CircuitBreaker.HALF_OPEN: 1,
+    CircuitBreaker.OPEN: 2,
+}
+
+INSTANCE = f"{socket.gethostname()}:{os.getpid()}"
+
+
+class BrightDataAPIError(Exception):
+    """Raised when the BrightData API answers with an unexpected response"""
+
+
+# One pooled client per event loop, an httpx client must not be shared across loops.
+_http_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def build_brightdata_http_client(**kwargs) -> httpx.AsyncClient:
+    """
+    Build an HTTP client for the BrightData API with the connection pool limits, HTTP/2,
+    keep-alive and per-phase timeouts of the `BRIGHTDATA_HTTP_*` settings.
+    """
+
+    return httpx.AsyncClient(
+        http2=settings.BRIGHTDATA_HTTP2,
+        limits=httpx.Limits(
+            max_connections=settings.BRIGHTDATA_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.BRIGHTDATA_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.BRIGHTDATA_HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(
+            connect=settings.BRIGHTDATA_HTTP_CONNECT_TIMEOUT,
+            read=settings.BRIGHTDATA_HTTP_READ_TIMEOUT,
+            write=settings.BRIGHTDATA_HTTP_WRITE_TIMEOUT,
+            pool=settings.BRIGHTDATA_HTTP_POOL_TIMEOUT,
+        ),
+        headers={"Authorization": f"Bearer {settings.BRIGHTDATA_API_KEY}"},
+        **kwargs,
+    )
+
+
+def get_brightdata_http_client() -> httpx.AsyncClient:
+    """
+    Return the pooled BrightData HTTP client of the running event loop, so every request
+    of an ASGI process reuses the same warm connections. Close it on shutdown with
+    `aclose_brightdata_http_clients`.
+
+    Short-lived loops (e.g. `async_to_sync` in Celery workers) should use their own
+    `build_brightdata_http_client()` in an `async with` block instead.
+    """
+
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+
+    if client is None or client.is_closed:
+        client = _http_clients[loop] = build_brightdata_http_client()
+
+    return client
+
+
+async def aclose_brightdata_http_clients() -> None:
+    """Close the pooled BrightData HTTP client of the running event loop"""
+
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+_circuit_breaker: Optional[CircuitBreaker] = None
+_limiter: Optional[AIMDLimiter] = None
+
+
+def get_brightdata_circuit_breaker() -> CircuitBreaker:
+    """Return the process-wide circuit breaker of outbound BrightData calls"""
+
+    global _circuit_breaker
+
+    if _circuit_breaker is None:
+        _circuit_breaker = CircuitBreaker(
+            failure_threshold=settings.BRIGHTDATA_CIRCUIT_FAILURE_THRESHOLD,
+            recovery_timeout=settings.BRIGHTDATA_CIRCUIT_RECOVERY_TIMEOUT,
+            on_state_change=lambda state: brightdata_circuit_state.set(
+                CIRCUIT_STATE_VALUES[state], instance=INSTANCE
+            ),
+        )
+
+    return _circuit_breaker
+
+
+def get_brightdata_limiter() -> AIMDLimiter:
+    """Return the process-wide adaptive limit of in-flight BrightData calls"""
+
+    global _limiter
+
+    if _limiter is None:
+        _limiter = AIMDLimiter(
+            initial_limit=settings.BRIGHTDATA_CONCURRENCY_INITIAL_LIMIT,
+            min_limit=settings.BRIGHTDATA_CONCURRENCY_MIN_LIMIT,
+            max_limit=settings.BRIGHTDATA_CONCURRENCY_MAX_LIMIT,
+            latency_target=settings.BRIGHTDATA_CONCURRENCY_LATENCY_TARGET,
+            on_limit_change=lambda limit: brightdata_concurrency_limit.set(
+                limit, instance=INSTANCE
+            ),
+        )
+
+    return _limiter
+
+
+def reset_brightdata_resilience() -> None:
+    """Drop the circuit breaker and limiter so they are rebuilt from the current settings"""
+
+    global _circuit_breaker, _limiter
+    _circuit_breaker = _limiter = None
+
+
+@asynccontextmanager
+async def guard_brightdata_call() -> AsyncIterator[Callable[[bool], None]]:
+    """
+    Guard one outbound BrightData call with the process's circuit breaker and adaptive
+    concurrency limit. Rejected calls raise a `CallRejectedError` subclass without waiting
+    for BrightData: `CircuitOpenError` at once, `ConcurrencyLimitError` after at most
+    `BRIGHTDATA_CONCURRENCY_ACQUIRE_TIMEOUT` seconds.
+
+    Yields a `record(success)` callback for the outcome of the call. Only BrightData being
+    unhealthy (5xx, 429, timeouts, connection errors) is a failure, a block left by an
+    exception before recording counts as one and a block left without recording counts
+    as a success.
+
+        async with guard_brightdata_call() as record:
+            response = await client.post(url, json=payload)
+            record(response.status_code < 500)
+    """
+
+    breaker = get_brightdata_circuit_breaker()
+    outcome: dict = {}
+
+    try:
+        # Checked before waiting for a slot so an open circuit fails fast
+        if breaker.state == CircuitBreaker.OPEN:
+            raise CircuitOpenError("BrightData circuit is open")
+
+        async with get_brightdata_limiter().slot(
+            settings.BRIGHTDATA_CONCURRENCY_ACQUIRE_TIMEOUT
+        ) as record_slot:
+            try:
+                breaker.before_call()
+            except CircuitOpenError:
+                record_slot(None)
+                raise
+
+            try:
+                yield lambda success: outcome.update(success=success)
+            except BaseException:
+                outcome.setdefault("success", False)
+                raise
+            finally:
+                success = outcome.setdefault("success", True)
+                record_slot(success)
+
+                if success:
+                    breaker.record_success()
+                else:
+                    breaker.record_failure()
+
+    except CallRejectedError as e:
+        # Only rejections of this guard, a rejection raised by the call itself was recorded
+        if "success" not in outcome:
+            logger.warning(f"BrightData call rejected ({e.reason}): {e}")
+            await brightdata_calls_rejected.ainc(reason=e.reason)
+
+        raise
+
+
+def is_brightdata_healthy_response(response: httpx.Response) -> bool:
+    """Whether a response shows BrightData healthy, client errors other than 429 do"""
+
+    return response.status_code < 500 and response.status_code != httpx.codes.TOO_MANY_REQUESTS
+
+
+class BrightDataClient:
+    """
+    Minimal async client of the BrightData datasets API used in pull mode, i.e. to poll
+    a snapshot's progress and download it when its webhook never arrived.
+
+    Use it as an async context manager so the underlying connection pool is closed:
+
+        async with BrightDataClient() as client:
+            status = await client.get_snapshot_status(snapshot_id)
+    """
+
+    def __init__(self, base_url: Optional[str] = None) -> None:
+        self._client = build_brightdata_http_client(
+            base_url=base_url or settings.BRIGHTDATA_API_BASE_URL
+        )
+
+    async def __aenter__(self) -> BrightDataClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self._client.aclose()
+
+    async def get_snapshot_status(self, snapshot_id: str) -> SnapshotStatus:
+        """
+        Return the progress status of a snapshot ("running", "ready" or "failed").
+
+        Raises BrightDataAPIError for an unsuccessful response.
+        """
+
+        async with guard_brightdata_call() as record:
+            response = await self._client.get(f"/datasets/v3/progress/{snapshot_id}")
+            record(is_brightdata_healthy_response(response))
+
+        if not response.is_success:
+            raise BrightDataAPIError(f"HTTP {response.status_code}: {response.text}")
+
+        return response.json().get("status", "running")
+
+    async def download_snapshot(self, snapshot_id: str) -> str:
+        """
+        Download a ready snapshot's records (JSON) and store them in the blob store.
+
+        The body is streamed to a temporary file on disk and compressed from there, so the
+        snapshot is never held in memory as a whole.
+
+        Raises BrightDataAPIError when the snapshot is not ready or the download fails.
+
+        Returns:
+            str: The blob store key of the snapshot records.
+        """
+
+        with tempfile.TemporaryFile() as spool:
+            async with guard_brightdata_call() as record, self._client.stream(
+                "GET", f"/datasets/v3/snapshot/{snapshot_id}", params={"format": "json"}
+            ) as response:
+                record(is_brightdata_healthy_response(response))
+
+                if response.status_code != httpx.codes.OK:
+                    await response.aread()
+                    raise BrightDataAPIError(f"HTTP {response.status_code}: {response.text}")
+
+                async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                    spool.write(chunk)
+
+            spool.seek(0)
+            return await sync_to_async(get_blob_store().put_stream)(
+                iter(lambda: spool.read(CHUNK_SIZE), b"")
+            )
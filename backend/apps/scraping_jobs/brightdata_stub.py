@@ -0,0 +1,201 @@
+# Python Imports
+import json
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+from uuid import uuid4
+
+
+@dataclass
+class StubSnapshot:
+    records: List[Any]
+    ready_at: float = 0.0
+    failed: bool = False
+    downloads: int = field(default=0)
+
+    @property
+    def status(self) -> str:
+        if self.failed:
+            return "failed"
+
+        return "ready" if time.monotonic() >= self.ready_at else "running"
+
+
+class BrightDataStubServer(ThreadingHTTPServer):
+    """
+    Local stand-in for the BrightData datasets API, for tests and local development.
+
+    It implements the endpoints the app uses (trigger, progress and snapshot download)
+    with in-memory snapshots that become ready `ready_after` seconds after being
+    triggered. It never calls the webhook back, which is what the stalled job sweeper
+    has to recover from. Set `trigger_status` to make triggers fail like an unhealthy API.
+
+        server = BrightDataStubServer(api_key="key").start()
+        settings.BRIGHTDATA_API_BASE_URL = server.base_url
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        address: Tuple[str, int] = ("127.0.0.1", 0),
+        api_key: Optional[str] = None,
+        ready_after: float = 0.0,
+    ) -> None:
+        super().__init__(address, BrightDataStubRequestHandler)
+        self.api_key = api_key
+        self.ready_after = ready_after
+        self.snapshots: Dict[str, StubSnapshot] = {}
+        self.requests: List[Tuple[str, str]] = []
+        self.connections = 0
+        self.trigger_status = HTTPStatus.OK
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def add_snapshot(
+        self,
+        records: List[Any],
+        snapshot_id: Optional[str] = None,
+        ready_after: Optional[float] = None,
+        failed: bool = False,
+    ) -> str:
+        snapshot_id = snapshot_id or f"s_{uuid4().hex[:16]}"
+        ready_after = self.ready_after if ready_after is None else ready_after
+
+        with self.lock:
+            self.snapshots[snapshot_id] = StubSnapshot(
+                records=records, ready_at=time.monotonic() + ready_after, failed=failed
+            )
+
+        return snapshot_id
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        with self.lock:
+            self.connections += 1
+
+        super().process_request(request, client_address)
+
+    def start(self) -> BrightDataStubServer:
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def build_stub_records(inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Build Perplexity-like records answering the triggered inputs"""
+
+    timestamp = datetime.now(timezone.utc).isoformat()
+
+    return [
+        {
+            "url": item.get("url"),
+            "prompt": item.get("prompt"),
+            "answer_text": f"Stub answer for: {item.get('prompt')}",
+            "sources": [],
+            "citations": [],
+            "timestamp": timestamp,
+            "input": item,
+        }
+        for item in inputs
+    ]
+
+
+class BrightDataStubRequestHandler(BaseHTTPRequestHandler):
+    server: BrightDataStubServer
+
+    # Keep connections alive like the real API, responses always carry a Content-Length
+    protocol_version = "HTTP/1.1"
+
+    PROGRESS_PATH = re.compile(r"^/datasets/v3/progress/(?P<snapshot_id>[^/]+)$")
+    SNAPSHOT_PATH = re.compile(r"^/datasets/v3/snapshot/(?P<snapshot_id>[^/]+)$")
+
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length)
+
+        if not self._authorize("POST"):
+            return
+
+        if self.path_only != "/datasets/v3/trigger":
+            return self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+
+        if self.server.trigger_status != HTTPStatus.OK:
+            return self._send_json(self.server.trigger_status, {"error": "Stub trigger error"})
+
+        payload = json.loads(body or b"{}")
+        snapshot_id = self.server.add_snapshot(build_stub_records(payload.get("input", [])))
+
+        self._send_json(HTTPStatus.OK, {"snapshot_id": snapshot_id})
+
+    def do_GET(self) -> None:
+        if not self._authorize("GET"):
+            return
+
+        if match := self.PROGRESS_PATH.match(self.path_only):
+            snapshot = self._get_snapshot(match["snapshot_id"])
+            if snapshot:
+                self._send_json(
+                    HTTPStatus.OK, {"snapshot_id": match["snapshot_id"], "status": snapshot.status}
+                )
+
+        elif match := self.SNAPSHOT_PATH.match(self.path_only):
+            snapshot = self._get_snapshot(match["snapshot_id"])
+            if not snapshot:
+                return
+
+            if snapshot.status != "ready":
+                return self._send_json(HTTPStatus.ACCEPTED, {"status": "building"})
+
+            snapshot.downloads += 1
+            self._send_json(HTTPStatus.OK, snapshot.records)
+
+        else:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Not found"})
+
+    @property
+    def path_only(self) -> str:
+        return urlparse(self.path).path
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _authorize(self, method: str) -> bool:
+        with self.server.lock:
+            self.server.requests.append((method, self.path_only))
+
+        if self.server.api_key and (
+            self.headers.get("Authorization") != f"Bearer {self.server.api_key}"
+        ):
+            self._send_json(HTTPStatus.UNAUTHORIZED, {"error": "Unauthorized"})
+            return False
+
+        return True
+
+    def _get_snapshot(self, snapshot_id: str) -> Optional[StubSnapshot]:
+        snapshot = self.server.snapshots.get(snapshot_id)
+        if not snapshot:
+            self._send_json(HTTPStatus.NOT_FOUND, {"error": "Snapshot not found"})
+
+        return snapshot
+
+    def _send_json(self, status: HTTPStatus, data: Any) -> None:
+        body = json.dumps(data).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
@@ -8,3 +8,138 @@ class ScrapingJobStatusChoices(TextChoices):
     ANALYZING = "ANALYZING"
     COMPLETED = "COMPLETED"
     FAILED = "FAILED"
+
+
+class ScrapingJobEventChoices(TextChoices):
+    # A job entering one of the `ScrapingJobStatusChoices`
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    ANALYZING = "ANALYZING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+    # Milestones between status changes
+    TRIGGER_DEFERRED = "TRIGGER_DEFERRED"
+    WEBHOOK_RECEIVED = "WEBHOOK_RECEIVED"
+    ANALYSIS_ENQUEUED = "ANALYSIS_ENQUEUED"
+    ANALYSIS_STARTED = "ANALYSIS_STARTED"
+
+
+# Statuses of a job that is still being worked on, i.e. that can still fail
+ACTIVE_STATUSES = (
+    ScrapingJobStatusChoices.PENDING.value,
+    ScrapingJobStatusChoices.RUNNING.value,
+    ScrapingJobStatusChoices.ANALYZING.value,
+)
+
+# Statuses ending a job run, a retry starts a new run
+TERMINAL_STATUSES = (
+    ScrapingJobStatusChoices.COMPLETED.value,
+    ScrapingJobStatusChoices.FAILED.value,
+)
+
+# Phases of a job run as (phase, starting event, ending events). The "total" phase spans
+# from the first event of the run to its terminal status.
+JOB_PHASES = (
+    ("trigger", ScrapingJobEventChoices.PENDING.value, (ScrapingJobEventChoices.RUNNING.value,)),
+    (
+        "scraping",
+        ScrapingJobEventChoices.RUNNING.value,
+        (ScrapingJobEventChoices.WEBHOOK_RECEIVED.value,),
+    ),
+    (
+        "webhook",
+        ScrapingJobEventChoices.WEBHOOK_RECEIVED.value,
+        (ScrapingJobEventChoices.ANALYZING.value,),
+    ),
+    (
+        "queue",
+        ScrapingJobEventChoices.ANALYSIS_ENQUEUED.value,
+        (ScrapingJobEventChoices.ANALYSIS_STARTED.value,),
+    ),
+    ("analysis", ScrapingJobEventChoices.ANALYSIS_STARTED.value, TERMINAL_STATUSES),
+)
+
+# Columns needed to render a job in the user's jobs list. Heavy columns
+# (`results`, `seo_report`, `analysis_prompt`) are intentionally left out
+# so they are never loaded when listing jobs.
+SCRAPING_JOB_LIST_FIELDS = (
+    "id",
+    "user",
+    "original_prompt",
+    "snapshot_id",
+    "status",
+    "completed_at",
+    "created_at",
+)
+
+# Job fields exposed by the API, the storage and cache bookkeeping ones are left out
+SCRAPING_JOB_DETAIL_FIELDS = (
+    "id",
+    "user",
+    "original_prompt",
+    "analysis_prompt",
+    "snapshot_id",
+    "country_code",
+    "status",
+    "has_results",
+    "seo_report",
+    "error",
+    "completed_at",
+    "created_at",
+)
+
+# Jobs sent at most in the snapshot of a client resuming its jobs status websocket too late
+# to replay the events it missed, it fetches the jobs list when there are more
+JOB_EVENT_SNAPSHOT_MAX_JOBS = 100
+
+
+# Gemini generation settings of the analysis call, part of the analysis cache key.
+GEMINI_GENERATION_SETTINGS = {
+    "temperature": 0.7,
+}
+
+# Tier of `GEMINI_MODEL_TIERS` analyzing every job when model routing is off
+DEFAULT_MODEL_TIER = "pro"
+
+# Calls of a tier needed before its hedge delay follows their latency, and seconds it is
+# reused by a process before being read again
+GEMINI_HEDGE_MIN_SAMPLES = 50
+GEMINI_HEDGE_DELAY_TTL = 30.0
+
+# Rough characters per token of Gemini's tokenizer, to estimate a prompt's tokens locally
+GEMINI_CHARS_PER_TOKEN = 4
+
+# Query parameters dropped from source URLs before de-duplicating them, besides `utm_*`
+TRACKING_QUERY_PARAMS = ("gclid", "fbclid", "msclkid", "ref", "ref_src", "srsltid")
+
+# List limits of `SEOReportSchema`, also kept when merging the partial reports of a
+# map-reduce analysis. Summary lists are not limited by the schema, the prompt asks for a
+# top 5.
+SEO_REPORT_MAX_COMPETITORS = 15
+SEO_REPORT_MAX_RECOMMENDATIONS = 25
+SEO_REPORT_MAX_CONTENT_KEYWORDS = 25
+SEO_REPORT_MAX_KEYWORD_THEMES = 8
+SEO_REPORT_MAX_THEME_KEYWORDS = 8
+SEO_REPORT_MAX_SUMMARY_ITEMS = 5
+
+# Columns the analysis task reads, the job is loaded once per analysis run.
+ANALYSIS_JOB_FIELDS = (
+    "id",
+    "user",
+    "status",
+    "results",
+    "results_blob_key",
+    "use_analysis_cache",
+)
+
+# Columns needed to feed BrightData results into a job's analysis.
+INGEST_JOB_FIELDS = (
+    "id",
+    "user",
+    "status",
+    "snapshot_id",
+    "scrape_cache_key",
+    "batch_id",
+    "batch_index",
+)
@@ -1,8 +1,10 @@
 # Python Imports
 import json
-from typing import Literal, Optional, TypedDict
+from typing import Any, Dict, List, Literal, NotRequired, Optional, TypedDict
+from urllib.parse import parse_qs
 
 # Third-Party Imports
+from asgiref.sync import sync_to_async
 from channels.generic.websocket import AsyncWebsocketConsumer
 
 # Project Imports
@@ -10,6 +12,9 @@ from authentication.models import User
 
 # App Imports
 from .constants import ScrapingJobStatusChoices
+from .event_log import event_id_time, parse_event_id, read_job_events
+from .metrics import job_event_resumes
+from .models import ScrapingJob
 
 
 class ScrapingJoStatusData(TypedDict):
@@ -19,15 +24,67 @@ class ScrapingJoStatusData(TypedDict):
 
 class ScrapingJoStatus(TypedDict):
     type: Literal["connection", "job_status_update"]
+    id: NotRequired[Optional[str]]
     data: Optional[ScrapingJoStatusData]
     message: Optional[str]
 
 
+class ScrapingJobReportSectionData(TypedDict):
+    job_id: str
+    schema_version: int
+    sections: Dict[str, Any]
+
+
+class ScrapingJobReportSection(TypedDict):
+    type: Literal["job_report_section"]
+    id: NotRequired[Optional[str]]
+    data: ScrapingJobReportSectionData
+
+
+class ScrapingJobsSnapshotData(TypedDict):
+    jobs: List[ScrapingJoStatusData]
+    complete: bool
+
+
+class ScrapingJobsSnapshot(TypedDict):
+    type: Literal["jobs_snapshot"]
+    id: Optional[str]
+    data: ScrapingJobsSnapshotData
+
+
 class ScrapingJobsStatusWebsocketConsumer(AsyncWebsocketConsumer):
+    """
+    Send a user the events of their jobs, one JSON object per message:
+
+    - `connection`: once, when the socket is accepted, with a `message`.
+    - `job_status_update`: the job `data.job_id` entered `data.status`.
+    - `job_report_section`: top-level sections of the SEO report of an ANALYZING job are
+      ready before it completes. `data.sections` maps `SEOReportSchema` keys (`meta`,
+      `keywords`, `competitors`...) to their JSON value, valid against the report schema of
+      `data.schema_version`. A key is sent once per analysis run, again only when the
+      Gemini call it came from lost to a hedge (see `ainvoke_hedged`), so a later value of a
+      key replaces the earlier one. Sections ready close together come in one event (see
+      `ReportSectionPublisher`).
+    - `jobs_snapshot`: see below.
+
+    Report sections are a preview: cached and map-reduce analyses send none, neither do single
+    call analyses run by Celery (see `ainvoke_model_tier`), and the report of the job once its
+    `COMPLETED` status is sent is the one to keep.
+
+    Job events carry the `id` of the event in the user's event log (see `append_job_event`),
+    None when it could not be logged. A client reconnecting with `?last_event_id=<id>` gets
+    the events it missed since, right after `connection`. When the log no longer holds them
+    all (the client was away too long), it gets a `jobs_snapshot` instead: `data.jobs` lists
+    the `job_id` and `status` of the jobs in progress or changed since, newest first, and
+    `data.complete` is false when there were too many to list and the jobs list should be
+    fetched again. Either way, events then resume after the `id` of the last one sent.
+    """
 
     async def connect(self) -> None:
         user: User = self.scope["user"]
         self.room_group_name = f"user_{user.id}_jobs_status"
+        # Live events up to this ID were already replayed
+        self.replayed_up_to: Optional[str] = None
 
         await self.channel_layer.group_add(self.room_group_name, self.channel_name)
 
@@ -39,15 +96,67 @@ class ScrapingJobsStatusWebsocketConsumer(AsyncWebsocketConsumer):
         }
         await self.send(text_data=json.dumps(event_data))
 
-    async def disconnect(self):
+        query = parse_qs(self.scope.get("query_string", b"").decode("utf-8"))
+        last_event_id = query.get("last_event_id")
+        if last_event_id:
+            await self.resume(user, last_event_id[0])
+
+    async def disconnect(self, code: int) -> None:
         await self.channel_layer.group_discard(self.room_group_name, self.channel_name)
 
-    async def job_update(self, event: ScrapingJoStatus):
-        event_data: ScrapingJoStatus = {
+    async def resume(self, user: User, last_event_id: str) -> None:
+        """
+        Send the events after `last_event_id`, or a snapshot of the user's jobs when they
+        cannot be replayed. Joining the group first, no event falls between the two.
+        """
+
+        events, self.replayed_up_to = await sync_to_async(read_job_events, thread_sensitive=False)(
+            user.id, last_event_id
+        )
+
+        if events is not None:
+            await job_event_resumes.ainc(outcome="replayed")
+            for event in events:
+                await self.send(json.dumps(self.format_event(event)))
+            return
+
+        await job_event_resumes.ainc(outcome="snapshot")
+        jobs, complete = await ScrapingJob.objects.aget_jobs_snapshot(
+            user.id, event_id_time(last_event_id)
+        )
+        event_data: ScrapingJobsSnapshot = {
+            "type": "jobs_snapshot",
+            "id": self.replayed_up_to,
+            "data": {"jobs": jobs, "complete": complete},
+        }
+        await self.send(json.dumps(event_data))
+
+    def is_replayed(self, event: Dict[str, Any]) -> bool:
+        if not self.replayed_up_to or not event.get("id"):
+            return False
+
+        event_id, replayed_up_to = parse_event_id(event["id"]), parse_event_id(self.replayed_up_to)
+        return event_id is not None and replayed_up_to is not None and event_id <= replayed_up_to
+
+    def format_event(
+        self, event: ScrapingJoStatus | ScrapingJobReportSection
+    ) -> ScrapingJoStatus | ScrapingJobReportSection:
+        if event["type"] == "job_report_section":
+            return {"type": "job_report_section", "id": event.get("id"), "data": event["data"]}
+
+        return {
             "type": "job_status_update",
+            "id": event.get("id"),
             "data": {
                 "job_id": event["data"]["job_id"],
                 "status": event["data"]["status"],
             },
         }
-        await self.send(json.dumps(event_data))
+
+    async def job_status_update(self, event: ScrapingJoStatus):
+        if not self.is_replayed(event):
+            await self.send(json.dumps(self.format_event(event)))
+
+    async def job_report_section(self, event: ScrapingJobReportSection):
+        if not self.is_replayed(event):
+            await self.send(json.dumps(self.format_event(event)))
@@ -0,0 +1,101 @@
+# Python Imports
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+# Django Imports
+from django.conf import settings
+
+# Third-Party Imports
+from redis.exceptions import RedisError
+
+# Project Imports
+from core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+def job_event_log_key(user_id: int) -> str:
+    return f"jobs_events:{user_id}"
+
+
+def parse_event_id(event_id: str) -> Optional[Tuple[int, int]]:
+    """Return a Redis stream ID (`<ms>-<seq>`) as comparable numbers, None when invalid"""
+
+    milliseconds, _, sequence = event_id.partition("-")
+    try:
+        return int(milliseconds), int(sequence or 0)
+    except ValueError:
+        return None
+
+
+def event_id_time(event_id: str) -> Optional[datetime]:
+    """Return when the event of a Redis stream ID was logged, None when the ID is invalid"""
+
+    parsed = parse_event_id(event_id)
+    if parsed is None:
+        return None
+
+    return datetime.fromtimestamp(parsed[0] / 1000, tz=timezone.utc)
+
+
+def append_job_event(user_id: int, event: Dict[str, Any]) -> Optional[str]:
+    """
+    Append an event sent to a user's jobs status websocket group to their event log: a Redis
+    stream of about their last `JOB_EVENT_LOG_MAXLEN` events, dropped after
+    `JOB_EVENT_LOG_TTL` seconds without a new one.
+
+    Returns:
+        Optional[str]: The ID of the event in the log, None when Redis is unavailable.
+    """
+
+    key = job_event_log_key(user_id)
+    try:
+        pipeline = get_redis().pipeline(transaction=False)
+        pipeline.xadd(
+            key,
+            {"event": json.dumps(event)},
+            maxlen=settings.JOB_EVENT_LOG_MAXLEN,
+            approximate=True,
+        )
+        pipeline.expire(key, settings.JOB_EVENT_LOG_TTL)
+        event_id, _ = pipeline.execute()
+    except RedisError as e:
+        logger.warning(f"Failed to log job event of user {user_id}: {e}")
+        return None
+
+    return event_id
+
+
+def read_job_events(
+    user_id: int, last_event_id: str
+) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+    """
+    Read the events of a user's event log after `last_event_id`, for a client resuming its
+    jobs status websocket.
+
+    Returns:
+        Tuple[Optional[List[Dict[str, Any]]], Optional[str]]: The events after
+            `last_event_id` with their `id`, or None when the log cannot tell which were
+            missed (the ID is invalid, or events after it were trimmed or expired), and the
+            ID of the last event in the log.
+    """
+
+    key = job_event_log_key(user_id)
+    after = parse_event_id(last_event_id)
+    redis = get_redis()
+
+    try:
+        latest = redis.xrevrange(key, count=1)
+        first = redis.xrange(key, count=1)
+        if after is None or not first or parse_event_id(first[0][0]) > after:
+            return None, latest[0][0] if latest else None
+
+        entries = redis.xrange(key, min=f"({last_event_id}")
+    except RedisError as e:
+        logger.warning(f"Failed to read job events of user {user_id}: {e}")
+        return None, None
+
+    events = [{**json.loads(fields["event"]), "id": entry_id} for entry_id, fields in entries]
+    return events, entries[-1][0] if entries else last_event_id
@@ -0,0 +1,65 @@
+# Python Imports
+from typing import Any, Dict
+
+# Third-Party Imports
+from asgiref.sync import async_to_sync, sync_to_async
+from channels.layers import get_channel_layer
+
+# App Imports
+from .consumers import ScrapingJobReportSection, ScrapingJoStatus
+from .event_log import append_job_event
+from .schemas import SEO_REPORT_SCHEMA_VERSION
+
+channel_layer = get_channel_layer()
+
+
+async def apublish_job_event(
+    user_id: int, event: ScrapingJoStatus | ScrapingJobReportSection
+) -> None:
+    """
+    Log an event to the user's event log (see `append_job_event`) and send it to their jobs
+    status websocket group with its ID, so a reconnecting client can resume after it.
+    """
+
+    event_id = await sync_to_async(append_job_event, thread_sensitive=False)(user_id, event)
+    await channel_layer.group_send(f"user_{user_id}_jobs_status", {**event, "id": event_id})
+
+
+def build_job_status_event(job_id: str, status: str, message: str) -> ScrapingJoStatus:
+    return {
+        "type": "job_status_update",
+        "data": {
+            "status": status,
+            "job_id": str(job_id),
+        },
+        "message": message,
+    }
+
+
+async def apublish_job_status(user_id: int, job_id: str, status: str, message: str) -> None:
+    """Notify the user's jobs status websocket group about a job status change"""
+
+    await apublish_job_event(user_id, build_job_status_event(job_id, status, message))
+
+
+def publish_job_status(user_id: int, job_id: str, status: str, message: str) -> None:
+    """Sync version of `apublish_job_status`"""
+
+    async_to_sync(apublish_job_status)(user_id, job_id, status, message)
+
+
+def build_report_section_event(job_id: str, sections: Dict[str, Any]) -> ScrapingJobReportSection:
+    return {
+        "type": "job_report_section",
+        "data": {
+            "job_id": str(job_id),
+            "schema_version": SEO_REPORT_SCHEMA_VERSION,
+            "sections": sections,
+        },
+    }
+
+
+async def apublish_report_sections(user_id: int, job_id: str, sections: Dict[str, Any]) -> None:
+    """Send the user's jobs status websocket group sections of a job's report being generated"""
+
+    await apublish_job_event(user_id, build_report_section_event(job_id, sections))
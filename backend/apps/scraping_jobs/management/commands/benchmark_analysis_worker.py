@@ -0,0 +1,143 @@
+# Python Imports
+import asyncio
+import resource
+import time
+from typing import Any, List
+
+# Django Imports
+from django.core.management.base import BaseCommand, CommandParser
+
+# Project Imports
+from authentication.models import User
+
+# App Imports
+from ... import analysis
+from ...analysis_queue import AnalysisWorker, enqueue_analysis
+from ...constants import ScrapingJobStatusChoices
+from ...models import ScrapingJob
+from ...schemas import SEOReportSchema
+from ...tasks import analyze_scraped_data
+
+STUB_SEO_REPORT = {
+    "meta": {
+        "entity_name": "Benchmark entity",
+        "entity_type": "business",
+        "analysis_date": "2025-01-01",
+        "data_sources_count": 1,
+        "confidence_score": 0.5,
+    },
+    "inventory": {"total_sources": 1, "unique_domains": ["example.com"], "date_range": {}},
+    "content_analysis": {"content_themes": [], "sentiment": {"overall": "neutral"}},
+    "keywords": {"content_keywords": [], "keyword_themes": []},
+    "competitors": [],
+    "social_presence": {"platforms": []},
+    "backlink_analysis": {"total_backlinks": 0, "referring_domains": 0, "backlink_sources": []},
+    "recommendations": [],
+    "summary": None,
+}
+
+
+class StubAnalysisModel:
+    """Stands in for the Gemini model, answering after a fixed latency"""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    def invoke(self, messages: List[Any]) -> SEOReportSchema:
+        time.sleep(self.latency)
+        return SEOReportSchema.model_validate(STUB_SEO_REPORT)
+
+    async def ainvoke(self, messages: List[Any]) -> SEOReportSchema:
+        await asyncio.sleep(self.latency)
+        return SEOReportSchema.model_validate(STUB_SEO_REPORT)
+
+
+def peak_rss_gb() -> float:
+    # ru_maxrss is in kilobytes on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 / 1024
+
+
+class Command(BaseCommand):
+    help = """
+    Benchmark analysis throughput per GB of worker memory against a stub Gemini model
+    answering after --latency seconds: the prefork `analyze_scraped_data` task, which
+    holds one process per in-flight analysis, against `AnalysisWorker` running
+    --concurrency analyses on one event loop.
+
+    Prefork throughput per GB is measured on one process and holds for any number of
+    them, each adds its own memory. Uses the configured database and Redis, stop other
+    analysis workers while it runs. A temporary user and its jobs are created and
+    deleted afterwards.
+    """
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--jobs", type=int, default=200, help="Analyses run by the worker")
+        parser.add_argument(
+            "--prefork-jobs", type=int, default=5, help="Analyses run by the prefork task"
+        )
+        parser.add_argument("--concurrency", type=int, default=50, help="Worker concurrency")
+        parser.add_argument("--latency", type=float, default=1.0, help="Stub model latency (s)")
+
+    def handle(self, *args: tuple, **options: dict) -> None:
+        user = User.objects.create(email="benchmark-analysis@elevate-seo.local")
+        get_analysis_model = analysis.get_analysis_model
+        analysis.get_analysis_model = lambda schema, tier: StubAnalysisModel(options["latency"])
+
+        self.stdout.write(
+            f"{'mode':<8} {'in flight':>10} {'jobs/s':>8} {'peak RSS (MB)':>14} {'jobs/s/GB':>10}"
+        )
+
+        try:
+            jobs = self._create_jobs(user, options["prefork_jobs"])
+            started_at = time.perf_counter()
+            for job in jobs:
+                analyze_scraped_data.run(str(job.id))
+            self._report("prefork", 1, len(jobs), time.perf_counter() - started_at)
+
+            jobs = self._create_jobs(user, options["jobs"])
+            for job in jobs:
+                enqueue_analysis(job.id)
+            elapsed = asyncio.run(self._drain(options["concurrency"], len(jobs)))
+            self._report("async", options["concurrency"], len(jobs), elapsed)
+
+            completed = ScrapingJob.objects.filter(
+                user=user, status=ScrapingJobStatusChoices.COMPLETED.value
+            ).count()
+            self.stdout.write(f"completed {completed} jobs")
+        finally:
+            analysis.get_analysis_model = get_analysis_model
+            user.delete()
+
+    def _report(self, mode: str, in_flight: int, count: int, elapsed: float) -> None:
+        throughput = count / elapsed
+        rss = peak_rss_gb()
+
+        self.stdout.write(
+            f"{mode:<8} {in_flight:>10} {throughput:>8.2f} {rss * 1024:>14.1f} "
+            f"{throughput / rss:>10.2f}"
+        )
+
+    def _create_jobs(self, user: User, count: int) -> List[ScrapingJob]:
+        return ScrapingJob.objects.bulk_create(
+            [
+                ScrapingJob(
+                    user=user,
+                    original_prompt=f"Benchmark entity {index}",
+                    status=ScrapingJobStatusChoices.ANALYZING.value,
+                    results=[{"answer_text": f"Benchmark answer {index}", "sources": []}],
+                    use_analysis_cache=False,
+                )
+                for index in range(count)
+            ],
+            batch_size=200,
+        )
+
+    async def _drain(self, concurrency: int, count: int) -> float:
+        worker = AnalysisWorker(name="benchmark", concurrency=concurrency)
+        started, started_at = 0, time.perf_counter()
+
+        while started < count:
+            started += await worker.consume_once(block=1000)
+        await worker.drain()
+
+        return time.perf_counter() - started_at
@@ -0,0 +1,108 @@
+# Python Imports
+import asyncio
+import statistics
+import time
+from typing import List, Optional
+
+# Django Imports
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+# Third-Party Imports
+import httpx
+
+# Project Imports
+from core.metrics import nearest_rank
+
+# App Imports
+from ...brightdata import build_brightdata_http_client
+from ...brightdata_stub import BrightDataStubServer
+from ...services.scraping_job_service import ScrapingJobService, build_brightdata_input
+
+
+class Command(BaseCommand):
+    help = """
+    Benchmark BrightData trigger latency and throughput with a new HTTP client per trigger
+    (the previous behaviour) against the pooled keep-alive client. Runs against an
+    in-process BrightData stand-in unless --base-url is given. A local plain-HTTP stand-in
+    does not include DNS and TLS setup, so gains against the real API are larger.
+    """
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--requests", type=int, default=500, help="Triggers per mode")
+        parser.add_argument(
+            "--concurrency", type=int, default=20, help="Triggers in flight at once"
+        )
+        parser.add_argument(
+            "--base-url",
+            default=None,
+            help="BrightData (stand-in) API base URL, defaults to an in-process stand-in",
+        )
+
+    def handle(self, *args: tuple, **options: dict) -> None:
+        base_url: Optional[str] = options["base_url"]
+        server = None
+
+        if not base_url:
+            server = BrightDataStubServer(api_key=settings.BRIGHTDATA_API_KEY).start()
+            base_url = server.base_url
+
+        settings.BRIGHTDATA_API_BASE_URL = base_url
+
+        self.stdout.write(
+            f"{'mode':<12} {'req/s':>8} {'p50 (ms)':>10} {'p95 (ms)':>10} "
+            f"{'p99 (ms)':>10} {'connections':>12}"
+        )
+
+        try:
+            for mode in ("per-request", "pooled"):
+                connections_before = server.connections if server else 0
+                elapsed, timings = asyncio.run(
+                    self._run(mode, options["requests"], options["concurrency"])
+                )
+                connections = server.connections - connections_before if server else "n/a"
+
+                timings.sort()
+                self.stdout.write(
+                    f"{mode:<12} {len(timings) / elapsed:>8.1f} "
+                    f"{statistics.median(timings):>10.2f} "
+                    f"{nearest_rank(timings, 0.95):>10.2f} "
+                    f"{nearest_rank(timings, 0.99):>10.2f} {connections:>12}"
+                )
+        finally:
+            if server:
+                server.stop()
+
+    async def _run(self, mode: str, requests: int, concurrency: int) -> tuple:
+        semaphore = asyncio.Semaphore(concurrency)
+        timings: List[float] = []
+
+        async with build_brightdata_http_client() as pooled_client:
+
+            async def trigger(index: int) -> None:
+                async with semaphore:
+                    started_at = time.perf_counter()
+
+                    if mode == "pooled":
+                        await self._trigger(index, pooled_client)
+                    else:
+                        async with build_brightdata_http_client() as client:
+                            await self._trigger(index, client)
+
+                    timings.append((time.perf_counter() - started_at) * 1000)
+
+            started_at = time.perf_counter()
+            await asyncio.gather(*(trigger(index) for index in range(requests)))
+            elapsed = time.perf_counter() - started_at
+
+        return elapsed, timings
+
+    async def _trigger(self, index: int, client: httpx.AsyncClient) -> None:
+        result = await ScrapingJobService.trigger_brightdata_scraping(
+            [build_brightdata_input(f"Benchmark entity {index}", "US", 1)],
+            {"job-id": f"benchmark-{index}"},
+            http_client=client,
+        )
+
+        if not result.get("snapshot_id"):
+            raise RuntimeError(f"Trigger failed: {result.get('message')}")
@@ -0,0 +1,119 @@
+# Python Imports
+import asyncio
+import random
+import time
+from typing import Any, List, Type
+
+# Django Imports
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+# Third-Party Imports
+from langchain.messages import HumanMessage
+from pydantic import BaseModel
+
+# Project Imports
+from core.metrics import nearest_rank
+
+# App Imports
+from ... import analysis
+from ...metrics import gemini_hedged_calls
+from .benchmark_analysis_worker import STUB_SEO_REPORT
+
+
+class StubLatencyModel:
+    """
+    Stands in for the Gemini model producing `schema`: answers after `latency` seconds, give
+    or take 20%, and `slow_factor` times later with probability `slow_rate`.
+    """
+
+    def __init__(
+        self,
+        schema: Type[BaseModel],
+        latency: float,
+        slow_rate: float,
+        slow_factor: float,
+        rng: random.Random,
+    ) -> None:
+        self.schema = schema
+        self.latency = latency
+        self.slow_rate = slow_rate
+        self.slow_factor = slow_factor
+        self.rng = rng
+
+    async def ainvoke(self, messages: List[Any]) -> BaseModel:
+        latency = self.latency * self.rng.uniform(0.8, 1.2)
+        if self.rng.random() < self.slow_rate:
+            latency *= self.slow_factor
+
+        await asyncio.sleep(latency)
+        return self.schema.model_validate(STUB_SEO_REPORT)
+
+
+class Command(BaseCommand):
+    help = """
+    Compare the latency percentiles of Gemini calls without and with hedging against a stub
+    Gemini model: a call takes --latency seconds, --slow-factor times more for a --slow-rate
+    share of them.
+
+    --runs calls are sent at once without hedging, which records the latencies the hedge
+    delay is computed from, then --runs with hedging. The rate limiter is disabled, metrics
+    are recorded in the configured Redis.
+    """
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--runs", type=int, default=1000, help="Calls per pass")
+        parser.add_argument("--latency", type=float, default=1.0, help="Usual call latency (s)")
+        parser.add_argument("--slow-rate", type=float, default=0.03, help="Share of slow calls")
+        parser.add_argument("--slow-factor", type=float, default=10.0, help="Slowdown factor")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed")
+
+    def handle(self, *args: tuple, **options: dict) -> None:
+        rng = random.Random(options["seed"])
+        get_analysis_model = analysis.get_analysis_model
+        analysis.get_analysis_model = lambda schema, tier: StubLatencyModel(
+            schema, options["latency"], options["slow_rate"], options["slow_factor"], rng
+        )
+        limits = settings.GEMINI_REQUESTS_PER_MINUTE, settings.GEMINI_TOKENS_PER_MINUTE
+        settings.GEMINI_REQUESTS_PER_MINUTE = settings.GEMINI_TOKENS_PER_MINUTE = 0
+        analysis.reset_gemini_rate_limiter()
+        hedging = settings.GEMINI_HEDGING
+
+        self.stdout.write(
+            f"{'hedging':<8} {'runs':>6} {'p50 (s)':>8} {'p95 (s)':>8} {'p99 (s)':>8} "
+            f"{'max (s)':>8} {'hedged':>7}"
+        )
+
+        try:
+            for enabled in (False, True):
+                settings.GEMINI_HEDGING = enabled
+                analysis.reset_hedge_delays()
+                hedged = sum(int(value) for value in gemini_hedged_calls.collect().values())
+                durations = asyncio.run(self._call(options["runs"]))
+                hedged = (
+                    sum(int(value) for value in gemini_hedged_calls.collect().values()) - hedged
+                )
+
+                durations.sort()
+                self.stdout.write(
+                    f"{'on' if enabled else 'off':<8} {len(durations):>6} "
+                    f"{nearest_rank(durations, 0.5):>8.2f} {nearest_rank(durations, 0.95):>8.2f} "
+                    f"{nearest_rank(durations, 0.99):>8.2f} {durations[-1]:>8.2f} "
+                    f"{hedged / len(durations):>7.1%}"
+                )
+        finally:
+            analysis.get_analysis_model = get_analysis_model
+            settings.GEMINI_REQUESTS_PER_MINUTE, settings.GEMINI_TOKENS_PER_MINUTE = limits
+            settings.GEMINI_HEDGING = hedging
+            analysis.reset_gemini_rate_limiter()
+            analysis.reset_hedge_delays()
+
+    async def _call(self, runs: int) -> List[float]:
+        messages = [HumanMessage("Benchmark prompt")]
+
+        async def call() -> float:
+            started_at = time.perf_counter()
+            await analysis.ainvoke_analysis_model(messages, True)
+            return time.perf_counter() - started_at
+
+        return list(await asyncio.gather(*(call() for _ in range(runs))))
@@ -0,0 +1,92 @@
+# Python Imports
+import statistics
+import time
+from typing import List
+
+# Django Imports
+from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+
+# Third-Party Imports
+from asgiref.sync import async_to_sync
+
+# Project Imports
+from authentication.models import User
+from core.pagination import CursorPage
+
+# App Imports
+from ...constants import ScrapingJobStatusChoices
+from ...models import ScrapingJob
+
+
+class Command(BaseCommand):
+    help = """
+    Benchmark the user's jobs list query against a full-row fetch while the per-user
+    job count grows. Synthetic data is created inside a transaction that is rolled back.
+    """
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--counts",
+            type=int,
+            nargs="+",
+            default=[100, 1000, 5000],
+            help="Per-user job counts to benchmark",
+        )
+        parser.add_argument(
+            "--blob-kb",
+            type=int,
+            default=200,
+            help="Approximate size (KB) of each job's `results` and `seo_report` blobs",
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+
+    def handle(self, *args: tuple, **options: dict) -> None:
+        counts: List[int] = sorted(options["counts"])
+        blob_kb: int = options["blob_kb"]
+        repeat: int = options["repeat"]
+
+        self.stdout.write(f"{'jobs':>8} {'lean p50 (ms)':>15} {'full p50 (ms)':>15}")
+
+        with transaction.atomic():
+            user = User.objects.create(email="benchmark-job-list@elevate-seo.local")
+            created = 0
+
+            for count in counts:
+                self._create_jobs(user, count - created, blob_kb)
+                created = count
+
+                lean = self._measure(lambda: async_to_sync(self._list_jobs)(user.id), repeat)
+                full = self._measure(lambda: list(ScrapingJob.objects.filter(user=user)), repeat)
+
+                self.stdout.write(f"{count:>8} {lean:>15.2f} {full:>15.2f}")
+
+            transaction.set_rollback(True)
+
+    def _create_jobs(self, user: User, count: int, blob_kb: int) -> None:
+        blob = {"payload": "x" * (blob_kb * 1024)}
+        ScrapingJob.objects.bulk_create(
+            [
+                ScrapingJob(
+                    user=user,
+                    original_prompt=f"Benchmark entity {index}",
+                    status=ScrapingJobStatusChoices.COMPLETED.value,
+                    results=[blob],
+                    seo_report=blob,
+                )
+                for index in range(count)
+            ],
+            batch_size=200,
+        )
+
+    async def _list_jobs(self, user_id: int) -> CursorPage:
+        return await ScrapingJob.objects.aget_user_jobs(user_id)
+
+    def _measure(self, fn, repeat: int) -> float:
+        timings = []
+        for _ in range(repeat):
+            started_at = time.perf_counter()
+            fn()
+            timings.append((time.perf_counter() - started_at) * 1000)
+
+        return statistics.median(timings)
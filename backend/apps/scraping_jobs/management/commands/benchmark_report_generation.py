@@ -0,0 +1,151 @@
+# Python Imports
+import asyncio
+import random
+import statistics
+import time
+from typing import Any, List, Type
+
+# Django Imports
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+# Third-Party Imports
+from langchain_core.exceptions import OutputParserException
+from pydantic import BaseModel
+
+# App Imports
+from ... import analysis
+from ...prompts.scraping_data import CompactScrapingData
+from ...schemas import SEO_REPORT_SECTIONS, SEOReportSchema
+from .benchmark_analysis_worker import STUB_SEO_REPORT
+
+# Relative output size of each section, the stub's generation time is proportional to it
+SECTION_WEIGHTS = {
+    "overview": 1.0,
+    "keywords": 1.0,
+    "competitors": 1.0,
+    "social_presence": 0.5,
+    "backlink_analysis": 1.0,
+    "recommendations": 1.5,
+    "summary": 0.5,
+}
+
+
+class StubSectionModel:
+    """
+    Stands in for the Gemini model producing `schema`: answers after reading the prompt for
+    `input_latency` seconds and generating each section it covers for its weight times
+    `section_latency` seconds, and fails the schema when any of those sections comes out
+    invalid, each with probability `invalid_rate`.
+    """
+
+    def __init__(
+        self,
+        schema: Type[BaseModel],
+        input_latency: float,
+        section_latency: float,
+        invalid_rate: float,
+        rng: random.Random,
+    ) -> None:
+        self.schema = schema
+        self.sections = (
+            list(SEO_REPORT_SECTIONS)
+            if schema is SEOReportSchema
+            else [name for name, section in SEO_REPORT_SECTIONS.items() if section is schema]
+        )
+        self.input_latency = input_latency
+        self.section_latency = section_latency
+        self.invalid_rate = invalid_rate
+        self.rng = rng
+
+    async def ainvoke(self, messages: List[Any]) -> BaseModel:
+        weight = sum(SECTION_WEIGHTS[section] for section in self.sections)
+        await asyncio.sleep(
+            (self.input_latency + weight * self.section_latency) * self.rng.uniform(0.8, 1.2)
+        )
+
+        if any(self.rng.random() < self.invalid_rate for _ in self.sections):
+            raise OutputParserException(f"Stub {self.schema.__name__} output is invalid")
+
+        return self.schema.model_validate(STUB_SEO_REPORT)
+
+
+class Command(BaseCommand):
+    help = """
+    Compare the wall-clock time and schema validation failure rate of generating SEO reports
+    in one call ("single" analysis mode) and section by section ("sections" mode) against a
+    stub Gemini model: a call takes --input-latency seconds plus --section-latency seconds
+    per weighted section it generates (see SECTION_WEIGHTS), and each section comes out
+    invalid with probability --invalid-rate.
+
+    Reports of a mode are generated --runs at once. The rate limiter is disabled, metrics
+    are recorded in the configured Redis.
+    """
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--runs", type=int, default=200, help="Reports generated per mode")
+        parser.add_argument("--input-latency", type=float, default=0.2, help="Prompt read (s)")
+        parser.add_argument(
+            "--section-latency", type=float, default=0.5, help="Generation per section (s)"
+        )
+        parser.add_argument(
+            "--invalid-rate", type=float, default=0.02, help="Invalid output rate per section"
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Random seed")
+
+    def handle(self, *args: tuple, **options: dict) -> None:
+        rng = random.Random(options["seed"])
+        get_analysis_model = analysis.get_analysis_model
+        analysis.get_analysis_model = lambda schema, tier: StubSectionModel(
+            schema,
+            options["input_latency"],
+            options["section_latency"],
+            options["invalid_rate"],
+            rng,
+        )
+        limits = settings.GEMINI_REQUESTS_PER_MINUTE, settings.GEMINI_TOKENS_PER_MINUTE
+        settings.GEMINI_REQUESTS_PER_MINUTE = settings.GEMINI_TOKENS_PER_MINUTE = 0
+        analysis.reset_gemini_rate_limiter()
+
+        self.stdout.write(
+            f"{'mode':<9} {'runs':>6} {'mean (s)':>9} {'p50 (s)':>8} {'p95 (s)':>8} "
+            f"{'invalid':>8}"
+        )
+
+        try:
+            for mode in ("single", "sections"):
+                durations, invalid = asyncio.run(self._generate(mode, options["runs"]))
+                durations.sort()
+                self.stdout.write(
+                    f"{mode:<9} {len(durations):>6} {statistics.fmean(durations):>9.2f} "
+                    f"{durations[len(durations) // 2]:>8.2f} "
+                    f"{durations[int(len(durations) * 0.95)]:>8.2f} "
+                    f"{invalid / len(durations):>8.1%}"
+                )
+        finally:
+            analysis.get_analysis_model = get_analysis_model
+            settings.GEMINI_REQUESTS_PER_MINUTE, settings.GEMINI_TOKENS_PER_MINUTE = limits
+            analysis.reset_gemini_rate_limiter()
+
+    async def _generate(self, mode: str, runs: int) -> tuple:
+        scraping_data = CompactScrapingData(
+            text='{"answers":[],"sources":[]}',
+            answers=1,
+            sources=0,
+            raw_tokens=0,
+            tokens=0,
+            untrimmed_tokens=0,
+        )
+
+        async def generate() -> tuple:
+            started_at = time.perf_counter()
+            try:
+                await analysis.agenerate_report(mode, "Benchmark prompt", scraping_data, [], True)
+                invalid = False
+            except OutputParserException:
+                invalid = True
+
+            return time.perf_counter() - started_at, invalid
+
+        results = await asyncio.gather(*(generate() for _ in range(runs)))
+        return [duration for duration, _ in results], sum(invalid for _, invalid in results)
@@ -0,0 +1,136 @@
+# Python Imports
+import asyncio
+import json
+import statistics
+import time
+from typing import List
+
+# Django Imports
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+# Third-Party Imports
+import httpx
+
+# Project Imports
+from authentication.models import User
+from core.metrics import nearest_rank
+
+# App Imports
+from ...constants import ScrapingJobStatusChoices
+from ...models import ScrapingJob
+from ...tasks import analyze_scraped_data
+from ...webhook_queue import WebhookDeliveryConsumer
+
+
+class Command(BaseCommand):
+    help = """
+    Benchmark BrightData webhook acknowledgement latency under a burst of concurrent
+    deliveries, ingesting before replying (BRIGHTDATA_WEBHOOK_QUEUE=False) against
+    spooling to the queue, then the time a consumer takes to drain the queue.
+
+    Deliveries are sent in-process to the ASGI application, with the configured database,
+    Redis and blob store. Analysis dispatch is stubbed out so no Celery broker is needed,
+    which understates the inline latency. Stop other webhook consumers while it runs. A
+    temporary user and its jobs are created and deleted afterwards.
+    """
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--requests", type=int, default=300, help="Deliveries per mode")
+        parser.add_argument(
+            "--concurrency", type=int, default=50, help="Deliveries in flight at once"
+        )
+        parser.add_argument("--records", type=int, default=10, help="Records per delivery")
+        parser.add_argument(
+            "--record-kb", type=int, default=20, help="Approximate size (KB) of each record"
+        )
+
+    def handle(self, *args: tuple, **options: dict) -> None:
+        user = User.objects.create(email="benchmark-webhook-ack@elevate-seo.local")
+        queue_setting = settings.BRIGHTDATA_WEBHOOK_QUEUE
+        analyze_scraped_data.delay = lambda job_id: None
+
+        self.stdout.write(
+            f"{'mode':<8} {'req/s':>8} {'p50 (ms)':>10} {'p95 (ms)':>10} "
+            f"{'p99 (ms)':>10} {'drain (s)':>10}"
+        )
+
+        try:
+            for mode in ("inline", "queued"):
+                settings.BRIGHTDATA_WEBHOOK_QUEUE = mode == "queued"
+                jobs = self._create_jobs(user, options["requests"])
+
+                elapsed, timings = asyncio.run(self._burst(jobs, options))
+                drain = asyncio.run(self._drain()) if mode == "queued" else 0.0
+
+                timings.sort()
+                self.stdout.write(
+                    f"{mode:<8} {len(timings) / elapsed:>8.1f} "
+                    f"{statistics.median(timings):>10.2f} "
+                    f"{nearest_rank(timings, 0.95):>10.2f} "
+                    f"{nearest_rank(timings, 0.99):>10.2f} {drain:>10.2f}"
+                )
+        finally:
+            settings.BRIGHTDATA_WEBHOOK_QUEUE = queue_setting
+            del analyze_scraped_data.delay
+            user.delete()
+
+    def _create_jobs(self, user: User, count: int) -> List[ScrapingJob]:
+        return ScrapingJob.objects.bulk_create(
+            [
+                ScrapingJob(
+                    user=user,
+                    original_prompt=f"Benchmark entity {index}",
+                    status=ScrapingJobStatusChoices.RUNNING.value,
+                )
+                for index in range(count)
+            ],
+            batch_size=200,
+        )
+
+    async def _burst(self, jobs: List[ScrapingJob], options: dict) -> tuple:
+        # Imported here so the ASGI application is only built when benchmarking
+        from config.asgi import application
+
+        semaphore = asyncio.Semaphore(options["concurrency"])
+        timings: List[float] = []
+        headers = {"Authorization": f"Bearer {settings.BRIGHTDATA_WEBHOOK_SECRET}"}
+        padding = "x" * (options["record_kb"] * 1024)
+
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=application), base_url="http://localhost"
+        ) as client:
+
+            async def deliver(job: ScrapingJob) -> None:
+                body = json.dumps(
+                    [
+                        {"answer_text": f"{job.id} {index} {padding}", "sources": []}
+                        for index in range(options["records"])
+                    ]
+                )
+
+                async with semaphore:
+                    started_at = time.perf_counter()
+                    response = await client.post(
+                        f"{settings.BRIGHTDATA_WEBHOOK_PATH}?job-id={job.id}",
+                        content=body,
+                        headers={**headers, "Content-Type": "application/json"},
+                    )
+                    timings.append((time.perf_counter() - started_at) * 1000)
+
+                response.raise_for_status()
+
+            started_at = time.perf_counter()
+            await asyncio.gather(*(deliver(job) for job in jobs))
+            elapsed = time.perf_counter() - started_at
+
+        return elapsed, timings
+
+    async def _drain(self) -> float:
+        consumer = WebhookDeliveryConsumer(name="benchmark", batch_size=50)
+        started_at = time.perf_counter()
+
+        while await consumer.consume_once():
+            pass
+
+        return time.perf_counter() - started_at
@@ -0,0 +1,32 @@
+# Python Imports
+import asyncio
+
+# Django Imports
+from django.core.management.base import BaseCommand, CommandParser
+
+# App Imports
+from ...webhook_queue import WebhookDeliveryConsumer
+
+
+class Command(BaseCommand):
+    help = """
+    Ingest the BrightData webhook deliveries acknowledged by the API (see
+    BRIGHTDATA_WEBHOOK_QUEUE): update their jobs and dispatch their analysis. Run as many
+    consumers as needed, they share the deliveries through a Redis consumer group.
+    """
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--name", default=None, help="Consumer name, defaults to <hostname>:<pid>"
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=10, help="Deliveries read from the stream at once"
+        )
+
+    def handle(self, *args, **options) -> None:
+        consumer = WebhookDeliveryConsumer(name=options["name"], batch_size=options["batch_size"])
+
+        try:
+            asyncio.run(consumer.run())
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,35 @@
+# Python Imports
+import asyncio
+
+# Django Imports
+from django.core.management.base import BaseCommand, CommandParser
+
+# App Imports
+from ...analysis_queue import AnalysisWorker
+
+
+class Command(BaseCommand):
+    help = """
+    Run the Gemini analyses enqueued with ANALYSIS_EXECUTION_MODE=async, many at once on
+    one event loop. Run as many workers as needed, they share the jobs through a Redis
+    consumer group.
+    """
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--name", default=None, help="Consumer name, defaults to <hostname>:<pid>"
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=None,
+            help="Analyses in flight at once, defaults to ANALYSIS_WORKER_CONCURRENCY",
+        )
+
+    def handle(self, *args, **options) -> None:
+        worker = AnalysisWorker(name=options["name"], concurrency=options["concurrency"])
+
+        try:
+            asyncio.run(worker.run())
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,40 @@
+# Django Imports
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+
+# App Imports
+from ...brightdata_stub import BrightDataStubServer
+
+
+class Command(BaseCommand):
+    help = """
+    Run a local stand-in for the BrightData datasets API. Point BRIGHTDATA_API_BASE_URL
+    at it to trigger, poll and download snapshots without BrightData. It never calls the
+    webhook back, jobs are resolved by the stalled job sweeper.
+    """
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+        parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+        parser.add_argument(
+            "--ready-after",
+            type=float,
+            default=30.0,
+            help="Seconds before a triggered snapshot becomes ready",
+        )
+
+    def handle(self, *args, **options) -> None:
+        server = BrightDataStubServer(
+            (options["host"], options["port"]),
+            api_key=settings.BRIGHTDATA_API_KEY,
+            ready_after=options["ready_after"],
+        )
+
+        self.stdout.write(f"BrightData stand-in listening on {server.base_url}")
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
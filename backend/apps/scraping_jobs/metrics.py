@@ -0,0 +1,137 @@
+# Project Imports
+from core.metrics import Counter, Gauge, Summary
+
+scrape_result_cache_requests = Counter(
+    "scrape_result_cache_requests_total",
+    "Scrape result cache lookups when creating a job, by result (hit or miss)",
+    ["result"],
+)
+
+analysis_cache_requests = Counter(
+    "analysis_cache_requests_total",
+    "Analysis cache lookups before calling Gemini, by result (hit or miss)",
+    ["result"],
+)
+
+job_phase_duration_seconds = Summary(
+    "scraping_job_phase_duration_seconds",
+    "Duration of each phase of a scraping job run (see JOB_PHASES), observed when it ends",
+    ["phase"],
+)
+
+stalled_jobs_swept = Counter(
+    "scraping_jobs_stalled_swept_total",
+    "Stalled jobs handled by the sweeper, by outcome (see StalledJobSweeperService)",
+    ["outcome"],
+)
+
+brightdata_circuit_state = Gauge(
+    "brightdata_circuit_state",
+    "State of a process's BrightData circuit breaker (0 closed, 1 half-open, 2 open)",
+    ["instance"],
+)
+
+brightdata_concurrency_limit = Gauge(
+    "brightdata_concurrency_limit",
+    "Adaptive limit of a process's in-flight BrightData calls",
+    ["instance"],
+)
+
+brightdata_calls_rejected = Counter(
+    "brightdata_calls_rejected_total",
+    "BrightData calls rejected without being sent, by reason (circuit_open or concurrency_limit)",
+    ["reason"],
+)
+
+webhook_deliveries = Counter(
+    "brightdata_webhook_deliveries_total",
+    "BrightData webhook deliveries by outcome (ingested, duplicate, stale, not_found or invalid)",
+    ["outcome"],
+)
+
+gemini_calls_throttled = Counter(
+    "gemini_calls_throttled_total",
+    "Gemini calls held back by the cluster-wide rate limiter, by reason (limiter when it "
+    "waited for room, quota_exhausted on a 429 from Gemini, timeout when it gave up)",
+    ["reason"],
+)
+
+gemini_rate_limit_wait_seconds = Summary(
+    "gemini_rate_limit_wait_seconds",
+    "Seconds Gemini calls queued for room under the requests and tokens per minute quotas",
+)
+
+gemini_prompt_tokens_saved = Summary(
+    "gemini_prompt_tokens_saved",
+    "Estimated input tokens saved per analysis by compacting its scraping data",
+)
+
+gemini_map_reduce_chunks = Summary(
+    "gemini_map_reduce_chunks",
+    "Scraping data chunks analyzed separately per map-reduce analysis",
+)
+
+gemini_report_generations = Counter(
+    "gemini_report_generations_total",
+    "SEO reports generated by Gemini, by analysis mode (single, sections or map_reduce) and "
+    "outcome (completed, invalid when the output failed the schema, error)",
+    ["mode", "outcome"],
+)
+
+gemini_report_generation_seconds = Summary(
+    "gemini_report_generation_seconds",
+    "Wall-clock seconds of generating an SEO report with Gemini, by analysis mode",
+    ["mode"],
+)
+
+gemini_report_section_failures = Counter(
+    "gemini_report_section_failures_total",
+    "Report sections of the sections analysis mode whose output failed their schema, by section",
+    ["section"],
+)
+
+gemini_report_repairs = Counter(
+    "gemini_report_repairs_total",
+    "Repairs of Gemini reports failing their schema, by outcome (mechanical when fixed without "
+    "a model call, regenerated when failing sections were generated again, failed)",
+    ["outcome"],
+)
+
+gemini_model_tier_calls = Counter(
+    "gemini_model_tier_calls_total",
+    "Gemini calls by model tier (see GEMINI_MODEL_TIERS) and outcome (success, invalid, "
+    "timeout, server_error, quota_exhausted, cancelled when a hedged call lost, or error)",
+    ["tier", "outcome"],
+)
+
+gemini_model_tier_call_seconds = Summary(
+    "gemini_model_tier_call_seconds",
+    "Latency of Gemini calls by model tier, whatever their outcome but cancelled",
+    ["tier"],
+)
+
+gemini_hedged_calls = Counter(
+    "gemini_hedged_calls_total",
+    "Gemini calls hedged with a second call, by model tier of the first call and winner "
+    "(primary, hedge or none when both failed)",
+    ["tier", "winner"],
+)
+
+job_report_first_section_seconds = Summary(
+    "scraping_job_report_first_section_seconds",
+    "Seconds from the start of a report's generation to its first job_report_section event, "
+    "by analysis mode",
+    ["mode"],
+)
+
+job_report_section_event_sections = Summary(
+    "scraping_job_report_section_event_sections",
+    "Report sections coalesced into each job_report_section event",
+)
+
+job_event_resumes = Counter(
+    "scraping_job_event_resumes_total",
+    "Jobs status websockets resumed after an event ID, by outcome (replayed when the missed "
+    "events were sent, snapshot when the jobs in progress were sent instead)",
+    ["outcome"],
+)
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-17 11:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraping_jobs", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="scrapingjob",
+            name="report_schema_version",
+            field=models.PositiveSmallIntegerField(
+                blank=True,
+                help_text="SEOReportSchema version `seo_report` was validated against",
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 11:23
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraping_jobs", "0002_scrapingjob_report_schema_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="scrapingjob",
+            name="results_blob_key",
+            field=models.CharField(
+                blank=True,
+                help_text="Blob store key of the scraping data received from BrightData's scraper",
+                max_length=64,
+                null=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="scrapingjob",
+            name="results",
+            field=models.JSONField(
+                blank=True,
+                encoder=django.core.serializers.json.DjangoJSONEncoder,
+                help_text="Legacy inline scraping data, new jobs store it in the blob store",
+                null=True,
+            ),
+        ),
+    ]
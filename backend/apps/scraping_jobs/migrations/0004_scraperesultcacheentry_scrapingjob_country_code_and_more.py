@@ -0,0 +1,69 @@
+# Generated by Django 5.2.18 on 2026-10-17 11:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraping_jobs", "0003_scrapingjob_results_blob_key_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ScrapeResultCacheEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="created at")),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="updated at")),
+                (
+                    "cache_key",
+                    models.CharField(
+                        help_text="SHA-256 of the normalized prompt, country and Perplexity prompt version",
+                        max_length=64,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "results_blob_key",
+                    models.CharField(
+                        help_text="Blob store key of the cached scraping data", max_length=64
+                    ),
+                ),
+                (
+                    "snapshot_id",
+                    models.CharField(
+                        blank=True,
+                        help_text="BrightData snapshot the cached scraping data came from",
+                        max_length=255,
+                        null=True,
+                    ),
+                ),
+            ],
+            options={
+                "abstract": False,
+            },
+        ),
+        migrations.AddField(
+            model_name="scrapingjob",
+            name="country_code",
+            field=models.CharField(
+                blank=True, help_text="Country the prompt is scraped for", max_length=2, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="scrapingjob",
+            name="scrape_cache_key",
+            field=models.CharField(
+                blank=True,
+                help_text="Key of the scrape result cache entry this job reads or fills",
+                max_length=64,
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-17 11:26
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraping_jobs", "0004_scraperesultcacheentry_scrapingjob_country_code_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="scrapingjob",
+            name="use_analysis_cache",
+            field=models.BooleanField(
+                blank=True,
+                default=True,
+                help_text="Whether the analysis may reuse a cached SEO report for identical input",
+            ),
+        ),
+        migrations.CreateModel(
+            name="AnalysisCacheEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="created at")),
+                ("updated_at", models.DateTimeField(auto_now=True, verbose_name="updated at")),
+                (
+                    "cache_key",
+                    models.CharField(
+                        help_text="SHA-256 of the prompt version, user prompt, model and generation settings",
+                        max_length=64,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "seo_report",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        help_text="Validated SEO report produced for this analysis input",
+                    ),
+                ),
+                (
+                    "report_schema_version",
+                    models.PositiveSmallIntegerField(
+                        help_text="SEOReportSchema version `seo_report` was validated against"
+                    ),
+                ),
+                ("hits", models.PositiveIntegerField(blank=True, default=0)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["updated_at"], name="analysis_cache_updated_at_idx")
+                ],
+            },
+        ),
+    ]
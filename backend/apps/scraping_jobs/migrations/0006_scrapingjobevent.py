@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-17 11:32
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraping_jobs", "0005_scrapingjob_use_analysis_cache_analysiscacheentry"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ScrapingJobEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                (
+                    "event",
+                    models.CharField(
+                        choices=[
+                            ("PENDING", "Pending"),
+                            ("RUNNING", "Running"),
+                            ("ANALYZING", "Analyzing"),
+                            ("COMPLETED", "Completed"),
+                            ("FAILED", "Failed"),
+                            ("WEBHOOK_RECEIVED", "Webhook Received"),
+                            ("ANALYSIS_ENQUEUED", "Analysis Enqueued"),
+                            ("ANALYSIS_STARTED", "Analysis Started"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("occurred_at", models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    "job",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="events",
+                        related_query_name="event",
+                        to="scraping_jobs.scrapingjob",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("occurred_at", "id"),
+                "indexes": [
+                    models.Index(fields=["job", "occurred_at"], name="scraping_job_event_job_idx")
+                ],
+            },
+        ),
+    ]
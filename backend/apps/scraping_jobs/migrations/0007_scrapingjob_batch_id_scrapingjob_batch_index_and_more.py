@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-17 11:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraping_jobs", "0006_scrapingjobevent"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="scrapingjob",
+            name="batch_id",
+            field=models.UUIDField(
+                blank=True,
+                help_text="Bulk creation batch sharing the job's BrightData trigger",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="scrapingjob",
+            name="batch_index",
+            field=models.PositiveIntegerField(
+                blank=True,
+                help_text="`index` of the job's input row in its batch's BrightData trigger",
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="scrapingjob",
+            index=models.Index(fields=["batch_id", "batch_index"], name="scraping_job_batch_idx"),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-17 11:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraping_jobs", "0007_scrapingjob_batch_id_scrapingjob_batch_index_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="scrapingjobevent",
+            name="event",
+            field=models.CharField(
+                choices=[
+                    ("PENDING", "Pending"),
+                    ("RUNNING", "Running"),
+                    ("ANALYZING", "Analyzing"),
+                    ("COMPLETED", "Completed"),
+                    ("FAILED", "Failed"),
+                    ("TRIGGER_DEFERRED", "Trigger Deferred"),
+                    ("WEBHOOK_RECEIVED", "Webhook Received"),
+                    ("ANALYSIS_ENQUEUED", "Analysis Enqueued"),
+                    ("ANALYSIS_STARTED", "Analysis Started"),
+                ],
+                max_length=20,
+            ),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-17 11:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scraping_jobs", "0008_alter_scrapingjobevent_event"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="WebhookDelivery",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False, verbose_name="ID"
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True, verbose_name="created at")),
+                (
+                    "payload_digest",
+                    models.CharField(
+                        help_text="SHA-256 of the delivery's raw body, i.e. its blob store key",
+                        max_length=64,
+                    ),
+                ),
+                ("received_at", models.DateTimeField()),
+                (
+                    "job",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="webhook_deliveries",
+                        related_query_name="webhook_delivery",
+                        to="scraping_jobs.scrapingjob",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("job", "payload_digest"), name="unique_webhook_delivery_payload"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Python Imports
+from typing import List, Optional
+
+# Django Imports
+from django.conf import settings
+
+# Project Imports
+from authentication.constants import UserPlanChoices
+from authentication.models import User
+
+# App Imports
+from .constants import DEFAULT_MODEL_TIER, ScrapingJobStatusChoices
+from .models import ScrapingJob
+
+
+def route_model_tiers(tokens: int, plan: Optional[str], queue_depth: int) -> List[str]:
+    """
+    Pick the Gemini model tiers of an analysis, the one to call first then its fallbacks.
+
+    Payloads of up to `GEMINI_ROUTING_FLASH_MAX_TOKENS` estimated tokens go to the flash
+    tier, which answers them in a fraction of the time. Larger ones go to the pro tier,
+    except free plan ones while `GEMINI_ROUTING_BUSY_QUEUE_DEPTH` or more analyses are
+    queued or running, which go to flash to drain the queue. Every other tier of
+    `GEMINI_MODEL_TIERS` follows as a fallback.
+
+    Args:
+        tokens (int): Estimated input tokens of the analysis calls.
+        plan (Optional[str]): The job owner's `UserPlanChoices`.
+        queue_depth (int): Analyses queued or running, across the cluster.
+
+    Returns:
+        List[str]: The tiers, in call order.
+    """
+
+    if not settings.GEMINI_MODEL_ROUTING:
+        return [DEFAULT_MODEL_TIER]
+
+    small = tokens <= settings.GEMINI_ROUTING_FLASH_MAX_TOKENS
+    busy = queue_depth >= settings.GEMINI_ROUTING_BUSY_QUEUE_DEPTH
+    primary = "flash" if small or (busy and plan != UserPlanChoices.PRO.value) else "pro"
+
+    return [primary, *(tier for tier in settings.GEMINI_MODEL_TIERS if tier != primary)]
+
+
+async def aroute_job_model_tiers(user_id: str, tokens: int) -> List[str]:
+    """Route a job's analysis with `route_model_tiers`, looking up its owner's plan and the queue"""
+
+    if not settings.GEMINI_MODEL_ROUTING:
+        return [DEFAULT_MODEL_TIER]
+
+    plan = await User.objects.filter(id=user_id).values_list("plan", flat=True).afirst()
+    queue_depth = await ScrapingJob.objects.filter(
+        status=ScrapingJobStatusChoices.ANALYZING.value
+    ).acount()
+
+    return route_model_tiers(tokens, plan, queue_depth)
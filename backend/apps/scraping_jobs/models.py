@@ -1,20 +1,45 @@
 # Python Imports
-from typing import Any, List, Optional
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from uuid import uuid4
 
 # Django Imports
+from django.conf import settings
 from django.db import models
+from django.db.models import Max, Q
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from django.core.serializers.json import DjangoJSONEncoder
 from django.core.validators import MinLengthValidator
 
+# Third-Party Imports
+from asgiref.sync import sync_to_async
+
 # Project Imports
-from core.models import CreatedAtMixin
+from core.blob_store import get_blob_store
+from core.models import CreatedAtMixin, TimeStampMixin
+from core.pagination import Cursor, CursorPage, KeysetPaginator
 from authentication.models import User
 
 # App Imports
-from .constants import ScrapingJobStatusChoices
-from .schemas import SEOReportSchema
+from .constants import (
+    ACTIVE_STATUSES,
+    INGEST_JOB_FIELDS,
+    JOB_EVENT_SNAPSHOT_MAX_JOBS,
+    SCRAPING_JOB_LIST_FIELDS,
+    TERMINAL_STATUSES,
+    ScrapingJobEventChoices,
+    ScrapingJobStatusChoices,
+)
+from .metrics import job_phase_duration_seconds
+from .schemas import SEO_REPORT_SCHEMA_VERSION, SEOReportSchema, upgrade_seo_report
+from .utils import compute_job_phases
+
+user_jobs_paginator = KeysetPaginator(
+    position_field="created_at",
+    page_size=settings.SCRAPING_JOBS_PAGE_SIZE,
+    max_page_size=settings.SCRAPING_JOBS_MAX_PAGE_SIZE,
+)
 
 
 class ScrapingJobQuerySet(models.QuerySet):
@@ -24,247 +49,470 @@ class ScrapingJobQuerySet(models.QuerySet):
         Expected kwargs:
             user(User | str): The user instance or user ID
             original_prompt (str): The original prompt provided by user
+            country_code (str): The country the prompt is scraped for
+            scrape_cache_key (Optional[str]): The scrape result cache key of the prompt
+            use_analysis_cache (bool): Whether the analysis may reuse a cached SEO report,
+                defaults to True
+            cached_scrape (Optional[ScrapeResultCacheEntry]): A fresh cached scrape result,
+                when given the job starts directly in ANALYZING with the cached results. It
+                gets no snapshot, `scrape_cache_key` records where its results come from.
 
         Returns:
             ScrapingJob: The created ScrapingJob instance.
 
         """
-        user = kwargs.get("user")
-        original_prompt = kwargs.get("original_prompt")
+        cached_scrape: Optional[ScrapeResultCacheEntry] = kwargs.get("cached_scrape")
 
         data = {
-            "user": user,
-            "original_prompt": original_prompt,
+            "user": kwargs.get("user"),
+            "original_prompt": kwargs.get("original_prompt"),
+            "country_code": kwargs.get("country_code"),
+            "scrape_cache_key": kwargs.get("scrape_cache_key"),
+            "use_analysis_cache": kwargs.get("use_analysis_cache", True),
             "status": ScrapingJobStatusChoices.PENDING.value,
         }
-        return await super().acreate(**data)
 
-    async def update_job_with_snapshot_id(self, job_id: str, snapshot_id: str) -> None:
+        if cached_scrape:
+            data.update(
+                status=ScrapingJobStatusChoices.ANALYZING.value,
+                results_blob_key=cached_scrape.results_blob_key,
+            )
+
+        job = await super().acreate(**data)
+        await ScrapingJobEvent.objects.arecord(job.id, job.status, job.created_at)
+
+        return job
+
+    async def abulk_create_jobs(
+        self, user: User, jobs_data: List[dict], trigger_size: int
+    ) -> List[ScrapingJob]:
+        """
+        Create several ScrapingJob instances with one INSERT.
+
+        Jobs without a cached scrape are grouped into batches of at most `trigger_size`
+        jobs, one BrightData trigger each. A job's `batch_index` is the `index` of its row
+        in the trigger's input, starting at 1.
+
+        Args:
+            user (User): The user creating the jobs.
+            jobs_data (List[dict]): One dict per job with the `acreate` kwargs
+                (except `user`).
+            trigger_size (int): The maximum number of jobs per batch.
+
+        Returns:
+            List[ScrapingJob]: The created jobs, in the order of `jobs_data`.
+        """
+
+        jobs, batch_id, batch_index = [], None, trigger_size
+
+        for data in jobs_data:
+            cached_scrape: Optional[ScrapeResultCacheEntry] = data.get("cached_scrape")
+            job = self.model(
+                user=user,
+                original_prompt=data.get("original_prompt"),
+                country_code=data.get("country_code"),
+                scrape_cache_key=data.get("scrape_cache_key"),
+                use_analysis_cache=data.get("use_analysis_cache", True),
+                status=ScrapingJobStatusChoices.PENDING.value,
+            )
+
+            if cached_scrape:
+                job.status = ScrapingJobStatusChoices.ANALYZING.value
+                job.results_blob_key = cached_scrape.results_blob_key
+            else:
+                if batch_index == trigger_size:
+                    batch_id, batch_index = uuid4(), 0
+
+                batch_index += 1
+                job.batch_id, job.batch_index = batch_id, batch_index
+
+            jobs.append(job)
+
+        jobs = await self.abulk_create(jobs)
+        await ScrapingJobEvent.objects.abulk_create(
+            [
+                ScrapingJobEvent(job_id=job.id, event=job.status, occurred_at=job.created_at)
+                for job in jobs
+            ]
+        )
+
+        return jobs
+
+    def transition(
+        self,
+        job_id: str,
+        from_statuses: Iterable[str],
+        to_status: str,
+        **fields: Any,
+    ) -> bool:
+        """
+        Move a ScrapingJob instance from one of `from_statuses` to `to_status` and write
+        `fields` in the same UPDATE statement.
+
+        The status acts as a compare-and-set guard: when the job is no longer in one of
+        `from_statuses` (another worker, retry or duplicate webhook got there first) nothing
+        is written. Only the caller whose transition won should dispatch follow-up work.
+
+        A won transition is appended to the job's timeline (`ScrapingJobEvent`).
+
+        Round trips per job with this API, not counting timeline INSERTs:
+            - BrightData webhook: 1 SELECT + 1 UPDATE
+            - Analysis task: 1 SELECT + 1 UPDATE (plus the analysis cache lookups)
+            - Retry: 1 SELECT + 1 UPDATE (+ 1 UPDATE for the snapshot ID of a new scrape)
+
+        Args:
+            job_id (str): The ID of the ScrapingJob instance.
+            from_statuses (Iterable[str]): Statuses the job must currently be in.
+            to_status (str): The status to move the job to.
+            **fields (Any): Other fields to write along with the status.
+
+        Returns:
+            bool: True if the transition won, False if the job was not in `from_statuses`.
         """
-        Update a ScrapingJob instance's snapshot_id, status, and error fields.
+
+        won = bool(
+            self.filter(id=job_id, status__in=from_statuses).update(status=to_status, **fields)
+        )
+        if won:
+            ScrapingJobEvent.objects.record(job_id, to_status)
+
+        return won
+
+    async def atransition(
+        self,
+        job_id: str,
+        from_statuses: Iterable[str],
+        to_status: str,
+        **fields: Any,
+    ) -> bool:
+        """Async version of `transition`"""
+
+        won = bool(
+            await self.filter(id=job_id, status__in=from_statuses).aupdate(
+                status=to_status, **fields
+            )
+        )
+        if won:
+            await ScrapingJobEvent.objects.arecord(job_id, to_status)
+
+        return won
+
+    async def update_job_with_snapshot_id(self, job_id: str, snapshot_id: str) -> bool:
+        """
+        Set a PENDING ScrapingJob instance to RUNNING with its BrightData snapshot_id.
+
+        When the BrightData webhook already moved the job forward, only the snapshot_id
+        is recorded so the status never goes backwards.
 
         Args:
             job_id (str): JobScraping's ID
             snapshot_id (str): BrightData task ID for tracking.
 
         Return:
-            None
+            bool: True if the job was moved to RUNNING.
 
         """
-        await self.filter(id=job_id).aupdate(
+
+        if await self.atransition(
+            job_id,
+            [ScrapingJobStatusChoices.PENDING.value],
+            ScrapingJobStatusChoices.RUNNING.value,
             snapshot_id=snapshot_id,
-            status=ScrapingJobStatusChoices.RUNNING.value,
             error=None,
-        )
+        ):
+            return True
+
+        await self.filter(id=job_id, snapshot_id__isnull=True).aupdate(snapshot_id=snapshot_id)
+        return False
 
-    def set_job_to_analyzing(self, job_id: str) -> None:
+    async def aget_batch_jobs(self, batch_id: str) -> List[ScrapingJob]:
         """
-        Set a ScrapingJob instance's status to ANALYZING and clear its error field.
+        Return the jobs of a bulk creation batch with only the columns needed to ingest
+        their BrightData results.
 
         Args:
-            job_id (str): JobScraping's ID
+            batch_id (str): The batch's ID.
+
+        Returns:
+            List[ScrapingJob]: The batch's jobs ordered by `batch_index`.
+        """
+
+        queryset = self.filter(batch_id=batch_id).only(*INGEST_JOB_FIELDS).order_by("batch_index")
+
+        return [job async for job in queryset]
+
+    async def aupdate_batch_with_snapshot_id(self, batch_id: str, snapshot_id: str) -> None:
+        """
+        Set the PENDING jobs of a batch to RUNNING with the snapshot_id of their shared
+        BrightData trigger, in one UPDATE.
+
+        Only the jobs the UPDATE moved get a RUNNING timeline event: they are selected back
+        by the new snapshot_id, which no other write sets on a batch's jobs.
+
+        Args:
+            batch_id (str): The batch's ID.
+            snapshot_id (str): BrightData task ID for tracking.
 
         Return:
             None
         """
 
-        self.filter(id=job_id).update(
-            status=ScrapingJobStatusChoices.ANALYZING.value,
+        await self.filter(batch_id=batch_id, status=ScrapingJobStatusChoices.PENDING.value).aupdate(
+            status=ScrapingJobStatusChoices.RUNNING.value,
+            snapshot_id=snapshot_id,
             error=None,
         )
 
-    async def save_raw_scraping_data(self, job_id: str, raw_data: Any) -> None:
+        queryset = self.filter(batch_id=batch_id, snapshot_id=snapshot_id)
+        job_ids = [job_id async for job_id in queryset.values_list("id", flat=True)]
+        await ScrapingJobEvent.objects.arecord_many(job_ids, ScrapingJobStatusChoices.RUNNING.value)
+
+    async def afail_batch(self, batch_id: str, error: str) -> None:
         """
-        Set a ScrapingJob instance's `results` field with received scraping data from BrightData,
-        set the `status` field to ANALYZING, and clear the `error` field.
+        Mark the active jobs of a batch as failed, e.g. when their trigger failed.
 
+        Only the jobs the UPDATE failed get a FAILED timeline event: they are selected back
+        by the `completed_at` it wrote.
 
         Args:
-            job_id (str): JobScraping's ID
-            raw_data (Any): scraping data received from BrightData
+            batch_id (str): The batch's ID.
+            error (str): The error message explaining why the jobs failed.
 
         Return:
             None
-
         """
 
-        await self.filter(id=job_id).aupdate(
-            results=raw_data,
-            status=ScrapingJobStatusChoices.ANALYZING.value,
-            error=None,
+        failed_at = timezone.now()
+        await self.filter(batch_id=batch_id, status__in=ACTIVE_STATUSES).aupdate(
+            status=ScrapingJobStatusChoices.FAILED.value,
+            error=error,
+            completed_at=failed_at,
         )
 
-    def save_seo_report(self, job_id: str, seo_report: Any) -> None:
-        """
-        Set a ScrapingJob instance's 'seo_report' with structured data received from Gemini.
+        queryset = self.filter(
+            batch_id=batch_id,
+            status=ScrapingJobStatusChoices.FAILED.value,
+            completed_at=failed_at,
+        )
+        job_ids = [job_id async for job_id in queryset.values_list("id", flat=True)]
+        await ScrapingJobEvent.objects.arecord_many(
+            job_ids, ScrapingJobStatusChoices.FAILED.value, occurred_at=failed_at
+        )
 
-        Raises pydantic.ValidationError exception for invalid schema - caller must handle it.
+    async def save_raw_scraping_data(self, job_id: str, results_blob_key: str) -> bool:
+        """
+        Point a PENDING or RUNNING ScrapingJob instance's `results_blob_key` at the scraping
+        data received from BrightData (already stored in the blob store), set the `status`
+        field to ANALYZING, and clear the `error` field.
 
         Args:
-            job_id (str): The ScrapingJob instance's ID.
-            seo_report (Any): The structured SEO report data.
+            job_id (str): JobScraping's ID
+            results_blob_key (str): Blob store key of the scraping data received from BrightData
 
         Return:
-            None
+            bool: True if the job was moved to ANALYZING, False for a duplicate delivery.
 
         """
 
-        self.filter(id=job_id).update(
-            seo_report=seo_report,
+        return await self.atransition(
+            job_id,
+            [ScrapingJobStatusChoices.PENDING.value, ScrapingJobStatusChoices.RUNNING.value],
+            ScrapingJobStatusChoices.ANALYZING.value,
+            results_blob_key=results_blob_key,
+            error=None,
         )
 
-    def save_analysis_prompt(self, job_id: str, prompt: str) -> None:
+    async def acomplete_analysis(
+        self, job_id: str, analysis_prompt: str, seo_report: SEOReportSchema | dict
+    ) -> bool:
         """
-        Save or update the analysis_prompt field of a ScrapingJob instance.
+        Mark an ANALYZING ScrapingJob instance as completed, saving its analysis prompt and
+        the SEO report stamped with the current `SEO_REPORT_SCHEMA_VERSION`.
+
+        The report is expected to be already validated, reads trust reports stamped with
+        the current schema version and never validate them again.
 
         Args:
-            job_id (str): The ID of the ScrapingJob instance to update.
-            prompt (str): The analysis prompt text to save.
+            job_id (str): The ScrapingJob instance's ID.
+            analysis_prompt (str): The analysis prompt sent to Gemini.
+            seo_report (SEOReportSchema | dict): The validated SEO report, or its JSON dump
+                at the current schema version (e.g. a cached analysis).
+
+        Return:
+            bool: True if the job was completed.
 
-        Returns:
-            None
         """
 
-        self.filter(id=job_id).update(
-            analysis_prompt=prompt,
+        if isinstance(seo_report, SEOReportSchema):
+            seo_report = seo_report.model_dump(mode="json")
+
+        return await self.atransition(
+            job_id,
+            [ScrapingJobStatusChoices.ANALYZING.value],
+            ScrapingJobStatusChoices.COMPLETED.value,
+            analysis_prompt=analysis_prompt,
+            seo_report=seo_report,
+            report_schema_version=SEO_REPORT_SCHEMA_VERSION,
+            error=None,
+            completed_at=timezone.now(),
         )
 
-    async def get_job_by_id(self, job_id: str) -> Optional[ScrapingJob]:
+    async def get_job_by_id(
+        self, job_id: str, user_id: Optional[int] = None
+    ) -> Optional[ScrapingJob]:
         """
         Retrieve a ScrapingJob instance by its ID.
 
-        Raises pydantic.ValidationError exception for invalid schema - caller must handle it.
-
         Args:
             job_id (str): The ID of the ScrapingJob instance to retrieve.
+            user_id (Optional[int]): When given, only return the job if it belongs to this user.
 
         Returns:
             Optional[ScrapingJob]: The ScrapingJob instance if found, otherwise None.
         """
 
-        job: ScrapingJob = await self.filter(id=job_id).afirst()
+        queryset = self.filter(id=job_id)
+        if user_id is not None:
+            queryset = queryset.filter(user_id=user_id)
 
-        if job and job.seo_report:
-            SEOReportSchema(**job.seo_report)
+        return await queryset.afirst()
 
-        return job
-
-    def set_job_to_completed(self, job_id: str) -> None:
+    async def aensure_current_report(self, job: ScrapingJob) -> ScrapingJob:
         """
-        Mark a ScrapingJob instance as completed by updating its status, clearing errors,
-        and setting the completion timestamp.
+        Make sure a ScrapingJob instance's SEO report matches the current schema version.
+
+        Reports already stamped with `SEO_REPORT_SCHEMA_VERSION` are returned untouched.
+        Older (or unversioned) reports are upgraded, validated and written back once,
+        so following reads trust them.
+
+        Raises pydantic.ValidationError exception for invalid schema - caller must handle it.
 
         Args:
-            job_id (str): The ID of the ScrapingJob instance to update.
+            job (ScrapingJob): The ScrapingJob instance holding the report.
 
         Returns:
-            None
+            ScrapingJob: The same instance with an up-to-date `seo_report`.
         """
-        self.filter(id=job_id).update(
-            status=ScrapingJobStatusChoices.COMPLETED.value,
-            error=None,
-            completed_at=timezone.now(),
+
+        if not job.seo_report or job.report_schema_version == SEO_REPORT_SCHEMA_VERSION:
+            return job
+
+        seo_report = upgrade_seo_report(job.seo_report, job.report_schema_version or 0)
+
+        job.seo_report = seo_report.model_dump(mode="json")
+        job.report_schema_version = SEO_REPORT_SCHEMA_VERSION
+        await self.filter(id=job.id).aupdate(
+            seo_report=job.seo_report,
+            report_schema_version=job.report_schema_version,
         )
 
-    async def set_job_to_failed(self, job_id: str, error: str) -> None:
+        return job
+
+    async def set_job_to_failed(
+        self, job_id: str, error: str, analysis_prompt: Optional[str] = None
+    ) -> bool:
         """
-        Mark a ScrapingJob instance as failed by updating its status, setting the error message,
-        and recording the completion timestamp.
+        Mark an active ScrapingJob instance as failed by updating its status, setting the
+        error message, and recording the completion timestamp.
 
         Args:
             job_id (str): The ID of the ScrapingJob instance to update.
             error (str): The error message explaining why the job failed.
+            analysis_prompt (Optional[str]): The analysis prompt built before the failure,
+                kept so the job can use smart retry.
 
         Returns:
-            None
+            bool: True if the job was marked as failed.
         """
-        await self.filter(id=job_id).aupdate(
-            status=ScrapingJobStatusChoices.FAILED.value,
-            error=error,
-            completed_at=timezone.now(),
+
+        fields = {"error": error, "completed_at": timezone.now()}
+        if analysis_prompt:
+            fields["analysis_prompt"] = analysis_prompt
+
+        return await self.atransition(
+            job_id,
+            ACTIVE_STATUSES,
+            ScrapingJobStatusChoices.FAILED.value,
+            **fields,
         )
 
-    def retry_job(self, job_id: str) -> None:
+    async def reset_job_for_scraping_retry(self, job_id: str) -> bool:
         """
-        Reset a ScrapingJob instance to allow it to be retried by setting its status
-        to PENDING and clearing error, results, SEO report, snapshot_id, and completion timestamp.
+        Reset a FAILED ScrapingJob instance to allow it to be scraped again by setting its
+        status to PENDING and clearing error, results, SEO report, snapshot_id,
+        and completion timestamp.
 
         Args:
             job_id (str): The ID of the ScrapingJob instance to reset.
 
         Returns:
-            None
+            bool: True if this call won the retry.
         """
 
-        self.filter(id=job_id).update(
-            status=ScrapingJobStatusChoices.PENDING.value,
+        return await self.atransition(
+            job_id,
+            [ScrapingJobStatusChoices.FAILED.value],
+            ScrapingJobStatusChoices.PENDING.value,
             error=None,
             completed_at=None,
             results=None,
+            results_blob_key=None,
             seo_report=None,
+            report_schema_version=None,
             snapshot_id=None,
         )
 
-    async def can_use_smart_retry(self, job_id: str, user_id: int) -> dict:
+    async def reset_job_for_analyzing_retry(self, job_id: str) -> bool:
         """
-        Check whether a ScrapingJob can use smart retry based on available scraping data
-        and analysis prompt.
+        Reset a FAILED ScrapingJob instance for analysis retry.
+        This clears analysis-related fields but preserves the scraping data.
 
         Args:
-            job_id (str): The ID of the ScrapingJob instance.
-            user_id (int): The ID of the user attempting the retry.
+            job_id (str): The ID of the ScrapingJob instance to reset.
 
         Returns:
-            dict: A dictionary containing the following keys:
-                - "can_retry_analysis_only" (bool): True if both scraping data and analysis
-                    prompt exist.
-                - "has_scraping_data" (bool): True if the job has scraping results.
-                - "has_analysis_prompt" (bool): True if the job has an analysis prompt.
+            bool: True if this call won the retry.
         """
 
-        job: ScrapingJob = await self.filter(id=job_id).afirst()
-
-        if not job or job.user.id != user_id:
-            return {
-                "can_retry_analysis_only": False,
-                "has_scraping_data": False,
-                "has_analysis_prompt": False,
-            }
-
-        has_scraping_data = job.results and len(job.results) > 0
-        has_analysis_prompt = bool(job.analysis_prompt)
-        can_retry_analysis_only = has_analysis_prompt and has_scraping_data
-
-        return {
-            "can_retry_analysis_only": can_retry_analysis_only,
-            "has_scraping_data": has_scraping_data,
-            "has_analysis_prompt": has_analysis_prompt,
-        }
+        return await self.atransition(
+            job_id,
+            [ScrapingJobStatusChoices.FAILED.value],
+            ScrapingJobStatusChoices.ANALYZING.value,
+            error=None,
+            completed_at=None,
+            seo_report=None,
+            report_schema_version=None,
+        )
 
-    async def reset_job_for_analyzing_retry(self, job_id: str) -> None:
+    async def aget_user_job(self, user_id: int, job_id: str) -> Optional[ScrapingJob]:
         """
-        Reset a ScrapingJob instance for analysis retry.
-        This clears analysis-related fields but preserves the scraping data.
+        Retrieve a ScrapingJob instance by its ID and user ID, upgrading its SEO report first
+        when it was stored with an older schema version.
+
+        Raises pydantic.ValidationError exception for invalid schema - caller must handle it.
 
         Args:
-            job_id (str): The ID of the ScrapingJob instance to reset.
+            user_id (int): The ID of the user who owns the job.
+            job_id (str): The ID of the job.
 
         Returns:
-            None
+            Optional[ScrapingJob]: The ScrapingJob instance if found, otherwise None.
         """
+        job: ScrapingJob = await self.filter(id=job_id, user=user_id).afirst()
+        if job:
+            await self.aensure_current_report(job)
 
-        await self.filter(id=job_id).aupdate(
-            status=ScrapingJobStatusChoices.ANALYZING.value,
-            error=None,
-            completed_at=None,
-            seo_report=None,
-        )
+        return job
 
     async def aget_job_by_snapshot_id(
         self, user_id: int, snapshot_id: str
     ) -> Optional[ScrapingJob]:
         """
-        Retrieve a ScrapingJob instance by its BrightData snapshot ID and user ID.
+        Retrieve a ScrapingJob instance by its BrightData snapshot ID and user ID, upgrading
+        its SEO report first when it was stored with an older schema version.
+
+        The jobs of a bulk batch share their snapshot, only the first one is returned, use
+        `aget_user_job` to get a given job.
 
         Raises pydantic.ValidationError exception for invalid schema - caller must handle it.
 
@@ -276,31 +524,111 @@ class ScrapingJobQuerySet(models.QuerySet):
             Optional[ScrapingJob]: The ScrapingJob instance if found, otherwise None.
         """
         job: ScrapingJob = await self.filter(snapshot_id=snapshot_id, user=user_id).afirst()
-        if job and job.seo_report:
-            SEOReportSchema(**job.seo_report)
+        if job:
+            await self.aensure_current_report(job)
 
         return job
 
-    async def aget_user_jobs(self, user_id: int) -> List[ScrapingJob]:
+    async def aget_stalled_jobs(self, limit: int) -> List[ScrapingJob]:
         """
-        Return a queryset of ScrapingJob instances belonging to a specific user.
+        Return the oldest stalled jobs, i.e. RUNNING jobs without any timeline event for
+        `STALLED_JOB_RUNNING_AFTER` seconds (their webhook was probably lost) and PENDING
+        jobs without any for `STALLED_JOB_PENDING_AFTER` seconds (their trigger failed or
+        was deferred).
 
-        Raises pydantic.ValidationError exception for invalid schema - caller must handle it.
+        Only the columns needed to resolve or re-trigger them are loaded.
+
+        Args:
+            limit (int): The maximum number of jobs to return.
+
+        Returns:
+            List[ScrapingJob]: The stalled jobs, least recently active first.
+        """
+
+        now = timezone.now()
+        running_before = now - timedelta(seconds=settings.STALLED_JOB_RUNNING_AFTER)
+        pending_before = now - timedelta(seconds=settings.STALLED_JOB_PENDING_AFTER)
+
+        queryset = (
+            self.alias(last_activity_at=Coalesce(Max("event__occurred_at"), "created_at"))
+            .filter(
+                models.Q(
+                    status=ScrapingJobStatusChoices.RUNNING.value,
+                    last_activity_at__lt=running_before,
+                )
+                | models.Q(
+                    status=ScrapingJobStatusChoices.PENDING.value,
+                    last_activity_at__lt=pending_before,
+                )
+            )
+            .only(*INGEST_JOB_FIELDS, "original_prompt", "country_code")
+            .order_by("last_activity_at")
+        )
+
+        return [job async for job in queryset[:limit]]
+
+    async def aget_user_jobs(
+        self, user_id: int, cursor: Optional[Cursor] = None, page_size: Optional[int] = None
+    ) -> CursorPage:
+        """
+        Return a page of ScrapingJob instances belonging to a specific user, newest first,
+        loading only the columns needed to list them (see `SCRAPING_JOB_LIST_FIELDS`).
+
+        The `results`, `seo_report` and `analysis_prompt` columns are never selected,
+        so the SEO report is not validated here either. Pages are keyset based on
+        (`created_at`, `id`) and served by the `scraping_job_user_created_idx` index.
 
         Args:
             user_id (int): The ID of the user whose jobs should be fetched.
+            cursor (Optional[Cursor]): Position to continue from, None for the first page.
+            page_size (Optional[int]): Number of jobs per page, defaults to
+                `SCRAPING_JOBS_PAGE_SIZE`.
 
         Returns:
-            Self: A ScrapingJobQuerySet filtered to the specified user's jobs.
+            CursorPage: The page's jobs with only the list columns loaded, plus the
+                next/previous cursors.
         """
 
-        jobs: List[ScrapingJob] = [job async for job in self.filter(user=user_id)]
+        queryset = self.filter(user=user_id).only(*SCRAPING_JOB_LIST_FIELDS)
 
-        for job in jobs:
-            if job and job.seo_report:
-                SEOReportSchema(**job.seo_report)
+        return await user_jobs_paginator.apaginate(
+            queryset, cursor, page_size or user_jobs_paginator.page_size
+        )
 
-        return jobs
+    async def aget_jobs_snapshot(
+        self, user_id: int, since: Optional[datetime]
+    ) -> Tuple[List[Dict[str, str]], bool]:
+        """
+        Return the ID and status of a user's jobs in progress, and of those with a timeline
+        event since `since`, newest first: what a client that stopped receiving the user's
+        job events at `since` needs to catch up (see `ScrapingJobsStatusWebsocketConsumer`).
+
+        Args:
+            user_id (int): The ID of the user whose jobs should be listed.
+            since (Optional[datetime]): When the client's last event was sent, None to only
+                list the jobs in progress.
+
+        Returns:
+            Tuple[List[Dict[str, str]], bool]: Up to `JOB_EVENT_SNAPSHOT_MAX_JOBS` jobs as
+                `job_id` and `status`, and whether no other job matched.
+        """
+
+        condition = Q(status__in=ACTIVE_STATUSES)
+        if since is not None:
+            condition |= Q(
+                id__in=ScrapingJobEvent.objects.filter(
+                    job__user=user_id, occurred_at__gte=since
+                ).values("job")
+            )
+
+        queryset = (
+            self.filter(condition, user=user_id)
+            .order_by("-created_at")
+            .values_list("id", "status")[: JOB_EVENT_SNAPSHOT_MAX_JOBS + 1]
+        )
+        jobs = [{"job_id": str(job_id), "status": status} async for job_id, status in queryset]
+
+        return jobs[:JOB_EVENT_SNAPSHOT_MAX_JOBS], len(jobs) <= JOB_EVENT_SNAPSHOT_MAX_JOBS
 
     def delete_job(self, job_id: str) -> bool:
         """
@@ -351,13 +679,49 @@ class ScrapingJob(CreatedAtMixin):
         help_text="BrightData scraping job's ID for tracking",
     )
 
+    country_code = models.CharField(
+        max_length=2,
+        null=True,
+        blank=True,
+        help_text="Country the prompt is scraped for",
+    )
+    scrape_cache_key = models.CharField(
+        max_length=64,
+        null=True,
+        blank=True,
+        help_text="Key of the scrape result cache entry this job reads or fills",
+    )
+
+    batch_id = models.UUIDField(
+        null=True,
+        blank=True,
+        help_text="Bulk creation batch sharing the job's BrightData trigger",
+    )
+    batch_index = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text="`index` of the job's input row in its batch's BrightData trigger",
+    )
+
+    use_analysis_cache = models.BooleanField(
+        default=True,
+        blank=True,
+        help_text="Whether the analysis may reuse a cached SEO report for identical input",
+    )
+
     status = models.CharField(max_length=10, choices=ScrapingJobStatusChoices.choices, blank=True)
 
     results = models.JSONField(
         encoder=DjangoJSONEncoder,
         blank=True,
         null=True,
-        help_text="Optional, filled when webhook receives data from BrightData's scraper",
+        help_text="Legacy inline scraping data, new jobs store it in the blob store",
+    )
+    results_blob_key = models.CharField(
+        max_length=64,
+        null=True,
+        blank=True,
+        help_text="Blob store key of the scraping data received from BrightData's scraper",
     )
 
     seo_report = models.JSONField(
@@ -366,6 +730,11 @@ class ScrapingJob(CreatedAtMixin):
         null=True,
         help_text="Structured SEO report from AI analysis",
     )
+    report_schema_version = models.PositiveSmallIntegerField(
+        null=True,
+        blank=True,
+        help_text="SEOReportSchema version `seo_report` was validated against",
+    )
     error = models.TextField(null=True, blank=True)
     completed_at = models.DateTimeField(null=True, blank=True)
 
@@ -378,4 +747,359 @@ class ScrapingJob(CreatedAtMixin):
             models.Index(fields=["status"], name="scraping_job_statust_idx"),
             models.Index(fields=["user"], name="scraping_job_user_idx"),
             models.Index(fields=["user", "created_at"], name="scraping_job_user_created_idx"),
+            models.Index(fields=["batch_id", "batch_index"], name="scraping_job_batch_idx"),
         ]
+
+    @property
+    def has_scraping_data(self) -> bool:
+        return bool(self.results_blob_key) or bool(self.results)
+
+    def get_smart_retry_info(self) -> dict:
+        """
+        Check whether the job can use smart retry based on available scraping data
+        and analysis prompt.
+
+        Returns:
+            dict: A dictionary containing the following keys:
+                - "can_retry_analysis_only" (bool): True if both scraping data and analysis
+                    prompt exist.
+                - "has_scraping_data" (bool): True if the job has scraping results.
+                - "has_analysis_prompt" (bool): True if the job has an analysis prompt.
+        """
+
+        has_scraping_data = self.has_scraping_data
+        has_analysis_prompt = bool(self.analysis_prompt)
+
+        return {
+            "can_retry_analysis_only": has_analysis_prompt and has_scraping_data,
+            "has_scraping_data": has_scraping_data,
+            "has_analysis_prompt": has_analysis_prompt,
+        }
+
+    def load_results(self) -> List[Any]:
+        """
+        Return the scraping data received from BrightData as a list of records, read from
+        the blob store or, for jobs stored before it existed, from the inline `results`.
+
+        Raises core.blob_store.BlobNotFoundError if the referenced blob is missing.
+        """
+
+        results = (
+            get_blob_store().read_json(self.results_blob_key)
+            if self.results_blob_key
+            else self.results
+        )
+
+        if not results:
+            return []
+
+        return results if isinstance(results, list) else [results]
+
+
+class ScrapeResultCacheEntryQuerySet(models.QuerySet):
+    async def aget_fresh(self, cache_key: str) -> Optional[ScrapeResultCacheEntry]:
+        """
+        Return the cached scrape result for a key if it is younger than
+        `SCRAPE_RESULT_CACHE_TTL` seconds.
+
+        Args:
+            cache_key (str): The scrape result cache key (see `build_scrape_cache_key`).
+
+        Returns:
+            Optional[ScrapeResultCacheEntry]: The fresh entry if any, otherwise None.
+        """
+
+        if settings.SCRAPE_RESULT_CACHE_TTL <= 0:
+            return None
+
+        fresh_after = timezone.now() - timedelta(seconds=settings.SCRAPE_RESULT_CACHE_TTL)
+
+        return await self.filter(cache_key=cache_key, updated_at__gte=fresh_after).afirst()
+
+    async def aget_fresh_many(self, cache_keys: Iterable[str]) -> Dict[str, ScrapeResultCacheEntry]:
+        """
+        Return the cached scrape results younger than `SCRAPE_RESULT_CACHE_TTL` seconds
+        for several keys in one query.
+
+        Args:
+            cache_keys (Iterable[str]): The scrape result cache keys.
+
+        Returns:
+            Dict[str, ScrapeResultCacheEntry]: The fresh entries by cache key.
+        """
+
+        if settings.SCRAPE_RESULT_CACHE_TTL <= 0:
+            return {}
+
+        fresh_after = timezone.now() - timedelta(seconds=settings.SCRAPE_RESULT_CACHE_TTL)
+
+        return {
+            entry.cache_key: entry
+            async for entry in self.filter(
+                cache_key__in=set(cache_keys), updated_at__gte=fresh_after
+            )
+        }
+
+    async def astore(self, cache_key: str, results_blob_key: str, snapshot_id: str) -> None:
+        """
+        Create or refresh the cached scrape result for a key.
+
+        Args:
+            cache_key (str): The scrape result cache key (see `build_scrape_cache_key`).
+            results_blob_key (str): Blob store key of the scraping data.
+            snapshot_id (str): BrightData snapshot the scraping data came from.
+
+        Returns:
+            None
+        """
+
+        await self.aupdate_or_create(
+            cache_key=cache_key,
+            defaults={"results_blob_key": results_blob_key, "snapshot_id": snapshot_id},
+        )
+
+
+class ScrapeResultCacheEntry(TimeStampMixin):
+    cache_key = models.CharField(
+        max_length=64,
+        unique=True,
+        help_text="SHA-256 of the normalized prompt, country and Perplexity prompt version",
+    )
+    results_blob_key = models.CharField(
+        max_length=64,
+        help_text="Blob store key of the cached scraping data",
+    )
+    snapshot_id = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True,
+        help_text="BrightData snapshot the cached scraping data came from",
+    )
+
+    objects: ScrapeResultCacheEntryQuerySet = ScrapeResultCacheEntryQuerySet.as_manager()
+
+
+class AnalysisCacheEntryQuerySet(models.QuerySet):
+    async def aget_fresh(self, cache_key: str) -> Optional[AnalysisCacheEntry]:
+        """
+        Return the cached SEO report for an analysis cache key and mark it as recently used.
+
+        Reports cached with an older `SEO_REPORT_SCHEMA_VERSION` are ignored.
+
+        Args:
+            cache_key (str): The analysis cache key (see `build_analysis_cache_key`).
+
+        Returns:
+            Optional[AnalysisCacheEntry]: The cached entry if any, otherwise None.
+        """
+
+        entry = await self.filter(
+            cache_key=cache_key, report_schema_version=SEO_REPORT_SCHEMA_VERSION
+        ).afirst()
+
+        if entry:
+            await self.filter(id=entry.id).aupdate(
+                hits=models.F("hits") + 1, updated_at=timezone.now()
+            )
+
+        return entry
+
+    async def astore(self, cache_key: str, seo_report: SEOReportSchema) -> None:
+        """
+        Cache a validated SEO report under an analysis cache key, then evict the least
+        recently used entries above `ANALYSIS_CACHE_MAX_ENTRIES`.
+
+        Args:
+            cache_key (str): The analysis cache key (see `build_analysis_cache_key`).
+            seo_report (SEOReportSchema): The validated SEO report.
+
+        Returns:
+            None
+        """
+
+        await self.aupdate_or_create(
+            cache_key=cache_key,
+            defaults={
+                "seo_report": seo_report.model_dump(mode="json"),
+                "report_schema_version": SEO_REPORT_SCHEMA_VERSION,
+            },
+        )
+
+        max_entries = settings.ANALYSIS_CACHE_MAX_ENTRIES
+        evicted_ids = [
+            entry_id
+            async for entry_id in self.order_by("-updated_at").values_list("id", flat=True)[
+                max_entries:
+            ]
+        ]
+        if evicted_ids:
+            await self.filter(id__in=evicted_ids).adelete()
+
+
+class AnalysisCacheEntry(TimeStampMixin):
+    cache_key = models.CharField(
+        max_length=64,
+        unique=True,
+        help_text="SHA-256 of the prompt version, user prompt, model and generation settings",
+    )
+    seo_report = models.JSONField(
+        encoder=DjangoJSONEncoder,
+        help_text="Validated SEO report produced for this analysis input",
+    )
+    report_schema_version = models.PositiveSmallIntegerField(
+        help_text="SEOReportSchema version `seo_report` was validated against",
+    )
+    hits = models.PositiveIntegerField(default=0, blank=True)
+
+    objects: AnalysisCacheEntryQuerySet = AnalysisCacheEntryQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["updated_at"], name="analysis_cache_updated_at_idx"),
+        ]
+
+
+class ScrapingJobEventQuerySet(models.QuerySet):
+    def record(self, job_id: str, event: str, occurred_at: Optional[datetime] = None) -> None:
+        """
+        Append an event to a ScrapingJob instance's timeline. A terminal status also records
+        the phase durations of the run it ends in `job_phase_duration_seconds`.
+
+        Args:
+            job_id (str): The ID of the ScrapingJob instance.
+            event (str): One of `ScrapingJobEventChoices`.
+            occurred_at (Optional[datetime]): When the event happened, defaults to now.
+
+        Returns:
+            None
+        """
+
+        self.create(job_id=job_id, event=event, occurred_at=occurred_at or timezone.now())
+
+        if event in TERMINAL_STATUSES:
+            observe_last_run(self.filter(job_id=job_id).values_list("event", "occurred_at"))
+
+    async def arecord(
+        self, job_id: str, event: str, occurred_at: Optional[datetime] = None
+    ) -> None:
+        """Async version of `record`"""
+
+        await self.acreate(job_id=job_id, event=event, occurred_at=occurred_at or timezone.now())
+
+        if event in TERMINAL_STATUSES:
+            await aobserve_last_run(
+                [
+                    pair
+                    async for pair in self.filter(job_id=job_id).values_list("event", "occurred_at")
+                ]
+            )
+
+    async def arecord_many(
+        self, job_ids: List[str], event: str, occurred_at: Optional[datetime] = None
+    ) -> None:
+        """Append the same event to the timelines of several jobs with one INSERT"""
+
+        occurred_at = occurred_at or timezone.now()
+        await self.abulk_create(
+            [self.model(job_id=job_id, event=event, occurred_at=occurred_at) for job_id in job_ids]
+        )
+
+        if event in TERMINAL_STATUSES:
+            for job_id in job_ids:
+                await aobserve_last_run(
+                    [
+                        pair
+                        async for pair in self.filter(job_id=job_id).values_list(
+                            "event", "occurred_at"
+                        )
+                    ]
+                )
+
+
+class ScrapingJobEvent(models.Model):
+    job = models.ForeignKey(
+        ScrapingJob,
+        on_delete=models.CASCADE,
+        related_name="events",
+        related_query_name="event",
+    )
+    event = models.CharField(max_length=20, choices=ScrapingJobEventChoices.choices)
+    occurred_at = models.DateTimeField(default=timezone.now)
+
+    objects: ScrapingJobEventQuerySet = ScrapingJobEventQuerySet.as_manager()
+
+    class Meta:
+        ordering = ("occurred_at", "id")
+        indexes = [
+            models.Index(fields=["job", "occurred_at"], name="scraping_job_event_job_idx"),
+        ]
+
+
+class WebhookDeliveryQuerySet(models.QuerySet):
+    async def aclaim(self, job_id: str, payload_digest: str, received_at: datetime) -> bool:
+        """
+        Record that a BrightData delivery is ingested for a job, unless it already was.
+
+        Args:
+            job_id (str): The ID of the ScrapingJob instance.
+            payload_digest (str): SHA-256 of the delivery's raw body.
+            received_at (datetime): When the delivery was received.
+
+        Returns:
+            bool: False when the same payload was already delivered for the job.
+        """
+
+        _, created = await self.aget_or_create(
+            job_id=job_id, payload_digest=payload_digest, defaults={"received_at": received_at}
+        )
+
+        return created
+
+    async def arelease(self, job_id: str, payload_digest: str) -> None:
+        """Forget a claimed delivery whose ingestion failed, so a redelivery is ingested"""
+
+        await self.filter(job_id=job_id, payload_digest=payload_digest).adelete()
+
+
+class WebhookDelivery(CreatedAtMixin):
+    """Idempotency record of a BrightData webhook payload ingested for a job"""
+
+    job = models.ForeignKey(
+        ScrapingJob,
+        on_delete=models.CASCADE,
+        related_name="webhook_deliveries",
+        related_query_name="webhook_delivery",
+    )
+    payload_digest = models.CharField(
+        max_length=64,
+        help_text="SHA-256 of the delivery's raw body, i.e. its blob store key",
+    )
+    received_at = models.DateTimeField()
+
+    objects: WebhookDeliveryQuerySet = WebhookDeliveryQuerySet.as_manager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["job", "payload_digest"], name="unique_webhook_delivery_payload"
+            ),
+        ]
+
+
+def observe_last_run(events: Iterable[tuple]) -> None:
+    """Record the phase durations of a job's latest run in `job_phase_duration_seconds`"""
+
+    phases = compute_job_phases(events)
+    if not phases:
+        return
+
+    last_run = phases[-1]["run"]
+    for phase in phases:
+        if phase["run"] == last_run:
+            job_phase_duration_seconds.observe(phase["seconds"], phase=phase["phase"])
+
+
+async def aobserve_last_run(events: List[tuple]) -> None:
+    """Async version of `observe_last_run`, the samples are written to Redis off the event loop"""
+
+    await sync_to_async(observe_last_run, thread_sensitive=False)(events)
@@ -1,7 +1,7 @@
 # flake8: noqa: E402
 
 # Python Imports
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 # App Imports
 from .base import BasePrompt
@@ -9,6 +9,9 @@ from .base import BasePrompt
 
 class GeminiPrompt(BasePrompt):
 
+    # Bump on every SYSTEM_PROMPT or *_TEMPLATE change, cached analyses are keyed by it.
+    VERSION = 2
+
     SYSTEM_PROMPT = """
         You are an expert SEO analyst specializing in comprehensive website and entity analysis.
 
@@ -122,22 +125,116 @@ class GeminiPrompt(BasePrompt):
     USER_TEMPLATE = """
         Please analyze the following scraping data and generate a comprehensive SEO report.
 
+        The scraping data is a JSON document: "answers" are the search answers about the entity, "sources" the pages they cite, referenced from each answer's "source_ids" by "id". Use the sources' URLs exactly as given as evidence.
+
+        SCRAPING DATA:
+        {scraping_data}
+
+        Generate a complete SEO report following the system prompt guidelines. Return only the JSON response matching the SeoReport interface structure.
+        """
+
+    # User prompt of one chunk of a map-reduce analysis, see `chunk_scraping_data`
+    MAP_TEMPLATE = """
+        Please analyze the following scraping data and generate an SEO report of the findings it supports.
+
+        The scraping data is one part of a larger set split for analysis, the reports of all parts are merged afterwards. Report only what this part supports: do not guess about the other parts, count only the sources of this part, and name themes, keywords, competitors, platforms and recommendations plainly so the same finding reads the same in every part.
+
+        The scraping data is a JSON document: "answers" are the search answers about the entity, "sources" the pages they cite, referenced from each answer's "source_ids" by "id". Use the sources' URLs exactly as given as evidence.
+
         SCRAPING DATA:
-        ${scraping_data}
+        {scraping_data}
 
         Generate a complete SEO report following the system prompt guidelines. Return only the JSON response matching the SeoReport interface structure.
         """
 
+    # User prompt of one section of a sectioned analysis, see `SEO_REPORT_SECTIONS`
+    SECTION_TEMPLATE = """
+        Please analyze the following scraping data and generate only these sections of the SEO report: {sections}.
+
+        The other sections are generated separately. Return only a JSON object with exactly the keys {sections}, each following the SeoReport interface structure for that section.
+
+        The scraping data is a JSON document: "answers" are the search answers about the entity, "sources" the pages they cite, referenced from each answer's "source_ids" by "id". Use the sources' URLs exactly as given as evidence.
+
+        SCRAPING DATA:
+        {scraping_data}
+        """
+
+    # User prompt of the summary pass of a sectioned analysis, run on the other sections
+    SUMMARY_TEMPLATE = """
+        Please write the summary section of the following SEO report, generated from scraping data about the entity.
+
+        Base the summary only on the report's findings. Return only a JSON object with the key summary, following the SeoReport interface structure for that section.
+
+        SEO REPORT:
+        {report}
+        """
+
+    # User prompt regenerating the sections of a report that failed validation
+    REPAIR_TEMPLATE = """
+        Your SEO report for the following scraping data failed validation in these sections: {sections}.
+
+        VALIDATION ERRORS:
+        {errors}
+
+        INVALID SECTIONS:
+        {report}
+
+        Generate these sections again from the scraping data, fixing the validation errors. Return only a JSON object with exactly the keys {sections}, each following the SeoReport interface structure for that section.
+
+        The scraping data is a JSON document: "answers" are the search answers about the entity, "sources" the pages they cite, referenced from each answer's "source_ids" by "id". Use the sources' URLs exactly as given as evidence.
+
+        SCRAPING DATA:
+        {scraping_data}
+        """
+
     def build(
-        self, prmpt_type: Literal["USER", "SYSTEM"], scraping_data: Optional[str] = None
+        self,
+        prmpt_type: Literal["USER", "MAP", "SECTION", "SUMMARY", "REPAIR", "SYSTEM"],
+        scraping_data: Optional[str] = None,
+        sections: Optional[List[str]] = None,
+        report: Optional[str] = None,
+        errors: Optional[str] = None,
     ) -> str:
         if prmpt_type == "SYSTEM":
             return self._clean(self.SYSTEM_PROMPT)
 
+        if prmpt_type == "REPAIR":
+            if scraping_data is None or not sections or report is None or not errors:
+                raise ValueError(
+                    "scraping_data, sections, report and errors are required when "
+                    "prmpt_type='REPAIR'."
+                )
+
+            return self._clean(
+                self.REPAIR_TEMPLATE.format(
+                    sections=", ".join(sections),
+                    errors=errors,
+                    report=report,
+                    scraping_data=scraping_data,
+                )
+            )
+
+        if prmpt_type == "SUMMARY":
+            if report is None:
+                raise ValueError("report is required when prmpt_type='SUMMARY'.")
+
+            return self._clean(self.SUMMARY_TEMPLATE.format(report=report))
+
         if scraping_data is None:
-            raise ValueError("scraping_data is required when prmpt_type='USER'.")
-        else:
-            return self._clean(self.USER_TEMPLATE.format(scraping_data=scraping_data))
+            raise ValueError(f"scraping_data is required when prmpt_type='{prmpt_type}'.")
+
+        if prmpt_type == "SECTION":
+            if not sections:
+                raise ValueError("sections are required when prmpt_type='SECTION'.")
+
+            return self._clean(
+                self.SECTION_TEMPLATE.format(
+                    sections=", ".join(sections), scraping_data=scraping_data
+                )
+            )
+
+        template = self.MAP_TEMPLATE if prmpt_type == "MAP" else self.USER_TEMPLATE
+        return self._clean(template.format(scraping_data=scraping_data))
 
 
 gemini_prompt = GeminiPrompt()
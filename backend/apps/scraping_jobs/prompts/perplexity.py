@@ -6,6 +6,9 @@ from .base import BasePrompt
 class PerplexityPrompt(BasePrompt):
     """Perplexity scraper prompt for entity analysis"""
 
+    # Bump on every TEMPLATE change, cached scrape results are keyed by it.
+    VERSION = 1
+
     TEMPLATE = """
     
         You are an SEO research assistant specializing in comprehensive entity analysis.
@@ -0,0 +1,296 @@
+# Python Imports
+import json
+import math
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+# Third-party Imports
+from pydantic import ValidationError
+
+# App Imports
+from ..constants import GEMINI_CHARS_PER_TOKEN
+from ..schemas import ScrapingDataSchema, SourceSchema
+from ..utils import canonicalize_url, estimate_tokens
+
+EMPTY_DOCUMENT = '{"prompt":"","scraped_at":"","answers":[],"sources":[]}'
+
+
+@dataclass
+class CompactScrapingData:
+    text: str
+    answers: int
+    sources: int
+    raw_tokens: int
+    tokens: int
+    # Estimated tokens of the document without a budget
+    untrimmed_tokens: int
+
+    @property
+    def tokens_saved(self) -> int:
+        return max(0, self.raw_tokens - self.tokens)
+
+
+def dumps(value: Any) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def normalize_record(record: Any) -> Optional[ScrapingDataSchema]:
+    """
+    Validate a BrightData record against `ScrapingDataSchema`, with its `citations`
+    merged into its sources. Records without an answer (e.g. error records) give None.
+    """
+
+    if not isinstance(record, dict):
+        return None
+
+    sources = []
+    for source in [*(record.get("sources") or []), *(record.get("citations") or [])]:
+        if isinstance(source, str):
+            source = {"url": source}
+
+        if isinstance(source, dict) and source.get("url"):
+            sources.append(source)
+
+    try:
+        return ScrapingDataSchema.model_validate({**record, "sources": sources})
+    except ValidationError:
+        return None
+
+
+def compact_scraping_data(records: List[Any], token_budget: int) -> CompactScrapingData:
+    """
+    Serialize BrightData records into the compact JSON document of the Gemini user prompt:
+
+        {"prompt": ..., "scraped_at": ..., "answers": [{"answer": ..., "source_ids": [1]}],
+         "sources": [{"id": 1, "url": ..., "title": ..., "description": ...}]}
+
+    Records are normalized with `normalize_record`. Sources are de-duplicated by
+    canonical URL (see `canonicalize_url`) into one table, ranked by how many answers
+    cite them then by first citation, and answers refer to them by ID. An answer only
+    repeats the prompt when it differs from the document's.
+
+    The document is filled up to `token_budget` (estimated) tokens in a fixed priority
+    order: answers in record order, the last one that fits truncated, then the URL and
+    title of the sources they cite by rank, then those sources' descriptions by rank.
+    Whatever does not fit is dropped, including the IDs of dropped sources.
+
+    Args:
+        records (List[Any]): The job's BrightData records.
+        token_budget (int): The maximum estimated tokens of the document.
+
+    Returns:
+        CompactScrapingData: The document and its size against the records' `repr`,
+            which the prompt used to embed.
+    """
+
+    normalized = [record for record in map(normalize_record, records) if record]
+    budget = token_budget * GEMINI_CHARS_PER_TOKEN
+
+    sources: Dict[str, dict] = {}
+    citations: Counter = Counter()
+    cited_keys: List[List[str]] = []
+
+    for record in normalized:
+        keys = []
+        for source in record.sources:
+            key = canonicalize_url(source.url)
+            # Later citations of the same page fill in what the first one lacked
+            known = sources.setdefault(key, {"url": source.url, "title": None, "description": None})
+            known["title"] = known["title"] or source.title
+            known["description"] = known["description"] or source.description
+
+            if key not in keys:
+                keys.append(key)
+                citations[key] += 1
+
+        cited_keys.append(keys)
+
+    # dicts keep insertion order, i.e. the first citation order
+    ranked = sorted(sources, key=lambda key: -citations[key])
+    source_ids = {key: index for index, key in enumerate(ranked, start=1)}
+
+    document: Dict[str, Any] = {
+        "prompt": normalized[0].prompt if normalized else None,
+        "scraped_at": max((record.timestamp or "" for record in normalized), default="") or None,
+        "answers": [],
+        "sources": [],
+    }
+    used = len(dumps(document))
+
+    answers: List[Dict[str, Any]] = []
+    for record, keys in zip(normalized, cited_keys):
+        answer: Dict[str, Any] = {"answer": record.answer_text}
+        if record.prompt != document["prompt"]:
+            answer["prompt"] = record.prompt
+        answer["source_ids"] = [source_ids[key] for key in keys]
+        answers.append(answer)
+
+    untrimmed = used + sum(len(dumps(answer)) + 1 for answer in answers)
+    untrimmed += sum(len(dumps({"id": source_ids[key], **sources[key]})) + 1 for key in ranked)
+
+    for record, answer in zip(normalized, answers):
+        size = len(dumps(answer)) + 1
+        if used + size > budget:
+            room = budget - used - (size - len(dumps(record.answer_text)))
+            if room > 0:
+                answer["answer"] = record.answer_text[:room]
+                # Escapes make the dumped text longer than the truncated one
+                while answer["answer"] and used + len(dumps(answer)) + 1 > budget:
+                    answer["answer"] = answer["answer"][: -max(1, len(answer["answer"]) // 10)]
+
+            if answer["answer"]:
+                document["answers"].append(answer)
+                used += len(dumps(answer)) + 1
+            break
+
+        document["answers"].append(answer)
+        used += size
+
+    cited_ids = {source_id for answer in document["answers"] for source_id in answer["source_ids"]}
+    kept: Dict[int, dict] = {}
+
+    for key in ranked:
+        if source_ids[key] not in cited_ids:
+            continue
+
+        source = {"id": source_ids[key], "url": sources[key]["url"]}
+        if sources[key]["title"]:
+            source["title"] = sources[key]["title"]
+
+        size = len(dumps(source)) + 1
+        if used + size <= budget:
+            kept[source["id"]] = source
+            used += size
+
+    for key in ranked:
+        source = kept.get(source_ids[key])
+        description = sources[key]["description"]
+        if not source or not description:
+            continue
+
+        size = len(dumps(description)) + len('"description":') + 1
+        if used + size <= budget:
+            source["description"] = description
+            used += size
+
+    document["sources"] = list(kept.values())
+    for answer in document["answers"]:
+        answer["source_ids"] = [
+            source_id for source_id in answer["source_ids"] if source_id in kept
+        ]
+
+    text = dumps(document)
+
+    return CompactScrapingData(
+        text=text,
+        answers=len(document["answers"]),
+        sources=len(kept),
+        raw_tokens=estimate_tokens(repr(records)),
+        tokens=estimate_tokens(text),
+        untrimmed_tokens=math.ceil(untrimmed / GEMINI_CHARS_PER_TOKEN),
+    )
+
+
+def chunk_scraping_data(records: List[Any], chunk_tokens: int) -> List[CompactScrapingData]:
+    """
+    Split BrightData records into compact documents (see `compact_scraping_data`) of up to
+    `chunk_tokens` estimated tokens each, analyzed separately by a map-reduce analysis.
+
+    Records are grouped in order, a chunk holds answers with the sources they cite,
+    so a source cited from several chunks is repeated in each of them. A record larger
+    than a chunk is first split with `split_record`, so each of its sources is in a chunk.
+
+    Args:
+        records (List[Any]): The job's BrightData records.
+        chunk_tokens (int): The maximum estimated tokens of a chunk's document.
+
+    Returns:
+        List[CompactScrapingData]: The chunks, in record order.
+    """
+
+    budget = chunk_tokens * GEMINI_CHARS_PER_TOKEN
+    groups: List[List[Any]] = []
+    used = 0
+
+    for record in records:
+        normalized = normalize_record(record)
+        if not normalized:
+            continue
+
+        for part in split_record(normalized, budget):
+            size = estimate_answer_size(part) + sum(map(estimate_source_size, part.sources))
+
+            if not groups or used + size > budget:
+                groups.append([])
+                used = len(EMPTY_DOCUMENT)
+
+            groups[-1].append(part.model_dump())
+            used += size
+
+    return [compact_scraping_data(group, chunk_tokens) for group in groups]
+
+
+def split_record(record: ScrapingDataSchema, budget: int) -> List[ScrapingDataSchema]:
+    """
+    Split a normalized record too large for a compact document of `budget` characters into
+    records that fit, in order. The answer text is cut in as many even parts as needed and
+    the sources are spread over the parts in order, each source in exactly one of them.
+
+    Args:
+        record (ScrapingDataSchema): The normalized BrightData record.
+        budget (int): The maximum characters of a compact document.
+
+    Returns:
+        List[ScrapingDataSchema]: The record itself when it fits, otherwise its parts.
+    """
+
+    sizes = [estimate_source_size(source) for source in record.sources]
+    text_size = len(dumps(record.answer_text)) - len('""')
+    # A prompt about as large as the budget is trimmed by `compact_scraping_data` anyway
+    room = max(
+        budget
+        - len(EMPTY_DOCUMENT)
+        - estimate_answer_size(record.model_copy(update={"answer_text": ""})),
+        budget // 2,
+    )
+
+    if text_size + sum(sizes) <= room:
+        return [record]
+
+    count = math.ceil((text_size + sum(sizes)) / room)
+    step = math.ceil(len(record.answer_text) / count) or 1
+    bounds = [*range(0, len(record.answer_text), step), len(record.answer_text)]
+    parts = [
+        {"answer_text": record.answer_text[start:end], "sources": []}
+        for start, end in zip(bounds, bounds[1:])
+    ] or [{"answer_text": "", "sources": []}]
+    used = [len(dumps(part["answer_text"])) - len('""') for part in parts]
+
+    index = 0
+    for source, size in zip(record.sources, sizes):
+        # Sources go in order, to the first part with room left after the previous one
+        while index < len(parts) and used[index] + size > room:
+            index += 1
+
+        if index == len(parts):
+            parts.append({"answer_text": "", "sources": []})
+            used.append(0)
+
+        parts[index]["sources"].append(source)
+        used[index] += size
+
+    return [record.model_copy(update=part) for part in parts]
+
+
+def estimate_answer_size(record: ScrapingDataSchema) -> int:
+    """Overestimate the characters of a record's answer in a compact document, sources aside"""
+
+    answer = {"answer": record.answer_text, "prompt": record.prompt, "source_ids": []}
+    return len(dumps(answer)) + len(dumps(record.timestamp)) + 1
+
+
+def estimate_source_size(source: SourceSchema) -> int:
+    """Overestimate the characters of a source in a compact document, its IDs included"""
+
+    return len(dumps(source.model_dump(exclude_none=True))) + len('"id":0,') + 16
@@ -0,0 +1,95 @@
+# Python Imports
+import json
+import tempfile
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator
+
+# Project Imports
+from core.blob_store import CHUNK_SIZE, get_blob_store
+from core.json_stream import iter_json_items
+
+# App Imports
+from .utils import get_record_index, is_cacheable_record
+
+
+@dataclass
+class StoredRecords:
+    key: str
+    count: int
+    cacheable: bool
+
+
+class RecordSpool:
+    """
+    Spool BrightData records one at a time into a temporary file holding them as a JSON
+    array, then store that file in the blob store. Only one record is in memory at a time.
+
+    The stored bytes are those of `BlobStore.put_json` for the same list, so a payload
+    stored either way gets the same content key.
+    """
+
+    def __init__(self) -> None:
+        self.file = tempfile.TemporaryFile()
+        self.count = 0
+        self.cacheable = True
+
+    def add(self, record: Any) -> None:
+        self.file.write(b"," if self.count else b"[")
+        self.file.write(json.dumps(record, separators=(",", ":"), default=str).encode())
+        self.count += 1
+        self.cacheable = self.cacheable and is_cacheable_record(record)
+
+    def store(self) -> StoredRecords:
+        """Store the spooled records in the blob store and close the spool"""
+
+        with self.file:
+            self.file.write(b"]" if self.count else b"[]")
+            self.file.seek(0)
+            key = get_blob_store().put_stream(iter(lambda: self.file.read(CHUNK_SIZE), b""))
+
+        return StoredRecords(key=key, count=self.count, cacheable=self.cacheable and self.count > 0)
+
+
+def iter_blob_records(key: str) -> Iterator[Any]:
+    """Yield the records of a JSON blob one at a time, see `iter_json_items`"""
+
+    with get_blob_store().open(key) as stream:
+        yield from iter_json_items(stream)
+
+
+def store_records(records: Iterable[Any]) -> StoredRecords:
+    """Store BrightData records, e.g. streamed by `iter_json_items`, as one blob"""
+
+    spool = RecordSpool()
+
+    try:
+        for record in records:
+            spool.add(record)
+    except BaseException:
+        spool.file.close()
+        raise
+
+    return spool.store()
+
+
+def store_records_by_index(records: Iterable[Any]) -> Dict[int, StoredRecords]:
+    """
+    Store the BrightData records of a multi-row trigger as one blob per input row, keyed
+    by the row's `index` (see `get_record_index`). Records without an index are dropped.
+    """
+
+    spools: Dict[int, RecordSpool] = {}
+
+    try:
+        for record in records:
+            index = get_record_index(record)
+            if index is None:
+                continue
+
+            spools.setdefault(index, RecordSpool()).add(record)
+
+        return {index: spool.store() for index, spool in spools.items()}
+
+    finally:
+        for spool in spools.values():
+            spool.file.close()
@@ -0,0 +1,420 @@
+# Python Imports
+from collections import Counter
+from itertools import chain
+from typing import Callable, Dict, Iterable, List, Optional, TypeVar
+from urllib.parse import urlsplit
+
+# App Imports
+from .constants import (
+    SEO_REPORT_MAX_COMPETITORS,
+    SEO_REPORT_MAX_CONTENT_KEYWORDS,
+    SEO_REPORT_MAX_KEYWORD_THEMES,
+    SEO_REPORT_MAX_RECOMMENDATIONS,
+    SEO_REPORT_MAX_SUMMARY_ITEMS,
+    SEO_REPORT_MAX_THEME_KEYWORDS,
+)
+from .schemas import (
+    BacklinkAnalysisSchema,
+    CompetitorSchema,
+    ContentAnalysisSchema,
+    ContentKeywordSchema,
+    ContentThemeSchema,
+    DateRangeSchema,
+    EntityType,
+    EvidenceSchema,
+    InventorySchema,
+    KeywordsSchema,
+    KeywordThemeSchema,
+    MetaSchema,
+    PlatformSchema,
+    Priority,
+    RecommendationSchema,
+    RelationshipType,
+    Sentiment,
+    SentimentSchema,
+    SEOReportSchema,
+    SocialPresenceSchema,
+    SourceTypesSchema,
+    SummarySchema,
+)
+from .utils import canonicalize_url
+
+T = TypeVar("T")
+
+PRIORITY_RANKS = {Priority.High: 0, Priority.MEDIUM: 1, Priority.LOW: 2}
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(text.split()).casefold()
+
+
+def normalize_domain(domain: str) -> str:
+    host = urlsplit(domain if "//" in domain else f"//{domain.strip()}").hostname or domain
+    return host.lower().removeprefix("www.")
+
+
+def group_by(items: Iterable[T], key: Callable[[T], str]) -> List[List[T]]:
+    """Group items by key, groups and their items in first appearance order"""
+
+    groups: Dict[str, List[T]] = {}
+    for item in items:
+        groups.setdefault(key(item), []).append(item)
+
+    return list(groups.values())
+
+
+def most_common(values: Iterable[T], default: Optional[T] = None) -> Optional[T]:
+    """The most frequent value, ties going to the first seen, ignoring None"""
+
+    counts = Counter(value for value in values if value is not None)
+    return counts.most_common(1)[0][0] if counts else default
+
+
+def first(values: Iterable[Optional[T]]) -> Optional[T]:
+    return next((value for value in values if value), None)
+
+
+def merge_unique(
+    lists: Iterable[Optional[List[str]]], limit: Optional[int] = None
+) -> Optional[List[str]]:
+    """Union of string lists compared by `normalize_text`, or None when all are None"""
+
+    lists = list(lists)
+    if all(values is None for values in lists):
+        return None
+
+    merged: Dict[str, str] = {}
+    for value in chain.from_iterable(values or [] for values in lists):
+        merged.setdefault(normalize_text(value), value)
+
+    return list(merged.values())[:limit]
+
+
+def merge_evidence(lists: Iterable[List[EvidenceSchema]]) -> List[EvidenceSchema]:
+    """
+    Union of evidence lists, de-duplicated by canonical URL and quote keeping the most
+    relevant copy, most relevant first.
+    """
+
+    merged: Dict[tuple, EvidenceSchema] = {}
+    for evidence in chain.from_iterable(lists):
+        key = (canonicalize_url(evidence.url), normalize_text(evidence.quote or ""))
+        if key not in merged or evidence.relevance_score > merged[key].relevance_score:
+            merged[key] = evidence
+
+    return sorted(merged.values(), key=lambda evidence: -evidence.relevance_score)
+
+
+def merge_meta(reports: List[SEOReportSchema]) -> MetaSchema:
+    metas = [report.meta for report in reports]
+    sources_count = sum(meta.data_sources_count for meta in metas)
+
+    # Weighted by the sources each chunk's confidence is based on
+    if sources_count:
+        confidence = sum(meta.confidence_score * meta.data_sources_count for meta in metas)
+        confidence /= sources_count
+    else:
+        confidence = sum(meta.confidence_score for meta in metas) / len(metas)
+
+    return MetaSchema(
+        entity_name=most_common(meta.entity_name for meta in metas),
+        entity_type=most_common(
+            (meta.entity_type for meta in metas if meta.entity_type != EntityType.UNKNOWN),
+            EntityType.UNKNOWN,
+        ),
+        analysis_date=max(meta.analysis_date for meta in metas),
+        data_sources_count=sources_count,
+        confidence_score=round(confidence, 2),
+    )
+
+
+def merge_inventory(reports: List[SEOReportSchema]) -> InventorySchema:
+    inventories = [report.inventory for report in reports]
+    source_types = None
+
+    if any(inventory.source_types for inventory in inventories):
+        source_types = SourceTypesSchema(
+            **{
+                field: [
+                    group[0]
+                    for group in group_by(
+                        chain.from_iterable(
+                            getattr(inventory.source_types, field) or []
+                            for inventory in inventories
+                            if inventory.source_types
+                        ),
+                        lambda source: canonicalize_url(source.url),
+                    )
+                ]
+                or None
+                for field in SourceTypesSchema.model_fields
+            }
+        )
+
+    earliest = [inventory.date_range.earliest for inventory in inventories]
+    latest = [inventory.date_range.latest for inventory in inventories]
+
+    return InventorySchema(
+        total_sources=sum(inventory.total_sources for inventory in inventories),
+        unique_domains=[
+            group[0]
+            for group in group_by(
+                chain.from_iterable(inventory.unique_domains for inventory in inventories),
+                normalize_domain,
+            )
+        ],
+        source_types=source_types,
+        date_range=DateRangeSchema(
+            earliest=min(filter(None, earliest), default=None),
+            latest=max(filter(None, latest), default=None),
+        ),
+    )
+
+
+def merge_content_analysis(reports: List[SEOReportSchema]) -> ContentAnalysisSchema:
+    themes = [
+        ContentThemeSchema(
+            theme=group[0].theme,
+            frequency=sum(theme.frequency for theme in group),
+            intent=most_common(theme.intent for theme in group),
+            subthemes=merge_unique(theme.subthemes for theme in group),
+            evidence=merge_evidence(theme.evidence for theme in group),
+        )
+        for group in group_by(
+            chain.from_iterable(report.content_analysis.content_themes for report in reports),
+            lambda theme: normalize_text(theme.theme),
+        )
+    ]
+
+    # Chunks disagreeing on the sentiment make it mixed, a neutral one does not
+    sentiments = {report.content_analysis.sentiment.overall for report in reports}
+    sentiments.discard(Sentiment.NEUTRAL)
+
+    if not sentiments:
+        sentiment = Sentiment.NEUTRAL
+    elif len(sentiments) == 1:
+        [sentiment] = sentiments
+    else:
+        sentiment = Sentiment.MIXED
+
+    return ContentAnalysisSchema(
+        content_themes=sorted(themes, key=lambda theme: -theme.frequency),
+        sentiment=SentimentSchema(overall=sentiment),
+    )
+
+
+def merge_keywords(reports: List[SEOReportSchema]) -> KeywordsSchema:
+    # Keywords and themes found in the most chunks first
+    keyword_groups = sorted(
+        group_by(
+            chain.from_iterable(report.keywords.content_keywords for report in reports),
+            lambda keyword: normalize_text(keyword.keyword),
+        ),
+        key=lambda group: -len(group),
+    )
+    theme_groups = sorted(
+        group_by(
+            chain.from_iterable(report.keywords.keyword_themes for report in reports),
+            lambda theme: normalize_text(theme.theme),
+        ),
+        key=lambda group: -len(group),
+    )
+
+    return KeywordsSchema(
+        content_keywords=[
+            ContentKeywordSchema(
+                keyword=group[0].keyword,
+                Intent=most_common(keyword.Intent for keyword in group),
+                evidence=merge_evidence(keyword.evidence for keyword in group),
+            )
+            for group in keyword_groups[:SEO_REPORT_MAX_CONTENT_KEYWORDS]
+        ],
+        keyword_themes=[
+            KeywordThemeSchema(
+                theme=group[0].theme,
+                keywords=merge_unique(
+                    (theme.keywords for theme in group), SEO_REPORT_MAX_THEME_KEYWORDS
+                ),
+                evidence=merge_evidence(theme.evidence for theme in group),
+            )
+            for group in theme_groups[:SEO_REPORT_MAX_KEYWORD_THEMES]
+        ],
+    )
+
+
+def merge_competitors(reports: List[SEOReportSchema]) -> List[CompetitorSchema]:
+    competitors = [
+        CompetitorSchema(
+            name=first(competitor.name for competitor in group),
+            domain=group[0].domain,
+            strength_score=max(competitor.strength_score for competitor in group),
+            overlap_keywords=merge_unique(competitor.overlap_keywords for competitor in group),
+            unique_advantages=merge_unique(competitor.unique_advantages for competitor in group),
+            relationship=most_common(
+                (
+                    competitor.relationship
+                    for competitor in group
+                    if competitor.relationship != RelationshipType.UNKNOWN
+                ),
+                RelationshipType.UNKNOWN,
+            ),
+            evidence=merge_evidence(competitor.evidence for competitor in group),
+        )
+        for group in group_by(
+            chain.from_iterable(report.competitors for report in reports),
+            lambda competitor: normalize_domain(competitor.domain),
+        )
+    ]
+
+    competitors.sort(key=lambda competitor: -competitor.strength_score)
+    return competitors[:SEO_REPORT_MAX_COMPETITORS]
+
+
+def merge_social_presence(reports: List[SEOReportSchema]) -> SocialPresenceSchema:
+    return SocialPresenceSchema(
+        platforms=[
+            PlatformSchema(
+                platform=group[0].platform,
+                url=first(platform.url for platform in group),
+                evidence=merge_evidence(platform.evidence for platform in group),
+            )
+            for group in group_by(
+                chain.from_iterable(report.social_presence.platforms for report in reports),
+                lambda platform: normalize_text(platform.platform),
+            )
+        ]
+    )
+
+
+def merge_backlink_analysis(reports: List[SEOReportSchema]) -> BacklinkAnalysisSchema:
+    analyses = [report.backlink_analysis for report in reports]
+    sources = [
+        group[0].model_copy(
+            update={
+                "description": first(source.description for source in group),
+                "evidence": merge_evidence(source.evidence for source in group),
+            }
+        )
+        for group in group_by(
+            chain.from_iterable(analysis.backlink_sources for analysis in analyses),
+            lambda source: canonicalize_url(source.url),
+        )
+    ]
+
+    # Chunks citing the same backlinks would count them twice, the merged sources are
+    # distinct but a chunk may have counted backlinks it did not list.
+    return BacklinkAnalysisSchema(
+        total_backlinks=max(len(sources), *(analysis.total_backlinks for analysis in analyses)),
+        referring_domains=max(
+            len({normalize_domain(source.domain) for source in sources}),
+            *(analysis.referring_domains for analysis in analyses),
+        ),
+        backlink_sources=sources,
+    )
+
+
+def merge_recommendations(reports: List[SEOReportSchema]) -> Optional[List[RecommendationSchema]]:
+    if all(report.recommendations is None for report in reports):
+        return None
+
+    groups = group_by(
+        chain.from_iterable(report.recommendations or [] for report in reports),
+        lambda recommendation: normalize_text(recommendation.title),
+    )
+
+    recommendations = [
+        group[0].model_copy(
+            update={
+                "priority": min(
+                    (recommendation.priority for recommendation in group),
+                    key=PRIORITY_RANKS.get,
+                ),
+                "expected_impact": min(
+                    (recommendation.expected_impact for recommendation in group),
+                    key=PRIORITY_RANKS.get,
+                ),
+                "evidence": merge_evidence(recommendation.evidence for recommendation in group),
+                "implementation_steps": merge_unique(
+                    recommendation.implementation_steps for recommendation in group
+                ),
+                "data_driven_insights": merge_unique(
+                    recommendation.data_driven_insights for recommendation in group
+                ),
+                "specific_quotes": merge_unique(
+                    recommendation.specific_quotes for recommendation in group
+                ),
+            }
+        )
+        for group in groups
+    ]
+    chunks_count = [len(group) for group in groups]
+
+    # By priority, then recommended by the most chunks, then first appearance
+    ranked = sorted(
+        range(len(recommendations)),
+        key=lambda index: (
+            PRIORITY_RANKS[recommendations[index].priority],
+            -chunks_count[index],
+        ),
+    )
+
+    return [recommendations[index] for index in ranked[:SEO_REPORT_MAX_RECOMMENDATIONS]]
+
+
+def merge_summary(reports: List[SEOReportSchema]) -> Optional[SummarySchema]:
+    summaries = [report.summary for report in reports if report.summary]
+    if not summaries:
+        return None
+
+    scores = [summary.overall_score for summary in summaries if summary.overall_score is not None]
+
+    return SummarySchema(
+        overall_score=round(sum(scores) / len(scores), 1) if scores else None,
+        **{
+            field: merge_unique(
+                (getattr(summary, field) for summary in summaries), SEO_REPORT_MAX_SUMMARY_ITEMS
+            )
+            for field in (
+                "key_strengths",
+                "critical_issues",
+                "quick_wins",
+                "long_term_opportunities",
+            )
+        },
+    )
+
+
+def merge_seo_reports(reports: List[SEOReportSchema]) -> SEOReportSchema:
+    """
+    Merge the partial reports of the chunks of a map-reduce analysis into one report.
+
+    The merge is deterministic: the same partial reports in the same (chunk) order always
+    give the same report. Items describing the same thing are merged into the first one
+    seen, themes, keywords, platforms and recommendations by case-insensitive name,
+    competitors and domains by domain, sources by canonical URL (see `canonicalize_url`).
+    Their evidence is de-duplicated by URL and quote, counts and frequencies are summed
+    and scores kept at their highest, except the confidence and overall scores, which are
+    averaged. Lists are then ranked (by frequency, strength, priority or the number of
+    chunks reporting an item) and cut to the `SEO_REPORT_MAX_*` limits.
+
+    Args:
+        reports (List[SEOReportSchema]): The chunks' reports, in chunk order.
+
+    Returns:
+        SEOReportSchema: The merged report.
+    """
+
+    if len(reports) == 1:
+        return reports[0]
+
+    return SEOReportSchema(
+        meta=merge_meta(reports),
+        inventory=merge_inventory(reports),
+        content_analysis=merge_content_analysis(reports),
+        keywords=merge_keywords(reports),
+        competitors=merge_competitors(reports),
+        social_presence=merge_social_presence(reports),
+        backlink_analysis=merge_backlink_analysis(reports),
+        recommendations=merge_recommendations(reports),
+        summary=merge_summary(reports),
+    )
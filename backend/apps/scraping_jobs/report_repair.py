@@ -0,0 +1,99 @@
+# Python Imports
+from typing import Any, Dict, List, Optional
+
+# Third-party Imports
+from pydantic import ValidationError
+from pydantic_core import ErrorDetails
+
+# App Imports
+from .schemas import SEO_REPORT_SECTIONS, SEOReportSchema
+
+# Report key -> the section of `SEO_REPORT_SECTIONS` generating it
+SECTION_OF_KEY = {
+    key: section for section, schema in SEO_REPORT_SECTIONS.items() for key in schema.model_fields
+}
+
+
+def report_errors(report: dict) -> List[ErrorDetails]:
+    """The errors of a report against `SEOReportSchema`, none when it is valid"""
+
+    try:
+        SEOReportSchema.model_validate(report)
+    except ValidationError as e:
+        return e.errors()
+
+    return []
+
+
+def fix_error(report: dict, error: ErrorDetails) -> bool:
+    """
+    Fix an error that needs no model in place: a list over its maximum length is cut to
+    it and a number out of its range clamped into it.
+
+    Returns:
+        bool: Whether the error was fixed.
+    """
+
+    *path, key = error["loc"] or [None]
+    parent: Any = report
+
+    try:
+        for part in path:
+            parent = parent[part]
+        value = parent[key]
+    except (KeyError, IndexError, TypeError):
+        # Under an item cut by an earlier fix
+        return False
+
+    ctx = error.get("ctx", {})
+
+    if error["type"] == "too_long" and isinstance(value, list):
+        parent[key] = value[: ctx["max_length"]]
+    elif error["type"] in ("less_than_equal", "less_than") and "le" in ctx:
+        parent[key] = ctx["le"]
+    elif error["type"] in ("greater_than_equal", "greater_than") and "ge" in ctx:
+        parent[key] = ctx["ge"]
+    else:
+        return False
+
+    return True
+
+
+def repair_mechanically(report: dict) -> List[ErrorDetails]:
+    """
+    Fix in place what `fix_error` can of a report failing `SEOReportSchema`. Fixing a list
+    length lets its items be validated, so fixes repeat until none applies.
+
+    Returns:
+        List[ErrorDetails]: The errors left, none when the report is now valid.
+    """
+
+    errors = report_errors(report)
+    # A list rather than a generator, so every error is fixed before validating again
+    while errors and any([fix_error(report, error) for error in errors]):
+        errors = report_errors(report)
+
+    return errors
+
+
+def failing_sections(errors: List[ErrorDetails]) -> Optional[Dict[str, List[ErrorDetails]]]:
+    """
+    Group errors by the section of `SEO_REPORT_SECTIONS` to generate again, or None when
+    one is not within a section (e.g. the output is not a JSON object).
+    """
+
+    sections: Dict[str, List[ErrorDetails]] = {}
+    for error in errors:
+        section = SECTION_OF_KEY.get(error["loc"][0]) if error["loc"] else None
+        if section is None:
+            return None
+
+        sections.setdefault(section, []).append(error)
+
+    return sections
+
+
+def format_errors(errors: List[ErrorDetails]) -> str:
+    """List errors one per line as `path: message`, for the repair prompt"""
+
+    return "\n".join(f"- {'.'.join(map(str, error['loc']))}: {error['msg']}" for error in errors)
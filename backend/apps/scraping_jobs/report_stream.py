@@ -0,0 +1,123 @@
+# Python Imports
+import asyncio
+import logging
+import time
+from functools import cache
+from typing import Annotated, Any, Dict, Optional, Set
+
+# Django Imports
+from django.conf import settings
+
+# Third-party Imports
+from pydantic import TypeAdapter, ValidationError
+
+# App Imports
+from .events import apublish_report_sections
+from .metrics import job_report_first_section_seconds, job_report_section_event_sections
+from .schemas import SEOReportSchema
+
+logger = logging.getLogger(__name__)
+
+
+@cache
+def get_section_adapter(key: str) -> TypeAdapter:
+    """Return the validator of a top-level key of `SEOReportSchema`, with its field limits"""
+
+    field = SEOReportSchema.model_fields[key]
+    return TypeAdapter(Annotated[field.annotation, field])
+
+
+class ReportSectionPublisher:
+    """
+    Send the top-level sections of a job's report to its user as `job_report_section` events
+    while the report is being generated (see `ScrapingJobsStatusWebsocketConsumer`).
+
+    A section is sent once, when it first passes its schema. Sections ready less than
+    `REPORT_SECTION_EVENT_INTERVAL` seconds after the last event are held and sent together
+    when the interval is over, so a streamed report costs a handful of channel layer messages
+    rather than one per chunk of output.
+    """
+
+    def __init__(self, user_id: int, job_id: str, mode: str) -> None:
+        self.user_id = user_id
+        self.job_id = job_id
+        self.mode = mode
+        self.started_at = time.monotonic()
+        self.sent_at: Optional[float] = None
+        self.seen: Set[str] = set()
+        self.pending: Dict[str, Any] = {}
+        self._flush: Optional[asyncio.Task] = None
+
+    async def apublish(self, sections: Dict[str, Any]) -> None:
+        """Queue the sections not seen yet that pass their schema, see the class docstring"""
+
+        for key, value in sections.items():
+            if key in self.seen or key not in SEOReportSchema.model_fields:
+                continue
+
+            # Seen even when invalid, a complete section does not change
+            self.seen.add(key)
+            adapter = get_section_adapter(key)
+            try:
+                self.pending[key] = adapter.dump_python(adapter.validate_python(value), mode="json")
+            except ValidationError:
+                logger.debug(f"Not publishing invalid {key} section of ScrapingJob {self.job_id}")
+
+        if not self.pending or self._flush is not None:
+            return
+
+        wait = (
+            0.0
+            if self.sent_at is None
+            else self.sent_at + settings.REPORT_SECTION_EVENT_INTERVAL - time.monotonic()
+        )
+        if wait <= 0:
+            await self.aflush()
+        else:
+            self._flush = asyncio.ensure_future(self._aflush_after(wait))
+
+    async def areplace(self, sections: Dict[str, Any]) -> None:
+        """
+        Send `sections` in place of the ones sent or held so far, e.g. those of a hedged call
+        that lost to another one (see `ainvoke_hedged`).
+        """
+
+        self.discard()
+        self.seen, self.pending = set(), {}
+        await self.apublish(sections)
+
+    async def aclose(self) -> None:
+        """Send the sections held back, before the job's `COMPLETED` status"""
+
+        self.discard()
+        await self.aflush()
+
+    def discard(self) -> None:
+        """Stop sending sections held back, e.g. when the analysis failed"""
+
+        if self._flush is not None:
+            self._flush.cancel()
+            self._flush = None
+
+    async def aflush(self) -> None:
+        if not self.pending:
+            return
+
+        sections, self.pending = self.pending, {}
+        if self.sent_at is None:
+            await job_report_first_section_seconds.aobserve(
+                time.monotonic() - self.started_at, mode=self.mode
+            )
+        self.sent_at = time.monotonic()
+        await job_report_section_event_sections.aobserve(len(sections))
+
+        try:
+            await apublish_report_sections(self.user_id, self.job_id, sections)
+        except Exception as e:
+            # A preview, the analysis goes on without it
+            logger.warning(f"Failed to publish report sections of ScrapingJob {self.job_id}: {e}")
+
+    async def _aflush_after(self, wait: float) -> None:
+        await asyncio.sleep(wait)
+        self._flush = None
+        await self.aflush()
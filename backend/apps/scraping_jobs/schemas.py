@@ -1,10 +1,19 @@
 # Python Imports
 from enum import Enum
-from typing import List, Literal, Optional
+from typing import Callable, Dict, List, Literal, Optional, Type
 
 # Third-party Imports
 from pydantic import BaseModel, Field, field_validator
 
+# App Imports
+from .constants import (
+    SEO_REPORT_MAX_COMPETITORS,
+    SEO_REPORT_MAX_CONTENT_KEYWORDS,
+    SEO_REPORT_MAX_KEYWORD_THEMES,
+    SEO_REPORT_MAX_RECOMMENDATIONS,
+    SEO_REPORT_MAX_THEME_KEYWORDS,
+)
+
 
 # Enums for better type safety
 class EntityType(str, Enum):
@@ -77,7 +86,7 @@ class EvidenceSchema(BaseModel):
 
 
 class SourceSchema(BaseModel):
-    title: str
+    title: Optional[str] = None
     url: str
     description: Optional[str] = None
 
@@ -151,35 +160,35 @@ class ContentKeywordSchema(BaseModel):
 
 class KeywordThemeSchema(BaseModel):
     theme: str
-    keywords: List[str] = Field(max_length=8)
+    keywords: List[str] = Field(max_length=SEO_REPORT_MAX_THEME_KEYWORDS)
     evidence: List[EvidenceSchema]
 
     @field_validator("keywords")
     @classmethod
     def validate_keywords_length(cls, v):
-        if len(v) > 8:
-            raise ValueError("Maximum 5 keywords allowed per theme")
+        if len(v) > SEO_REPORT_MAX_THEME_KEYWORDS:
+            raise ValueError(f"Maximum {SEO_REPORT_MAX_THEME_KEYWORDS} keywords allowed per theme")
 
         return v
 
 
 class KeywordsSchema(BaseModel):
-    content_keywords: List[ContentKeywordSchema] = Field(max_length=25)
-    keyword_themes: List[KeywordThemeSchema] = Field(max_length=8)
+    content_keywords: List[ContentKeywordSchema] = Field(max_length=SEO_REPORT_MAX_CONTENT_KEYWORDS)
+    keyword_themes: List[KeywordThemeSchema] = Field(max_length=SEO_REPORT_MAX_KEYWORD_THEMES)
 
     @field_validator("content_keywords")
     @classmethod
     def validate_content_keywords(cls, v):
-        if len(v) > 25:
-            raise ValueError("Maximum 25 content keywords allowed")
+        if len(v) > SEO_REPORT_MAX_CONTENT_KEYWORDS:
+            raise ValueError(f"Maximum {SEO_REPORT_MAX_CONTENT_KEYWORDS} content keywords allowed")
 
         return v
 
     @field_validator("keyword_themes")
     @classmethod
     def validate_keyword_themes_length(cls, v):
-        if len(v) > 8:
-            raise ValueError("Maximum 8 keyword themes allowed")
+        if len(v) > SEO_REPORT_MAX_KEYWORD_THEMES:
+            raise ValueError(f"Maximum {SEO_REPORT_MAX_KEYWORD_THEMES} keyword themes allowed")
 
         return v
 
@@ -252,24 +261,26 @@ class SEOReportSchema(BaseModel):
     inventory: InventorySchema
     content_analysis: ContentAnalysisSchema
     keywords: KeywordsSchema
-    competitors: List[CompetitorSchema] = Field(min_length=0, max_length=15)
+    competitors: List[CompetitorSchema] = Field(min_length=0, max_length=SEO_REPORT_MAX_COMPETITORS)
     social_presence: SocialPresenceSchema
     backlink_analysis: BacklinkAnalysisSchema
-    recommendations: Optional[List[RecommendationSchema]] = Field(None, max_length=25)
+    recommendations: Optional[List[RecommendationSchema]] = Field(
+        None, max_length=SEO_REPORT_MAX_RECOMMENDATIONS
+    )
     summary: Optional[SummarySchema] = None
 
     @field_validator("competitors")
     @classmethod
     def validate_competitors_length(cls, v):
-        if len(v) > 15:
-            raise ValueError("Maximum 15 competitors allowed")
+        if len(v) > SEO_REPORT_MAX_COMPETITORS:
+            raise ValueError(f"Maximum {SEO_REPORT_MAX_COMPETITORS} competitors allowed")
         return v
 
     @field_validator("recommendations")
     @classmethod
     def validate_recommendations_length(cls, v):
-        if v and len(v) > 25:
-            raise ValueError("Maximum 25 recommendations allowed")
+        if v and len(v) > SEO_REPORT_MAX_RECOMMENDATIONS:
+            raise ValueError(f"Maximum {SEO_REPORT_MAX_RECOMMENDATIONS} recommendations allowed")
         return v
 
     model_config = {
@@ -292,10 +303,88 @@ class SEOReportSchema(BaseModel):
     }
 
 
+# Sections of `SEOReportSchema` generated by separate calls in the "sections" analysis mode,
+# each a JSON object with the report's keys it covers. The summary is generated last, from
+# the other sections.
+class OverviewSectionSchema(BaseModel):
+    meta: MetaSchema
+    inventory: InventorySchema
+    content_analysis: ContentAnalysisSchema
+
+
+class KeywordsSectionSchema(BaseModel):
+    keywords: KeywordsSchema
+
+
+class CompetitorsSectionSchema(BaseModel):
+    competitors: List[CompetitorSchema] = Field(min_length=0, max_length=SEO_REPORT_MAX_COMPETITORS)
+
+
+class SocialPresenceSectionSchema(BaseModel):
+    social_presence: SocialPresenceSchema
+
+
+class BacklinkAnalysisSectionSchema(BaseModel):
+    backlink_analysis: BacklinkAnalysisSchema
+
+
+class RecommendationsSectionSchema(BaseModel):
+    recommendations: Optional[List[RecommendationSchema]] = Field(
+        None, max_length=SEO_REPORT_MAX_RECOMMENDATIONS
+    )
+
+
+class SummarySectionSchema(BaseModel):
+    summary: Optional[SummarySchema] = None
+
+
+SEO_REPORT_SECTIONS: Dict[str, Type[BaseModel]] = {
+    "overview": OverviewSectionSchema,
+    "keywords": KeywordsSectionSchema,
+    "competitors": CompetitorsSectionSchema,
+    "social_presence": SocialPresenceSectionSchema,
+    "backlink_analysis": BacklinkAnalysisSectionSchema,
+    "recommendations": RecommendationsSectionSchema,
+    "summary": SummarySectionSchema,
+}
+
+# Version of `SEOReportSchema` stamped on stored reports, bump it on every schema change
+# that makes previously stored reports invalid and register an upgrade step below.
+SEO_REPORT_SCHEMA_VERSION = 1
+
+# Maps a stored report version to a function upgrading such a report to the next version.
+# Reports stored before versioning was introduced are treated as version 0.
+SEO_REPORT_UPGRADES: Dict[int, Callable[[dict], dict]] = {
+    0: lambda report: report,
+}
+
+
+def upgrade_seo_report(report: dict, from_version: int) -> SEOReportSchema:
+    """
+    Upgrade a stored SEO report to `SEO_REPORT_SCHEMA_VERSION` and validate it.
+
+    Raises pydantic.ValidationError exception for invalid schema - caller must handle it.
+
+    Args:
+        report (dict): The stored SEO report.
+        from_version (int): The schema version the report was stored with.
+
+    Returns:
+        SEOReportSchema: The validated report at the current schema version.
+    """
+
+    for version in range(from_version, SEO_REPORT_SCHEMA_VERSION):
+        report = SEO_REPORT_UPGRADES[version](report)
+
+    return SEOReportSchema(**report)
+
+
 # Scraping data schema
 class ScrapingDataSchema(BaseModel):
-    url: str
-    prompt: str
+    """A BrightData record as sent to Gemini, other fields (`input`, `citations`...) are dropped"""
+
+    url: Optional[str] = None
+    prompt: Optional[str] = None
     answer_text: str
-    sources: List[SourceSchema]
-    timestamp: str
+    sources: List[SourceSchema] = []
+    timestamp: Optional[str] = None
@@ -1,3 +1,6 @@
+# Django Imports
+from django.conf import settings
+
 # REST Framework Imports
 from rest_framework import serializers
 
@@ -5,24 +8,48 @@ from rest_framework import serializers
 from adrf.serializers import ModelSerializer as AsyncModelSerializer
 
 # App Imports
-from .models import ScrapingJob
+from .constants import SCRAPING_JOB_DETAIL_FIELDS, SCRAPING_JOB_LIST_FIELDS
+from .models import ScrapingJob, ScrapingJobEvent
 
 
 class ScrapingJobCreationSerializer(serializers.Serializer):
     prompt = serializers.CharField(min_length=2, max_length=255)
     country_code = serializers.CharField(min_length=2, max_length=2)
     existing_job_id = serializers.UUIDField(required=False)
+    use_analysis_cache = serializers.BooleanField(required=False, default=True)
+
+
+class ScrapingJobBulkItemSerializer(serializers.Serializer):
+    prompt = serializers.CharField(min_length=2, max_length=255)
+    country_code = serializers.CharField(min_length=2, max_length=2)
+
+
+class ScrapingJobBulkCreationSerializer(serializers.Serializer):
+    jobs = serializers.ListField(
+        child=ScrapingJobBulkItemSerializer(),
+        min_length=1,
+        max_length=settings.SCRAPING_JOBS_BULK_MAX_SIZE,
+    )
+    use_analysis_cache = serializers.BooleanField(required=False, default=True)
 
 
 class ScrapingJobModelSerializer(AsyncModelSerializer):
+    # The scraping results live in the blob store, only whether there are some is exposed
+    has_results = serializers.BooleanField(source="has_scraping_data", read_only=True)
 
     class Meta:
         model = ScrapingJob
-        fields = "__all__"
+        fields = SCRAPING_JOB_DETAIL_FIELDS
 
 
 class ListScrapingJobModelSerializer(ScrapingJobModelSerializer):
 
     class Meta(ScrapingJobModelSerializer.Meta):
-        exclude = ("results", "seo_report", "error")
-        fields = None
+        fields = SCRAPING_JOB_LIST_FIELDS
+
+
+class ScrapingJobEventModelSerializer(AsyncModelSerializer):
+
+    class Meta:
+        model = ScrapingJobEvent
+        fields = ("event", "occurred_at")
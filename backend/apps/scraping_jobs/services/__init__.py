@@ -1,3 +1,4 @@
 # flake8: noqa: E402
 from .bright_data_webhook_service import BrightDataWebhookService
 from .scraping_job_service import ScrapingJobService
+from .stalled_job_sweeper_service import StalledJobSweeperService
@@ -1,32 +1,65 @@
 # Python Imports
 import logging
-from typing import Optional, Tuple
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
 # Django Imports
 from django.conf import settings
+from django.utils import timezone
 
 # REST Framework Imports
 from rest_framework import status
 from rest_framework.request import Request
 
+# Third-Party Imports
+from asgiref.sync import sync_to_async
+
+# Project Imports
+from core.blob_store import BlobNotFoundError, get_blob_store
+from core.json_stream import PayloadTooLargeError
+
 # App Imports
-from ..models import ScrapingJob
-from ..tasks import analyze_scraped_data
+from ..constants import ScrapingJobEventChoices, ScrapingJobStatusChoices
+from ..metrics import webhook_deliveries
+from ..models import ScrapeResultCacheEntry, ScrapingJob, ScrapingJobEvent, WebhookDelivery
+from ..records import StoredRecords, iter_blob_records, store_records, store_records_by_index
+from ..tasks import adispatch_analysis
+from ..webhook_queue import (
+    QueuedWebhookDelivery,
+    build_webhook_delivery,
+    enqueue_webhook_delivery,
+    store_webhook_body,
+)
 
 logger = logging.getLogger(__name__)
 
+# Statuses in which a job still waits for its BrightData results, the webhook can
+# arrive before the trigger call returned so PENDING jobs accept it too.
+WEBHOOK_ACCEPTING_STATUSES = (
+    ScrapingJobStatusChoices.PENDING.value,
+    ScrapingJobStatusChoices.RUNNING.value,
+)
+
 
 class BrightDataWebhookService:
 
     @staticmethod
     async def handle(request: Request) -> Tuple[Optional[str], str, int]:
+        """
+        Handle a BrightData webhook delivery. The body is only read once the delivery is
+        authorized, bodies larger than `BRIGHTDATA_WEBHOOK_MAX_BODY_SIZE` are rejected.
 
-        data = request.data
+        The raw body is first spooled to durable storage. With `BRIGHTDATA_WEBHOOK_QUEUE`
+        the delivery is then acknowledged with 202 right away, `WebhookDeliveryConsumer`
+        ingests it later (see `ingest_delivery`). Otherwise it is ingested before replying.
+        """
+
+        received_at = timezone.now()
         auth_header = request.headers.get("Authorization", "")
         expected_auth = f"Bearer {settings.BRIGHTDATA_WEBHOOK_SECRET}"
 
         if auth_header != expected_auth:
-            logger.error("Unauthorized BrightData webhook access", extra={"data": data})
+            logger.error("Unauthorized BrightData webhook access")
             return (
                 "Unauthorized to do this action",
                 "FORBIDDEN",
@@ -34,24 +67,279 @@ class BrightDataWebhookService:
             )
 
         job_id = request.query_params.get("job-id")
-        if not job_id:
-            logger.error("No job ID found with Webhook URL", extra={"data": data})
+        batch_id = request.query_params.get("batch-id")
+        if not job_id and not batch_id:
+            logger.error("No job ID found with Webhook URL")
             return (
                 "No job ID found",
                 "BAD_REQUEST",
                 status.HTTP_400_BAD_REQUEST,
             )
 
+        try:
+            content_length = int(request.headers.get("Content-Length") or 0)
+        except ValueError:
+            logger.error("Invalid Content-Length header of BrightData webhook")
+            return (
+                "Invalid Content-Length header",
+                "BAD_REQUEST",
+                status.HTTP_400_BAD_REQUEST,
+            )
+
+        if content_length > settings.BRIGHTDATA_WEBHOOK_MAX_BODY_SIZE:
+            return BrightDataWebhookService.payload_too_large_response(job_id or batch_id)
+
+        try:
+            # Off the thread of the ORM, spooling needs neither the database nor order
+            body_blob_key = await sync_to_async(store_webhook_body, thread_sensitive=False)(
+                request.stream
+            )
+        except PayloadTooLargeError:
+            return BrightDataWebhookService.payload_too_large_response(job_id or batch_id)
+
+        delivery = build_webhook_delivery(job_id, batch_id, body_blob_key, received_at)
+
+        if settings.BRIGHTDATA_WEBHOOK_QUEUE:
+            await sync_to_async(enqueue_webhook_delivery, thread_sensitive=False)(delivery)
+            return None, "ACCEPTED", status.HTTP_202_ACCEPTED
+
+        try:
+            return await BrightDataWebhookService.ingest(delivery)
+
+        except ValueError as e:
+            logger.error(
+                "Invalid BrightData webhook payload",
+                extra={"delivery": delivery, "error_detail": str(e)},
+            )
+            await webhook_deliveries.ainc(outcome="invalid")
+            await BrightDataWebhookService.discard_body(body_blob_key)
+
+            return "Invalid JSON payload", "BAD_REQUEST", status.HTTP_400_BAD_REQUEST
+
+    @staticmethod
+    async def ingest(delivery: QueuedWebhookDelivery) -> Tuple[Optional[str], str, int]:
+        """
+        Ingest a delivery for a single job or a bulk creation batch from its spooled body.
+
+        Raises ValueError when the body is not valid JSON, see `iter_json_items`.
+        """
+
+        job_id, batch_id = delivery["job_id"] or None, delivery["batch_id"] or None
+        body_blob_key = delivery["body_blob_key"]
+        received_at = datetime.fromisoformat(delivery["received_at"])
+
+        if batch_id:
+            return await BrightDataWebhookService.handle_batch(batch_id, body_blob_key, received_at)
+
+        return await BrightDataWebhookService.handle_job(job_id, body_blob_key, received_at)
+
+    @staticmethod
+    async def ingest_delivery(delivery: QueuedWebhookDelivery) -> None:
+        """
+        Ingest a delivery enqueued by `enqueue_webhook_delivery`.
+
+        A body that is not valid JSON fails the delivery's jobs, BrightData already got
+        its acknowledgement and will not send it again.
+        """
+
+        try:
+            await BrightDataWebhookService.ingest(delivery)
+
+        except BlobNotFoundError:
+            # An identical delivery was ingested first and dropped the shared body
+            logger.info("Ignoring duplicate BrightData webhook", extra={"delivery": delivery})
+            await webhook_deliveries.ainc(outcome="duplicate")
+
+        except ValueError as e:
+            # The raw body is kept for inspection
+            logger.error(
+                "Invalid BrightData webhook payload",
+                extra={"delivery": delivery, "error_detail": str(e)},
+            )
+            await webhook_deliveries.ainc(outcome="invalid")
+
+            error = "Invalid BrightData webhook payload"
+            if delivery["batch_id"]:
+                await ScrapingJob.objects.afail_batch(delivery["batch_id"], error)
+            else:
+                await ScrapingJob.objects.set_job_to_failed(delivery["job_id"], error)
+
+    @staticmethod
+    async def discard_body(body_blob_key: str) -> None:
+        """Delete a delivery's raw body, unless it is byte for byte a job's stored results"""
+
+        if not await ScrapingJob.objects.filter(results_blob_key=body_blob_key).aexists():
+            await sync_to_async(get_blob_store().delete)(body_blob_key)
+
+    @staticmethod
+    def payload_too_large_response(delivery_id: str) -> Tuple[Optional[str], str, int]:
+        logger.error("BrightData webhook payload too large", extra={"delivery_id": delivery_id})
+
+        return (
+            f"Payload larger than {settings.BRIGHTDATA_WEBHOOK_MAX_BODY_SIZE} bytes",
+            "PAYLOAD_TOO_LARGE",
+            status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        )
+
+    @staticmethod
+    async def handle_job(
+        job_id: str, body_blob_key: str, received_at: datetime
+    ) -> Tuple[Optional[str], str, int]:
+        """
+        Handle the webhook of a single job's BrightData trigger.
+
+        The payload is claimed for the job (see `WebhookDelivery`) before anything is
+        written, so a repeated delivery is acknowledged without storing the records again
+        or dispatching a second analysis, even once the job is waiting for results again.
+        """
+
         job = await ScrapingJob.objects.get_job_by_id(job_id)
         if not job:
             logger.error("No job found for job ID", extra={"job_id": job_id})
+            await webhook_deliveries.ainc(outcome="not_found")
+            await BrightDataWebhookService.discard_body(body_blob_key)
             return "No job found for job ID", "NOT_FOUND", status.HTTP_404_NOT_FOUND
 
-        if not isinstance(data, list):
-            data = [data]
+        if not await WebhookDelivery.objects.aclaim(job.id, body_blob_key, received_at):
+            logger.info("Ignoring duplicate BrightData webhook", extra={"job_id": job_id})
+            await webhook_deliveries.ainc(outcome="duplicate")
+
+            # While the job waits for results the first delivery may still read the body
+            if job.status not in WEBHOOK_ACCEPTING_STATUSES:
+                await BrightDataWebhookService.discard_body(body_blob_key)
+
+            return None, "SUCCESS", status.HTTP_200_OK
+
+        ingested = False
+        if job.status in WEBHOOK_ACCEPTING_STATUSES:
+            try:
+                stored = await sync_to_async(store_records)(iter_blob_records(body_blob_key))
+
+                await ScrapingJobEvent.objects.arecord(
+                    job_id, ScrapingJobEventChoices.WEBHOOK_RECEIVED.value, received_at
+                )
+                ingested = await BrightDataWebhookService.ingest_results(
+                    job, stored.key, stored.cacheable
+                )
+            except BaseException:
+                await WebhookDelivery.objects.arelease(job.id, body_blob_key)
+                raise
+
+        if not ingested:
+            logger.info("Ignoring stale BrightData webhook", extra={"job_id": job_id})
+
+        await webhook_deliveries.ainc(outcome="ingested" if ingested else "stale")
+        await BrightDataWebhookService.discard_body(body_blob_key)
+
+        return None, "SUCCESS", status.HTTP_200_OK
+
+    @staticmethod
+    async def handle_batch(
+        batch_id: str, body_blob_key: str, received_at: datetime
+    ) -> Tuple[Optional[str], str, int]:
+        """
+        Handle the webhook of a bulk creation batch's shared BrightData trigger, each job
+        claims the payload as in `handle_job`.
+        """
+
+        jobs = await ScrapingJob.objects.aget_batch_jobs(batch_id)
+        if not jobs:
+            logger.error("No jobs found for batch ID", extra={"batch_id": batch_id})
+            await webhook_deliveries.ainc(outcome="not_found")
+            await BrightDataWebhookService.discard_body(body_blob_key)
+            return "No jobs found for batch ID", "NOT_FOUND", status.HTTP_404_NOT_FOUND
+
+        claimed = [
+            job
+            for job in jobs
+            if await WebhookDelivery.objects.aclaim(job.id, body_blob_key, received_at)
+        ]
+        if not claimed:
+            logger.info("Ignoring duplicate BrightData webhook", extra={"batch_id": batch_id})
+            await webhook_deliveries.ainc(outcome="duplicate")
+
+            if not any(job.status in WEBHOOK_ACCEPTING_STATUSES for job in jobs):
+                await BrightDataWebhookService.discard_body(body_blob_key)
 
-        await ScrapingJob.objects.save_raw_scraping_data(job_id, data)
+            return None, "SUCCESS", status.HTTP_200_OK
 
-        analyze_scraped_data.delay(job_id)
+        jobs = [job for job in claimed if job.status in WEBHOOK_ACCEPTING_STATUSES]
+        if jobs:
+            try:
+                stored_by_index = await sync_to_async(store_records_by_index)(
+                    iter_blob_records(body_blob_key)
+                )
+
+                await ScrapingJobEvent.objects.arecord_many(
+                    [job.id for job in jobs],
+                    ScrapingJobEventChoices.WEBHOOK_RECEIVED.value,
+                    received_at,
+                )
+                await BrightDataWebhookService.ingest_batch_results(jobs, stored_by_index)
+            except BaseException:
+                for job in claimed:
+                    await WebhookDelivery.objects.arelease(job.id, body_blob_key)
+                raise
+        else:
+            logger.info("Ignoring stale BrightData webhook", extra={"batch_id": batch_id})
+
+        await webhook_deliveries.ainc(outcome="ingested" if jobs else "stale")
+        await BrightDataWebhookService.discard_body(body_blob_key)
 
         return None, "SUCCESS", status.HTTP_200_OK
+
+    @staticmethod
+    async def ingest_batch_results(
+        jobs: List[ScrapingJob], stored_by_index: Dict[int, StoredRecords]
+    ) -> None:
+        """
+        Feed each job of a batch the records of its own input row, as split by
+        `store_records_by_index`. Jobs without any record are failed.
+
+        Args:
+            jobs (List[ScrapingJob]): The batch's jobs still waiting for their results.
+            stored_by_index (Dict[int, StoredRecords]): The stored records of the batch's
+                snapshot by input row index.
+
+        Returns:
+            None
+        """
+
+        for job in jobs:
+            stored = stored_by_index.get(job.batch_index)
+
+            if not stored:
+                logger.error(f"No BrightData record received for job {job.id}")
+                await ScrapingJob.objects.set_job_to_failed(
+                    job.id, "No BrightData record received for this job"
+                )
+                continue
+
+            await BrightDataWebhookService.ingest_results(job, stored.key, stored.cacheable)
+
+    @staticmethod
+    async def ingest_results(job: ScrapingJob, results_blob_key: str, cacheable: bool) -> bool:
+        """
+        Feed BrightData records, already stored in the blob store, into the analysis path:
+        move the job to ANALYZING, cache the scrape result and dispatch the analysis.
+
+        Args:
+            job (ScrapingJob): The job the records were scraped for.
+            results_blob_key (str): Blob store key of the records.
+            cacheable (bool): Whether the records can be reused (see `is_cacheable_record`).
+
+        Returns:
+            bool: False when another delivery already moved the job past scraping.
+        """
+
+        if not await ScrapingJob.objects.save_raw_scraping_data(job.id, results_blob_key):
+            return False
+
+        if job.scrape_cache_key and cacheable:
+            await ScrapeResultCacheEntry.objects.astore(
+                job.scrape_cache_key, results_blob_key, job.snapshot_id
+            )
+
+        await adispatch_analysis(job.id)
+
+        return True
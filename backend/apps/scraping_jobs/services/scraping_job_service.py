@@ -1,7 +1,9 @@
 # Python Imports
+import asyncio
 import logging
-from typing import List, Optional, Tuple, TypedDict
-from urllib.parse import quote
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple, TypedDict
+from urllib.parse import quote, urlencode
 import httpx
 
 # Django Imports
@@ -11,17 +13,26 @@ from django.conf import settings
 from rest_framework import status
 
 # Third-Party Imports
-from asgiref.sync import sync_to_async
 from pydantic import ValidationError
 
 # Project Imports
 from authentication.models import User
+from core.pagination import CursorPage, InvalidCursorError
+from core.resilience import CallRejectedError
 
 # App Imports
-from ..serializers import ScrapingJobModelSerializer
-from ..tasks import analyze_scraped_data
-from ..models import ScrapingJob
+from ..brightdata import (
+    get_brightdata_http_client,
+    guard_brightdata_call,
+    is_brightdata_healthy_response,
+)
+from ..constants import ScrapingJobEventChoices, ScrapingJobStatusChoices
+from ..serializers import ScrapingJobEventModelSerializer, ScrapingJobModelSerializer
+from ..tasks import adispatch_analysis
+from ..metrics import scrape_result_cache_requests
+from ..models import ScrapeResultCacheEntry, ScrapingJob, ScrapingJobEvent, user_jobs_paginator
 from ..prompts.perplexity import perplexity_prompt as perplexity_prompt_obj
+from ..utils import build_scrape_cache_key, compute_job_phases
 
 logger = logging.getLogger(__name__)
 
@@ -32,33 +43,81 @@ class StartBrightDataScrapingReturn(TypedDict):
     code: int
 
 
+BRIGHTDATA_OUTPUT_FIELDS = [
+    "url",
+    "prompt",
+    "answer_text",
+    "sources",
+    "citations",
+    "timestamp",
+    "input",
+]
+
+
+def build_brightdata_input(
+    original_prompt: Optional[str], country_code: Optional[str], index: int
+) -> dict:
+    """Build one input row of a BrightData trigger, `index` is echoed back in its records"""
+
+    return {
+        "url": "https://www.perplexity.ai",
+        "prompt": perplexity_prompt_obj.build(original_prompt),
+        "country": country_code,
+        "index": index,
+    }
+
+
 class ScrapingJobService:
 
     @classmethod
     async def retry_job(cls, job_id: str, user: User):
-        retry_info = await ScrapingJob.objects.can_use_smart_retry(job_id, user.id)
+        job = await ScrapingJob.objects.get_job_by_id(job_id, user.id)
+        if not job:
+            logger.error(f"No scraping job found with given ID ({job_id}) for user ({user.id})")
 
-        job = await ScrapingJob.objects.get_job_by_id(job_id)
-        if retry_info.get("can_retry_analysis_only"):
-            await ScrapingJob.objects.reset_job_for_analyzing_retry(job.id)
-            analyze_scraped_data.delay(job_id)
+            return (
+                None,
+                "NOT_FOUND",
+                status.HTTP_404_NOT_FOUND,
+            )
 
-        elif not retry_info.get("has_scraping_data"):
-            bt_scraping_result = await cls.start_brightdata_scraping(job)
+        retry_info = job.get_smart_retry_info()
 
-            if (
-                not bt_scraping_result.get("success")
-                and bt_scraping_result.get("code") == status.HTTP_500_INTERNAL_SERVER_ERROR
-            ):
-                return (
-                    bt_scraping_result.get("message"),
-                    "UNKNOWN_ERROR",
-                    status.HTTP_500_INTERNAL_SERVER_ERROR,
+        if retry_info.get("can_retry_analysis_only"):
+            retried = await ScrapingJob.objects.reset_job_for_analyzing_retry(job.id)
+            if retried:
+                job.status = ScrapingJobStatusChoices.ANALYZING.value
+                await adispatch_analysis(job.id)
+
+        else:
+            retried = await ScrapingJob.objects.reset_job_for_scraping_retry(job.id)
+            if retried:
+                bt_scraping_result = await cls.start_brightdata_scraping(
+                    job, job.original_prompt, job.country_code
                 )
 
-            snapshot_id = bt_scraping_result.get("snapshot_id")
+                if bt_scraping_result.get("code") == status.HTTP_500_INTERNAL_SERVER_ERROR:
+                    return (
+                        bt_scraping_result.get("message"),
+                        "UNKNOWN_ERROR",
+                        status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    )
+
+                if bt_scraping_result.get("code") == status.HTTP_503_SERVICE_UNAVAILABLE:
+                    return await cls.brightdata_unavailable_response(job)
 
-            await ScrapingJob.objects.update_job_with_snapshot_id(job.id, snapshot_id)
+                job.snapshot_id = bt_scraping_result.get("snapshot_id")
+                job.status = ScrapingJobStatusChoices.RUNNING.value
+                await ScrapingJob.objects.update_job_with_snapshot_id(job.id, job.snapshot_id)
+
+        if not retried:
+            logger.warning(f"Scraping job {job_id} is not retryable in status {job.status}")
+
+            return (
+                "Only failed jobs can be retried",
+                "CONFLICT",
+                status.HTTP_409_CONFLICT,
+            )
 
         response_data = await ScrapingJobModelSerializer(instance=job).adata
         return (
@@ -67,15 +126,85 @@ class ScrapingJobService:
             status.HTTP_200_OK,
         )
 
-    @staticmethod
+    @classmethod
     async def start_brightdata_scraping(
-        job: ScrapingJob, original_prompt: Optional[str], country_code: Optional[str]
+        cls,
+        job: ScrapingJob,
+        original_prompt: Optional[str],
+        country_code: Optional[str],
+        http_client: Optional[httpx.AsyncClient] = None,
     ) -> StartBrightDataScrapingReturn:
-        webhook_url = f"{settings.API_BASE_URL}{settings.BRIGHTDATA_WEBHOOK_PATH}?job-id={job.id}"
+        # A bulk created job keeps its batch index so the sweeper can match its records
+        result = await cls.trigger_brightdata_scraping(
+            [build_brightdata_input(original_prompt, country_code, job.batch_index or 1)],
+            {"job-id": job.id},
+            http_client,
+        )
+
+        if result.get("code") == status.HTTP_500_INTERNAL_SERVER_ERROR:
+            await ScrapingJob.objects.set_job_to_failed(job.id, result.get("message"))
+
+        elif result.get("code") == status.HTTP_503_SERVICE_UNAVAILABLE:
+            if settings.BRIGHTDATA_UNAVAILABLE_POLICY == "defer":
+                await ScrapingJobEvent.objects.arecord(
+                    job.id, ScrapingJobEventChoices.TRIGGER_DEFERRED.value
+                )
+            else:
+                await ScrapingJob.objects.set_job_to_failed(job.id, result.get("message"))
+
+        return result
+
+    @staticmethod
+    async def brightdata_unavailable_response(job: ScrapingJob):
+        """
+        Response of a job whose trigger was rejected because BrightData is unavailable:
+        202 with the still pending job when it is deferred, otherwise 503.
+        """
+
+        if settings.BRIGHTDATA_UNAVAILABLE_POLICY == "defer":
+            job.status = ScrapingJobStatusChoices.PENDING.value
+            response_data = await ScrapingJobModelSerializer(instance=job).adata
+            return (
+                response_data,
+                "DEFERRED",
+                status.HTTP_202_ACCEPTED,
+            )
+
+        return (
+            "BrightData is currently unavailable, please retry later",
+            "BRIGHTDATA_UNAVAILABLE",
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+
+    @staticmethod
+    async def trigger_brightdata_scraping(
+        inputs: List[dict],
+        webhook_params: dict,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ) -> StartBrightDataScrapingReturn:
+        """
+        Trigger one BrightData collection for one or more input rows.
+
+        Args:
+            inputs (List[dict]): The input rows (see `build_brightdata_input`).
+            webhook_params (dict): Query parameters identifying the job(s) in the webhook URL,
+                `job-id` for a single job or `batch-id` for a bulk creation batch.
+            http_client (Optional[httpx.AsyncClient]): The client to send the trigger with,
+                defaults to the process-wide pooled client (`get_brightdata_http_client`).
+
+        Returns:
+            StartBrightDataScrapingReturn: The snapshot ID on success (code 200), otherwise
+                the error message (code 500), or code 503 when the call was rejected by the
+                circuit breaker or the concurrency limit (see `guard_brightdata_call`).
+        """
+
+        webhook_url = (
+            f"{settings.API_BASE_URL}{settings.BRIGHTDATA_WEBHOOK_PATH}?{urlencode(webhook_params)}"
+        )
         encoded_webhook_url = quote(webhook_url, safe="")
 
         url = (
-            f"https://api.brightdata.com/datasets/v3/trigger"
+            f"{settings.BRIGHTDATA_API_BASE_URL}/datasets/v3/trigger"
             f"?dataset_id={settings.BRIGHTDATA_DATASET_ID}"
             f"&uncompressed_webhook=true"
             f"&format=json"
@@ -84,64 +213,48 @@ class ScrapingJobService:
             f"&include_errors=true"
         )
 
-        perplexity_prompt = perplexity_prompt_obj.build(original_prompt)
-
         payload = {
-            "input": [
-                {
-                    "url": "https://www.perplexity.ai",
-                    "prompt": perplexity_prompt,
-                    "country": country_code,
-                    "index": 1,
-                }
-            ],
-            "custom_output_fields": [
-                "url",
-                "prompt",
-                "answer_text",
-                "sources",
-                "citations",
-                "timestamp",
-                "input",
-            ],
+            "input": inputs,
+            "custom_output_fields": BRIGHTDATA_OUTPUT_FIELDS,
         }
 
-        headers = {
-            "Authorization": f"Bearer {settings.BRIGHTDATA_API_KEY}",
-            "Content-Type": "application/json",
-        }
+        client = http_client or get_brightdata_http_client()
 
         try:
+            async with guard_brightdata_call() as record:
+                response = await client.post(url, json=payload)
+                record(is_brightdata_healthy_response(response))
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(url, json=payload, headers=headers)
-
-                if not response.is_success:
-                    error_text = response.text or ""
-                    error_msg = f"HTTP {response.status_code}: {error_text}"
+            if not response.is_success:
+                error_text = response.text or ""
+                error_msg = f"HTTP {response.status_code}: {error_text}"
 
-                    logger.error(f"BrightData API call's error for job {job.id}: {error_text}")
+                logger.error(f"BrightData API call's error for {webhook_params}: {error_text}")
 
-                    await ScrapingJob.objects.set_job_to_failed(job.id, error_msg)
+                return {
+                    "message": error_msg,
+                    "snapshot_id": None,
+                    "code": status.HTTP_500_INTERNAL_SERVER_ERROR,
+                }
 
-                    return {
-                        "message": error_msg,
-                        "code": status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    }
+            data = response.json()
 
-                data = response.json()
+            return {
+                "message": "success",
+                "snapshot_id": data.get("snapshot_id"),
+                "code": status.HTTP_200_OK,
+            }
 
-                return {
-                    "message": "success",
-                    "snapshot_id": data.get("snapshot_id"),
-                    "code": status.HTTP_200_OK,
-                }
+        except CallRejectedError as e:
+            return {
+                "message": str(e),
+                "snapshot_id": None,
+                "code": status.HTTP_503_SERVICE_UNAVAILABLE,
+            }
 
         except httpx.TimeoutException as e:
             error_msg = str(e)
-            logger.error(f"BrightData API call timeout error for job {job.id}: {error_msg}")
-
-            await ScrapingJob.objects.set_job_to_failed(job.id, error_msg)
+            logger.error(f"BrightData API call timeout error for {webhook_params}: {error_msg}")
 
             return {
                 "message": error_msg,
@@ -151,11 +264,7 @@ class ScrapingJobService:
 
         except Exception as e:
             error_msg = str(e)
-            logger.error(
-                f"""
-                Error happened while updating job status to failed (Job ID:  {job.id}): {error_msg}
-                """
-            )
+            logger.error(f"BrightData API call failed for {webhook_params}: {error_msg}")
 
             return {
                 "message": error_msg,
@@ -169,9 +278,34 @@ class ScrapingJobService:
         user: User,
         original_prompt: str,
         country_code: Optional["str"] = "US",
+        use_analysis_cache: bool = True,
     ):
 
-        scraping_job = await ScrapingJob.objects.acreate(user=user, original_prompt=original_prompt)
+        country_code = country_code.upper()
+        scrape_cache_key = build_scrape_cache_key(original_prompt, country_code)
+        cached_scrape = await ScrapeResultCacheEntry.objects.aget_fresh(scrape_cache_key)
+
+        scraping_job = await ScrapingJob.objects.acreate(
+            user=user,
+            original_prompt=original_prompt,
+            country_code=country_code,
+            scrape_cache_key=scrape_cache_key,
+            use_analysis_cache=use_analysis_cache,
+            cached_scrape=cached_scrape,
+        )
+
+        if cached_scrape:
+            await scrape_result_cache_requests.ainc(result="hit")
+            await adispatch_analysis(scraping_job.id)
+
+            response_data = await ScrapingJobModelSerializer(instance=scraping_job).adata
+            return (
+                response_data,
+                "CREATED",
+                status.HTTP_201_CREATED,
+            )
+
+        await scrape_result_cache_requests.ainc(result="miss")
 
         bt_scraping_result = await cls.start_brightdata_scraping(
             scraping_job, original_prompt, country_code
@@ -187,11 +321,16 @@ class ScrapingJobService:
                 status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-        snapshot_id = bt_scraping_result.get("snapshot_id")
+        if bt_scraping_result.get("code") == status.HTTP_503_SERVICE_UNAVAILABLE:
+            return await cls.brightdata_unavailable_response(scraping_job)
 
-        await ScrapingJob.objects.update_job_with_snapshot_id(scraping_job.id, snapshot_id)
+        scraping_job.snapshot_id = bt_scraping_result.get("snapshot_id")
+
+        if await ScrapingJob.objects.update_job_with_snapshot_id(
+            scraping_job.id, scraping_job.snapshot_id
+        ):
+            scraping_job.status = ScrapingJobStatusChoices.RUNNING.value
 
-        await sync_to_async(scraping_job.refresh_from_db)(fields=["snapshot_id"])
         response_data = await ScrapingJobModelSerializer(instance=scraping_job).adata
         return (
             response_data,
@@ -199,27 +338,112 @@ class ScrapingJobService:
             status.HTTP_201_CREATED,
         )
 
+    @classmethod
+    async def create_jobs_in_bulk(
+        cls, user: User, jobs_data: List[dict], use_analysis_cache: bool = True
+    ):
+        """
+        Create many jobs at once: one INSERT for all jobs, cached scrapes go straight to
+        analysis and the other jobs share multi-row BrightData triggers of at most
+        `BRIGHTDATA_TRIGGER_MAX_INPUTS` rows, sent concurrently.
+        """
+
+        prepared = []
+        for item in jobs_data:
+            country_code = item.get("country_code").upper()
+            prepared.append(
+                {
+                    "original_prompt": item.get("prompt"),
+                    "country_code": country_code,
+                    "scrape_cache_key": build_scrape_cache_key(item.get("prompt"), country_code),
+                    "use_analysis_cache": use_analysis_cache,
+                }
+            )
+
+        cached_scrapes = await ScrapeResultCacheEntry.objects.aget_fresh_many(
+            data["scrape_cache_key"] for data in prepared
+        )
+        for data in prepared:
+            data["cached_scrape"] = cached_scrapes.get(data["scrape_cache_key"])
+
+        jobs = await ScrapingJob.objects.abulk_create_jobs(
+            user, prepared, settings.BRIGHTDATA_TRIGGER_MAX_INPUTS
+        )
+
+        batches: Dict[str, List[ScrapingJob]] = defaultdict(list)
+        for job, data in zip(jobs, prepared):
+            if data["cached_scrape"]:
+                await scrape_result_cache_requests.ainc(result="hit")
+                await adispatch_analysis(job.id)
+            else:
+                await scrape_result_cache_requests.ainc(result="miss")
+                batches[job.batch_id].append(job)
+
+        await asyncio.gather(
+            *(cls.start_batch_scraping(batch_id, batch) for batch_id, batch in batches.items())
+        )
+
+        response_data = await ScrapingJobModelSerializer(instance=jobs, many=True).adata
+        return (
+            response_data,
+            "CREATED",
+            status.HTTP_201_CREATED,
+        )
+
+    @classmethod
+    async def start_batch_scraping(cls, batch_id: str, jobs: List[ScrapingJob]) -> None:
+        result = await cls.trigger_brightdata_scraping(
+            [
+                build_brightdata_input(job.original_prompt, job.country_code, job.batch_index)
+                for job in jobs
+            ],
+            {"batch-id": batch_id},
+        )
+
+        deferred = (
+            result.get("code") == status.HTTP_503_SERVICE_UNAVAILABLE
+            and settings.BRIGHTDATA_UNAVAILABLE_POLICY == "defer"
+        )
+
+        if deferred:
+            await ScrapingJobEvent.objects.arecord_many(
+                [job.id for job in jobs], ScrapingJobEventChoices.TRIGGER_DEFERRED.value
+            )
+            job_status, snapshot_id = ScrapingJobStatusChoices.PENDING.value, None
+        elif result.get("code") != status.HTTP_200_OK:
+            await ScrapingJob.objects.afail_batch(batch_id, result.get("message"))
+            job_status, snapshot_id = ScrapingJobStatusChoices.FAILED.value, None
+        else:
+            snapshot_id = result.get("snapshot_id")
+            await ScrapingJob.objects.aupdate_batch_with_snapshot_id(batch_id, snapshot_id)
+            job_status = ScrapingJobStatusChoices.RUNNING.value
+
+        for job in jobs:
+            job.status, job.snapshot_id = job_status, snapshot_id
+
     @staticmethod
-    async def list(user_id: int) -> Tuple[Optional[List[ScrapingJob]], str, int]:
+    async def list(
+        user_id: int, raw_cursor: Optional[str] = None, raw_page_size: Optional[str] = None
+    ) -> Tuple[Optional[CursorPage], str, int]:
 
         try:
-            jobs = await ScrapingJob.objects.aget_user_jobs(user_id)
+            cursor = user_jobs_paginator.get_cursor(raw_cursor)
+            page_size = user_jobs_paginator.get_page_size(raw_page_size)
+
+            page = await ScrapingJob.objects.aget_user_jobs(user_id, cursor, page_size)
 
             return (
-                jobs,
+                page,
                 "SUCCESS",
                 status.HTTP_200_OK,
             )
 
-        except ValidationError as e:
-            logger.error(
-                f"SEO report validation error when fetching jobs for user: {user_id}",
-                extra={"validation_errors": e.errors()},
-            )
+        except InvalidCursorError:
+            logger.error(f"Invalid jobs list cursor for user: {user_id}")
 
             return (
                 None,
-                "BAD_REQUEST",
+                "INVALID_CURSOR",
                 status.HTTP_400_BAD_REQUEST,
             )
 
@@ -235,6 +459,39 @@ class ScrapingJobService:
                 status.HTTP_400_BAD_REQUEST,
             )
 
+    @staticmethod
+    async def retrieve(job_id: str, user_id: int) -> Tuple[Optional[ScrapingJob], str, int]:
+
+        try:
+            job = await ScrapingJob.objects.aget_user_job(user_id, job_id)
+
+            if not job:
+                logger.error(f"No scraping job found with given ID ({job_id}) for user ({user_id})")
+
+                return (
+                    None,
+                    "NOT_FOUND",
+                    status.HTTP_404_NOT_FOUND,
+                )
+
+            return (
+                job,
+                "SUCCESS",
+                status.HTTP_200_OK,
+            )
+
+        except ValidationError as e:
+            logger.error(
+                f"SEO report validation error when fetching job ({job_id}) for user ({user_id})",
+                extra={"validation_errors": e.errors()},
+            )
+
+            return (
+                None,
+                "BAD_REQUEST",
+                status.HTTP_400_BAD_REQUEST,
+            )
+
     @staticmethod
     async def retrieve_by_snapshot_id(
         user_id: int, snapshot_id: str
@@ -277,3 +534,33 @@ class ScrapingJobService:
                 "BAD_REQUEST",
                 status.HTTP_400_BAD_REQUEST,
             )
+
+    @staticmethod
+    async def timeline(job_id: str, user_id: int) -> Tuple[Optional[dict], str, int]:
+        job = (
+            await ScrapingJob.objects.filter(id=job_id, user_id=user_id)
+            .only("id", "status")
+            .afirst()
+        )
+
+        if not job:
+            logger.error(f"No scraping job found with given ID ({job_id}) for user ({user_id})")
+
+            return (
+                None,
+                "NOT_FOUND",
+                status.HTTP_404_NOT_FOUND,
+            )
+
+        events = [event async for event in ScrapingJobEvent.objects.filter(job_id=job.id)]
+
+        return (
+            {
+                "job_id": str(job.id),
+                "status": job.status,
+                "events": await ScrapingJobEventModelSerializer(instance=events, many=True).adata,
+                "phases": compute_job_phases((event.event, event.occurred_at) for event in events),
+            },
+            "SUCCESS",
+            status.HTTP_200_OK,
+        )
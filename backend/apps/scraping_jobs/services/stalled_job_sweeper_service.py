@@ -0,0 +1,183 @@
+# Python Imports
+import asyncio
+import logging
+from collections import defaultdict
+from typing import Dict, List
+
+# Django Imports
+from django.conf import settings
+
+# REST Framework Imports
+from rest_framework import status
+
+# Third-Party Imports
+import httpx
+from asgiref.sync import sync_to_async
+
+# Project Imports
+from core.resilience import CallRejectedError
+
+# App Imports
+from ..brightdata import BrightDataAPIError, BrightDataClient, build_brightdata_http_client
+from ..constants import ScrapingJobStatusChoices
+from ..events import apublish_job_status
+from ..metrics import stalled_jobs_swept
+from ..models import ScrapingJob
+from ..records import StoredRecords, iter_blob_records, store_records_by_index
+from ..utils import is_cacheable_record
+from .bright_data_webhook_service import BrightDataWebhookService
+from .scraping_job_service import ScrapingJobService
+
+logger = logging.getLogger(__name__)
+
+
+class StalledJobSweeperService:
+    """
+    Resolve jobs stuck waiting on BrightData.
+
+    Stalled jobs are grouped by snapshot so every snapshot is polled once, with at most
+    `BRIGHTDATA_POLL_CONCURRENCY` requests in flight. Ready snapshots are downloaded in
+    pull mode and fed into the same path as a webhook delivery, failed snapshots fail
+    their jobs, and PENDING jobs that never got a snapshot are triggered again when
+    `BRIGHTDATA_UNAVAILABLE_POLICY` is "defer", otherwise failed so they can be retried.
+
+    Outcomes (the `outcome` label of `scraping_jobs_stalled_swept_total`):
+        - "ready": the snapshot was downloaded and the job sent to analysis
+        - "running": BrightData is still working on the snapshot
+        - "failed": BrightData failed the snapshot
+        - "never_triggered": the job has no snapshot and was failed
+        - "retriggered": the job had no snapshot and was triggered again
+        - "deferred": the job has no snapshot and BrightData is still unavailable
+        - "error": BrightData could not be reached (or its circuit is open), the job is
+          retried on the next sweep
+    """
+
+    @classmethod
+    async def sweep(cls) -> Dict[str, int]:
+        jobs = await ScrapingJob.objects.aget_stalled_jobs(settings.STALLED_JOB_SWEEP_BATCH_SIZE)
+        outcomes: Dict[str, int] = defaultdict(int)
+        jobs_by_snapshot: Dict[str, List[ScrapingJob]] = defaultdict(list)
+        untriggered_jobs: List[ScrapingJob] = []
+
+        for job in jobs:
+            if job.snapshot_id:
+                jobs_by_snapshot[job.snapshot_id].append(job)
+            elif settings.BRIGHTDATA_UNAVAILABLE_POLICY == "defer":
+                untriggered_jobs.append(job)
+            else:
+                await cls._fail(job, "BrightData scraping was never triggered")
+                outcomes["never_triggered"] += 1
+
+        if untriggered_jobs:
+            # The sweep runs in a short-lived loop (`async_to_sync` in Celery), so it triggers
+            # with its own client rather than leaving a pooled one open on that loop
+            async with build_brightdata_http_client() as http_client:
+                for job in untriggered_jobs:
+                    outcomes[await cls._retrigger(job, http_client)] += 1
+
+        if jobs_by_snapshot:
+            semaphore = asyncio.Semaphore(settings.BRIGHTDATA_POLL_CONCURRENCY)
+
+            async with BrightDataClient() as client:
+                snapshot_outcomes = await asyncio.gather(
+                    *(
+                        cls._sweep_snapshot(client, semaphore, snapshot_id, snapshot_jobs)
+                        for snapshot_id, snapshot_jobs in jobs_by_snapshot.items()
+                    )
+                )
+
+            for outcome, snapshot_jobs in zip(snapshot_outcomes, jobs_by_snapshot.values()):
+                outcomes[outcome] += len(snapshot_jobs)
+
+        for outcome, count in outcomes.items():
+            await stalled_jobs_swept.ainc(count, outcome=outcome)
+
+        return dict(outcomes)
+
+    @classmethod
+    async def _sweep_snapshot(
+        cls,
+        client: BrightDataClient,
+        semaphore: asyncio.Semaphore,
+        snapshot_id: str,
+        jobs: List[ScrapingJob],
+    ) -> str:
+        try:
+            async with semaphore:
+                snapshot_status = await client.get_snapshot_status(snapshot_id)
+
+                if snapshot_status == "ready":
+                    results_blob_key = await client.download_snapshot(snapshot_id)
+
+        except (httpx.HTTPError, BrightDataAPIError, CallRejectedError) as e:
+            logger.warning(f"Failed to poll BrightData snapshot {snapshot_id}: {e}")
+            return "error"
+
+        if snapshot_status == "failed":
+            for job in jobs:
+                await cls._fail(job, f"BrightData snapshot {snapshot_id} failed")
+
+        elif snapshot_status == "ready":
+            batch_jobs = [job for job in jobs if job.batch_id]
+
+            if batch_jobs:
+                stored_by_index = await sync_to_async(cls._store_records_by_index)(results_blob_key)
+                await BrightDataWebhookService.ingest_batch_results(batch_jobs, stored_by_index)
+
+            if len(batch_jobs) < len(jobs):
+                cacheable = await sync_to_async(cls._is_cacheable)(results_blob_key)
+
+                for job in jobs:
+                    if not job.batch_id:
+                        await BrightDataWebhookService.ingest_results(
+                            job, results_blob_key, cacheable
+                        )
+
+        return snapshot_status
+
+    @staticmethod
+    def _store_records_by_index(results_blob_key: str) -> Dict[int, StoredRecords]:
+        return store_records_by_index(iter_blob_records(results_blob_key))
+
+    @staticmethod
+    def _is_cacheable(results_blob_key: str) -> bool:
+        count = 0
+        for count, record in enumerate(iter_blob_records(results_blob_key), start=1):
+            if not is_cacheable_record(record):
+                return False
+
+        return count > 0
+
+    @staticmethod
+    async def _retrigger(job: ScrapingJob, http_client: httpx.AsyncClient) -> str:
+        result = await ScrapingJobService.start_brightdata_scraping(
+            job, job.original_prompt, job.country_code, http_client
+        )
+
+        if result.get("code") == status.HTTP_503_SERVICE_UNAVAILABLE:
+            return "deferred"
+
+        if result.get("code") != status.HTTP_200_OK:
+            return "never_triggered"
+
+        if await ScrapingJob.objects.update_job_with_snapshot_id(job.id, result["snapshot_id"]):
+            await apublish_job_status(
+                job.user_id,
+                job.id,
+                ScrapingJobStatusChoices.RUNNING.value,
+                "ScrapingJob has been triggered",
+            )
+
+        return "retriggered"
+
+    @staticmethod
+    async def _fail(job: ScrapingJob, error: str) -> None:
+        logger.error(f"Stalled scraping job {job.id} marked as failed: {error}")
+
+        if await ScrapingJob.objects.set_job_to_failed(job.id, error):
+            await apublish_job_status(
+                job.user_id,
+                job.id,
+                ScrapingJobStatusChoices.FAILED.value,
+                "ScrapingJob has been failed",
+            )
@@ -0,0 +1,144 @@
+# Python Imports
+import hashlib
+import json
+import math
+from datetime import datetime
+from typing import Any, Iterable, List, Optional, Tuple, TypedDict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# App Imports
+from .constants import GEMINI_CHARS_PER_TOKEN, JOB_PHASES, TERMINAL_STATUSES, TRACKING_QUERY_PARAMS
+from .prompts.perplexity import PerplexityPrompt
+
+
+class JobPhase(TypedDict):
+    run: int
+    phase: str
+    started_at: datetime
+    ended_at: datetime
+    seconds: float
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Casefold a user prompt and collapse its whitespace"""
+
+    return " ".join(prompt.casefold().split())
+
+
+def build_scrape_cache_key(prompt: str, country_code: str) -> str:
+    """
+    Build the scrape result cache key of a user prompt.
+
+    Two prompts share a key when they are equal once normalized, target the same country
+    and would be sent to BrightData with the same `PerplexityPrompt` template version.
+    """
+
+    raw_key = f"{PerplexityPrompt.VERSION}:{country_code.upper()}:{normalize_prompt(prompt)}"
+    return hashlib.sha256(raw_key.encode()).hexdigest()
+
+
+def is_cacheable_record(record: Any) -> bool:
+    """Tell whether a BrightData record can be reused, i.e. it is not an error record"""
+
+    return isinstance(record, dict) and "error" not in record and "error_code" not in record
+
+
+def get_record_index(record: Any) -> Optional[int]:
+    """
+    Return the `index` of the input row a BrightData record answers, which is echoed back
+    in the record's `input` field, or None when it has none.
+    """
+
+    index = (record.get("input") or {}).get("index") if isinstance(record, dict) else None
+    return None if index is None else int(index)
+
+
+def build_analysis_cache_key(
+    prompt_version: int, user_prompt: str, model: str, generation_settings: dict
+) -> str:
+    """
+    Build the analysis cache key of a Gemini call, i.e. the SHA-256 of everything that
+    determines its output: the system prompt version, the built user prompt, the model
+    identifier and the generation settings.
+    """
+
+    raw_key = json.dumps(
+        [prompt_version, model, generation_settings, user_prompt],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(raw_key.encode()).hexdigest()
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Return the canonical form of a source URL, so the same page cited with a different
+    scheme, `www.` prefix, trailing slash, fragment or tracking parameters compares equal.
+    """
+
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower().removeprefix("www.")
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith("utm_") and key.lower() not in TRACKING_QUERY_PARAMS
+        )
+    )
+
+    return urlunsplit(("https", host, parts.path.rstrip("/"), query, ""))
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the Gemini tokens of a text without asking Gemini to count them"""
+
+    return math.ceil(len(text) / GEMINI_CHARS_PER_TOKEN)
+
+
+def compute_job_phases(events: Iterable[Tuple[str, datetime]]) -> List[JobPhase]:
+    """
+    Compute the phase durations of a job from its timeline.
+
+    Args:
+        events (Iterable[Tuple[str, datetime]]): The job's `(event, occurred_at)` pairs,
+            oldest first.
+
+    Returns:
+        List[JobPhase]: The completed phases (see `JOB_PHASES`) in the order they ended.
+            Every terminal status ends a run, the events of a retry belong to the next run.
+    """
+
+    phases: List[JobPhase] = []
+    run, run_started_at, started = 1, None, {}
+
+    for event, occurred_at in events:
+        run_started_at = run_started_at or occurred_at
+
+        for phase, start_event, end_events in JOB_PHASES:
+            if event in end_events and start_event in started:
+                started_at = started.pop(start_event)
+                phases.append(
+                    {
+                        "run": run,
+                        "phase": phase,
+                        "started_at": started_at,
+                        "ended_at": occurred_at,
+                        "seconds": (occurred_at - started_at).total_seconds(),
+                    }
+                )
+
+        started[event] = occurred_at
+
+        if event in TERMINAL_STATUSES:
+            phases.append(
+                {
+                    "run": run,
+                    "phase": "total",
+                    "started_at": run_started_at,
+                    "ended_at": occurred_at,
+                    "seconds": (occurred_at - run_started_at).total_seconds(),
+                }
+            )
+            run, run_started_at, started = run + 1, None, {}
+
+    return phases
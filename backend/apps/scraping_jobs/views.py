@@ -17,6 +17,7 @@ from core.responses import Response
 
 from .serializers import (
     ListScrapingJobModelSerializer,
+    ScrapingJobBulkCreationSerializer,
     ScrapingJobCreationSerializer,
     ScrapingJobModelSerializer,
 )
@@ -26,6 +27,8 @@ from .services import BrightDataWebhookService, ScrapingJobService
 
 
 class ScrapingJobViewSet(ViewSet):
+    # Job IDs are UUIDs, anything else is not found rather than a failed lookup
+    lookup_value_regex = r"[0-9a-fA-F]{8}(-[0-9a-fA-F]{4}){3}-[0-9a-fA-F]{12}"
 
     async def create(self, request: Request) -> Response:
         data = request.data
@@ -37,12 +40,15 @@ class ScrapingJobViewSet(ViewSet):
             validated_data = serializer.validated_data
             existing_job_id = validated_data.get("existing_job_id")
             if existing_job_id:
-                ScrapingJobService.retry_job(job_id=existing_job_id, user=user)
+                response_data, status_text, status_code = await ScrapingJobService.retry_job(
+                    job_id=existing_job_id, user=user
+                )
             else:
                 response_data, status_text, status_code = await ScrapingJobService.create_new_job(
                     user,
                     validated_data.get("prompt"),
                     validated_data.get("country_code"),
+                    validated_data.get("use_analysis_cache"),
                 )
         except ValidationError as e:
             response_data, status_text, status_code = (
@@ -53,15 +59,58 @@ class ScrapingJobViewSet(ViewSet):
 
         return Response(data=response_data, status_text=status_text, status_code=status_code)
 
+    @action(methods=["POST"], detail=False)
+    async def bulk(self, request: Request) -> Response:
+        serializer = ScrapingJobBulkCreationSerializer(data=request.data)
+
+        try:
+            serializer.is_valid(raise_exception=True)
+            validated_data = serializer.validated_data
+            response_data, status_text, status_code = await ScrapingJobService.create_jobs_in_bulk(
+                request.user,
+                validated_data.get("jobs"),
+                validated_data.get("use_analysis_cache"),
+            )
+        except ValidationError as e:
+            response_data, status_text, status_code = (
+                e.detail,
+                None,
+                status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response(data=response_data, status_text=status_text, status_code=status_code)
+
     async def list(self, request: Request) -> Response:
         user = request.user
-        jobs, status_text, status_code = await ScrapingJobService.list(user.id)
-        response_data = []
+        page, status_text, status_code = await ScrapingJobService.list(
+            user.id,
+            request.query_params.get("cursor"),
+            request.query_params.get("page_size"),
+        )
+        response_data, pagination = [], None
+
+        if page:
+            pagination = page.pagination
+            if page.items:
+                response_data = await ListScrapingJobModelSerializer(
+                    instance=page.items, many=True
+                ).adata
+
+        return Response(
+            data=response_data,
+            status_text=status_text,
+            status_code=status_code,
+            pagination=pagination,
+        )
 
-        if jobs:
-            response_data = await ListScrapingJobModelSerializer(instance=jobs, many=True).adata
+    async def retrieve(self, request: Request, pk: str) -> Response:
+        user = request.user
+        job, status_text, status_code = await ScrapingJobService.retrieve(pk, user.id)
 
-        return Response(data=response_data, status_text=status_text, status_code=status_code)
+        if job:
+            job = await ScrapingJobModelSerializer(instance=job).adata
+
+        return Response(data=job, status_text=status_text, status_code=status_code)
 
     @action(methods=["GET"], detail=False, url_path=r"by-snapshot/(?P<snapshot_id>[^/.]+)")
     async def retrieve_by_snapshot_id(self, request: Request, snapshot_id: str) -> Response:
@@ -82,6 +131,13 @@ class ScrapingJobViewSet(ViewSet):
 
         return Response(data=job, status_text=status_text, status_code=status_code)
 
+    @action(methods=["GET"], detail=True)
+    async def timeline(self, request: Request, pk: str) -> Response:
+        user = request.user
+        timeline, status_text, status_code = await ScrapingJobService.timeline(pk, user.id)
+
+        return Response(data=timeline, status_text=status_text, status_code=status_code)
+
 
 class BrightDataWebhookAPIView(APIView):
     authentication_classes = []
@@ -0,0 +1,182 @@
+# Python Imports
+import logging
+import os
+import socket
+from datetime import datetime
+from typing import BinaryIO, List, Optional, Tuple, TypedDict
+
+# Django Imports
+from django.conf import settings
+from django.db import close_old_connections
+
+# Third-Party Imports
+from asgiref.sync import sync_to_async
+from redis.exceptions import ResponseError
+
+# Project Imports
+from core.blob_store import get_blob_store
+from core.json_stream import iter_bounded_chunks
+from core.redis import get_redis
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_CONSUMER_GROUP = "webhook-ingest"
+
+
+class QueuedWebhookDelivery(TypedDict):
+    # Stream entries only hold strings, a missing ID is an empty string
+    job_id: str
+    batch_id: str
+    body_blob_key: str
+    received_at: str
+
+
+def store_webhook_body(stream: Optional[BinaryIO]) -> str:
+    """
+    Stream a BrightData webhook delivery's raw body into the blob store. Its content key,
+    the SHA-256 of the body, identifies the payload (see `WebhookDelivery`).
+
+    Raises PayloadTooLargeError when the body is larger than
+    `BRIGHTDATA_WEBHOOK_MAX_BODY_SIZE`, nothing is stored then.
+    """
+
+    chunks = (
+        iter_bounded_chunks(stream, settings.BRIGHTDATA_WEBHOOK_MAX_BODY_SIZE) if stream else []
+    )
+
+    return get_blob_store().put_stream(chunks)
+
+
+def build_webhook_delivery(
+    job_id: Optional[str],
+    batch_id: Optional[str],
+    body_blob_key: str,
+    received_at: datetime,
+) -> QueuedWebhookDelivery:
+    return {
+        "job_id": job_id or "",
+        "batch_id": batch_id or "",
+        "body_blob_key": body_blob_key,
+        "received_at": received_at.isoformat(),
+    }
+
+
+def enqueue_webhook_delivery(delivery: QueuedWebhookDelivery) -> str:
+    """
+    Append a delivery, whose body `store_webhook_body` persisted, to the
+    `BRIGHTDATA_WEBHOOK_STREAM` Redis stream, where `WebhookDeliveryConsumer` picks it up.
+
+    Returns:
+        str: The ID of the stream entry.
+    """
+
+    return get_redis().xadd(
+        settings.BRIGHTDATA_WEBHOOK_STREAM,
+        delivery,
+        maxlen=settings.BRIGHTDATA_WEBHOOK_STREAM_MAXLEN,
+        approximate=True,
+    )
+
+
+class WebhookDeliveryConsumer:
+    """
+    Consume spooled BrightData webhook deliveries from the `BRIGHTDATA_WEBHOOK_STREAM`
+    Redis stream as a member of the `WEBHOOK_CONSUMER_GROUP` consumer group, so several
+    consumer processes share the deliveries.
+
+    A delivery is acknowledged once ingested (see `BrightDataWebhookService.ingest_delivery`).
+    One whose consumer crashed or failed stays pending and is claimed again after
+    `BRIGHTDATA_WEBHOOK_RECLAIM_AFTER` seconds, up to `BRIGHTDATA_WEBHOOK_MAX_DELIVERIES`
+    attempts after which it is dropped with an error log (its raw body is kept).
+    """
+
+    def __init__(self, name: Optional[str] = None, batch_size: int = 10) -> None:
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}"
+        self.batch_size = batch_size
+        self.stream = settings.BRIGHTDATA_WEBHOOK_STREAM
+
+    def ensure_group(self) -> None:
+        try:
+            get_redis().xgroup_create(self.stream, WEBHOOK_CONSUMER_GROUP, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def run(self, block: int = 5000) -> None:
+        """Consume deliveries until interrupted, waiting up to `block` ms for new ones"""
+
+        await sync_to_async(self.ensure_group, thread_sensitive=False)()
+        logger.info(f"Consuming BrightData webhook deliveries as {self.name}")
+
+        while True:
+            await self.consume_once(block)
+            await sync_to_async(close_old_connections)()
+
+    async def consume_once(self, block: Optional[int] = None) -> int:
+        """
+        Ingest the deliveries due for a retry and the new ones, waiting up to `block` ms
+        for new ones when there are none.
+
+        Returns:
+            int: The number of deliveries handled.
+        """
+
+        # Imported here, the webhook service imports this module
+        from .services import BrightDataWebhookService
+
+        await sync_to_async(self.ensure_group, thread_sensitive=False)()
+        entries = await sync_to_async(self._reclaim, thread_sensitive=False)()
+        entries += await sync_to_async(self._read, thread_sensitive=False)(block)
+
+        for entry_id, delivery in entries:
+            try:
+                await BrightDataWebhookService.ingest_delivery(delivery)
+            except Exception:
+                logger.exception(f"Failed to ingest BrightData webhook delivery {entry_id}")
+                continue
+
+            await sync_to_async(get_redis().xack, thread_sensitive=False)(
+                self.stream, WEBHOOK_CONSUMER_GROUP, entry_id
+            )
+
+        return len(entries)
+
+    def _read(self, block: Optional[int]) -> List[Tuple[str, QueuedWebhookDelivery]]:
+        response = get_redis().xreadgroup(
+            WEBHOOK_CONSUMER_GROUP,
+            self.name,
+            {self.stream: ">"},
+            count=self.batch_size,
+            block=block,
+        )
+
+        return [entry for _, entries in response or [] for entry in entries]
+
+    def _reclaim(self) -> List[Tuple[str, QueuedWebhookDelivery]]:
+        redis = get_redis()
+        _, entries, _ = redis.xautoclaim(
+            self.stream,
+            WEBHOOK_CONSUMER_GROUP,
+            self.name,
+            min_idle_time=int(settings.BRIGHTDATA_WEBHOOK_RECLAIM_AFTER * 1000),
+            count=self.batch_size,
+        )
+
+        retried = []
+        for entry_id, delivery in entries:
+            [pending] = redis.xpending_range(
+                self.stream, WEBHOOK_CONSUMER_GROUP, min=entry_id, max=entry_id, count=1
+            )
+
+            if pending["times_delivered"] > settings.BRIGHTDATA_WEBHOOK_MAX_DELIVERIES:
+                logger.error(
+                    f"Dropping BrightData webhook delivery {entry_id} after "
+                    f"{settings.BRIGHTDATA_WEBHOOK_MAX_DELIVERIES} attempts",
+                    extra={"delivery": delivery},
+                )
+                redis.xack(self.stream, WEBHOOK_CONSUMER_GROUP, entry_id)
+                continue
+
+            retried.append((entry_id, delivery))
+
+        return retried
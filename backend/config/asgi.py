@@ -27,16 +27,20 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 django_asgi_app = get_asgi_application()
 
-from core.middlewares import WebsocketJWTAuthentication
+from core.middlewares import LifespanMiddleware, WebsocketJWTAuthentication
 
 # Project Imports
+from scraping_jobs.brightdata import aclose_brightdata_http_clients
 from scraping_jobs.routing import websocket_patterns
 
-application = ProtocolTypeRouter(
-    {
-        "http": django_asgi_app,
-        "websocket": AllowedHostsOriginValidator(
-            WebsocketJWTAuthentication(URLRouter(websocket_patterns))
-        ),
-    }
+application = LifespanMiddleware(
+    ProtocolTypeRouter(
+        {
+            "http": django_asgi_app,
+            "websocket": AllowedHostsOriginValidator(
+                WebsocketJWTAuthentication(URLRouter(websocket_patterns))
+            ),
+        }
+    ),
+    on_shutdown=[aclose_brightdata_http_clients],
 )
@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 # Python Imports
+import json
 import logging
 import os
 import sys
@@ -199,16 +200,19 @@ SIMPLE_JWT = {
     "TOKEN_OBTAIN_SERIALIZER": None,
 }
 
+# Redis
+REDIS_HOST = config("REDIS_HOST", default="redis")
+REDIS_PORT = config("REDIS_PORT", default="6379")
+REDIS_URL = config("REDIS_URL", default=f"redis://{REDIS_HOST}:{REDIS_PORT}/1")
+
+
 # RabbitMQ & Channels
 CHANNEL_LAYERS = {
     "default": {
         "BACKEND": "channels_redis.core.RedisChannelLayer",
         "CONFIG": {
             "hosts": [
-                (
-                    config("REDIS_HOST", default="redis"),
-                    config("REDIS_PORT", default="6379"),
-                ),
+                (REDIS_HOST, REDIS_PORT),
             ]
         },
     }
@@ -231,6 +235,12 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = "UTC"
+CELERY_BEAT_SCHEDULE = {
+    "sweep-stalled-scraping-jobs": {
+        "task": "scraping_jobs.sweep_stalled_jobs",
+        "schedule": config("STALLED_JOB_SWEEP_INTERVAL", default=5 * 60, cast=int),
+    },
+}
 
 
 # OAuth
@@ -261,13 +271,152 @@ CORS_ALLOWED_ORIGINS = config(
 )
 
 
+# Blob Store
+BLOB_STORE = {
+    "BACKEND": config("BLOB_STORE_BACKEND", default="core.blob_store.LocalFileSystemBlobStore"),
+    "OPTIONS": config(
+        "BLOB_STORE_OPTIONS",
+        cast=json.loads,
+        default=json.dumps({"location": str(BASE_DIR / "data" / "blobs")}),
+    ),
+}
+
+
+# Metrics
+METRICS_AUTH_TOKEN = config("METRICS_AUTH_TOKEN", default="")
+
+
+# Scraping Jobs
+ANALYSIS_CACHE_MAX_ENTRIES = config("ANALYSIS_CACHE_MAX_ENTRIES", default=5000, cast=int)
+SCRAPE_RESULT_CACHE_TTL = config("SCRAPE_RESULT_CACHE_TTL", default=24 * 60 * 60, cast=int)
+SCRAPING_JOBS_PAGE_SIZE = config("SCRAPING_JOBS_PAGE_SIZE", default=20, cast=int)
+SCRAPING_JOBS_MAX_PAGE_SIZE = config("SCRAPING_JOBS_MAX_PAGE_SIZE", default=100, cast=int)
+SCRAPING_JOBS_BULK_MAX_SIZE = config("SCRAPING_JOBS_BULK_MAX_SIZE", default=100, cast=int)
+STALLED_JOB_RUNNING_AFTER = config("STALLED_JOB_RUNNING_AFTER", default=15 * 60, cast=int)
+STALLED_JOB_PENDING_AFTER = config("STALLED_JOB_PENDING_AFTER", default=5 * 60, cast=int)
+STALLED_JOB_SWEEP_BATCH_SIZE = config("STALLED_JOB_SWEEP_BATCH_SIZE", default=200, cast=int)
+
+
 # Bright Data
+BRIGHTDATA_API_BASE_URL = config("BRIGHTDATA_API_BASE_URL", default="https://api.brightdata.com")
+BRIGHTDATA_HTTP2 = config("BRIGHTDATA_HTTP2", default=True, cast=bool)
+BRIGHTDATA_HTTP_MAX_CONNECTIONS = config("BRIGHTDATA_HTTP_MAX_CONNECTIONS", default=100, cast=int)
+BRIGHTDATA_HTTP_MAX_KEEPALIVE_CONNECTIONS = config(
+    "BRIGHTDATA_HTTP_MAX_KEEPALIVE_CONNECTIONS", default=20, cast=int
+)
+BRIGHTDATA_HTTP_KEEPALIVE_EXPIRY = config(
+    "BRIGHTDATA_HTTP_KEEPALIVE_EXPIRY", default=30.0, cast=float
+)
+BRIGHTDATA_HTTP_CONNECT_TIMEOUT = config("BRIGHTDATA_HTTP_CONNECT_TIMEOUT", default=5.0, cast=float)
+BRIGHTDATA_HTTP_READ_TIMEOUT = config("BRIGHTDATA_HTTP_READ_TIMEOUT", default=30.0, cast=float)
+BRIGHTDATA_HTTP_WRITE_TIMEOUT = config("BRIGHTDATA_HTTP_WRITE_TIMEOUT", default=30.0, cast=float)
+BRIGHTDATA_HTTP_POOL_TIMEOUT = config("BRIGHTDATA_HTTP_POOL_TIMEOUT", default=5.0, cast=float)
+BRIGHTDATA_TRIGGER_MAX_INPUTS = config("BRIGHTDATA_TRIGGER_MAX_INPUTS", default=50, cast=int)
+BRIGHTDATA_POLL_CONCURRENCY = config("BRIGHTDATA_POLL_CONCURRENCY", default=5, cast=int)
+BRIGHTDATA_CIRCUIT_FAILURE_THRESHOLD = config(
+    "BRIGHTDATA_CIRCUIT_FAILURE_THRESHOLD", default=5, cast=int
+)
+BRIGHTDATA_CIRCUIT_RECOVERY_TIMEOUT = config(
+    "BRIGHTDATA_CIRCUIT_RECOVERY_TIMEOUT", default=30.0, cast=float
+)
+# What job creation does while BrightData is unavailable: "fail" answers 503 at once,
+# "defer" keeps the job pending for the stalled job sweeper to trigger later.
+BRIGHTDATA_UNAVAILABLE_POLICY = config("BRIGHTDATA_UNAVAILABLE_POLICY", default="fail")
+BRIGHTDATA_CONCURRENCY_INITIAL_LIMIT = config(
+    "BRIGHTDATA_CONCURRENCY_INITIAL_LIMIT", default=20, cast=int
+)
+BRIGHTDATA_CONCURRENCY_MIN_LIMIT = config("BRIGHTDATA_CONCURRENCY_MIN_LIMIT", default=2, cast=int)
+BRIGHTDATA_CONCURRENCY_MAX_LIMIT = config("BRIGHTDATA_CONCURRENCY_MAX_LIMIT", default=100, cast=int)
+BRIGHTDATA_CONCURRENCY_LATENCY_TARGET = config(
+    "BRIGHTDATA_CONCURRENCY_LATENCY_TARGET", default=5.0, cast=float
+)
+BRIGHTDATA_CONCURRENCY_ACQUIRE_TIMEOUT = config(
+    "BRIGHTDATA_CONCURRENCY_ACQUIRE_TIMEOUT", default=2.0, cast=float
+)
 BRIGHTDATA_API_KEY = config("BRIGHTDATA_API_KEY", cast=str)
 BRIGHTDATA_WEBHOOK_SECRET = config("BRIGHTDATA_WEBHOOK_SECRET", cast=str)
 BRIGHTDATA_WEBHOOK_PATH = "/webhooks/brightdata/"
+# Webhook bodies are decoded as a stream, this only bounds the spooled upload size
+BRIGHTDATA_WEBHOOK_MAX_BODY_SIZE = config(
+    "BRIGHTDATA_WEBHOOK_MAX_BODY_SIZE", default=50 * 1024 * 1024, cast=int
+)
+# Acknowledge webhooks once spooled to the blob store and a Redis stream, the
+# `consume_brightdata_webhooks` command ingests them. False ingests before replying.
+BRIGHTDATA_WEBHOOK_QUEUE = config("BRIGHTDATA_WEBHOOK_QUEUE", default=True, cast=bool)
+BRIGHTDATA_WEBHOOK_STREAM = config("BRIGHTDATA_WEBHOOK_STREAM", default="brightdata:webhooks")
+BRIGHTDATA_WEBHOOK_STREAM_MAXLEN = config(
+    "BRIGHTDATA_WEBHOOK_STREAM_MAXLEN", default=100_000, cast=int
+)
+BRIGHTDATA_WEBHOOK_RECLAIM_AFTER = config(
+    "BRIGHTDATA_WEBHOOK_RECLAIM_AFTER", default=60.0, cast=float
+)
+BRIGHTDATA_WEBHOOK_MAX_DELIVERIES = config("BRIGHTDATA_WEBHOOK_MAX_DELIVERIES", default=5, cast=int)
 BRIGHTDATA_DATASET_ID = config("BRIGHTDATA_DATASET_ID", cast=str)
 
 
 # GOOGLE
 GOOGLE_GEMINI_MODEL_IDENTIFIER = config("GOOGLE_GEMINI_MODEL_IDENTIFIER", default="gemini-2.5-pro")
 GOOGLE_API_KEY = config("GOOGLE_API_KEY")
+# Gemini models by tier, "pro" (GOOGLE_GEMINI_MODEL_IDENTIFIER) analyzes when routing is off
+GEMINI_MODEL_TIERS = {
+    "flash": config("GEMINI_FLASH_MODEL_IDENTIFIER", default="gemini-2.5-flash"),
+    "pro": GOOGLE_GEMINI_MODEL_IDENTIFIER,
+}
+# Route each analysis to a tier (see `route_model_tiers`): payloads up to
+# GEMINI_ROUTING_FLASH_MAX_TOKENS estimated tokens, and free plan ones while at least
+# GEMINI_ROUTING_BUSY_QUEUE_DEPTH jobs are ANALYZING, go to flash. A call to a tier timing out
+# after GEMINI_CALL_TIMEOUT seconds or failing with a 5xx falls back to the other one.
+GEMINI_MODEL_ROUTING = config("GEMINI_MODEL_ROUTING", default=False, cast=bool)
+GEMINI_ROUTING_FLASH_MAX_TOKENS = config("GEMINI_ROUTING_FLASH_MAX_TOKENS", default=8_000, cast=int)
+GEMINI_ROUTING_BUSY_QUEUE_DEPTH = config("GEMINI_ROUTING_BUSY_QUEUE_DEPTH", default=200, cast=int)
+GEMINI_CALL_TIMEOUT = config("GEMINI_CALL_TIMEOUT", default=180.0, cast=float)
+# Hedge a Gemini call still running after the GEMINI_HEDGE_PERCENTILE latency of its tier (or
+# GEMINI_HEDGE_DEFAULT_DELAY seconds until enough calls were seen, never under
+# GEMINI_HEDGE_MIN_DELAY) with a second one to the "same" tier or the "next" one of the job,
+# the first valid output wins (see `ainvoke_hedged`).
+GEMINI_HEDGING = config("GEMINI_HEDGING", default=False, cast=bool)
+GEMINI_HEDGE_PERCENTILE = config("GEMINI_HEDGE_PERCENTILE", default=0.95, cast=float)
+GEMINI_HEDGE_DEFAULT_DELAY = config("GEMINI_HEDGE_DEFAULT_DELAY", default=60.0, cast=float)
+GEMINI_HEDGE_MIN_DELAY = config("GEMINI_HEDGE_MIN_DELAY", default=1.0, cast=float)
+GEMINI_HEDGE_TARGET = config("GEMINI_HEDGE_TARGET", default="same")
+# Project quotas of the Gemini model, shared by every worker through Redis. 0 disables one.
+GEMINI_REQUESTS_PER_MINUTE = config("GEMINI_REQUESTS_PER_MINUTE", default=150, cast=int)
+GEMINI_TOKENS_PER_MINUTE = config("GEMINI_TOKENS_PER_MINUTE", default=2_000_000, cast=int)
+GEMINI_RATE_LIMIT_MAX_WAIT = config("GEMINI_RATE_LIMIT_MAX_WAIT", default=600.0, cast=float)
+# Pause of every Gemini call after a 429 without a retry delay, and retries of one call
+GEMINI_QUOTA_BACKOFF = config("GEMINI_QUOTA_BACKOFF", default=30.0, cast=float)
+GEMINI_QUOTA_MAX_RETRIES = config("GEMINI_QUOTA_MAX_RETRIES", default=3, cast=int)
+# Estimated tokens of the scraping data sent to Gemini, see `compact_scraping_data`
+GEMINI_PROMPT_TOKEN_BUDGET = config("GEMINI_PROMPT_TOKEN_BUDGET", default=100_000, cast=int)
+# Scraping data above this many estimated tokens is analyzed in chunks of
+# GEMINI_MAP_REDUCE_CHUNK_TOKENS, up to GEMINI_MAP_REDUCE_CONCURRENCY at once per job, whose
+# reports are merged. 0 disables the map-reduce analysis, the data is trimmed to the budget.
+GEMINI_MAP_REDUCE_THRESHOLD = config("GEMINI_MAP_REDUCE_THRESHOLD", default=100_000, cast=int)
+GEMINI_MAP_REDUCE_CHUNK_TOKENS = config("GEMINI_MAP_REDUCE_CHUNK_TOKENS", default=30_000, cast=int)
+GEMINI_MAP_REDUCE_CONCURRENCY = config("GEMINI_MAP_REDUCE_CONCURRENCY", default=4, cast=int)
+# "single" generates a report in one call, "sections" each section by its own call at once
+# then the summary (see `asectioned_analysis`), retrying an invalid section on its own.
+GEMINI_ANALYSIS_MODE = config("GEMINI_ANALYSIS_MODE", default="single")
+GEMINI_SECTION_MAX_ATTEMPTS = config("GEMINI_SECTION_MAX_ATTEMPTS", default=2, cast=int)
+# Rounds of generating the invalid sections of a report again before the analysis fails
+GEMINI_REPAIR_MAX_ATTEMPTS = config("GEMINI_REPAIR_MAX_ATTEMPTS", default=2, cast=int)
+
+# Analysis
+# "celery" runs each analysis in a prefork `analyze_scraped_data` task, "async" enqueues it
+# on a Redis stream for the `run_analysis_worker` command, which awaits many at once.
+ANALYSIS_EXECUTION_MODE = config("ANALYSIS_EXECUTION_MODE", default="celery")
+ANALYSIS_WORKER_CONCURRENCY = config("ANALYSIS_WORKER_CONCURRENCY", default=32, cast=int)
+ANALYSIS_STREAM = config("ANALYSIS_STREAM", default="analysis:jobs")
+ANALYSIS_STREAM_MAXLEN = config("ANALYSIS_STREAM_MAXLEN", default=100_000, cast=int)
+# Keep well above the longest Gemini call, another worker would analyze the job again
+ANALYSIS_RECLAIM_AFTER = config("ANALYSIS_RECLAIM_AFTER", default=900.0, cast=float)
+ANALYSIS_MAX_DELIVERIES = config("ANALYSIS_MAX_DELIVERIES", default=3, cast=int)
+# Send the sections of a report to its user as they are generated (see
+# `ReportSectionPublisher`), at most one event every REPORT_SECTION_EVENT_INTERVAL seconds per job
+REPORT_SECTION_EVENTS = config("REPORT_SECTION_EVENTS", default=True, cast=bool)
+REPORT_SECTION_EVENT_INTERVAL = config("REPORT_SECTION_EVENT_INTERVAL", default=1.0, cast=float)
+# Log of each user's jobs status websocket events, replayed to a client reconnecting with the
+# ID of its last event: about the JOB_EVENT_LOG_MAXLEN latest, dropped JOB_EVENT_LOG_TTL
+# seconds after the last one
+JOB_EVENT_LOG_MAXLEN = config("JOB_EVENT_LOG_MAXLEN", default=200, cast=int)
+JOB_EVENT_LOG_TTL = config("JOB_EVENT_LOG_TTL", default=1_800, cast=int)
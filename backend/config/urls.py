@@ -25,12 +25,16 @@ from drf_spectacular.views import (
     SpectacularSwaggerView,
 )
 
+# Project Imports
+from core.views import MetricsAPIView
+
 urlpatterns = [
     path(
         "api/auth/",
         include(("authentication.routing", "authentication"), namespace="authentication"),
     ),
     path("", include("scraping_jobs.routing")),
+    path("metrics/", MetricsAPIView.as_view(), name="metrics"),
     path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
     path(
         "api/doc/swagger/",
@@ -4,9 +4,17 @@
 from rest_framework.test import APIClient
 
 # Third Party Imports
+import fakeredis
 import pytest
+from redis import Redis
 
 # Project Imports
+from core.blob_store import get_blob_store
+from core.redis import get_redis
+from scraping_jobs.analysis import reset_gemini_rate_limiter
+from scraping_jobs.brightdata import reset_brightdata_resilience
+from scraping_jobs.brightdata_stub import BrightDataStubServer
+
 from .factories import AccountFactory
 
 
@@ -21,7 +29,8 @@ def authenticated_client(db):
     """Authenticated API Client with test user"""
     account = AccountFactory()
     user = account.user
-    client = APIClient.force_authenticate(user=user)
+    client = APIClient()
+    client.force_authenticate(user=user)
     return client, user
 
 
@@ -31,3 +40,61 @@ def test_user(db):
     account = AccountFactory()
     user = account.user
     return user
+
+
+@pytest.fixture(autouse=True)
+def fake_redis(monkeypatch):
+    """Replace the shared Redis client with an in-memory fake"""
+
+    client = fakeredis.FakeRedis(decode_responses=True)
+    monkeypatch.setattr(Redis, "from_url", lambda *args, **kwargs: client)
+    get_redis.cache_clear()
+
+    yield client
+
+    get_redis.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def blob_store(settings, tmp_path):
+    """Keep blobs written by tests in a temporary directory"""
+
+    settings.BLOB_STORE = {
+        "BACKEND": "core.blob_store.LocalFileSystemBlobStore",
+        "OPTIONS": {"location": str(tmp_path / "blobs")},
+    }
+    get_blob_store.cache_clear()
+
+    yield get_blob_store()
+
+    get_blob_store.cache_clear()
+
+
+@pytest.fixture
+def brightdata_stub(settings):
+    """Local BrightData stand-in the app's BrightData calls are sent to"""
+
+    server = BrightDataStubServer(api_key=settings.BRIGHTDATA_API_KEY).start()
+    settings.BRIGHTDATA_API_BASE_URL = server.base_url
+
+    yield server
+
+    server.stop()
+
+
+@pytest.fixture(autouse=True)
+def brightdata_resilience():
+    """Start every test with a closed BrightData circuit and a fresh concurrency limit"""
+
+    reset_brightdata_resilience()
+    yield
+    reset_brightdata_resilience()
+
+
+@pytest.fixture(autouse=True)
+def gemini_rate_limiter():
+    """Build the Gemini rate limiter on each test's fake Redis"""
+
+    reset_gemini_rate_limiter()
+    yield
+    reset_gemini_rate_limiter()
@@ -15,6 +15,8 @@ from factory.django import DjangoModelFactory
 # Project Imports
 from authentication.models import User, Account
 from authentication.constants import AccountTypeChoices, AccountProviderChoices
+from scraping_jobs.constants import ScrapingJobStatusChoices
+from scraping_jobs.models import ScrapingJob
 
 
 class UserFactory(DjangoModelFactory):
@@ -54,3 +56,48 @@ class AccountFactory(DjangoModelFactory):
     scope = None
     id_token = None
     expires_at = factory.LazyAttribute(lambda _: timezone.now() + timedelta(days=30))
+
+
+class ScrapingJobFactory(DjangoModelFactory):
+    class Meta:
+        model = ScrapingJob
+
+    id = factory.LazyFunction(uuid.uuid4)
+    user = factory.SubFactory(UserFactory)
+    original_prompt = factory.Faker("company")
+    snapshot_id = factory.Faker("uuid4")
+    status = ScrapingJobStatusChoices.COMPLETED.value
+    results = factory.LazyFunction(
+        lambda: [
+            {
+                "url": "https://www.perplexity.ai",
+                "prompt": "prompt",
+                "answer_text": "answer",
+                "sources": [],
+                "timestamp": "2025-01-01T00:00:00Z",
+            }
+        ]
+    )
+    seo_report = None
+
+
+def build_seo_report() -> dict:
+    """Minimal SEO report that satisfies `SEOReportSchema`"""
+
+    return {
+        "meta": {
+            "entity_name": "Example Corp",
+            "entity_type": "business",
+            "analysis_date": "2025-01-01",
+            "data_sources_count": 1,
+            "confidence_score": 0.5,
+        },
+        "inventory": {"total_sources": 1, "unique_domains": ["example.com"], "date_range": {}},
+        "content_analysis": {"content_themes": [], "sentiment": {"overall": "neutral"}},
+        "keywords": {"content_keywords": [], "keyword_themes": []},
+        "competitors": [],
+        "social_presence": {"platforms": []},
+        "backlink_analysis": {"total_backlinks": 0, "referring_domains": 0, "backlink_sources": []},
+        "recommendations": [],
+        "summary": None,
+    }
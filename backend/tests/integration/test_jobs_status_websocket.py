@@ -0,0 +1,123 @@
+# Python Imports
+from datetime import timedelta
+
+# Django Imports
+from django.utils import timezone
+
+# Third-party Imports
+import pytest
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from channels.testing import WebsocketCommunicator
+
+# Project Imports
+from scraping_jobs.constants import ScrapingJobStatusChoices
+from scraping_jobs.consumers import ScrapingJobsStatusWebsocketConsumer
+from scraping_jobs.event_log import job_event_log_key
+from scraping_jobs.events import apublish_job_status
+from scraping_jobs.metrics import job_event_resumes
+from scraping_jobs.models import ScrapingJobEvent
+
+from ..factories import ScrapingJobFactory, UserFactory
+
+
+@pytest.fixture(autouse=True)
+def channel_layer(settings, monkeypatch):
+    settings.CHANNEL_LAYERS = {"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}}
+    layer = get_channel_layer()
+    monkeypatch.setattr("scraping_jobs.events.channel_layer", layer)
+
+    return layer
+
+
+async def aconnect(user, last_event_id=None):
+    path = "/ws/scraping-jobs/status/"
+    if last_event_id:
+        path += f"?last_event_id={last_event_id}"
+
+    communicator = WebsocketCommunicator(ScrapingJobsStatusWebsocketConsumer.as_asgi(), path)
+    communicator.scope["user"] = user
+    connected, _ = await communicator.connect()
+    assert connected
+    assert (await communicator.receive_json_from())["type"] == "connection"
+
+    return communicator
+
+
+@pytest.mark.django_db
+class TestJobsStatusWebsocket:
+    """Test resuming the jobs status websocket from the user's event log"""
+
+    def test_reconnect_replays_missed_events(self, fake_redis):
+        """Test a client reconnecting gets only the events after its last one, then live ones"""
+
+        job = ScrapingJobFactory(status=ScrapingJobStatusChoices.PENDING.value)
+        statuses = [
+            ScrapingJobStatusChoices.RUNNING.value,
+            ScrapingJobStatusChoices.ANALYZING.value,
+            ScrapingJobStatusChoices.COMPLETED.value,
+        ]
+
+        async def run():
+            for status in statuses[:2]:
+                await apublish_job_status(job.user_id, job.id, status, "message")
+            [(last_seen, _), (missed, _)] = fake_redis.xrange(job_event_log_key(job.user_id))
+
+            communicator = await aconnect(job.user, last_seen)
+            replayed = await communicator.receive_json_from()
+            await apublish_job_status(job.user_id, job.id, statuses[2], "message")
+            live = await communicator.receive_json_from()
+            assert await communicator.receive_nothing()
+            await communicator.disconnect()
+
+            return missed, replayed, live
+
+        missed, replayed, live = async_to_sync(run)()
+
+        assert replayed == {
+            "type": "job_status_update",
+            "id": missed,
+            "data": {"job_id": str(job.id), "status": ScrapingJobStatusChoices.ANALYZING.value},
+        }
+        assert live["data"]["status"] == ScrapingJobStatusChoices.COMPLETED.value
+        assert live["id"] > missed
+        assert job_event_resumes.collect() == {'["replayed"]': "1"}
+
+    def test_reconnect_after_the_log_expired_sends_a_snapshot(self, fake_redis):
+        """Test a client whose missed events are gone gets the jobs in progress or changed"""
+
+        user = UserFactory()
+        disconnected_at = timezone.now() - timedelta(minutes=5)
+        running = ScrapingJobFactory(user=user, status=ScrapingJobStatusChoices.RUNNING.value)
+        completed = ScrapingJobFactory(user=user)
+        ScrapingJobEvent.objects.record(completed.id, ScrapingJobStatusChoices.COMPLETED.value)
+        old = ScrapingJobFactory(user=user)
+        ScrapingJobEvent.objects.record(
+            old.id,
+            ScrapingJobStatusChoices.COMPLETED.value,
+            occurred_at=disconnected_at - timedelta(minutes=1),
+        )
+        ScrapingJobFactory(status=ScrapingJobStatusChoices.RUNNING.value)
+        last_event_id = f"{int(disconnected_at.timestamp() * 1000)}-0"
+
+        async def run():
+            communicator = await aconnect(user, last_event_id)
+            snapshot = await communicator.receive_json_from()
+            await communicator.disconnect()
+
+            return snapshot
+
+        snapshot = async_to_sync(run)()
+
+        assert snapshot == {
+            "type": "jobs_snapshot",
+            "id": None,
+            "data": {
+                "jobs": [
+                    {"job_id": str(completed.id), "status": ScrapingJobStatusChoices.COMPLETED},
+                    {"job_id": str(running.id), "status": ScrapingJobStatusChoices.RUNNING},
+                ],
+                "complete": True,
+            },
+        }
+        assert job_event_resumes.collect() == {'["snapshot"]': "1"}
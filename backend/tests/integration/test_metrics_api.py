@@ -0,0 +1,58 @@
+# Django Imports
+from django.urls import reverse
+
+# DRF Imports
+from rest_framework import status
+from rest_framework.test import APIClient
+
+# Third-party Imports
+import pytest
+
+# Project Imports
+from scraping_jobs.metrics import job_phase_duration_seconds, scrape_result_cache_requests
+
+
+class TestMetricsAPI:
+    """Test Prometheus Metrics Endpoint"""
+
+    @pytest.fixture(autouse=True)
+    def metrics_token(self, settings):
+        settings.METRICS_AUTH_TOKEN = "metrics-token"
+
+    def test_metrics_rendered_in_prometheus_format(self, api_client: APIClient):
+        """Test recorded metrics are exposed in the text exposition format"""
+
+        scrape_result_cache_requests.inc(result="hit")
+        scrape_result_cache_requests.inc(result="hit")
+
+        response = api_client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer metrics-token")
+
+        body = response.content.decode()
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"].startswith("text/plain")
+        assert "# TYPE scrape_result_cache_requests_total counter" in body
+        assert 'scrape_result_cache_requests_total{result="hit"} 2' in body
+
+    def test_summary_rendered_with_quantiles(self, api_client: APIClient):
+        """Test summaries expose quantiles, sum and count per label set"""
+
+        for seconds in range(1, 101):
+            job_phase_duration_seconds.observe(seconds, phase="analysis")
+
+        response = api_client.get(reverse("metrics"), HTTP_AUTHORIZATION="Bearer metrics-token")
+
+        body = response.content.decode()
+        name = "scraping_job_phase_duration_seconds"
+        assert f"# TYPE {name} summary" in body
+        assert f'{name}{{phase="analysis",quantile="0.5"}} 50.0' in body
+        assert f'{name}{{phase="analysis",quantile="0.95"}} 95.0' in body
+        assert f'{name}{{phase="analysis",quantile="0.99"}} 99.0' in body
+        assert f'{name}_sum{{phase="analysis"}} 5050' in body
+        assert f'{name}_count{{phase="analysis"}} 100' in body
+
+    def test_metrics_require_token(self, api_client: APIClient):
+        """Test metrics are not exposed without the bearer token"""
+
+        response = api_client.get(reverse("metrics"))
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
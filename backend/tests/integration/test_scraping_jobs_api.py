@@ -0,0 +1,1216 @@
+# Python Imports
+import asyncio
+import base64
+import json
+import time
+import uuid
+from datetime import timedelta
+
+# Django Imports
+from django.conf import settings
+from django.db import OperationalError
+from django.urls import reverse
+from django.utils import timezone
+
+# DRF Imports
+from rest_framework import status
+
+# Third-party Imports
+import pytest
+from asgiref.sync import async_to_sync
+from google.api_core.exceptions import ResourceExhausted, ServiceUnavailable
+from langchain_core.exceptions import OutputParserException
+
+# Project Imports
+from scraping_jobs.analysis import reset_hedge_delays
+from scraping_jobs.analysis_queue import ANALYSIS_CONSUMER_GROUP, AnalysisWorker, enqueue_analysis
+from scraping_jobs.constants import (
+    GEMINI_GENERATION_SETTINGS,
+    SCRAPING_JOB_DETAIL_FIELDS,
+    SCRAPING_JOB_LIST_FIELDS,
+    ScrapingJobEventChoices,
+    ScrapingJobStatusChoices,
+)
+from scraping_jobs.metrics import (
+    gemini_calls_throttled,
+    gemini_hedged_calls,
+    gemini_model_tier_calls,
+    gemini_report_generations,
+    gemini_report_repairs,
+    gemini_report_section_failures,
+    job_phase_duration_seconds,
+    webhook_deliveries,
+)
+from scraping_jobs.models import (
+    AnalysisCacheEntry,
+    ScrapeResultCacheEntry,
+    ScrapingJob,
+    ScrapingJobEvent,
+    WebhookDelivery,
+)
+from scraping_jobs.prompts.gemini import GeminiPrompt, gemini_prompt
+from scraping_jobs.prompts.scraping_data import compact_scraping_data
+from scraping_jobs.schemas import SEO_REPORT_SCHEMA_VERSION, SEOReportSchema
+from scraping_jobs.services import BrightDataWebhookService, ScrapingJobService
+from scraping_jobs.tasks import adispatch_analysis, analyze_scraped_data
+from scraping_jobs.utils import build_analysis_cache_key, build_scrape_cache_key
+from scraping_jobs.webhook_queue import WebhookDeliveryConsumer
+
+from ..factories import ScrapingJobFactory, build_seo_report
+
+
+def consume_webhooks() -> int:
+    """Ingest the webhook deliveries acknowledged so far"""
+
+    return async_to_sync(WebhookDeliveryConsumer(name="tests").consume_once)()
+
+
+@pytest.mark.django_db
+class TestScrapingJobsListAPI:
+    """Test Scraping Jobs List Endpoint"""
+
+    def test_list_returns_only_list_fields(self, authenticated_client):
+        """Test listing jobs never exposes the heavy report columns"""
+
+        client, user = authenticated_client
+        ScrapingJobFactory.create_batch(3, user=user, seo_report={"meta": {}})
+
+        response = client.get(reverse("scraping-job-list"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data) == 3
+        assert set(response.data[0].keys()) == set(SCRAPING_JOB_LIST_FIELDS)
+
+    def test_list_only_returns_user_jobs(self, authenticated_client):
+        """Test listing jobs is scoped to the authenticated user"""
+
+        client, user = authenticated_client
+        ScrapingJobFactory(user=user)
+        ScrapingJobFactory()
+
+        response = client.get(reverse("scraping-job-list"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data) == 1
+
+    def test_user_jobs_query_defers_blob_columns(self, test_user):
+        """Test the list query does not load `results` and `seo_report`"""
+
+        ScrapingJobFactory(user=test_user, seo_report={"meta": {}})
+
+        page = async_to_sync(ScrapingJob.objects.all().aget_user_jobs)(test_user.id)
+        [job] = page.items
+
+        assert {"results", "seo_report", "analysis_prompt"} <= job.get_deferred_fields()
+
+    def test_list_paginates_with_cursors(self, authenticated_client):
+        """Test walking the jobs list forward and back with cursors"""
+
+        client, user = authenticated_client
+        jobs = ScrapingJobFactory.create_batch(5, user=user)
+        expected_ids = [
+            str(job.id) for job in sorted(jobs, key=lambda j: (j.created_at, j.id), reverse=True)
+        ]
+        url = reverse("scraping-job-list")
+
+        first = client.get(url, {"page_size": 2})
+        second = client.get(url, {"page_size": 2, "cursor": first.json()["pagination"]["next"]})
+        third = client.get(url, {"page_size": 2, "cursor": second.json()["pagination"]["next"]})
+        back = client.get(url, {"page_size": 2, "cursor": third.json()["pagination"]["previous"]})
+
+        pages = [first, second, third]
+        assert [job["id"] for page in pages for job in page.data] == expected_ids
+        assert first.json()["pagination"]["previous"] is None
+        assert third.json()["pagination"]["next"] is None
+        assert [job["id"] for job in back.data] == expected_ids[2:4]
+
+    def test_list_rejects_invalid_cursor(self, authenticated_client):
+        """Test listing jobs with a tampered cursor"""
+
+        client, _ = authenticated_client
+
+        response = client.get(reverse("scraping-job-list"), {"cursor": "not-a-cursor"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["status_text"] == "INVALID_CURSOR"
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"p": "2025-01-01T00:00:00+00:00", "k": "not-a-uuid", "r": 0},
+            {"p": "2025-01-01T00:00:00", "k": str(uuid.uuid4()), "r": 0},
+        ],
+        ids=["non_uuid_key", "naive_position"],
+    )
+    def test_list_rejects_cursor_with_invalid_fields(self, authenticated_client, payload):
+        """Test a well-formed cursor with a non-UUID key or a naive position is invalid"""
+
+        client, _ = authenticated_client
+        cursor = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+        response = client.get(reverse("scraping-job-list"), {"cursor": cursor})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.json()["status_text"] == "INVALID_CURSOR"
+
+
+@pytest.mark.django_db
+class TestScrapingJobRetrieveAPI:
+    """Test Scraping Job Retrieve Endpoint"""
+
+    def test_retrieve_upgrades_unversioned_report(self, authenticated_client):
+        """Test a report stored before versioning is validated once and stamped"""
+
+        client, user = authenticated_client
+        job = ScrapingJobFactory(user=user, seo_report=build_seo_report())
+        url = reverse("scraping-job-detail", args=[job.id])
+
+        response = client.get(url)
+
+        job.refresh_from_db()
+        assert response.status_code == status.HTTP_200_OK
+        assert job.report_schema_version == SEO_REPORT_SCHEMA_VERSION
+
+    def test_retrieve_trusts_current_version_report(self, authenticated_client):
+        """Test a report stamped with the current version is not validated again"""
+
+        client, user = authenticated_client
+        job = ScrapingJobFactory(
+            user=user,
+            seo_report={"meta": {}},
+            report_schema_version=SEO_REPORT_SCHEMA_VERSION,
+        )
+        url = reverse("scraping-job-detail", args=[job.id])
+
+        response = client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_retrieve_exposes_only_public_fields(self, authenticated_client):
+        """Test the storage and cache fields are not sent, only whether there are results"""
+
+        client, user = authenticated_client
+        job = ScrapingJobFactory(user=user, results_blob_key="results/job.json.zst")
+        url = reverse("scraping-job-detail", args=[job.id])
+
+        response = client.get(url)
+
+        data = response.json()["data"]
+        assert response.status_code == status.HTTP_200_OK
+        assert data["has_results"] is True
+        assert set(data) == set(SCRAPING_JOB_DETAIL_FIELDS)
+
+    def test_retrieve_jobs_sharing_a_batch_snapshot(self, authenticated_client):
+        """Test each job of a bulk batch is retrieved by its ID, though they share a snapshot"""
+
+        client, user = authenticated_client
+        batch_id = uuid.uuid4()
+        jobs = [
+            ScrapingJobFactory(
+                user=user,
+                original_prompt=prompt,
+                snapshot_id="batch-snapshot",
+                batch_id=batch_id,
+                batch_index=index,
+            )
+            for index, prompt in enumerate(["First Corp", "Second Corp"], start=1)
+        ]
+
+        responses = [client.get(reverse("scraping-job-detail", args=[job.id])) for job in jobs]
+
+        assert [response.status_code for response in responses] == [status.HTTP_200_OK] * 2
+        assert [response.json()["data"]["id"] for response in responses] == [
+            str(job.id) for job in jobs
+        ]
+        assert [response.json()["data"]["original_prompt"] for response in responses] == [
+            "First Corp",
+            "Second Corp",
+        ]
+
+    def test_retrieve_only_returns_user_jobs(self, authenticated_client):
+        """Test retrieving another user's job or a non-UUID ID is not found"""
+
+        client, _ = authenticated_client
+        job = ScrapingJobFactory()
+
+        response = client.get(reverse("scraping-job-detail", args=[job.id]))
+        invalid = client.get(f"{reverse('scraping-job-list')}not-a-job-id/")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert invalid.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_retrieve_by_snapshot_id(self, authenticated_client):
+        """Test retrieving a job by its BrightData snapshot ID"""
+
+        client, user = authenticated_client
+        job = ScrapingJobFactory(user=user)
+        url = reverse("scraping-job-retrieve-by-snapshot-id", args=[job.snapshot_id])
+
+        response = client.get(url)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"]["id"] == str(job.id)
+
+    def test_retrieve_rejects_invalid_legacy_report(self, authenticated_client):
+        """Test an unversioned report that fails validation"""
+
+        client, user = authenticated_client
+        job = ScrapingJobFactory(user=user, seo_report={"meta": {}})
+        url = reverse("scraping-job-detail", args=[job.id])
+
+        response = client.get(url)
+
+        job.refresh_from_db()
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert job.report_schema_version is None
+
+
+@pytest.mark.django_db
+class TestScrapingJobCreateAPI:
+    """Test Scraping Job Creation Endpoint"""
+
+    def test_create_with_cached_scrape_skips_brightdata(
+        self, authenticated_client, blob_store, monkeypatch
+    ):
+        """Test a fresh cached scrape result sends the job straight to analysis"""
+
+        client, _ = authenticated_client
+        dispatched = []
+        monkeypatch.setattr(analyze_scraped_data, "delay", dispatched.append)
+        monkeypatch.setattr(ScrapingJobService, "start_brightdata_scraping", None)
+        results_blob_key = blob_store.put_json([{"answer_text": "cached"}])
+        ScrapeResultCacheEntry.objects.create(
+            cache_key=build_scrape_cache_key("Example  Corp", "US"),
+            results_blob_key=results_blob_key,
+            snapshot_id="snapshot",
+        )
+
+        response = client.post(
+            reverse("scraping-job-list"),
+            {"prompt": "  example corp ", "country_code": "us"},
+            format="json",
+        )
+
+        job = ScrapingJob.objects.get(id=response.data["id"])
+        assert response.status_code == status.HTTP_201_CREATED
+        assert job.status == ScrapingJobStatusChoices.ANALYZING.value
+        assert job.results_blob_key == results_blob_key
+        assert job.snapshot_id is None
+        assert job.scrape_cache_key == build_scrape_cache_key("Example  Corp", "US")
+        assert dispatched == [str(job.id)]
+
+    def test_create_without_cached_scrape_triggers_brightdata(
+        self, authenticated_client, monkeypatch
+    ):
+        """Test a cache miss triggers a BrightData scrape"""
+
+        client, _ = authenticated_client
+
+        async def start_brightdata_scraping(job, original_prompt, country_code):
+            return {"message": "success", "snapshot_id": "new-snapshot", "code": 200}
+
+        monkeypatch.setattr(
+            ScrapingJobService, "start_brightdata_scraping", start_brightdata_scraping
+        )
+
+        response = client.post(
+            reverse("scraping-job-list"),
+            {"prompt": "Example Corp", "country_code": "US"},
+            format="json",
+        )
+
+        job = ScrapingJob.objects.get(id=response.data["id"])
+        assert response.status_code == status.HTTP_201_CREATED
+        assert job.status == ScrapingJobStatusChoices.RUNNING.value
+        assert job.scrape_cache_key == build_scrape_cache_key("Example Corp", "US")
+
+
+@pytest.mark.django_db
+class TestBrightDataUnavailable:
+    """Test job creation while BrightData is failing"""
+
+    @pytest.fixture(autouse=True)
+    def failing_brightdata(self, brightdata_stub, settings):
+        settings.BRIGHTDATA_CIRCUIT_FAILURE_THRESHOLD = 2
+        brightdata_stub.trigger_status = status.HTTP_502_BAD_GATEWAY
+
+        return brightdata_stub
+
+    def create_job(self, client):
+        return client.post(
+            reverse("scraping-job-list"),
+            {"prompt": "Example Corp", "country_code": "US"},
+            format="json",
+        )
+
+    def test_open_circuit_fails_fast(self, authenticated_client, failing_brightdata, fake_redis):
+        """Test creation stops calling BrightData once the circuit opens"""
+
+        client, _ = authenticated_client
+
+        responses = [self.create_job(client) for _ in range(3)]
+
+        assert [response.status_code for response in responses] == [
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+        ]
+        assert len(failing_brightdata.requests) == 2
+        assert fake_redis.hgetall("metrics:brightdata_calls_rejected_total") == {
+            '["circuit_open"]': "1"
+        }
+        assert list(fake_redis.hgetall("metrics:brightdata_circuit_state").values()) == ["2"]
+
+    def test_open_circuit_defers_job(self, authenticated_client, failing_brightdata, settings):
+        """Test the deferred policy keeps jobs pending instead of failing them"""
+
+        client, _ = authenticated_client
+        settings.BRIGHTDATA_UNAVAILABLE_POLICY = "defer"
+        for _ in range(2):
+            self.create_job(client)
+
+        response = self.create_job(client)
+
+        job = ScrapingJob.objects.get(id=response.data["id"])
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert job.status == ScrapingJobStatusChoices.PENDING.value
+        assert list(job.events.values_list("event", flat=True)) == [
+            ScrapingJobEventChoices.PENDING.value,
+            ScrapingJobEventChoices.TRIGGER_DEFERRED.value,
+        ]
+
+
+@pytest.mark.django_db
+class TestAnalysisCache:
+    """Test Gemini analysis caching"""
+
+    @pytest.fixture(autouse=True)
+    def silence_channel_layer(self, monkeypatch):
+        class ChannelLayer:
+            async def group_send(self, group, message):
+                pass
+
+        monkeypatch.setattr("scraping_jobs.events.channel_layer", ChannelLayer())
+
+    def test_cached_analysis_skips_gemini(self, monkeypatch):
+        """Test an identical analysis input reuses the cached report"""
+
+        def unexpected_model(schema, tier):
+            raise AssertionError("Gemini should not be called on a cache hit")
+
+        monkeypatch.setattr("scraping_jobs.analysis.get_analysis_model", unexpected_model)
+        job = ScrapingJobFactory(status=ScrapingJobStatusChoices.ANALYZING.value)
+        seo_report = SEOReportSchema.model_validate(build_seo_report())
+        analysis_prompt = gemini_prompt.build(
+            "USER", compact_scraping_data(job.results, settings.GEMINI_PROMPT_TOKEN_BUDGET).text
+        )
+        cache_key = build_analysis_cache_key(
+            GeminiPrompt.VERSION,
+            analysis_prompt,
+            settings.GOOGLE_GEMINI_MODEL_IDENTIFIER,
+            GEMINI_GENERATION_SETTINGS,
+        )
+        async_to_sync(AnalysisCacheEntry.objects.astore)(cache_key, seo_report)
+
+        analyze_scraped_data.run(str(job.id))
+
+        job.refresh_from_db()
+        entry = AnalysisCacheEntry.objects.get(cache_key=cache_key)
+        assert job.status == ScrapingJobStatusChoices.COMPLETED.value
+        assert job.seo_report == seo_report.model_dump(mode="json")
+        assert job.report_schema_version == SEO_REPORT_SCHEMA_VERSION
+        assert entry.hits == 1
+
+    def test_store_evicts_least_recently_used_entries(self, settings):
+        """Test the cache keeps at most `ANALYSIS_CACHE_MAX_ENTRIES` entries"""
+
+        settings.ANALYSIS_CACHE_MAX_ENTRIES = 2
+        seo_report = SEOReportSchema.model_validate(build_seo_report())
+
+        async def run():
+            await AnalysisCacheEntry.objects.astore("first", seo_report)
+            await AnalysisCacheEntry.objects.astore("second", seo_report)
+            await AnalysisCacheEntry.objects.aget_fresh("first")
+            await AnalysisCacheEntry.objects.astore("third", seo_report)
+
+        async_to_sync(run)()
+
+        assert set(AnalysisCacheEntry.objects.values_list("cache_key", flat=True)) == {
+            "first",
+            "third",
+        }
+
+
+@pytest.mark.django_db
+class TestAnalysisWorker:
+    """Test the asyncio analysis worker"""
+
+    @pytest.fixture(autouse=True)
+    def group_messages(self, monkeypatch):
+        messages = []
+
+        class ChannelLayer:
+            async def group_send(self, group, message):
+                messages.append((group, message))
+
+        monkeypatch.setattr("scraping_jobs.events.channel_layer", ChannelLayer())
+
+        return messages
+
+    @pytest.fixture
+    def stub_model(self, monkeypatch):
+        class StubModel:
+            in_flight = max_in_flight = 0
+            errors = []
+            prompts = []
+            tiers = []
+            latencies = []
+
+            def __init__(self, schema, tier):
+                self.schema = schema
+                self.tier = tier
+
+            async def ainvoke(self, messages):
+                StubModel.tiers.append(self.tier)
+                if StubModel.errors:
+                    raise StubModel.errors.pop()
+
+                StubModel.prompts.append(messages[-1].content)
+
+                StubModel.in_flight += 1
+                StubModel.max_in_flight = max(StubModel.max_in_flight, StubModel.in_flight)
+                await asyncio.sleep(StubModel.latencies.pop(0) if StubModel.latencies else 0.05)
+                StubModel.in_flight -= 1
+
+                return self.schema.model_validate(build_seo_report())
+
+            async def astream(self, messages):
+                # The report parsed so far, one more top-level key per chunk
+                report = (await self.ainvoke(messages)).model_dump(mode="json")
+                for index in range(1, len(report) + 1):
+                    yield dict(list(report.items())[:index])
+
+        monkeypatch.setattr("scraping_jobs.analysis.get_analysis_model", StubModel)
+        monkeypatch.setattr(
+            "scraping_jobs.analysis.get_streaming_analysis_model",
+            lambda tier: StubModel(SEOReportSchema, tier),
+        )
+
+        return StubModel
+
+    def run_worker(self, worker, jobs):
+        for job in jobs:
+            enqueue_analysis(job.id)
+
+        async def run():
+            started = 0
+            while started < len(jobs):
+                started += await worker.consume_once()
+            await worker.drain()
+
+        async_to_sync(run)()
+
+    def test_async_mode_enqueues_analysis(self, settings, fake_redis):
+        """Test the async execution mode dispatches to the worker's stream, not Celery"""
+
+        settings.ANALYSIS_EXECUTION_MODE = "async"
+        job = ScrapingJobFactory(status=ScrapingJobStatusChoices.ANALYZING.value)
+
+        async_to_sync(adispatch_analysis)(job.id)
+
+        [(_, fields)] = fake_redis.xrange(settings.ANALYSIS_STREAM)
+        assert fields == {"job_id": str(job.id)}
+
+    def test_worker_runs_analyses_concurrently_up_to_its_limit(self, stub_model, fake_redis):
+        """Test the worker overlaps analyses, never more than its concurrency"""
+
+        jobs = ScrapingJobFactory.create_batch(
+            5, status=ScrapingJobStatusChoices.ANALYZING.value, use_analysis_cache=False
+        )
+        self.run_worker(AnalysisWorker(name="tests", concurrency=2), jobs)
+
+        assert stub_model.max_in_flight == 2
+        assert set(ScrapingJob.objects.values_list("status", flat=True)) == {
+            ScrapingJobStatusChoices.COMPLETED.value
+        }
+        assert (
+            fake_redis.xpending(settings.ANALYSIS_STREAM, ANALYSIS_CONSUMER_GROUP)["pending"] == 0
+        )
+
+    def test_worker_waits_for_jobs_while_analyses_run(self, stub_model):
+        """Test a worker with analyses in flight blocks on the stream rather than polling it"""
+
+        job = ScrapingJobFactory(
+            status=ScrapingJobStatusChoices.ANALYZING.value, use_analysis_cache=False
+        )
+        enqueue_analysis(job.id)
+        worker = AnalysisWorker(name="tests", concurrency=2)
+        blocks, read = [], worker._read
+        worker._read = lambda count, block: blocks.append(block) or read(count, block)
+
+        async def run():
+            started = await worker.consume_once(block=10)
+            await worker.consume_once(block=10)
+            await worker.drain()
+
+            return started
+
+        assert async_to_sync(run)() == 1
+        assert blocks == [10, 10]
+
+    def test_exhausted_quota_pauses_and_retries_the_call(self, stub_model, settings):
+        """Test a 429 from Gemini makes the call wait and retry instead of failing the job"""
+
+        settings.GEMINI_QUOTA_BACKOFF = 0.05
+        stub_model.errors.append(ResourceExhausted("Quota exceeded"))
+        job = ScrapingJobFactory(
+            status=ScrapingJobStatusChoices.ANALYZING.value, use_analysis_cache=False
+        )
+
+        self.run_worker(AnalysisWorker(name="tests"), [job])
+
+        job.refresh_from_db()
+        assert job.status == ScrapingJobStatusChoices.COMPLETED.value
+        assert gemini_calls_throttled.collect() == {
+            '["quota_exhausted"]': "1",
+            '["limiter"]': "1",
+        }
+
+    def test_oversized_scraping_data_is_analyzed_in_chunks(self, stub_model, settings):
+        """Test an oversized record is split across chunks analyzed in parallel, no source lost"""
+
+        settings.GEMINI_MAP_REDUCE_THRESHOLD = 500
+        settings.GEMINI_MAP_REDUCE_CHUNK_TOKENS = 300
+        urls = [f"https://site{index}.com/page" for index in range(40)]
+        job = ScrapingJobFactory(
+            status=ScrapingJobStatusChoices.ANALYZING.value,
+            use_analysis_cache=False,
+            results=[
+                {
+                    "prompt": "Example Corp",
+                    "answer_text": "word " * 300,
+                    "sources": [{"url": url, "title": "Example page"} for url in urls],
+                }
+            ],
+        )
+
+        self.run_worker(AnalysisWorker(name="tests"), [job])
+
+        job.refresh_from_db()
+        assert job.status == ScrapingJobStatusChoices.COMPLETED.value
+        assert len(stub_model.prompts) > settings.GEMINI_MAP_REDUCE_CONCURRENCY
+        assert stub_model.max_in_flight == settings.GEMINI_MAP_REDUCE_CONCURRENCY
+        assert all(any(url in prompt for prompt in stub_model.prompts) for url in urls)
+        assert all("one part of a larger set" in prompt for prompt in stub_model.prompts)
+        # The chunk prompts in any order, the calls start concurrently
+        assert len(job.analysis_prompt) == len("\n\n".join(stub_model.prompts))
+        assert all(prompt in job.analysis_prompt for prompt in stub_model.prompts)
+
+    def test_sections_mode_generates_sections_concurrently(self, stub_model, settings):
+        """Test each section is generated at once then the summary, an invalid one alone again"""
+
+        settings.GEMINI_ANALYSIS_MODE = "sections"
+        stub_model.errors.append(OutputParserException("Invalid overview"))
+        job = ScrapingJobFactory(
+            status=ScrapingJobStatusChoices.ANALYZING.value, use_analysis_cache=False
+        )
+
+        self.run_worker(AnalysisWorker(name="tests"), [job])
+
+        job.refresh_from_db()
+        assert job.status == ScrapingJobStatusChoices.COMPLETED.value
+        assert job.seo_report == SEOReportSchema.model_validate(build_seo_report()).model_dump(
+            mode="json"
+        )
+        assert stub_model.max_in_flight == 6
+        assert len(stub_model.prompts) == 7
+        assert "summary section" in stub_model.prompts[-1]
+        # Whichever section's call started first got the invalid output
+        assert list(gemini_report_section_failures.collect().values()) == ["1"]
+        assert gemini_report_generations.collect() == {'["sections", "completed"]': "1"}
+
+    def test_invalid_report_sections_are_repaired(self, stub_model):
+        """Test an invalid report is fixed in place or by generating only its invalid sections"""
+
+        report = build_seo_report()
+        report["keywords"]["keyword_themes"] = [
+            {"theme": f"Theme {index}", "keywords": [], "evidence": []} for index in range(9)
+        ]
+        report["competitors"] = [
+            {
+                "domain": "rival.com",
+                "strength_score": 12,
+                "overlap_keywords": [],
+                "unique_advantages": [],
+                "relationship": "rival",
+                "evidence": [],
+            }
+        ]
+        stub_model.errors.append(
+            OutputParserException("Invalid report", llm_output=json.dumps(report))
+        )
+        job = ScrapingJobFactory(
+            status=ScrapingJobStatusChoices.ANALYZING.value, use_analysis_cache=False
+        )
+
+        self.run_worker(AnalysisWorker(name="tests"), [job])
+
+        job.refresh_from_db()
+        [repair_prompt] = stub_model.prompts
+        assert job.status == ScrapingJobStatusChoices.COMPLETED.value
+        assert len(job.seo_report["keywords"]["keyword_themes"]) == 8
+        assert job.seo_report["competitors"] == []
+        assert "failed validation in these sections: competitors" in repair_prompt
+        assert "- competitors.0.relationship: Input should be" in repair_prompt
+        assert "strength_score" not in repair_prompt.split("INVALID SECTIONS")[0]
+        assert gemini_report_repairs.collect() == {'["regenerated"]': "1"}
+
+    def test_failed_call_falls_back_to_the_next_model_tier(self, stub_model, settings):
+        """Test a small payload is routed to flash, then to pro when flash answers a 5xx"""
+
+        settings.GEMINI_MODEL_ROUTING = True
+        stub_model.errors.append(ServiceUnavailable("Overloaded"))
+        job = ScrapingJobFactory(
+            status=ScrapingJobStatusChoices.ANALYZING.value, use_analysis_cache=False
+        )
+
+        self.run_worker(AnalysisWorker(name="tests"), [job])
+
+        job.refresh_from_db()
+        assert job.status == ScrapingJobStatusChoices.COMPLETED.value
+        assert stub_model.tiers == ["flash", "pro"]
+        assert gemini_model_tier_calls.collect() == {
+            '["flash", "server_error"]': "1",
+            '["pro", "success"]': "1",
+        }
+
+    def test_report_sections_are_published_while_generated(
+        self, stub_model, group_messages, settings
+    ):
+        """Test a streamed report's sections are sent before the job completes, coalesced"""
+
+        settings.REPORT_SECTION_EVENT_INTERVAL = 60
+        job = ScrapingJobFactory(
+            status=ScrapingJobStatusChoices.ANALYZING.value, use_analysis_cache=False
+        )
+
+        self.run_worker(AnalysisWorker(name="tests"), [job])
+
+        types = [message["type"] for _, message in group_messages]
+        assert types == [
+            "job_status_update",
+            "job_report_section",
+            "job_report_section",
+            "job_status_update",
+        ]
+        first, last = (message["data"] for _, message in group_messages[1:3])
+        report = SEOReportSchema.model_validate(build_seo_report()).model_dump(mode="json")
+        # The first complete section goes out at once, the others are held for the interval
+        assert first["sections"] == {"meta": report["meta"]}
+        assert {**first["sections"], **last["sections"]} == report
+        assert first["job_id"] == str(job.id)
+        assert first["schema_version"] == SEO_REPORT_SCHEMA_VERSION
+        assert group_messages[-1][1]["data"]["status"] == ScrapingJobStatusChoices.COMPLETED.value
+        assert {group for group, _ in group_messages} == {f"user_{job.user_id}_jobs_status"}
+
+    def test_slow_call_is_hedged(self, stub_model, settings):
+        """Test a call still running after the hedge delay loses to a second call"""
+
+        settings.GEMINI_HEDGING = True
+        settings.GEMINI_HEDGE_DEFAULT_DELAY = 0.1
+        reset_hedge_delays()
+        stub_model.latencies.append(30)
+        job = ScrapingJobFactory(
+            status=ScrapingJobStatusChoices.ANALYZING.value, use_analysis_cache=False
+        )
+
+        started_at = time.perf_counter()
+        self.run_worker(AnalysisWorker(name="tests"), [job])
+
+        job.refresh_from_db()
+        assert job.status == ScrapingJobStatusChoices.COMPLETED.value
+        assert time.perf_counter() - started_at < 5
+        assert stub_model.tiers == ["pro", "pro"]
+        assert gemini_hedged_calls.collect() == {'["pro", "hedge"]': "1"}
+        assert gemini_model_tier_calls.collect() == {
+            '["pro", "cancelled"]': "1",
+            '["pro", "success"]': "1",
+        }
+
+    def test_winning_hedge_replaces_the_streamed_sections(
+        self, stub_model, group_messages, settings, monkeypatch
+    ):
+        """Test the sections streamed by a slow call are replaced by those of its hedge"""
+
+        settings.GEMINI_HEDGING = True
+        settings.GEMINI_HEDGE_DEFAULT_DELAY = 0.1
+        settings.REPORT_SECTION_EVENT_INTERVAL = 0
+        reset_hedge_delays()
+        report = SEOReportSchema.model_validate(build_seo_report()).model_dump(mode="json")
+        slow_meta = {**report["meta"], "entity_name": "Slow Corp"}
+
+        class SlowStreamingModel:
+            async def astream(self, messages):
+                # The meta section is complete once the next one starts
+                yield {"meta": slow_meta, "inventory": {}}
+                await asyncio.sleep(30)
+
+        monkeypatch.setattr(
+            "scraping_jobs.analysis.get_streaming_analysis_model",
+            lambda tier: SlowStreamingModel(),
+        )
+        job = ScrapingJobFactory(
+            status=ScrapingJobStatusChoices.ANALYZING.value, use_analysis_cache=False
+        )
+
+        self.run_worker(AnalysisWorker(name="tests"), [job])
+
+        section_events = [
+            message["data"]["sections"]
+            for _, message in group_messages
+            if message["type"] == "job_report_section"
+        ]
+        sections = {}
+        for event_sections in section_events:
+            sections.update(event_sections)
+        assert section_events[0] == {"meta": slow_meta}
+        assert sections == report
+        assert gemini_hedged_calls.collect() == {'["pro", "hedge"]': "1"}
+
+
+@pytest.mark.django_db
+class TestScrapingJobTransitions:
+    """Test status-guarded job transitions"""
+
+    def test_transition_is_compare_and_set(self):
+        """Test a transition only wins when the job is in one of the expected statuses"""
+
+        job = ScrapingJobFactory(status=ScrapingJobStatusChoices.RUNNING.value)
+        from_statuses = [ScrapingJobStatusChoices.RUNNING.value]
+
+        first = ScrapingJob.objects.transition(
+            job.id, from_statuses, ScrapingJobStatusChoices.ANALYZING.value, error=None
+        )
+        second = ScrapingJob.objects.transition(
+            job.id, from_statuses, ScrapingJobStatusChoices.ANALYZING.value, error="late"
+        )
+
+        job.refresh_from_db()
+        assert (first, second) == (True, False)
+        assert job.status == ScrapingJobStatusChoices.ANALYZING.value
+        assert job.error is None
+
+    def test_concurrent_retries_dispatch_analysis_once(self, authenticated_client, monkeypatch):
+        """Test only the first retry of a failed job dispatches the analysis"""
+
+        client, user = authenticated_client
+        dispatched = []
+        monkeypatch.setattr(analyze_scraped_data, "delay", dispatched.append)
+        job = ScrapingJobFactory(
+            user=user,
+            status=ScrapingJobStatusChoices.FAILED.value,
+            analysis_prompt="analysis prompt",
+        )
+        url = reverse("scraping-job-retry", kwargs={"pk": job.id})
+
+        first = client.post(url)
+        second = client.post(url)
+
+        assert first.status_code == status.HTTP_200_OK
+        assert first.data["status"] == ScrapingJobStatusChoices.ANALYZING.value
+        assert second.status_code == status.HTTP_409_CONFLICT
+        assert dispatched == [str(job.id)]
+
+    def test_duplicate_webhook_is_acknowledged_without_dispatch(self, api_client, monkeypatch):
+        """Test a second BrightData delivery for the same job is ignored"""
+
+        dispatched = []
+        monkeypatch.setattr(analyze_scraped_data, "delay", dispatched.append)
+        job = ScrapingJobFactory(status=ScrapingJobStatusChoices.RUNNING.value, results=None)
+        url = f"{reverse('brightdata-webhook')}?job-id={job.id}"
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {settings.BRIGHTDATA_WEBHOOK_SECRET}"}
+
+        responses = [
+            api_client.post(url, [{"answer_text": "answer"}], format="json", **headers)
+            for _ in range(2)
+        ]
+        consume_webhooks()
+
+        job.refresh_from_db()
+        assert [response.status_code for response in responses] == [202, 202]
+        assert job.status == ScrapingJobStatusChoices.ANALYZING.value
+        assert job.results_blob_key
+        assert dispatched == [str(job.id)]
+
+
+@pytest.mark.django_db
+class TestScrapingJobTimelineAPI:
+    """Test Scraping Job Timeline Endpoint"""
+
+    def test_timeline_lists_events_and_phases(self, authenticated_client):
+        """Test the timeline returns the job's events with the phases they delimit"""
+
+        client, user = authenticated_client
+        job = ScrapingJobFactory(user=user, status=ScrapingJobStatusChoices.COMPLETED.value)
+        started_at = timezone.now() - timedelta(minutes=5)
+        timeline = [
+            (ScrapingJobEventChoices.PENDING, 0),
+            (ScrapingJobEventChoices.RUNNING, 2),
+            (ScrapingJobEventChoices.WEBHOOK_RECEIVED, 62),
+            (ScrapingJobEventChoices.ANALYZING, 63),
+            (ScrapingJobEventChoices.ANALYSIS_ENQUEUED, 63),
+            (ScrapingJobEventChoices.ANALYSIS_STARTED, 65),
+            (ScrapingJobEventChoices.COMPLETED, 95),
+        ]
+        for event, offset in timeline:
+            ScrapingJobEvent.objects.create(
+                job=job, event=event, occurred_at=started_at + timedelta(seconds=offset)
+            )
+
+        response = client.get(reverse("scraping-job-timeline", kwargs={"pk": job.id}))
+
+        phases = {phase["phase"]: phase["seconds"] for phase in response.data["phases"]}
+        assert response.status_code == status.HTTP_200_OK
+        assert [event["event"] for event in response.data["events"]] == [
+            event for event, _ in timeline
+        ]
+        assert phases == {
+            "trigger": 2,
+            "scraping": 60,
+            "webhook": 1,
+            "queue": 2,
+            "analysis": 30,
+            "total": 95,
+        }
+
+    def test_timeline_of_other_user_job_is_not_found(self, authenticated_client):
+        """Test the timeline is scoped to the authenticated user"""
+
+        client, _ = authenticated_client
+        job = ScrapingJobFactory()
+
+        response = client.get(reverse("scraping-job-timeline", kwargs={"pk": job.id}))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_terminal_transition_records_phase_durations(self, fake_redis):
+        """Test ending a run observes its phase durations"""
+
+        job = ScrapingJobFactory(status=ScrapingJobStatusChoices.ANALYZING.value)
+        ScrapingJobEvent.objects.record(job.id, ScrapingJobEventChoices.ANALYSIS_STARTED)
+
+        ScrapingJob.objects.transition(
+            job.id,
+            [ScrapingJobStatusChoices.ANALYZING.value],
+            ScrapingJobStatusChoices.FAILED.value,
+        )
+
+        samples = job_phase_duration_seconds.collect()
+        assert set(samples) == {'["analysis"]', '["total"]'}
+
+
+@pytest.mark.django_db
+class TestScrapingJobBulkCreateAPI:
+    """Test Scraping Jobs Bulk Creation Endpoint"""
+
+    def test_bulk_create_groups_jobs_into_multi_row_triggers(
+        self, authenticated_client, brightdata_stub, blob_store, settings, monkeypatch
+    ):
+        """Test uncached jobs share triggers of at most BRIGHTDATA_TRIGGER_MAX_INPUTS rows"""
+
+        client, user = authenticated_client
+        settings.BRIGHTDATA_TRIGGER_MAX_INPUTS = 2
+        dispatched = []
+        monkeypatch.setattr(analyze_scraped_data, "delay", dispatched.append)
+        ScrapeResultCacheEntry.objects.create(
+            cache_key=build_scrape_cache_key("Cached Corp", "US"),
+            results_blob_key=blob_store.put_json([{"answer_text": "cached"}]),
+        )
+        prompts = ["Cached Corp", "First Corp", "Second Corp", "Third Corp"]
+
+        response = client.post(
+            reverse("scraping-job-bulk"),
+            {"jobs": [{"prompt": prompt, "country_code": "us"} for prompt in prompts]},
+            format="json",
+        )
+
+        jobs = {job.original_prompt: job for job in ScrapingJob.objects.filter(user=user)}
+        triggers = [request for request in brightdata_stub.requests if request[0] == "POST"]
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [job["original_prompt"] for job in response.data] == prompts
+        assert len(triggers) == 2
+        assert dispatched == [str(jobs["Cached Corp"].id)]
+        assert jobs["Cached Corp"].status == ScrapingJobStatusChoices.ANALYZING.value
+        assert jobs["First Corp"].batch_id == jobs["Second Corp"].batch_id
+        assert jobs["Third Corp"].batch_id != jobs["First Corp"].batch_id
+        assert [jobs[prompt].batch_index for prompt in prompts[1:]] == [1, 2, 1]
+        assert {jobs[prompt].status for prompt in prompts[1:]} == {
+            ScrapingJobStatusChoices.RUNNING.value
+        }
+
+    def test_batch_transitions_record_events_only_for_moved_jobs(self):
+        """Test jobs of a batch a webhook already moved on get no RUNNING or FAILED event"""
+
+        batch_id = uuid.uuid4()
+        pending, analyzing, completed = [
+            ScrapingJobFactory(status=job_status, batch_id=batch_id, batch_index=index)
+            for index, job_status in enumerate(
+                (
+                    ScrapingJobStatusChoices.PENDING.value,
+                    ScrapingJobStatusChoices.ANALYZING.value,
+                    ScrapingJobStatusChoices.COMPLETED.value,
+                ),
+                start=1,
+            )
+        ]
+
+        async_to_sync(ScrapingJob.objects.aupdate_batch_with_snapshot_id)(batch_id, "snapshot")
+        async_to_sync(ScrapingJob.objects.afail_batch)(batch_id, "Trigger failed")
+
+        events = ScrapingJobEvent.objects.filter(job__batch_id=batch_id)
+        assert sorted(events.values_list("job_id", "event")) == sorted(
+            [
+                (pending.id, ScrapingJobStatusChoices.RUNNING.value),
+                (pending.id, ScrapingJobStatusChoices.FAILED.value),
+                (analyzing.id, ScrapingJobStatusChoices.FAILED.value),
+            ]
+        )
+        completed.refresh_from_db()
+        assert completed.status == ScrapingJobStatusChoices.COMPLETED.value
+
+    def test_bulk_rejects_empty_job_list(self, authenticated_client):
+        """Test a bulk creation needs at least one job"""
+
+        client, _ = authenticated_client
+
+        response = client.post(reverse("scraping-job-bulk"), {"jobs": []}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_batch_webhook_maps_records_to_jobs_by_index(self, api_client, monkeypatch):
+        """Test a batch webhook feeds every job the records of its input row"""
+
+        dispatched = []
+        monkeypatch.setattr(analyze_scraped_data, "delay", dispatched.append)
+        batch_id = uuid.uuid4()
+        first, second, missing = [
+            ScrapingJobFactory(
+                status=ScrapingJobStatusChoices.RUNNING.value,
+                results=None,
+                batch_id=batch_id,
+                batch_index=index,
+            )
+            for index in (1, 2, 3)
+        ]
+        records = [
+            {"answer_text": "second", "input": {"index": 2}},
+            {"answer_text": "first", "input": {"index": 1}},
+        ]
+
+        response = api_client.post(
+            f"{reverse('brightdata-webhook')}?batch-id={batch_id}",
+            records,
+            format="json",
+            HTTP_AUTHORIZATION=f"Bearer {settings.BRIGHTDATA_WEBHOOK_SECRET}",
+        )
+        consume_webhooks()
+
+        for job in (first, second, missing):
+            job.refresh_from_db()
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert first.load_results() == [records[1]]
+        assert second.load_results() == [records[0]]
+        assert missing.status == ScrapingJobStatusChoices.FAILED.value
+        assert sorted(dispatched) == sorted([str(first.id), str(second.id)])
+
+
+@pytest.mark.django_db
+class TestBrightDataWebhookAPI:
+    """Test BrightData Webhook Endpoint"""
+
+    def post_webhook(self, api_client, job, body, secret=None):
+        return api_client.post(
+            f"{reverse('brightdata-webhook')}?job-id={job.id}",
+            body,
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {secret or settings.BRIGHTDATA_WEBHOOK_SECRET}",
+        )
+
+    def test_unauthorized_delivery_body_is_not_parsed(self, api_client):
+        """Test authorization is checked before the body is decoded"""
+
+        job = ScrapingJobFactory(status=ScrapingJobStatusChoices.RUNNING.value, results=None)
+
+        response = self.post_webhook(api_client, job, "{not json", secret="wrong")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_oversized_delivery_is_rejected(self, api_client, settings):
+        """Test bodies larger than the maximum size are rejected and the job left waiting"""
+
+        settings.BRIGHTDATA_WEBHOOK_MAX_BODY_SIZE = 1024
+        job = ScrapingJobFactory(status=ScrapingJobStatusChoices.RUNNING.value, results=None)
+
+        response = self.post_webhook(api_client, job, [{"answer_text": "x" * 2048}])
+
+        job.refresh_from_db()
+        assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+        assert job.status == ScrapingJobStatusChoices.RUNNING.value
+
+    def test_malformed_content_length_is_rejected(self, api_client):
+        """Test a Content-Length header that is not a number is a bad request"""
+
+        job = ScrapingJobFactory(status=ScrapingJobStatusChoices.RUNNING.value, results=None)
+
+        response = api_client.post(
+            f"{reverse('brightdata-webhook')}?job-id={job.id}",
+            [{"answer_text": "answer"}],
+            content_type="application/json",
+            CONTENT_LENGTH="not-a-number",
+            HTTP_AUTHORIZATION=f"Bearer {settings.BRIGHTDATA_WEBHOOK_SECRET}",
+        )
+
+        job.refresh_from_db()
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert job.status == ScrapingJobStatusChoices.RUNNING.value
+
+    def test_invalid_json_is_rejected(self, api_client, settings):
+        """Test a malformed body is a bad request when ingested before replying"""
+
+        settings.BRIGHTDATA_WEBHOOK_QUEUE = False
+        job = ScrapingJobFactory(status=ScrapingJobStatusChoices.RUNNING.value, results=None)
+
+        response = self.post_webhook(api_client, job, '[{"answer_text": "answer"},')
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_queued_invalid_json_fails_job(self, api_client, blob_store):
+        """Test a malformed body acknowledged before ingestion fails its job"""
+
+        job = ScrapingJobFactory(status=ScrapingJobStatusChoices.RUNNING.value, results=None)
+
+        response = self.post_webhook(api_client, job, '[{"answer_text": "answer"},')
+        consume_webhooks()
+
+        job.refresh_from_db()
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert job.status == ScrapingJobStatusChoices.FAILED.value
+
+    def test_delivery_is_acknowledged_before_ingestion(self, api_client, monkeypatch, blob_store):
+        """Test the reply only spools the body, the consumer ingests it and drops it"""
+
+        dispatched = []
+        monkeypatch.setattr(analyze_scraped_data, "delay", dispatched.append)
+        job = ScrapingJobFactory(status=ScrapingJobStatusChoices.RUNNING.value, results=None)
+        body = '[ {"answer_text": "answer"} ]'
+
+        response = self.post_webhook(api_client, job, body)
+
+        job.refresh_from_db()
+        body_blob_key = blob_store.put(body.encode())
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert job.status == ScrapingJobStatusChoices.RUNNING.value
+
+        assert consume_webhooks() == 1
+
+        job.refresh_from_db()
+        assert job.status == ScrapingJobStatusChoices.ANALYZING.value
+        assert job.load_results() == [{"answer_text": "answer"}]
+        assert dispatched == [str(job.id)]
+        assert not blob_store.exists(body_blob_key)
+        assert consume_webhooks() == 0
+
+    def test_failed_delivery_is_retried(self, api_client, monkeypatch, settings):
+        """Test a delivery whose ingestion failed is claimed again, then ingested"""
+
+        settings.BRIGHTDATA_WEBHOOK_RECLAIM_AFTER = 0
+        monkeypatch.setattr(analyze_scraped_data, "delay", lambda job_id: None)
+        handle_job = BrightDataWebhookService.handle_job
+        outcomes = iter([OperationalError("Database unavailable"), None])
+
+        async def flaky_handle_job(*args):
+            if error := next(outcomes):
+                raise error
+
+            return await handle_job(*args)
+
+        monkeypatch.setattr(BrightDataWebhookService, "handle_job", flaky_handle_job)
+        job = ScrapingJobFactory(status=ScrapingJobStatusChoices.RUNNING.value, results=None)
+
+        self.post_webhook(api_client, job, [{"answer_text": "answer"}])
+        consume_webhooks()
+        consume_webhooks()
+
+        job.refresh_from_db()
+        assert job.status == ScrapingJobStatusChoices.ANALYZING.value
+
+    def test_redelivery_after_retry_is_ignored(self, api_client, monkeypatch, blob_store):
+        """Test a payload already ingested is not ingested again once the job waits again"""
+
+        dispatched = []
+        monkeypatch.setattr(analyze_scraped_data, "delay", dispatched.append)
+        job = ScrapingJobFactory(status=ScrapingJobStatusChoices.RUNNING.value, results=None)
+        body = [{"answer_text": "answer"}]
+
+        self.post_webhook(api_client, job, body)
+        consume_webhooks()
+        ScrapingJob.objects.filter(pk=job.pk).update(
+            status=ScrapingJobStatusChoices.RUNNING.value, results_blob_key=None
+        )
+        response = self.post_webhook(api_client, job, body)
+        consume_webhooks()
+
+        job.refresh_from_db()
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert job.status == ScrapingJobStatusChoices.RUNNING.value
+        assert dispatched == [str(job.id)]
+        assert WebhookDelivery.objects.filter(job=job).count() == 1
+        assert webhook_deliveries.collect() == {'["ingested"]': "1", '["duplicate"]': "1"}
+
+    def test_failed_ingestion_releases_delivery(self, api_client, monkeypatch, settings):
+        """Test a delivery whose ingestion failed after its claim is not taken for a duplicate"""
+
+        settings.BRIGHTDATA_WEBHOOK_RECLAIM_AFTER = 0
+        dispatched = []
+        monkeypatch.setattr(analyze_scraped_data, "delay", dispatched.append)
+        arecord = ScrapingJobEvent.objects.arecord
+        outcomes = iter([OperationalError("Database unavailable")])
+
+        async def flaky_arecord(*args):
+            if error := next(outcomes, None):
+                raise error
+
+            return await arecord(*args)
+
+        monkeypatch.setattr(ScrapingJobEvent.objects, "arecord", flaky_arecord)
+        job = ScrapingJobFactory(status=ScrapingJobStatusChoices.RUNNING.value, results=None)
+
+        self.post_webhook(api_client, job, [{"answer_text": "answer"}])
+        consume_webhooks()
+        consume_webhooks()
+
+        job.refresh_from_db()
+        assert job.status == ScrapingJobStatusChoices.ANALYZING.value
+        assert dispatched == [str(job.id)]
+
+    def test_streamed_records_are_stored_like_before(self, api_client, monkeypatch, blob_store):
+        """Test streamed records get the blob key of the whole payload and are cached"""
+
+        monkeypatch.setattr(analyze_scraped_data, "delay", lambda job_id: None)
+        job = ScrapingJobFactory(
+            status=ScrapingJobStatusChoices.RUNNING.value,
+            results=None,
+            scrape_cache_key=build_scrape_cache_key("Example Corp", "US"),
+        )
+        records = [
+            {"answer_text": f"answer {index}", "sources": ["s" * 1000]} for index in range(50)
+        ]
+
+        response = self.post_webhook(api_client, job, records)
+        consume_webhooks()
+
+        job.refresh_from_db()
+        assert response.status_code == status.HTTP_202_ACCEPTED
+        assert job.results_blob_key == blob_store.put_json(records)
+        assert job.load_results() == records
+        assert ScrapeResultCacheEntry.objects.filter(cache_key=job.scrape_cache_key).exists()
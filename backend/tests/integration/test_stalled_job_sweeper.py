@@ -0,0 +1,115 @@
+# Python Imports
+from datetime import timedelta
+
+# Django Imports
+from django.utils import timezone
+
+# Third-party Imports
+import pytest
+from asgiref.sync import async_to_sync
+
+# Project Imports
+from scraping_jobs.brightdata_stub import build_stub_records
+from scraping_jobs.constants import ScrapingJobStatusChoices
+from scraping_jobs.models import ScrapingJob
+from scraping_jobs.services import StalledJobSweeperService
+from scraping_jobs.tasks import analyze_scraped_data
+
+from ..factories import ScrapingJobFactory
+
+
+@pytest.fixture(autouse=True)
+def silence_channel_layer(monkeypatch):
+    class ChannelLayer:
+        async def group_send(self, group, message):
+            pass
+
+    monkeypatch.setattr("scraping_jobs.events.channel_layer", ChannelLayer())
+
+
+def create_stalled_job(**kwargs) -> ScrapingJob:
+    job = ScrapingJobFactory(results=None, **kwargs)
+    ScrapingJob.objects.filter(id=job.id).update(created_at=timezone.now() - timedelta(hours=1))
+
+    return job
+
+
+@pytest.mark.django_db
+class TestStalledJobSweeper:
+    """Test the stalled job sweeper against the BrightData stand-in"""
+
+    def test_ready_snapshot_is_pulled_into_analysis(self, brightdata_stub, monkeypatch):
+        """Test jobs sharing a ready snapshot are fed into analysis with one download"""
+
+        dispatched = []
+        monkeypatch.setattr(analyze_scraped_data, "delay", dispatched.append)
+        records = build_stub_records([{"url": "https://www.perplexity.ai", "prompt": "p"}])
+        snapshot_id = brightdata_stub.add_snapshot(records)
+        jobs = [
+            create_stalled_job(
+                status=ScrapingJobStatusChoices.RUNNING.value, snapshot_id=snapshot_id
+            )
+            for _ in range(2)
+        ]
+
+        outcomes = async_to_sync(StalledJobSweeperService.sweep)()
+
+        assert outcomes == {"ready": 2}
+        assert brightdata_stub.snapshots[snapshot_id].downloads == 1
+        assert sorted(dispatched) == sorted(str(job.id) for job in jobs)
+        for job in jobs:
+            job.refresh_from_db()
+            assert job.status == ScrapingJobStatusChoices.ANALYZING.value
+            assert job.load_results() == records
+
+    def test_unfinished_snapshots_and_untriggered_jobs(self, brightdata_stub):
+        """Test running snapshots are left alone while failed and untriggered jobs fail"""
+
+        running = create_stalled_job(
+            status=ScrapingJobStatusChoices.RUNNING.value,
+            snapshot_id=brightdata_stub.add_snapshot([], ready_after=60),
+        )
+        failed = create_stalled_job(
+            status=ScrapingJobStatusChoices.RUNNING.value,
+            snapshot_id=brightdata_stub.add_snapshot([], failed=True),
+        )
+        untriggered = create_stalled_job(
+            status=ScrapingJobStatusChoices.PENDING.value, snapshot_id=None
+        )
+        recent = ScrapingJobFactory(
+            status=ScrapingJobStatusChoices.RUNNING.value,
+            snapshot_id=brightdata_stub.add_snapshot([]),
+        )
+
+        outcomes = async_to_sync(StalledJobSweeperService.sweep)()
+
+        statuses = {
+            job.id: job.status
+            for job in ScrapingJob.objects.filter(
+                id__in=[running.id, failed.id, untriggered.id, recent.id]
+            )
+        }
+        assert outcomes == {"running": 1, "failed": 1, "never_triggered": 1}
+        assert statuses == {
+            running.id: ScrapingJobStatusChoices.RUNNING.value,
+            failed.id: ScrapingJobStatusChoices.FAILED.value,
+            untriggered.id: ScrapingJobStatusChoices.FAILED.value,
+            recent.id: ScrapingJobStatusChoices.RUNNING.value,
+        }
+
+    def test_deferred_jobs_are_triggered_again(self, brightdata_stub, settings, monkeypatch):
+        """Test the deferred policy re-triggers untriggered jobs instead of failing them"""
+
+        settings.BRIGHTDATA_UNAVAILABLE_POLICY = "defer"
+        # The sweep's loop is short-lived, it must not open a pooled client on it
+        monkeypatch.setattr(
+            "scraping_jobs.services.scraping_job_service.get_brightdata_http_client", None
+        )
+        job = create_stalled_job(status=ScrapingJobStatusChoices.PENDING.value, snapshot_id=None)
+
+        outcomes = async_to_sync(StalledJobSweeperService.sweep)()
+
+        job.refresh_from_db()
+        assert outcomes == {"retriggered": 1}
+        assert job.status == ScrapingJobStatusChoices.RUNNING.value
+        assert job.snapshot_id in brightdata_stub.snapshots
@@ -0,0 +1,72 @@
+# Third-party Imports
+import pytest
+
+# Project Imports
+from core.blob_store import BlobNotFoundError, LocalFileSystemBlobStore
+
+
+class TestLocalFileSystemBlobStore:
+    """Test Local Filesystem Blob Store"""
+
+    def test_put_and_read_round_trip(self, tmp_path):
+        """Test a stored payload is read back unchanged"""
+
+        store = LocalFileSystemBlobStore(location=tmp_path)
+        payload = [{"answer_text": "x" * 10_000, "sources": []}]
+
+        key = store.put_json(payload)
+
+        assert store.exists(key)
+        assert store.read_json(key) == payload
+
+    def test_identical_payloads_are_stored_once(self, tmp_path):
+        """Test blobs are content addressed"""
+
+        store = LocalFileSystemBlobStore(location=tmp_path)
+
+        first_key = store.put(b"same payload")
+        second_key = store.put(b"same payload")
+
+        assert first_key == second_key
+        assert len(list(tmp_path.rglob("*.zst"))) == 1
+
+    def test_payloads_are_compressed(self, tmp_path):
+        """Test blobs are stored compressed"""
+
+        store = LocalFileSystemBlobStore(location=tmp_path)
+
+        key = store.put(b"a" * 1_000_000)
+
+        [path] = tmp_path.rglob(f"{key}.zst")
+        assert path.stat().st_size < 10_000
+
+    def test_missing_blob(self, tmp_path):
+        """Test reading a missing blob"""
+
+        store = LocalFileSystemBlobStore(location=tmp_path)
+
+        with pytest.raises(BlobNotFoundError):
+            store.read("0" * 64)
+
+    def test_reading_closes_the_blob_file(self, tmp_path):
+        """Test closing a blob stream releases its file"""
+
+        store = LocalFileSystemBlobStore(location=tmp_path)
+        key = store.put(b"payload")
+
+        with store.open(key) as stream:
+            fileobj = stream._fp
+
+        assert fileobj.closed
+
+    def test_empty_blob_file(self, tmp_path):
+        """Test an empty blob file is reported as a missing blob"""
+
+        store = LocalFileSystemBlobStore(location=tmp_path)
+        key = "0" * 64
+        path = store._path(key)
+        path.parent.mkdir(parents=True)
+        path.touch()
+
+        with pytest.raises(BlobNotFoundError):
+            store.read(key)
@@ -0,0 +1,47 @@
+# Python Imports
+import asyncio
+
+# Project Imports
+from core.middlewares import LifespanMiddleware
+from scraping_jobs.brightdata import aclose_brightdata_http_clients, get_brightdata_http_client
+
+
+def test_pooled_client_is_shared_per_event_loop():
+    """Test the pooled client is reused within a loop and not across loops"""
+
+    async def get_twice():
+        first, second = get_brightdata_http_client(), get_brightdata_http_client()
+        await aclose_brightdata_http_clients()
+        return first, second
+
+    first, second = asyncio.run(get_twice())
+    other, _ = asyncio.run(get_twice())
+
+    assert first is second
+    assert other is not first
+    assert first.is_closed
+
+
+def test_lifespan_shutdown_closes_pooled_client():
+    """Test the ASGI lifespan shutdown runs the cleanup callbacks"""
+
+    async def run_lifespan():
+        client = get_brightdata_http_client()
+        messages = iter([{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+        sent = []
+
+        async def receive():
+            return next(messages)
+
+        async def send(message):
+            sent.append(message["type"])
+
+        app = LifespanMiddleware(None, on_shutdown=[aclose_brightdata_http_clients])
+        await app({"type": "lifespan"}, receive, send)
+
+        return client, sent
+
+    client, sent = asyncio.run(run_lifespan())
+
+    assert sent == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+    assert client.is_closed
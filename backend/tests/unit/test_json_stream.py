@@ -0,0 +1,52 @@
+# Python Imports
+import io
+import json
+
+# Third-party Imports
+import pytest
+
+# Project Imports
+from core.json_stream import PayloadTooLargeError, iter_json_items
+
+
+def decode(document: str, **kwargs) -> list:
+    return list(iter_json_items(io.BytesIO(document.encode()), **kwargs))
+
+
+class TestIterJsonItems:
+    """Test Incremental JSON Decoding"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64 * 1024])
+    def test_yields_array_items_whatever_the_chunk_size(self, chunk_size):
+        """Test items split across reads, including multi-byte characters, decode intact"""
+
+        items = [{"answer_text": "é" * 500, "index": index} for index in range(20)] + [
+            12345,
+            "text",
+            None,
+        ]
+
+        assert decode(json.dumps(items), chunk_size=chunk_size) == items
+
+    def test_non_array_document_is_a_single_item(self):
+        """Test a document that is not an array is yielded as its only item"""
+
+        assert decode(' {"answer_text": "answer"} ') == [{"answer_text": "answer"}]
+        assert decode("[ ]") == []
+
+    @pytest.mark.parametrize("document", ["", "[1,]", "[1 2]", "[1]x", '{"a": ', "[1, 2"])
+    def test_rejects_invalid_documents(self, document):
+        """Test malformed or empty documents raise a ValueError"""
+
+        with pytest.raises(ValueError):
+            decode(document, chunk_size=2)
+
+    def test_rejects_documents_over_the_maximum_size(self):
+        """Test reading stops as soon as the document grows past its maximum size"""
+
+        stream = io.BytesIO(json.dumps([{"answer_text": "x" * 1000}] * 100).encode())
+
+        with pytest.raises(PayloadTooLargeError):
+            list(iter_json_items(stream, max_size=4096, chunk_size=1024))
+
+        assert stream.tell() <= 5120
@@ -0,0 +1,27 @@
+# Project Imports
+from authentication.constants import UserPlanChoices
+from scraping_jobs.model_routing import route_model_tiers
+
+
+class TestRouteModelTiers:
+    """Test the routing of analyses to Gemini model tiers"""
+
+    def test_tiers_follow_payload_size_plan_and_queue_depth(self, settings):
+        """Test small payloads and free plans under load go to flash, with pro as fallback"""
+
+        settings.GEMINI_MODEL_ROUTING = True
+        settings.GEMINI_ROUTING_FLASH_MAX_TOKENS = 1_000
+        settings.GEMINI_ROUTING_BUSY_QUEUE_DEPTH = 10
+        free, pro = UserPlanChoices.FREE.value, UserPlanChoices.PRO.value
+
+        assert route_model_tiers(1_000, pro, 0) == ["flash", "pro"]
+        assert route_model_tiers(1_001, free, 9) == ["pro", "flash"]
+        assert route_model_tiers(1_001, free, 10) == ["flash", "pro"]
+        assert route_model_tiers(1_001, pro, 10) == ["pro", "flash"]
+
+    def test_routing_off_keeps_the_default_tier(self, settings):
+        """Test every analysis goes to the pro tier alone when routing is off"""
+
+        settings.GEMINI_MODEL_ROUTING = False
+
+        assert route_model_tiers(10, UserPlanChoices.FREE.value, 1_000) == ["pro"]
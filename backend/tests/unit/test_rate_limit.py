@@ -0,0 +1,65 @@
+# Python Imports
+import asyncio
+
+# Third-party Imports
+import pytest
+
+# Project Imports
+from core.rate_limit import RateLimitTimeoutError, TokenBucketRateLimiter
+
+
+class TestTokenBucketRateLimiter:
+    """Test Token Bucket Rate Limiter"""
+
+    def test_charges_every_bucket_or_none(self):
+        """Test a call lacking room in one bucket charges no bucket and gets a wait"""
+
+        limiter = TokenBucketRateLimiter("tests", {"requests": 60, "tokens": 600}, max_wait=1)
+
+        assert limiter.try_acquire(requests=1, tokens=590) == 0
+        wait = limiter.try_acquire(requests=1, tokens=20)
+
+        # 10 tokens short at 10 tokens per second
+        assert wait == pytest.approx(1, abs=0.05)
+        assert limiter.try_acquire(requests=58, tokens=10) == 0
+        assert limiter.try_acquire(requests=2) > 0
+
+    def test_limiters_share_buckets(self):
+        """Test limiters with the same name, e.g. in other processes, share the quotas"""
+
+        first = TokenBucketRateLimiter("tests", {"requests": 2}, max_wait=1)
+        second = TokenBucketRateLimiter("tests", {"requests": 2}, max_wait=1)
+
+        assert first.try_acquire(requests=1) == 0
+        assert second.try_acquire(requests=1) == 0
+        assert first.try_acquire(requests=1) > 0
+
+    def test_unlimited_bucket_is_ignored(self):
+        """Test a bucket with a quota of 0 never throttles"""
+
+        limiter = TokenBucketRateLimiter("tests", {"requests": 0}, max_wait=1)
+
+        assert all(limiter.try_acquire(requests=1000) == 0 for _ in range(3))
+
+    def test_acquire_waits_for_room(self):
+        """Test `acquire` waits for the bucket to refill and reports the wait"""
+
+        throttled = []
+        limiter = TokenBucketRateLimiter(
+            "tests", {"requests": 6000}, max_wait=1, on_throttle=throttled.append
+        )
+
+        assert asyncio.run(limiter.acquire(requests=6000)) == 0
+        waited = asyncio.run(limiter.acquire(requests=10))
+
+        assert waited >= 0.09
+        assert throttled == [waited]
+
+    def test_acquire_gives_up_after_max_wait(self):
+        """Test `acquire` raises when room comes later than the maximum wait"""
+
+        limiter = TokenBucketRateLimiter("tests", {"requests": 60}, max_wait=0.5)
+        limiter.penalize(30)
+
+        with pytest.raises(RateLimitTimeoutError):
+            asyncio.run(limiter.acquire(requests=1))
@@ -0,0 +1,109 @@
+# Project Imports
+from scraping_jobs.report_merge import merge_seo_reports
+from scraping_jobs.schemas import SEOReportSchema
+from tests.factories import build_seo_report
+
+
+def build_partial_report(**sections):
+    return SEOReportSchema.model_validate({**build_seo_report(), **sections})
+
+
+def build_recommendation(title, priority):
+    return {
+        "category": "content",
+        "priority": priority,
+        "title": title,
+        "description": title,
+        "expected_impact": "medium",
+        "effort_required": "low",
+        "evidence": [],
+        "implementation_steps": [title],
+    }
+
+
+class TestMergeSEOReports:
+    """Test the merge of the partial reports of a map-reduce analysis"""
+
+    def test_items_and_evidence_are_deduplicated(self):
+        """Test the same competitor and evidence found by several chunks is merged once"""
+
+        evidence = {"url": "https://www.rival.com/", "quote": "Rival", "relevance_score": 0.4}
+        first = build_partial_report(
+            competitors=[
+                {
+                    "name": None,
+                    "domain": "rival.com",
+                    "strength_score": 4,
+                    "overlap_keywords": ["SEO"],
+                    "unique_advantages": [],
+                    "relationship": "unknown",
+                    "evidence": [evidence],
+                }
+            ],
+            content_analysis={"content_themes": [], "sentiment": {"overall": "positive"}},
+        )
+        second = build_partial_report(
+            competitors=[
+                {
+                    "name": "Rival",
+                    "domain": "www.Rival.com",
+                    "strength_score": 7,
+                    "overlap_keywords": ["seo", "Ads"],
+                    "unique_advantages": ["Price"],
+                    "relationship": "competitor",
+                    "evidence": [
+                        {**evidence, "url": "https://rival.com", "relevance_score": 0.9},
+                        {**evidence, "quote": "Other"},
+                    ],
+                }
+            ],
+            content_analysis={"content_themes": [], "sentiment": {"overall": "negative"}},
+        )
+
+        report = merge_seo_reports([first, second])
+
+        [competitor] = report.competitors
+        assert competitor.name == "Rival"
+        assert competitor.strength_score == 7
+        assert competitor.overlap_keywords == ["SEO", "Ads"]
+        assert competitor.relationship == "competitor"
+        assert [(item.quote, item.relevance_score) for item in competitor.evidence] == [
+            ("Rival", 0.9),
+            ("Other", 0.4),
+        ]
+        assert report.content_analysis.sentiment.overall == "mixed"
+        assert report.meta.data_sources_count == 2
+        assert report.inventory.unique_domains == ["example.com"]
+
+    def test_lists_are_ranked_and_limited(self):
+        """Test merged lists keep the schema limits, best ranked items first"""
+
+        reports = [
+            build_partial_report(
+                recommendations=[
+                    build_recommendation(f"Low {chunk}", "low"),
+                    build_recommendation(f"High {chunk}", "high"),
+                    build_recommendation("Shared", "medium"),
+                ],
+                keywords={
+                    "content_keywords": [
+                        {"keyword": f"keyword {chunk} {index}", "evidence": []}
+                        for index in range(10)
+                    ],
+                    "keyword_themes": [],
+                },
+            )
+            for chunk in range(10)
+        ]
+
+        report = merge_seo_reports(reports)
+
+        assert len(report.recommendations) == 21
+        assert [item.title for item in report.recommendations[:11]] == [
+            *(f"High {chunk}" for chunk in range(10)),
+            "Shared",
+        ]
+        assert report.recommendations[10].implementation_steps == ["Shared"]
+        assert len(report.keywords.content_keywords) == 25
+        assert report.keywords.content_keywords[0].keyword == "keyword 0 0"
+        assert merge_seo_reports(reports) == report
@@ -0,0 +1,49 @@
+# Project Imports
+from scraping_jobs.report_repair import failing_sections, repair_mechanically
+from tests.factories import build_seo_report
+
+
+def build_competitor(**fields):
+    return {
+        "domain": "rival.com",
+        "strength_score": 5,
+        "overlap_keywords": [],
+        "unique_advantages": [],
+        "relationship": "competitor",
+        "evidence": [],
+        **fields,
+    }
+
+
+class TestRepairReport:
+    """Test the repair of reports failing `SEOReportSchema`"""
+
+    def test_overflows_and_out_of_range_numbers_are_fixed_in_place(self):
+        """Test lists are cut to their limit and numbers clamped, including revealed errors"""
+
+        report = build_seo_report()
+        report["meta"]["confidence_score"] = 1.5
+        report["competitors"] = [build_competitor(strength_score=12)] * 16
+
+        assert repair_mechanically(report) == []
+        assert report["meta"]["confidence_score"] == 1
+        assert len(report["competitors"]) == 15
+        assert {competitor["strength_score"] for competitor in report["competitors"]} == {10}
+
+    def test_errors_left_are_grouped_by_section(self):
+        """Test errors needing a model are mapped to the sections generating them"""
+
+        report = build_seo_report()
+        del report["inventory"]
+        report["competitors"] = [build_competitor(relationship="rival")]
+
+        errors = repair_mechanically(report)
+
+        assert {
+            section: [error["loc"] for error in errors]
+            for section, errors in failing_sections(errors).items()
+        } == {
+            "overview": [("inventory",)],
+            "competitors": [("competitors", 0, "relationship")],
+        }
+        assert failing_sections([{"loc": (), "msg": "Input should be an object"}]) is None
@@ -0,0 +1,110 @@
+# Python Imports
+import asyncio
+
+# Third-party Imports
+import pytest
+
+# Project Imports
+from core.resilience import AIMDLimiter, CircuitBreaker, CircuitOpenError, ConcurrencyLimitError
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Test Circuit Breaker"""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test the circuit opens at the failure threshold and rejects calls"""
+
+        states = []
+        breaker = CircuitBreaker(
+            failure_threshold=2, recovery_timeout=30, on_state_change=states.append
+        )
+
+        breaker.record_failure()
+        breaker.before_call()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.OPEN
+        assert states == [CircuitBreaker.OPEN]
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_success_resets_failure_count(self):
+        """Test only consecutive failures open the circuit"""
+
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=30)
+
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_probe_closes_or_reopens(self):
+        """Test one probe goes through after the cooldown and decides the next state"""
+
+        clock = Clock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=30, clock=clock)
+        breaker.record_failure()
+
+        clock.now = 30
+        breaker.before_call()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+        clock.now = 60
+        breaker.before_call()
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+
+class TestAIMDLimiter:
+    """Test AIMD Concurrency Limiter"""
+
+    def test_limit_grows_additively_and_shrinks_multiplicatively(self):
+        """Test fast successes raise the limit and failures halve it"""
+
+        limiter = AIMDLimiter(initial_limit=4, min_limit=1, max_limit=10, latency_target=1)
+
+        async def call(success):
+            async with limiter.slot(timeout=0) as record:
+                record(success)
+
+        async def run():
+            for _ in range(5):
+                await call(True)
+            grown = limiter.limit
+
+            await call(False)
+            return grown, limiter.limit
+
+        grown, shrunk = asyncio.run(run())
+
+        assert grown == 5
+        assert shrunk == 2
+
+    def test_rejects_when_no_slot_frees_up(self):
+        """Test a call waiting longer than the timeout for a slot is rejected"""
+
+        limiter = AIMDLimiter(initial_limit=1, min_limit=1, max_limit=1, latency_target=1)
+
+        async def run():
+            async with limiter.slot(timeout=0):
+                with pytest.raises(ConcurrencyLimitError):
+                    async with limiter.slot(timeout=0.05):
+                        pass
+
+        asyncio.run(run())
+
+        assert limiter.in_flight == 0
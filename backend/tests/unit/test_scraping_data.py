@@ -0,0 +1,80 @@
+# Python Imports
+import json
+
+# Project Imports
+from scraping_jobs.prompts.scraping_data import compact_scraping_data
+from scraping_jobs.utils import canonicalize_url
+
+
+def build_record(answer_text, sources, prompt="Example Corp"):
+    return {
+        "url": "https://www.perplexity.ai",
+        "prompt": prompt,
+        "answer_text": answer_text,
+        "sources": sources,
+        "citations": [source["url"] for source in sources],
+        "timestamp": "2025-01-01T00:00:00Z",
+        "input": {"url": "https://www.perplexity.ai", "prompt": prompt, "index": 1},
+    }
+
+
+class TestCompactScrapingData:
+    """Test the compact serialization of scraping data for the Gemini prompt"""
+
+    def test_sources_are_deduplicated_by_canonical_url(self):
+        """Test the same page cited under several URLs is one source ranked by citations"""
+
+        records = [
+            build_record("first", [{"title": "Blog", "url": "https://blog.example.com/a"}]),
+            build_record(
+                "second",
+                [
+                    {"title": "Home", "url": "https://www.example.com/?utm_source=x"},
+                    {"title": "Blog", "url": "http://blog.example.com/a/#top"},
+                ],
+            ),
+            {"error": "Timeout", "error_code": "timeout"},
+        ]
+
+        compact = compact_scraping_data(records, token_budget=10_000)
+        document = json.loads(compact.text)
+
+        assert document["prompt"] == "Example Corp"
+        assert document["answers"] == [
+            {"answer": "first", "source_ids": [1]},
+            {"answer": "second", "source_ids": [2, 1]},
+        ]
+        assert document["sources"] == [
+            {"id": 1, "url": "https://blog.example.com/a", "title": "Blog"},
+            {"id": 2, "url": "https://www.example.com/?utm_source=x", "title": "Home"},
+        ]
+        assert compact.tokens_saved > compact.tokens
+
+    def test_budget_keeps_answers_then_sources_then_descriptions(self):
+        """Test trimming follows the priority order and stays within the budget"""
+
+        source = {"title": "Home", "url": "https://example.com", "description": "d" * 400}
+        records = [build_record("a" * 400, [source]), build_record("b" * 400, [])]
+
+        compact = compact_scraping_data(records, token_budget=250)
+        document = json.loads(compact.text)
+
+        assert compact.tokens <= 250
+        assert [answer["answer"][0] for answer in document["answers"]] == ["a", "b"]
+        assert document["sources"] == [{"id": 1, "url": "https://example.com", "title": "Home"}]
+
+        compact = compact_scraping_data(records, token_budget=150)
+        document = json.loads(compact.text)
+
+        assert compact.tokens <= 150
+        assert document["answers"][0]["answer"] == "a" * 400
+        assert document["answers"][1]["answer"].startswith("b")
+        assert document["sources"] == []
+        assert document["answers"][0]["source_ids"] == []
+
+    def test_canonical_url(self):
+        """Test scheme, www, trailing slash, fragment and tracking parameters are ignored"""
+
+        assert canonicalize_url("http://WWW.Example.com/a/?b=1&utm_medium=x&fbclid=y#c") == (
+            canonicalize_url("https://example.com/a?b=1")
+        )
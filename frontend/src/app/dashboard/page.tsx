@@ -28,7 +28,7 @@ const DashboardPage = () => {
     mutationKey: scrapingJobKeys.create(),
     mutationFn: createScrapingJob,
     onSuccess: (data) => {
-      router.push(`/dashboard/report/${data.snapshot_id}`);
+      router.push(`/dashboard/report/${data.id}`);
     },
     retry: 3,
   });
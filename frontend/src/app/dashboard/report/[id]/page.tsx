@@ -1,5 +1,6 @@
 "use client";
 
+import { useState } from "react";
 import { useQuery, useMutation } from "@tanstack/react-query";
 import { useRouter, useParams } from "next/navigation";
 import Link from "next/link";
@@ -24,7 +25,7 @@ import {
 import { Button } from "@/components/ui/button";
 import { StatusBadge } from "@/components/status-badge";
 import {
-  getScrapingJobBySnapshotID,
+  getScrapingJobByID,
   retryJob,
 } from "@/lib/api/scrapingJob/fetchers";
 import { scrapingJobKeys } from "@/lib/query-keys";
@@ -43,29 +44,43 @@ import type { ScrapingJobStatusUpdateEventPayload } from "@/lib/websocket/scrapi
 const ReportPage = () => {
   const router = useRouter();
 
-  const snapshotId = useParams<{ id: string }>().id;
+  const jobId = useParams<{ id: string }>().id;
 
   const mutation = useMutation({
-    mutationKey: scrapingJobKeys.retry(snapshotId),
+    mutationKey: scrapingJobKeys.retry(jobId),
     mutationFn: retryJob,
     onSuccess: (data, variables, onMutateResult, cx) => {
-      if (data.snapshot_id !== snapshotId)
-        router.replace(`/dashboard/report/${data.snapshot_id}`);
+      if (data.id !== jobId) router.replace(`/dashboard/report/${data.id}`);
     },
   });
 
   const { data, isPending, error, refetch } = useQuery({
-    queryKey: scrapingJobKeys.bySnapshot(snapshotId),
-    queryFn: () => getScrapingJobBySnapshotID({ snapshot_id: snapshotId }),
+    queryKey: scrapingJobKeys.detail(jobId),
+    queryFn: () => getScrapingJobByID({ jobId }),
   });
 
+  // Report sections generated so far, a preview until the job completes
+  const [readySections, setReadySections] = useState<string[]>([]);
+
   useScrapingJobsStatus(
     async (event_data: ScrapingJobStatusUpdateEventPayload) => {
-      if (
-        event_data.type === "job_status_update" &&
-        (event_data.data?.job_id === event_data.data?.job_id) === data.id
-      )
+      if (event_data.type === "job_report_section") {
+        if (event_data.data.job_id !== jobId) return;
+
+        const keys = Object.keys(event_data.data.sections);
+        setReadySections((ready) => [
+          ...ready,
+          ...keys.filter((key) => !ready.includes(key)),
+        ]);
+      } else if (
+        (event_data.type === "job_status_update" &&
+          event_data.data.job_id === jobId) ||
+        (event_data.type === "jobs_snapshot" &&
+          (!event_data.data.complete ||
+            event_data.data.jobs.some((job) => job.job_id === jobId)))
+      ) {
         await refetch();
+      }
     }
   );
 
@@ -148,6 +163,13 @@ const ReportPage = () => {
                     )}`}
                   />
                 </div>
+
+                {data.status === "ANALYZING" && readySections.length > 0 && (
+                  <p className="text-sm text-muted-foreground">
+                    {readySections.length} report section
+                    {readySections.length > 1 ? "s" : ""} ready
+                  </p>
+                )}
               </div>
 
               {/** Job Details */}
@@ -216,30 +238,28 @@ const ReportPage = () => {
               </div>
 
               {/** Results Preview */}
-              {data.status === "COMPLETED" &&
-                data.results &&
-                data.results.length > 0 && (
-                  <div className="pt-4 border-t">
-                    <div className="flex items-center gap-2 mb-3">
-                      <BarChart3 className="w-4 h-4 text-green-600" />
-                      <p className="text-sm font-medium text-green-800 dark:text-green-200">
-                        Results Available
-                      </p>
-                    </div>
-                    <div className="p-3 bg-green-50 dark:bg-green-900/20 border border-green-200 dark:border-green-800 rounded-lg">
-                      <p className="text-sm text-green-700 dark:text-green-300">
-                        Your SEO report is ready for analysis.
-                      </p>
-                    </div>
+              {data.status === "COMPLETED" && data.has_results && (
+                <div className="pt-4 border-t">
+                  <div className="flex items-center gap-2 mb-3">
+                    <BarChart3 className="w-4 h-4 text-green-600" />
+                    <p className="text-sm font-medium text-green-800 dark:text-green-200">
+                      Results Available
+                    </p>
                   </div>
-                )}
+                  <div className="p-3 bg-green-50 dark:bg-green-900/20 border border-green-200 dark:border-green-800 rounded-lg">
+                    <p className="text-sm text-green-700 dark:text-green-300">
+                      Your SEO report is ready for analysis.
+                    </p>
+                  </div>
+                </div>
+              )}
             </CardContent>
           </Card>
 
           {/** Action Buttons */}
           <div className="flex flex-col sm:flex-row gap-4 justify-center items-center">
             {data.status === "COMPLETED" && (
-              <Link href={`/dashboard/report/${data.snapshot_id}/summary`}>
+              <Link href={`/dashboard/report/${data.id}/summary`}>
                 <Button
                   variant="default"
                   size="lg"
@@ -4,7 +4,7 @@ import { use } from "react";
 import { useQuery } from "@tanstack/react-query";
 import { AlertTriangle, Loader2 } from "lucide-react";
 
-import { getScrapingJobBySnapshotID } from "@/lib/api/scrapingJob/fetchers";
+import { getScrapingJobByID } from "@/lib/api/scrapingJob/fetchers";
 import { scrapingJobKeys } from "@/lib/query-keys";
 import {
   KeyMetricsGrid,
@@ -27,8 +27,8 @@ interface ReportSummaryPageProps {
 export default function ReportSummaryPage({ params }: ReportSummaryPageProps) {
   const { id } = use(params);
   const { data, isPending, error } = useQuery({
-    queryKey: scrapingJobKeys.bySnapshot(id),
-    queryFn: () => getScrapingJobBySnapshotID({ snapshot_id: id }),
+    queryKey: scrapingJobKeys.detail(id),
+    queryFn: () => getScrapingJobByID({ jobId: id }),
   });
 
   if (isPending) {
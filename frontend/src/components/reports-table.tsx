@@ -4,7 +4,11 @@ import { useState } from "react";
 import { useRouter } from "next/navigation";
 
 import { Loader2, FileText, Plus, Trash2, TrendingUp } from "lucide-react";
-import { useQuery, useQueryClient } from "@tanstack/react-query";
+import {
+  type InfiniteData,
+  useInfiniteQuery,
+  useQueryClient,
+} from "@tanstack/react-query";
 
 import {
   Table,
@@ -18,33 +22,63 @@ import { Button } from "./ui/button";
 import { StatusBadge } from "./status-badge";
 import { formateDate, getSpinnerColor } from "@/lib/status-utils";
 import { getScrapingJobs } from "@/lib/api/scrapingJob/fetchers";
+import type { GetScrapingJobsResponse } from "@/lib/api/scrapingJob/types";
 import { scrapingJobKeys } from "@/lib/query-keys";
 import { useScrapingJobsStatus } from "@/lib/websocket/hooks/use-scraping-jobs-status";
 import type { ScrapingJobStatusUpdateEventPayload } from "@/lib/websocket/scraping-job-status-websocket";
 
 export const ReportsTable = () => {
-  const { data, isPending, isSuccess, error, isError, status } = useQuery({
+  const {
+    data,
+    isPending,
+    error,
+    hasNextPage,
+    fetchNextPage,
+    isFetchingNextPage,
+  } = useInfiniteQuery({
     queryKey: scrapingJobKeys.list(),
-    queryFn: getScrapingJobs,
+    queryFn: ({ pageParam }) => getScrapingJobs({ cursor: pageParam }),
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => lastPage.nextCursor,
   });
+  const jobs = data?.pages.flatMap((page) => page.jobs) ?? [];
+  const completedJobs = jobs.filter((job) => job.status === "COMPLETED");
 
   const [deletingJobId, setDeletingJobId] = useState<string | null>(null);
 
   const queryClient = useQueryClient();
-  useScrapingJobsStatus(async (data: ScrapingJobStatusUpdateEventPayload) => {
-    if (data.type === "job_status_update")
-      queryClient.setQueryData(
-        scrapingJobKeys.list(),
-        (oldJobs: ScrapingJob[]) => {
-          if (!oldJobs) return oldJobs;
-
-          return oldJobs.map((job) =>
-            job.id === data?.data?.job_id
-              ? { ...job, status: data.data?.status }
-              : job
-          );
-        }
-      );
+  useScrapingJobsStatus(async (event: ScrapingJobStatusUpdateEventPayload) => {
+    // Sent on reconnect when the missed events are gone, an incomplete one does not list
+    // every job that changed meanwhile
+    if (event.type === "jobs_snapshot" && !event.data.complete) {
+      await queryClient.invalidateQueries({ queryKey: scrapingJobKeys.list() });
+      return;
+    }
+
+    let updates;
+    if (event.type === "job_status_update") updates = [event.data];
+    else if (event.type === "jobs_snapshot") updates = event.data.jobs;
+    else return;
+
+    const statuses = new Map(updates.map((job) => [job.job_id, job.status]));
+    queryClient.setQueryData(
+      scrapingJobKeys.list(),
+      (oldData: InfiniteData<GetScrapingJobsResponse> | undefined) => {
+        if (!oldData) return oldData;
+
+        return {
+          ...oldData,
+          pages: oldData.pages.map((page) => ({
+            ...page,
+            jobs: page.jobs.map((job) =>
+              statuses.has(job.id)
+                ? { ...job, status: statuses.get(job.id)! }
+                : job
+            ),
+          })),
+        };
+      }
+    );
   });
 
   const router = useRouter();
@@ -68,7 +102,7 @@ export const ReportsTable = () => {
     return;
   }
 
-  if (data?.length === 0) {
+  if (jobs.length === 0) {
     return (
       <div className="flex flex-col items-center justify-center p-12 text-center">
         <div className="p-4 bg-muted/50 rounded-full mb-6">
@@ -120,11 +154,11 @@ export const ReportsTable = () => {
             </TableRow>
           </TableHeader>
           <TableBody>
-            {data?.map((job) => (
+            {jobs.map((job) => (
               <TableRow
                 key={job.id}
                 className="cursor-pointer hover:muted/30 transition-colors border-b border-border/30 last:border-b-0"
-                onClick={() => handleRowClick(job.snapshot_id)}
+                onClick={() => handleRowClick(job.id)}
               >
                 <TableCell className="font-medium py-4">
                   <div className="flex items-center gap-3">
@@ -188,6 +222,20 @@ export const ReportsTable = () => {
         </Table>
       </div>
 
+      {hasNextPage && (
+        <div className="mt-4 flex justify-center">
+          <Button
+            variant="outline"
+            size="sm"
+            onClick={() => fetchNextPage()}
+            disabled={isFetchingNextPage}
+          >
+            {isFetchingNextPage && <Loader2 className="h-4 w-4 animate-spin" />}
+            Load more
+          </Button>
+        </div>
+      )}
+
       {/** Summary */}
       <div className="mt-6 flex items-center justify-between text-sm text-muted-foreground">
         <div className="flex items-center gap-4">
@@ -195,13 +243,15 @@ export const ReportsTable = () => {
             <TrendingUp className="w-4 h-4" />
             <span>
               {" "}
-              {data?.length} total report {data?.length !== 1 ? "s" : ""}
+              {jobs.length}
+              {hasNextPage ? "+" : ""} total report
+              {jobs.length !== 1 ? "s" : ""}
             </span>
           </div>
-          {data?.filter((job) => job.status === "COMPLETED").length > 0 && (
+          {completedJobs.length > 0 && (
             <div className="flex items-center gap-2">
               <div className="w-2 h-2 bg-green-500 rounded-full" />
-              <span> {data?.length} completed</span>
+              <span> {completedJobs.length} completed</span>
             </div>
           )}
         </div>
@@ -1,20 +1,24 @@
 import api from "@/lib/axios";
 import type {
+  DataTableScrpingJob,
+  GetScrapingJobsPayload,
   GetScrapingJobsResponse,
   CreateScrapingJobPayload,
   CreateScrapingJobResponse,
-  GetScrapingJobBySnapshotIDPayload,
-  GetScrapingJobBySnapshotIDResponse,
+  GetScrapingJobByIDPayload,
+  GetScrapingJobByIDResponse,
   RetryJobPayload,
   RetryJobResponse,
 } from "./types";
 
-export const getScrapingJobs = async (): Promise<GetScrapingJobsResponse> => {
-  const response = (await api.get(
-    "/scraping-jobs/"
-  )) as unknown as APIResponse<GetScrapingJobsResponse>;
+export const getScrapingJobs = async ({
+  cursor,
+}: GetScrapingJobsPayload = {}): Promise<GetScrapingJobsResponse> => {
+  const response = (await api.get("/scraping-jobs/", {
+    params: cursor ? { cursor } : undefined,
+  })) as unknown as PaginatedAPIResponse<DataTableScrpingJob[]>;
 
-  return response.data;
+  return { jobs: response.data, nextCursor: response.pagination.next };
 };
 
 export const createScrapingJob = async ({
@@ -31,12 +35,12 @@ export const createScrapingJob = async ({
   return response.data;
 };
 
-export const getScrapingJobBySnapshotID = async ({
-  snapshot_id,
-}: GetScrapingJobBySnapshotIDPayload): Promise<GetScrapingJobBySnapshotIDResponse> => {
+export const getScrapingJobByID = async ({
+  jobId,
+}: GetScrapingJobByIDPayload): Promise<GetScrapingJobByIDResponse> => {
   const response = (await api.get(
-    `/scraping-jobs/by-snapshot/${snapshot_id}/`
-  )) as unknown as APIResponse<GetScrapingJobBySnapshotIDResponse>;
+    `/scraping-jobs/${jobId}/`
+  )) as unknown as APIResponse<GetScrapingJobByIDResponse>;
 
   return response.data;
 };
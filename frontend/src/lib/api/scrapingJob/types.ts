@@ -1,9 +1,16 @@
 export type DataTableScrpingJob = Omit<
   ScrapingJob,
-  "results" | "seo_report" | "error"
+  "results" | "seo_report" | "error" | "analysis_prompt"
 >;
 
-export type GetScrapingJobsResponse = DataTableScrpingJob[];
+export type GetScrapingJobsPayload = {
+  cursor?: string | null;
+};
+
+export type GetScrapingJobsResponse = {
+  jobs: DataTableScrpingJob[];
+  nextCursor: string | null;
+};
 
 export type CreateScrapingJobPayload = {
   country_code: string;
@@ -13,11 +20,11 @@ export type CreateScrapingJobPayload = {
 
 export type CreateScrapingJobResponse = ScrapingJob;
 
-export type GetScrapingJobBySnapshotIDPayload = {
-  snapshot_id: string;
+export type GetScrapingJobByIDPayload = {
+  jobId: string;
 };
 
-export type GetScrapingJobBySnapshotIDResponse = ScrapingJob;
+export type GetScrapingJobByIDResponse = ScrapingJob;
 
 export type RetryJobPayload = {
   jobId: string;
@@ -23,6 +23,16 @@ interface APIResponse<T = any> {
   status_code: number;
 }
 
+interface CursorPagination {
+  next: string | null;
+  previous: string | null;
+  page_size: number;
+}
+
+interface PaginatedAPIResponse<T = any> extends APIResponse<T> {
+  pagination: CursorPagination;
+}
+
 interface ErrorAPIResponse extends Omit<APIResponse, "data"> {
   errors: Json;
 }
@@ -53,7 +63,8 @@ interface ScrapingJob {
   original_prompt?: string;
   analysis_prompt?: string;
   snapshot_id: string;
-  results?: Array;
+  country_code?: string;
+  has_results?: boolean;
   seo_report?: SeoReport;
   error?: string;
   completed_at?: string;
@@ -1,16 +1,37 @@
 import { getSession } from "next-auth/react";
 
+import type { SeoReport } from "@/lib/seo-schema";
+
 interface ScrapingJoStatusData {
   job_id: string;
   status: ScrapingJobStatus;
 }
 
-export interface ScrapingJobStatusUpdateEventPayload {
-  type: "job_status_update" | "connection";
-  data?: ScrapingJoStatusData;
-  message?: string;
+interface ScrapingJobReportSectionData {
+  job_id: string;
+  schema_version: number;
+  // A later value of a key replaces the earlier one
+  sections: Partial<SeoReport>;
+}
+
+interface ScrapingJobsSnapshotData {
+  jobs: ScrapingJoStatusData[];
+  // False when more jobs changed than listed, the jobs list must be fetched again
+  complete: boolean;
 }
 
+// `id` is the event's position in the user's event log, sent back as `last_event_id`
+// on reconnect to get the events missed meanwhile (or a `jobs_snapshot`)
+export type ScrapingJobStatusUpdateEventPayload =
+  | { type: "connection"; message?: string; id?: undefined; data?: undefined }
+  | { type: "job_status_update"; id?: string | null; data: ScrapingJoStatusData }
+  | {
+      type: "job_report_section";
+      id?: string | null;
+      data: ScrapingJobReportSectionData;
+    }
+  | { type: "jobs_snapshot"; id?: string | null; data: ScrapingJobsSnapshotData };
+
 export interface ScrapingJobStatusWSCallback {
   (data: ScrapingJobStatusUpdateEventPayload): void | Promise<void>;
 }
@@ -21,12 +42,15 @@ export class ScrapingJobStatusWebSocket {
   private maxReconnectAttempts: number = 5;
   private reconnectDelay: number = 2000;
   private callbacks: ScrapingJobStatusWSCallback[] = [];
+  private lastEventId: string | null = null;
 
   public connect = async (): Promise<void> =>
     new Promise(async (resolve, reject) => {
       const session = await getSession();
 
-      const webSocketUrl = `${process.env.NEXT_PUBLIC_BASE_WEBSOCKET_URL}/scraping-jobs/status/?token=${session?.access}`;
+      let webSocketUrl = `${process.env.NEXT_PUBLIC_BASE_WEBSOCKET_URL}/scraping-jobs/status/?token=${session?.access}`;
+      if (this.lastEventId)
+        webSocketUrl += `&last_event_id=${encodeURIComponent(this.lastEventId)}`;
 
       this.ws = new WebSocket(webSocketUrl);
 
@@ -44,6 +68,8 @@ export class ScrapingJobStatusWebSocket {
 
           console.log("📩 Received WebSocket message:", data);
 
+          if (data.id) this.lastEventId = data.id;
+
           this.callbacks.forEach(async (cb) => await cb(data));
         } catch (error) {
           console.error("❌ Error parsing WebSocket message:", error);